@@ -0,0 +1,1611 @@
+"""Messages catalog compiled from ``main_database.db``
+
+This file is generated by ``python -m pycafee.database_management.catalog``. Do not edit it by hand.
+"""
+
+# the schema version (PRAGMA user_version) of the database the catalog was compiled from
+SCHEMA_VERSION = 1
+
+# {language: id_language}
+LANGUAGES = {
+    'univ': 1,
+    'en': 2,
+    'pt-br': 3,
+}
+
+# {nome: id_funcao}
+FUNCTIONS = {
+    '_check_is_bool': 1,
+    '_check_is_data_frame': 2,
+    '_check_is_dict': 3,
+    '_check_is_float_or_int': 4,
+    '_check_is_float': 5,
+    '_check_is_integer': 6,
+    '_check_is_list': 7,
+    '_check_is_numpy_1_D': 8,
+    '_check_is_str': 9,
+    '_change_locale': 10,
+    'get_shapiro_wilk_tabulated_value': 11,
+    'shapiro_wilk': 12,
+    '_check_data_in_range': 13,
+    'ShapiroWilkNormalityTest': 14,
+    '_check_is_positive': 15,
+    '_export_to_csv': 16,
+    '_check_forbidden_character': 17,
+    '_export_to_excel': 18,
+    'draw_shapiro_wilk_tabulated_values': 19,
+    'shapiro_wilk_to_csv': 20,
+    'shapiro_wilk_to_xlsx': 21,
+    'multimode': 22,
+    '_check_conflicting_filename': 23,
+    'draw_density_function': 24,
+    'LanguageManagement': 25,
+    'AlphaManagement': 26,
+    'NDigitsManagement': 27,
+    '_check_blank_space': 28,
+    '_sep_checker': 29,
+    '_check_figure_extension': 30,
+    '_flat_list_of_lists': 31,
+    '_check_plot_design': 32,
+    '_check_which_density_gaussian_kernal_plot': 33,
+    '_check_file_name_is_str': 34,
+    'KolmogorovSmirnov': 35,
+    '_check_is_subplots': 36,
+    'Lilliefors': 37,
+    'draw_critical_values': 38,
+    'get_critical_value': 39,
+    'AbdiMolin': 40,
+    'to_xlsx': 41,
+    '_check_value_is_equal_or_higher_than': 42,
+    'to_csv': 43,
+    'normalitycheck_fit': 44,
+    'AndersonDarling': 45,
+    'ShapiroWilk': 46,
+    'normalitycheck_fit_shapiro_wilk': 47,
+    'NormalityCheck': 48,
+    'Sample': 49,
+    '_check_list_length': 50,
+    'StudentDistribution': 51,
+    '_check_array_lower_size': 52,
+    '_check_decimal_separator': 53,
+    'gaussian': 54,
+    'Dixon': 55,
+    '_check_value_is_equal_or_lower_than': 56,
+    'generic': 57,
+    'outliers': 58,
+    '_check_dixon_division_by_zero': 59,
+    'interquartile_range': 60,
+    'Grubbs': 61,
+    '_check_is_numpy_2_D': 62,
+    'ParallelExecutor': 64,
+    'MonteCarloTable': 65,
+    'StreamingSample': 66,
+    'QuantileSketch': 67,
+    '_check_source': 68,
+    '_read_chunks': 69,
+}
+
+# {id_language: {fk_id_function: {position: (slice, ...)}}}
+MESSAGES = {
+    1: {
+        1: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        2: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+            3: ('Text',),
+            4: ('Text', '{param_name}', 'Text'),
+        },
+        3: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        4: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        5: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        6: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        7: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        8: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+            3: ('Text',),
+            4: ('Text', '{param_name}', 'Text'),
+            5: ('Text',),
+            6: ('Text', '{param_name}', 'Text'),
+        },
+        9: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+            3: ('Text',),
+            4: ('Text', '{param_name}', 'Text'),
+        },
+        10: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{decimal_separator}'),
+            3: ('Text', '{local}', 'Text.'),
+        },
+        11: {
+            1: ('Text',),
+            2: ('Text', '{n_rep}'),
+            3: ('Text', 'Text', 'Text'),
+        },
+        12: {
+            1: ('Text',),
+            2: ('Text', '{conclusion}'),
+            3: ('Text',),
+            4: ('Text', '{details}'),
+            5: ('Text',),
+            6: ('Text', '{alfa}', 'Text'),
+            7: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{100*(1-alfa)}', 'Text'),
+            8: ('Text', '{100*(1-alfa)}', 'Text'),
+            9: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{100*(1-alfa)}', 'Text'),
+            10: ('Text', '{100*(1-alfa)}', 'Text'),
+            11: ('Text', '{tabulated}', 'Text', '{statistic}', 'Text', '{100*(1-alfa)}', 'Text'),
+            12: ('Text', '{tabulated}', 'Text', '{statistic}', 'Text', '{100*(1-alfa)}', 'Text'),
+            13: ('Text',),
+            14: ('Text',),
+            15: ('Text',),
+            16: ('Text',),
+            17: ('Text',),
+        },
+        13: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{lower}', 'Text', '{upper}', 'Text', '{value}'),
+        },
+        14: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        15: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{value}'),
+        },
+        16: {
+            1: ('Text', '{file}', 'Text'),
+            2: ('Text', '{file_name}'),
+            3: ('Text', '{file_name}', 'Text'),
+            4: ('Text', '{file_name}', 'Text'),
+            5: ('Text', '{file_name}', 'Text'),
+            6: ('Text',),
+        },
+        17: {
+            1: ('Text',),
+            2: ('Text', '{character}', 'Text'),
+            3: ('Text',),
+        },
+        18: {
+            1: ('Text', '{file_name}', 'Text'),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text', '{file_name}', 'Text'),
+            6: ('Text', '{file_name}', 'Text'),
+            7: ('Text', '{file_name}', 'Text'),
+            8: ('Text',),
+        },
+        19: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+        },
+        20: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+            9: ('Text',),
+        },
+        21: {
+            1: ('Text',),
+            2: ('Text', '{parameter}', 'Text', '{len(parameter)}'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+            9: ('Text',),
+        },
+        22: {
+            1: ('Text',),
+        },
+        23: {
+            1: ('Text', '{file}', 'Text'),
+            2: ('Text',),
+            3: ('Text', '{file_name}'),
+        },
+        24: {
+            1: ('Text', '{file}', 'Text'),
+            2: ('Text',),
+            3: ('Text', '{param}', 'Text', '{scott}', 'Text', '{silverman}', 'Text', '{bw_method}'),
+            4: ('Text', 'Text', 'Text', 'Text'),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+        },
+        25: {
+            1: ('Text',),
+            2: ('Text', '{language}', 'Text', 'Text'),
+            3: ('Text', '{_func_name}', 'Text', '{language}', 'Text', '{_func_name}', 'Text'),
+            4: ('Text', '{language}'),
+            5: ('Text', '{self.language}'),
+        },
+        26: {
+            1: ('Text',),
+        },
+        27: {
+            1: ('Text',),
+        },
+        28: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{decimal_separator}'),
+        },
+        29: {
+            1: ('Text',),
+            2: ('Text', '{sep}', 'Text', '{len(sep)}'),
+            3: ('Text',),
+        },
+        30: {
+            1: ('Text',),
+            2: ('Text', '{extension}', 'Text', '{param_name}', 'Text'),
+            3: ('Text',),
+        },
+        31: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text'),
+        },
+        32: {
+            1: ('Text',),
+            2: ('Text', '{chave}', 'Text'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text', '{len}', 'Text', '{len}'),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text', '{key}', 'Text', '{type}'),
+            9: ('Text',),
+            10: ('Text', '{chave}', 'Text', '{len}', 'Text', '{len}'),
+            11: ('Text',),
+            12: ('Text',),
+            13: ('Text', '{i}', 'Text', '{chave}', 'Text', '{type}', 'Text', '{type}'),
+        },
+        33: {
+            1: ('Text',),
+            2: ('Text', '{value}', 'Text'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+        },
+        34: {
+            1: ('Text',),
+            2: ('Text', '{type}'),
+            3: ('Text',),
+            4: ('Text',),
+        },
+        35: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        36: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+        },
+        37: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        38: {
+            1: ('Text',),
+            2: ('Text', '{TestName}', 'Text'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text', '{file_name}', 'Text'),
+        },
+        39: {
+            1: ('Text',),
+            2: ('Text', '{TestName}', 'test is', '{n}', 'but we got', '{n_rep}'),
+            3: ('Text', 'Text', 'Text'),
+        },
+        40: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        41: {
+            1: ('Text',),
+            2: ('Text', '{parameter}', 'Text', '{len(parameter)}'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+            9: ('Text',),
+        },
+        42: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{minimum}', 'Text', '{value}'),
+        },
+        43: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+            9: ('Text',),
+        },
+        44: {
+            1: ('Text',),
+            2: ('Text', '{details}'),
+            3: ('Text', '{alfa}', 'Text'),
+            4: ('Text', '{critical}', 'Text', '{statistic}', 'Text', '{test_name}', 'Text', '{100*(1-alfa)}', 'Text'),
+            5: ('Text', '{100*(1-alfa)}', 'Text'),
+            6: ('Text', '{critical}', 'Text', '{statistic}', 'Text', '{test_name}', 'Text', '{100*(1-alfa)}', 'Text'),
+            7: ('Text', '{100*(1-alfa)}', 'Text'),
+            8: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{100*(1-alfa)}', 'Text'),
+            9: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{100*(1-alfa)}', 'Text'),
+            10: ('Text',),
+            11: ('Text',),
+            12: ('Text',),
+            13: ('Text',),
+            14: ('Text',),
+            15: ('Text', '{comparison}'),
+        },
+        45: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        46: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        47: {
+            1: ('Text',),
+            2: ('Text', '{details}'),
+            3: ('Text', '{alfa}', 'Text'),
+            4: ('Text', '{critical}', 'Text', '{statistic}', 'Text', '{100*(1-alfa)}', 'Text'),
+            5: ('Text', '{100*(1-alfa)}', 'Text'),
+            6: ('Text', '{critical}', 'Text', '{statistic}', 'Text', '{100*(1-alfa)}', 'Text'),
+            7: ('Text', '{100*(1-alfa)}', 'Text'),
+            8: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{100*(1-alfa)}', 'Text'),
+            9: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{100*(1-alfa)}', 'Text'),
+            10: ('Text',),
+            11: ('Text',),
+            12: ('Text',),
+            13: ('Text',),
+            14: ('Text',),
+            15: ('Text', '{conclusion}'),
+        },
+        48: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text', '{test}', 'Text', '{test}', 'Text', '{values}'),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+            9: ('Text',),
+        },
+        49: {
+            1: ('Text',),
+            2: ('Text', '{name}'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+            9: ('Text', '{100*(1-alfa)}', '%'),
+            10: ('Text',),
+            11: ('Text', '{100*(1-self.alfa)}', 'Text'),
+            12: ('Text',),
+            13: ('Text',),
+            14: ('Text',),
+            15: ('Text',),
+            16: ('Text',),
+            17: ('Text',),
+            18: ('Text',),
+            19: ('Text',),
+        },
+        50: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{n}', 'Text', '{len(value)}'),
+        },
+        51: {
+            1: ('Text',),
+            2: ('Text', '{which}', 'Text', '{bilateral}', 'Text', '{unilateral}', 'Text', '{which}'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text', '{interval}', 'Text', '{interval[0] > interval[1]}'),
+            7: ('Text', '{interval}', 'Text', '{interval[0] > interval[1]}'),
+            8: ('Text',),
+            9: ('Text',),
+            10: ('Text',),
+            11: ('Text',),
+            12: ('Text',),
+            13: ('Text', 'Text', 'Text', 'Text', 'Text'),
+            14: ('Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            15: ('Text', '{statistic}', 'Text', '{critical_low},{Critical_high}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            16: ('Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            17: ('Text', '{statistic}', 'Text', '{critical_high}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            18: ('Text', '{statistic}', 'Text', '{critical_low}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            19: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            20: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            21: ('Text',),
+            22: ('Text', '{x_exp.mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            23: ('Text', '{statistic}', 'Text', '{critical.Lower}', 'Text', '{value}', 'Text', '{x_exp.mean()}', 'Text', '{100*(1-alfa)}', 'Text'),
+            24: ('Text', '{statistic}', 'Text', '{critical.Lower}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            25: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            26: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            27: ('Text', '{value}', 'Text', '{mean}', 'Text'),
+            28: ('Text', '{x_exp.mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            29: ('Text', '{statistic}', 'Text', '{critical[1]}', 'Text', '{x_exp.mean()}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            30: ('Text', '{p_value}', 'Text', '{alfa}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+            31: ('Text', '{param_name}', 'Text', '{critical}', 'Text', '{p-value}', 'Text', '{comparison}'),
+            32: ('Text', '{statistic}', 'Text', '{critical_high}', 'Text', '{mean}', 'Text', '{value}', 'Text', '{100*(1-alfa)}', 'Text'),
+        },
+        52: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{value}', 'Text,{array.size}'),
+        },
+        53: {
+            1: ('Text',),
+            2: ('Text', '{character}', 'Text'),
+            3: ('Text',),
+        },
+        54: {
+            1: ('Text',),
+            2: ('Text', '{std}', 'Text'),
+            3: ('Text', '{100*(1-alfa}', 'Text'),
+            4: ('Text', '{100*(1-alfa}', 'Text'),
+            5: ('Text', '{kurtosis}', 'Text', '{lower}', 'Text', '{upper}', 'Text', '{100*(1-alfa)}', 'Text'),
+            6: ('Text', '{kurtosis}', 'Text', '{upper}', 'Text', '{100*(1-alfa)}', 'Text'),
+            7: ('Text', '{kurtosis}', 'Text', '{lower}', 'Text', '{100*(1-alfa)}', 'Text'),
+            8: ('Text', 'Text', 'Text', 'Text'),
+            9: ('Text', '{100*(1-alfa}', 'Text'),
+            10: ('Text', '{100*(1-alfa}', 'Text'),
+            11: ('Text', '{skewness}', 'Text', '{lower}', 'Text', '{upper}', 'Text', '{100*(1-alfa)}', 'Text'),
+            12: ('Text', '{skewness}', 'Text', '{upper}', 'Text', '{100*(1-alfa)}', 'Text'),
+            13: ('Text', '{skewness}', 'Text', '{lower}', 'Text', '{100*(1-alfa)}', 'Text'),
+            14: ('Text',),
+        },
+        55: {
+            1: ('Text',),
+            2: ('Text', '{ratio}', 'Text'),
+            3: ('Text', '{x_exp[0]}', 'Text', '{100*(1-alfa)}', 'Text'),
+            4: ('Text', '{q_low}', 'Text', '{critical}', 'Text', '{x_exp[0]}', 'Text', '{100*(1-alfa)}', 'Text'),
+            5: ('Text', '{100*(1-alfa)}', 'Text'),
+            6: ('Text', '{q_low}', 'Text', '{critical}', 'Text', '{100*(1-alfa)}', 'Text'),
+            7: ('Text', '{x_exp[-1]}', 'Text', '{100*(1-alfa)}', 'Text'),
+            8: ('Text', '{q_upper}', 'Text', '{critical}', 'Text', '{x_exp[0]}', 'Text', '{100*(1-alfa)}', 'Text'),
+            9: ('Text', 'Text', '{which}'),
+            10: ('Text',),
+            11: ('Text', '{position_1}', 'Text', '{x_exp[position_1]}', 'Text', '{position_2}', 'Text', '{x_exp[position_2]}', 'Text'),
+            12: ('Text',),
+        },
+        56: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{maximum}', 'Text', '{value}'),
+        },
+        57: {
+            1: ('Text', 'Text', 'Text', 'Text'),
+            2: ('Text', '{test_name}', 'Text'),
+            3: ('Text',),
+            4: ('Text', '{param_name}', 'Text', '{list_of_keys}', 'Text', '{param_value}'),
+            5: ('Text',),
+            6: ('Text',),
+        },
+        58: {
+            1: ('Text', 'Text', '{which}'),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+            7: ('Text',),
+            8: ('Text',),
+        },
+        59: {
+            1: ('Text',),
+            2: ('Text', '{position_1}', 'Text', '{x_exp[position_1]}', 'Text', '{position_2}', 'Text', '{x_exp[position_2]}', 'Text'),
+        },
+        60: {
+            1: ('Text', 'Text', 'Text', 'Text'),
+        },
+        61: {
+            1: ('Text',),
+            2: ('Text', '{ratio}', 'Text'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text', '{100*(1-alfa)}', 'Text'),
+            7: ('Text', '{statistic}', 'Text', '{critical}', 'Text', '{100*(1-alfa)}', 'Text'),
+            8: ('Text', '{outlier}', 'Text', '{100*(1-alfa)}', 'Text'),
+            9: ('Text', '{statistic}', 'Text', '{critical}', 'Text', '{outlier}', 'Text', '{100*(1-alfa)}', 'Text'),
+            10: ('Text', '{outlier}', 'Text', '{outlier}', 'Text', '{100*(1-alfa)}', 'Text'),
+            11: ('Text', '{statistic}', 'Text', '{critical}', 'Text', '{outlier}', 'Text', '{outlier}', 'Text', '{100*(1-alfa)}', 'Text'),
+            12: ('Text', '{statistic}', 'Text', '{critical}', 'Text', '{100*(1-alfa)}', 'Text'),
+            13: ('Text', '{statistic}', 'Text', '{critical}', 'Text', '{outlier}', 'Text', '{100*(1-alfa)}', 'Text'),
+        },
+        62: {
+            1: ('Text',),
+            2: ('Text', '{param_name}', 'Text', '{type(value).__name__}'),
+            3: ('Text',),
+            4: ('Text', '{param_name}', 'Text'),
+            5: ('Text',),
+            6: ('Text', '{param_name}', 'Text'),
+        },
+        64: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text', '{method}', 'Text', '{test}'),
+        },
+        65: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        66: {
+            1: ('Text',),
+            2: ('Text', '{name}'),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+        },
+        67: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text',),
+            5: ('Text',),
+            6: ('Text',),
+        },
+        68: {
+            1: ('Text',),
+            2: ('Text',),
+        },
+        69: {
+            1: ('Text',),
+            2: ('Text',),
+            3: ('Text',),
+            4: ('Text',),
+        },
+    },
+    2: {
+        1: {
+            1: ('Error: not a boolean.',),
+            2: ('The', '{param_name}', 'parameter must be a boolean, but we got a parameter of type', '{type(value).__name__}'),
+        },
+        2: {
+            1: ('Error: not a DataFrame',),
+            2: ('The', '{param_name}', 'parameter must be a DataFrame, but we got a parameter of type', '{type(value).__name__}'),
+            3: ('Error: empty DataFrame',),
+            4: ('The', '{param_name}', 'parameter cannot be an empty DataFrame.'),
+        },
+        3: {
+            1: ('Error: not a dict',),
+            2: ('The ', '{param_name}', 'parameter must be a dict, but we got a parameter of type', '{type(value).__name__}'),
+        },
+        4: {
+            1: ('Error: not a float or integer.',),
+            2: ('The', '{param_name}', 'parameter must be of type float or integer, but we got a parameter of type', '{type(value).__name__}'),
+        },
+        5: {
+            1: ('Error: not a float.',),
+            2: ('The', '{param_name}', 'parameter must be a float, but we got a parameter of type', '{type(value).__name__}'),
+        },
+        6: {
+            1: ('Error: not an integer.',),
+            2: ('The', '{param_name}', 'parameter must be an integer, but we got a parameter of type', '{type(value).__name__}'),
+        },
+        7: {
+            1: ('Error: not a list',),
+            2: ('The ', '{param_name}', 'parameter must be a list, but we got a parameter of type', '{type(value).__name__}'),
+        },
+        8: {
+            1: ('Error: not numpy array',),
+            2: ('The', '{param_name}', 'parameter must be a numpy array, but we got a parameter of type', '{type(value).__name__}'),
+            3: ('Error: numpy array with more than one dimension',),
+            4: ('The', '{param_name}', 'parameter must be a numpy array with one dimension, but we got a numpy array with '),
+            5: ('Error: empty numpy array',),
+            6: ('The', '{param_name}', 'parameter cannot be empty, but its size is'),
+        },
+        9: {
+            1: ('Error: not a string',),
+            2: ('The', '{param_name}', 'parameter must be a string, but we got a parameter of type', '{type(value).__name__}'),
+            3: ('Error: empty string',),
+            4: ('The', '{param_name}', 'parameter cannot be an empty string.'),
+        },
+        10: {
+            1: ('Error: not supported decimal separator.',),
+            2: ('The', '{param_name}', "parameter accepts only the comma (',') or the dot ('.') as inputs, but we got", '{decimal_separator}'),
+            3: ("The value passed to 'local' (", '{local}', ') is not supported.'),
+        },
+        11: {
+            1: ('Error: very small number of observations',),
+            2: ("The minimum number of observations to obtain the tabulated value of the Shapiro Wilk test is '3', but we got", '{n_rep}'),
+            3: ('ShapiroWilkResult', 'tabulate', 'alpha'),
+        },
+        12: {
+            1: ('Error: value not supported',),
+            2: ("The 'conclusion' parameter only accepts 'tabulate' or 'p_value' as values, but we got", '{conclusion}'),
+            3: ('Error: value not supported',),
+            4: ("The 'details' parameter only accepts 'short' or 'full' as values, but we got", '{details}'),
+            5: ('Tabulated value not available',),
+            6: ('The tabulated value for alpha', '{alfa}', 'is not available. The comparison test will be performed using the p-value.'),
+            7: ('Since p-value (', '{p_value}', ') >= alpha (', '{alfa}', '), we have NO evidence to reject the hypothesis of data normality, according to the Shapiro-Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            8: ('Data is Normal at a', '{100*(1-alfa)}', '% of confidence level.'),
+            9: ('Since p-value (', '{p_value}', ') < alpha (', '{alfa}', '), we HAVE evidence to reject the hypothesis of data normality, according to the Shapiro-Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            10: ('Data is Not Normal at a', '{100*(1-alfa)}', '% of confidence level.'),
+            11: ('Since the tabulated value (', '{tabulated}', ') <= statistic (', '{statistic}', '), we have NO evidence to reject the hypothesis of data normality, according to the Shapiro-Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            12: ('Since the tabulated value (', '{tabulated}', ') > statistic (', '{statistic}', '), we HAVE evidence to reject the hypothesis of data normality, according to the Shapiro-Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            13: ('ShapiroWilkResult',),
+            14: ('Statistic',),
+            15: ('Tabulated',),
+            16: ('p_value',),
+            17: ('Alpha',),
+        },
+        13: {
+            1: ('Error: out of range',),
+            2: ('The', '{param_name}', 'parameter must be a number between', '{lower}', 'and', '{upper}', 'but we got', '{value}'),
+        },
+        14: {
+            1: ("The Shapiro-Wilk test was not performed. Use the 'shapiro_wilk' method to perform the test.",),
+            2: ('Shapiro-Wilk Normality test',),
+        },
+        15: {
+            1: ('Error: negative value',),
+            2: ('The', '{param_name}', 'parameter must be higher than zero (positive), but we got', '{value}'),
+        },
+        16: {
+            1: ('UserWarning: The', '{file}', 'already exists in the current folder.'),
+            2: ('The file will be exported with the name', '{file_name}'),
+            3: ('The', '{file_name}', 'file was exported!'),
+            4: ('You are not current allowed to change the', '{file_name}', 'file'),
+            5: ('Hint ---> Maybe the', '{file_name}', 'file is open! Please close the file and try again!'),
+            6: ('Hint ---> If you are creating a file in a subfolder, create the folder in advance!',),
+        },
+        17: {
+            1: ('Error: Character not allowed',),
+            2: ('The', '{character}', 'character cannot be used in a filename.'),
+            3: ('The characters not allowed are:',),
+        },
+        18: {
+            1: ('The', '{file_name}', 'file contains sheets with the following names:'),
+            2: ('And it was requested to save the data on the following tabs:',),
+            3: ('In order to avoid information loss, new names will be used for the sheets with conflicting sheet name.',),
+            4: ('No changes will be made to the data contained in these worksheets.',),
+            5: ('The data has been exported to the', '{file_name}', 'file'),
+            6: ('You are not current allowed to change the', '{file_name}', 'file'),
+            7: ('Hint ---> Maybe the', '{file_name}', 'file is open! Please close the file and try again!'),
+            8: ('Hint ---> If you are creating a file in a subfolder, create the folder in advance!',),
+        },
+        19: {
+            1: ('Alpha',),
+            2: ('*the critical value for alpha equal to 0.99 with 30 observations probably has a typo. The correct value is probably 0.990 instead of 0.900.',),
+            3: ('Tabulated values of the Shapiro Wilk normality test',),
+        },
+        20: {
+            1: ('Parameters',),
+            2: ('ShapiroWilkResult',),
+            3: ('Statistic',),
+            4: ('Tabulated',),
+            5: ('p_value',),
+            6: ('Alpha',),
+            7: ('Message',),
+            8: ('Data',),
+            9: ('Values',),
+        },
+        21: {
+            1: ('Error: size does not match!',),
+            2: ('The', '{parameter}', 'must have 2 elements, but we got', '{len(parameter)}'),
+            3: ('Parameters',),
+            4: ('ShapiroWilkResult',),
+            5: ('Statistic',),
+            6: ('Tabulated',),
+            7: ('p_value',),
+            8: ('Alpha',),
+            9: ('Message',),
+        },
+        22: {
+            1: ('The data has no mode.',),
+        },
+        23: {
+            1: ('The', '{file}', 'file already exists in the current directory'),
+            2: ('UserWarning',),
+            3: ('The file was exported as', '{file_name}'),
+        },
+        24: {
+            1: ('The', '{file}', 'file was exported!'),
+            2: ('Error: Key not allowed',),
+            3: ('The', '{param}', 'parameter only accepts', '{scott}', 'or', '{silverman}', 'as key, but we got', '{bw_method}'),
+            4: ('Non-parametric density', 'Mean', 'Median', 'Mode'),
+            5: ('Non-parametric density',),
+            6: ('UserWaring',),
+            7: ('The data does not have a mode (all values are unique)',),
+            8: ('The data has more than one mode (bimodal or multi-modal distributions tend to be over smoothed)',),
+        },
+        25: {
+            1: ('Error: language not valid',),
+            2: ('The', '{language}', ' language is not yet available.', 'The available languages are:'),
+            3: ('The function', '{_func_name}', 'has no translation for language', '{language}', 'The languages available for', '{_func_name}', 'are'),
+            4: ('If you are interested, you can contribute with the translation to the language', '{language}'),
+            5: ('The current language is:', '{self.language}'),
+        },
+        26: {
+            1: ('The current significance level is',),
+        },
+        27: {
+            1: ('The current n_digits is',),
+        },
+        28: {
+            1: ('Error: string with white space',),
+            2: ('The', '{param_name}', 'has at least one white space'),
+        },
+        29: {
+            1: ('Error: length does not match',),
+            2: ('The length of the', '{sep}', 'parameter must be equal to 1, but it is', '{len(sep)}'),
+            3: ('Hint',),
+        },
+        30: {
+            1: ('Error: extension not supported',),
+            2: ('The', '{extension}', 'extension is not accepted for the', '{param_name}', 'parameter'),
+            3: ('The current extensions allowed are:',),
+        },
+        31: {
+            1: ('Error: not a list of lists',),
+            2: ('At least one element of the', '{param_name}', 'list is not a list'),
+        },
+        32: {
+            1: ('Error: key not found',),
+            2: ('The', '{chave}', "key was not found on the supplied 'plot_design' dict"),
+            3: ('The following keys are required:',),
+            4: ('Error: inconsistent number of keys',),
+            5: ("The number of keys of the 'plot_design' dict must be equal to", '{len}', 'but it has a size of', '{len}'),
+            6: ("The 'plot_design' parameter must have these, and only these, keys:",),
+            7: ('Error: not a list',),
+            8: ('The value for the', '{key}', 'key must be list, but we got', '{type}'),
+            9: ('Error: size does not match',),
+            10: ('The length of the list contained in', '{chave}', 'key must be', '{len}', 'but we got', '{len}'),
+            11: ('This list must be like:',),
+            12: ('Error: type mismatch',),
+            13: ('The type of the element', '{i}', 'of the key', '{chave}', 'must be', '{type}', 'but we got', '{type}'),
+        },
+        33: {
+            1: ('Error: no key match found',),
+            2: ('The', '{value}', 'key is not allowed'),
+            3: ('The accepted keys are:',),
+            4: ('Error: key combination not supported',),
+            5: ("The 'all' key cannot be used combined with other keys, but we got:",),
+        },
+        34: {
+            1: ('Error: not a string',),
+            2: ('The file name must be a string, but we got', '{type}'),
+            3: ('Error: empty string',),
+            4: ('The file name cannot be empty!',),
+        },
+        35: {
+            1: ("The Kolmogorov Smirnov test was not performed yet. Use the 'fit' method to perform the test.",),
+            2: ('Kolmogorov Smirnov Normality test',),
+        },
+        36: {
+            1: ('Error: not a matplotlib.axes.SubplotBase.',),
+            2: ('The', '{param_name}', "parameter must be a 'matplotlib.axes.SubplotBase', but we got a parameter of type", '{type(value).__name__}'),
+        },
+        37: {
+            1: ("The Lilliefors test was not performed yet. Use the 'fit' method to perform the test.",),
+            2: ('Lilliefors Normality test',),
+        },
+        38: {
+            1: ('Alpha',),
+            2: ('Critical values of the', '{TestName}', 'test'),
+            3: ('Number of observations',),
+            4: ('Critical values',),
+            5: ('The', '{file_name}', 'file has been exported'),
+        },
+        39: {
+            1: ('Error: very small number of observations',),
+            2: ('The minimum number of observations to obtain the critical value of the', '{TestName}', 'test is', '{n}', 'but we got', '{n_rep}'),
+            3: ('Result', 'critical', 'alpha'),
+        },
+        40: {
+            1: ("The AbdiMolin test was not performed yet. Use the 'fit' method to perform the test.",),
+            2: ('AbdiMolin Normality test',),
+        },
+        41: {
+            1: ('Error: size does not match!',),
+            2: ('The', '{parameter}', 'must have 2 elements, but we got', '{len(parameter)}'),
+            3: ('Parameters',),
+            4: ('Result',),
+            5: ('Statistic',),
+            6: ('Tabulated',),
+            7: ('p_value',),
+            8: ('Alpha',),
+            9: ('Message',),
+        },
+        42: {
+            1: ('Error: lower value',),
+            2: ('The', '{param_name}', 'parameter must be a number equal or higher than', '{minimum}', 'but we got', '{value}'),
+        },
+        43: {
+            1: ('Parameters',),
+            2: ('Result',),
+            3: ('Statistic',),
+            4: ('Tabulated',),
+            5: ('p_value',),
+            6: ('Alpha',),
+            7: ('Message',),
+            8: ('Data',),
+            9: ('Values',),
+        },
+        44: {
+            1: ('Error: value not supported',),
+            2: ("The 'details' parameter only accepts 'short', 'full' or 'binary' as values, but we got", '{details}'),
+            3: ('The critical value for alpha', '{alfa}', 'is not available. The available alpha values are:'),
+            4: ('Since the critical value (', '{critical}', ') >= statistic (', '{statistic}', '), we have NO evidence to reject the hypothesis of data normality, according to the', '{test_name}', 'test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            5: ('Data is Normal at a', '{100*(1-alfa)}', '% of confidence level.'),
+            6: ('Since the critical value (', '{critical}', ') < statistic (', '{statistic}', '), we HAVE evidence to reject the hypothesis of data normality, according to the', '{test_name}', 'test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            7: ('Data is Not Normal at a', '{100*(1-alfa)}', '% of confidence level.'),
+            8: ('Since p-value (', '{p_value}', ') >= alpha (', '{alfa}', '), we have NO evidence to reject the hypothesis of data normality, according to the', '{test_name}', 'test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            9: ('Since p-value (', '{p_value}', ') < alpha (', '{alfa}', '), we HAVE evidence to reject the hypothesis of data normality, according to the', '{test_name}', 'test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            10: ('Result',),
+            11: ('Statistic',),
+            12: ('Critical',),
+            13: ('p_value',),
+            14: ('Alpha',),
+            15: ("The 'comparison' parameter only accepts 'critical' or 'p-value' as values, but we got", '{comparison}'),
+        },
+        45: {
+            1: ("The AndersonDarling test was not performed yet. Use the 'fit' method to perform the test.",),
+            2: ('AndersonDarling Normality test',),
+        },
+        46: {
+            1: ("The ShapiroWilk test was not performed yet. Use the 'fit' method to perform the test.",),
+            2: ('ShapiroWilk Normality test',),
+        },
+        47: {
+            1: ('Error: value not supported',),
+            2: ("The 'details' parameter only accepts 'short' or 'full' as values, but we got", '{details}'),
+            3: ('The critical value for alpha', '{alfa}', 'is not available. The available alpha values are:'),
+            4: ('Since the critical value (', '{critical}', ') <= statistic (', '{statistic}', '), we have NO evidence to reject the hypothesis of data normality, according to the Shapiro Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            5: ('Data is Normal at a', '{100*(1-alfa)}', '% of confidence level.'),
+            6: ('Since the critical value (', '{critical}', ') > statistic (', '{statistic}', '), we HAVE evidence to reject the hypothesis of data normality, according to the Shapiro Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            7: ('Data is Not Normal at a', '{100*(1-alfa)}', '% of confidence level.'),
+            8: ('Since p-value (', '{p_value}', ') >= alpha (', '{alfa}', '), we have NO evidence to reject the hypothesis of data normality, according to the Shapiro Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            9: ('Since p-value (', '{p_value}', ') < alpha (', '{alfa}', '), we HAVE evidence to reject the hypothesis of data normality, according to the Shapiro Wilk test at a', '{100*(1-alfa)}', '% of confidence level.'),
+            10: ('Result',),
+            11: ('Statistic',),
+            12: ('Critical',),
+            13: ('p_value',),
+            14: ('Alpha',),
+            15: ("The 'conclusion' parameter only accepts 'critical' or 'p-value' as values, but we got", '{conclusion}'),
+        },
+        48: {
+            1: ("The NormalityCheck was not performed yet. Use the 'check' method to perform the test.",),
+            2: ('NormalityCheck',),
+            3: ('Error: value not allowed',),
+            4: ('The parameter', '{test}', 'does not accept the value', '{test}', 'The accepted values are', '{values}'),
+            5: ('UserWarning',),
+            6: ("The Abdi-Molin test does not support the 'conclusion' parameter",),
+            7: ('The comparison will be made by comparing the test statistic with the respective critical value',),
+            8: ('Conclusion',),
+            9: ('n',),
+        },
+        49: {
+            1: ('Error: data not found',),
+            2: ("The calculations have not been performed for this sample yet. Use the 'fit' method to estimate the statistics for", '{name}'),
+            3: ('Sample evaluation class',),
+            4: ('Sample',),
+            5: ('with mean',),
+            6: ('Mean',),
+            7: ('Variance',),
+            8: ('Standard deviation',),
+            9: ('Confidence interval', '{100*(1-alfa)}', '%'),
+            10: ('Coefficient of variation (%)',),
+            11: ('with a', '{100*(1-self.alfa)}', '% of confidence level'),
+            12: ('Minimum',),
+            13: ('Q1',),
+            14: ('Median',),
+            15: ('Q3',),
+            16: ('Maximum',),
+            17: ('Interquartile range',),
+            18: ('Error: Normality test not evaluated',),
+            19: ("The Normality test needs the whole sample, so it is not evaluated when the data is read in chunks ('x_source' or 'numpy.memmap'). Use 'fit' with the data in memory ('x_exp') to check the Normality of the",),
+        },
+        50: {
+            1: ('Error: length does not match',),
+            2: ('The ', '{param_name}', 'parameter have size equal to', '{n}', 'must its size is', '{len(value)}'),
+        },
+        51: {
+            1: ('Error: Key not allowed',),
+            2: ('The', '{which}', 'parameter only accepts', '{bilateral}', 'or', '{unilateral}', 'as key, but we got', '{which}'),
+            3: ('Probability density',),
+            4: ("Student's $t$",),
+            5: ('Error: interval not allowed',),
+            6: ('The first element of the', '{interval}', 'parameter must be lower than its second element, but', '{interval[0] > interval[1]}'),
+            7: ('The first element of the', '{interval}', 'parameter must be lower than its second element, but they are equal', '{interval[0] = interval[1]}'),
+            8: ('UserWaring',),
+            9: ('The intervals are not symmetrical! This causes the graph to be shifted!',),
+            10: ('Rejection region',),
+            11: ('Acceptance region',),
+            12: ("Student's t distribution",),
+            13: ('Student', 'Upper', 'Lower', 'Alpha', 'Distribution'),
+            14: ('The mean (', '{mean}', ') is equal to the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            15: ('Since the test statistic (', '{statistic}', ') is a number between the critical values (', '{critical_low},{Critical_high}', '), there is no evidence to reject the null hypothesis, and we can say that the mean (', '{mean}', ') is equal to the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence).'),
+            16: ('The mean (', '{mean}', ') is different from the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            17: ('Since the test statistic (', '{statistic}', ') is higher than the upper critical value (', '{critical_high}', '), we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{mean}', ') is different from the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            18: ('Since the test statistic (', '{statistic}', ') is lower than the lower critical value (', '{critical_low}', '),  we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{mean}', ') is different from constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            19: ('Since the p-value (', '{p_value}', ') is lower than the adopted significance level (', '{alfa}', '), we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{mean}', ') is different from the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            20: ('Since the p-value (', '{p_value}', ') is higher than the adopted significance level (', '{alfa}', '), we do not have evidence to reject the hypothesis of equality between the means, and we can say that the mean (', '{mean}', ') is equal to the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            21: ('OneSampleStudentComparison', 'statistic', 'critical', 'p_value', 'alpha'),
+            22: ('The mean (', '{x_exp.mean}', ') is higher than the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            23: ('Since the test statistic (', '{statistic}', ') is higher than the lower critical value (', '{critical.Lower}', '), we have no evidence to reject the null hypothesis of equality between the means, and we can say that the mean (', '{mean}', ') is equal to the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            24: ('Since the test statistic (', '{statistic}', ') is lower than the upper critical value (', '{critical.Lower}', '), we have no evidence to reject the null hypothesis of equality between the means, and we can say that the mean (', '{mean}', ') is equal to the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            25: ('Since the p-value (', '{p_value}', ') is lower than the adopted significance level (', '{alfa}', '), we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{mean}', ') is higher than the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            26: ('Since the p-value (', '{p_value}', ') is higher than the adopted significance level (', '{alfa}', '), we have no evidence to reject the null hypothesis of equality between the means, and we can say that the mean (', '{mean}', ') is equal to the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            27: ('The constant (', '{value}', ') and the mean (', '{mean}', ') are exactly the same'),
+            28: ('The mean (', '{x_exp.mean}', ') is lower than the constant (', '{}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            29: ('Since the test statistic (', '{statistic}', ') is lower than the lower critical value (', '{critical[1]}', '), we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{x_exp.mean()}', ') is lower than the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            30: ('Since the p-value (', '{p_value}', ') is lower than the adopted significance level (', '{alfa}', '), we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{mean}', ') is lower than the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+            31: ('The', '{param_name}', 'parameter only accepts the keys', '{critical}', 'or', '{p-value}', 'but we got', '{comparison}'),
+            32: ('Since the test statistic (', '{statistic}', ') is higher than the upper critical value (', '{critical_high}', '), we have evidence to reject the null hypothesis of equality of means, and we can say that the mean (', '{mean}', ') is higher than the constant (', '{value}', ') (with', '{100*(1-alfa)}', '% confidence)'),
+        },
+        52: {
+            1: ('Error: sample size not accepted',),
+            2: ('The minimum sample size for the', '{param_name}', 'parameter is', '{value}', 'but we got a sample of size', '{array.size}'),
+        },
+        53: {
+            1: ('Error: Decimal separator not allowed',),
+            2: ('The', '{character}', 'character cannot be used as decimal separator'),
+            3: ('The characters allowed are:',),
+        },
+        54: {
+            1: ('Error: Division by zero/almost zero',),
+            2: ('The sample standard deviation (', '{std}', ') is lower than 10E-6, which makes the results inaccurate.'),
+            3: ('Kurtosis is Normal (', '{100*(1-alfa}', '% confidence)'),
+            4: ('Kurtosis is NOT Normal (', '{100*(1-alfa}', '% confidence)'),
+            5: ('Since the calculated statistic for the kurtosis (', '{kurtosis}', ') is a value between the lower critical value (', '{lower}', ') and the upper critical value (', '{upper}', '), we have no evidence to reject the null hypothesis that the distribution has kurtosis similar to the kurtosis of a Normal distribution (with', '{100*(1-alfa)}', '% confidence).'),
+            6: ('Since the calculated statistic for the kurtosis (', '{kurtosis}', ') is a value higher than the upper critical value (', '{upper}', '), we have evidence to reject the null hypothesis, and we can say that the distribution does not have kurtosis similar to the kurtosis of a Normal distribution (with', '{100*(1-alfa)}', '% confidence).'),
+            7: ('Since the calculated statistic for the kurtosis (', '{kurtosis}', ') is a value lower than the lower critical value (', '{lower}', '), we have evidence to reject the null hypothesis, and we can say that the distribution does not have kurtosis similar to the kurtosis of a Normal distribution (with', '{100*(1-alfa)}', '% confidence).'),
+            8: ('KurtosisResult', 'Statistics', 'Critical', 'Alpha', 'SkewnessResult'),
+            9: ('Skewness is Normal (', '{100*(1-alfa}', '% confidence)'),
+            10: ('Skewness is NOT Normal (', '{100*(1-alfa}', '% confidence)'),
+            11: ('Since the calculated statistic for the skewness (', '{skewness}', ') is a value between the lower critical value (', '{lower}', ') and the upper critical value (', '{upper}', '), we have no evidence to reject the null hypothesis that the distribution has skewness similar to the skewness of a Normal distribution (with', '{100*(1-alfa)}', '% confidence).'),
+            12: ('Since the calculated statistic for the skewness (', '{skewness}', ') is a value higher than the upper critical value (', '{upper}', '), we have evidence to reject the null hypothesis, and we can say that the distribution does not have skewness similar to the skewness of a Normal distribution (with', '{100*(1-alfa)}', '% confidence).'),
+            13: ('Since the calculated statistic for the skewness (', '{skewness}', ') is a value lower than the lower critical value (', '{lower}', '), we have evidence to reject the null hypothesis, and we can say that the distribution does not have skewness similar to the skewness of a Normal distribution (with', '{100*(1-alfa)}', '% confidence).'),
+            14: ('Kurtosis and Skewness measures',),
+        },
+        55: {
+            1: ('Error: ratio not allowed',),
+            2: ("The 'ratio' parameter does not accept the key", '{ratio}', 'The accepted keys are the following'),
+            3: ('The lower value (', '{x_exp[0]}', ') perhaps be an outlier (with', '{100*(1-alfa)}', '% confidence)'),
+            4: ('Since the test statistic value (', '{q_low}', ') is higher than the critical value (', '{critical}', '), we have evidence to reject the null hypothesis that the sample does not contain outliers, and perhaps the lower value (', '{x_exp[0]}', ') is an outlier (with', '{100*(1-alfa)}', '% confidence)'),
+            5: ('The data does not have outliers (with', '{100*(1-alfa)}', '% confidence)'),
+            6: ('Since the test statistic value (', '{q_low}', ') is lower than the critical value (', '{critical}', '), we have no evidence to reject the null hypothesis that the sample does not contain outliers (with', '{100*(1-alfa)}', '% confidence)'),
+            7: ('The upper value (', '{x_exp[-1]}', ') perhaps be an outlier (with', '{100*(1-alfa)}', '% confidence)'),
+            8: ('Since the test statistic value (', '{q_upper}', ') is higher than the critical value (', '{critical}', '), we have evidence to reject the null hypothesis that the sample does not contain outliers, and perhaps the upper value (', '{x_exp[-1]}', ') is an outlier (with', '{100*(1-alfa)}', '% confidence)'),
+            9: ('Error: key not supported', "The 'which' parameter only accepts 'min' or 'max' as keys, be we got", '{which}'),
+            10: ('Error: Division by zero',),
+            11: ('The values in positions', '{position_1}', '(', '{x_exp[position_1]}', ') and', '{position_2}', '(', '{x_exp[position_2]}', ') cannot be equal, as this leads to a division by zero error'),
+            12: ("Dixon's test for outlier detection",),
+        },
+        56: {
+            1: ('Error: higher value',),
+            2: ('The', '{param_name}', 'parameter must be a number equal or lower than', '{maximum}', 'but we got', '{value}'),
+        },
+        57: {
+            1: ('Result', 'Critical', 'alpha', 'Statistic', 'Outlier', 'Interval'),
+            2: ('The', '{test_name}', "test was not performed yet. Use the 'fit' method to perform the test."),
+            3: ('Error: value not supported',),
+            4: ('The', '{param_name}', 'parameter only accepts the following keys', '{list_of_keys}', 'But we got', '{param_value}'),
+            5: ('Error: Division by zero',),
+            6: ('The estimated standard deviation for the dataset is equal to or very close to zero, which caused a division-by-zero error.',),
+        },
+        58: {
+            1: ('Error: key not supported', "The 'which' parameter only accepts 'min' or 'max' as keys, be we got", '{which}'),
+            2: ('The dataset has no outliers',),
+            3: ('The dataset has outliers',),
+            4: ("ZScore's test for outlier detection",),
+            5: ("Modified ZScore's test for outlier detection",),
+            6: ('The estimated median of the absolute deviations about the median for the dataset is equal to or very close to zero, which caused a division-by-zero error.',),
+            7: ('Error: Division by zero',),
+            8: ("Tukey's test for outlier detection",),
+        },
+        59: {
+            1: ('Error; Division by zero',),
+            2: ('The values in positions', '{position_1}', '(', '{x_exp[position_1]}', ') and', '{position_2}', '(', '{x_exp[position_2]}', ') cannot be equal, as this leads to a division by zero error'),
+        },
+        60: {
+            1: ('InterquartileRangeResult', 'InterquartileRange', 'FirstQuartil', 'ThirdQuartil'),
+        },
+        61: {
+            1: ('Error: kind not allowed',),
+            2: ("The 'kind' parameter does not accept the key", '{kind}', 'The accepted keys are the following'),
+            3: ('Error: alpha not found',),
+            4: ("Grubbs's test for outlier detection",),
+            5: ('The sample standard deviation cannot be equal to zero, as this causes division by zero error.',),
+            6: ('The data does not have outliers (', '{100*(1-alfa)}', '% confidence level)'),
+            7: ('As the test statistic (', '{statistic}', ') is lower than the critical value (', '{critical}', '), we have no evidence to reject the null hypothesis that the sample does not contain outliers (', '{100*(1-alfa)}', '% confidence level)'),
+            8: ('The sample', '{outlier}', 'perhaps be an outlier (', '{100*(1-alfa)}', '% confidence level)'),
+            9: ('Since the test statistic (', '{statistic}', ') is higher than the critical value (', '{critical}', '), we have evidence to reject the null hypothesis, and perhaps sample', '{outlier}', 'is an outlier (', '{100*(1-alfa)}', '% confidence level)'),
+            10: ('Samples', '{outlier}', 'and', '{outlier}', 'may be outliers (', '{100*(1-alfa)}', '% confidence level)'),
+            11: ('Since the test statistic (', '{statistic}', ') is lower than the critical value (', '{critical}', '), we have evidence to reject the null hypothesis, and perhaps sample', '{outlier}', 'and', '{outlier}', 'are outliers (', '{100*(1-alfa)}', '% confidence level)'),
+            12: ('As the test statistic (', '{statistic}', ') is higher than the critical value (', '{critical}', '), we have no evidence to reject the null hypothesis that the sample does not contain outliers (', '{100*(1-alfa)}', '% confidence level)'),
+            13: ('Since the test statistic (', '{statistic}', ') is higher than the critical value (', '{critical}', '), we have evidence to reject the null hypothesis, and perhaps samples', '{outlier}', 'and', '{outlier}', 'are outliers (', '{100*(1-alfa)}', '% confidence level)'),
+        },
+        62: {
+            1: ('Error: not numpy array',),
+            2: ('The', '{param_name}', 'parameter must be a numpy array, but we got a parameter of type', '{type(value).__name__}'),
+            3: ('Error: numpy array without two dimensions',),
+            4: ('The', '{param_name}', 'parameter must be a numpy array with two dimensions, but we got a numpy array with '),
+            5: ('Error: empty numpy array',),
+            6: ('The', '{param_name}', 'parameter cannot be empty, but its shape is'),
+        },
+        64: {
+            1: ('Parallel executor with the number of worker processes equal to',),
+            2: ('ParallelExecutor',),
+            3: ('Error: invalid test',),
+            4: ('The test must be a class with the', '{method}', 'method, but we got', '{test}'),
+        },
+        65: {
+            1: ('Monte Carlo table of critical values with the number of replicates equal to',),
+            2: ('MonteCarloTable',),
+        },
+        66: {
+            1: ('Error: data not found',),
+            2: ("No data has been added to this sample yet. Use the 'push' method to add data to", '{name}'),
+            3: ('Streaming sample evaluation class',),
+            4: ('Streaming sample',),
+            5: ('Error: the samples can not be merged',),
+            6: ("The 'other' parameter must be a StreamingSample, but we got",),
+        },
+        67: {
+            1: ('Quantile sketch with normalized rank error of',),
+            2: ('QuantileSketch',),
+            3: ('Error: the sketches can not be merged',),
+            4: ("The 'other' parameter must be a QuantileSketch, but we got",),
+            5: ('Error: the sketch is empty',),
+            6: ("Use the 'push' method to add data to the sketch",),
+        },
+        68: {
+            1: ("The 'x_exp' and 'x_source' parameters cannot be used together",),
+            2: ("Use the 'x_exp' parameter for data in memory or the 'x_source' parameter for data read in chunks, but not both.",),
+        },
+        69: {
+            1: ("The 'x_source' parameter is not valid",),
+            2: ("The 'x_source' parameter must be a file path, a numpy array or an iterable of numpy arrays, but we got",),
+            3: ('The data source can only be read once',),
+            4: ("This test reads the data twice, so 'x_source' must be a file path, a numpy array or a list of numpy arrays (not an iterator).",),
+        },
+    },
+    3: {
+        1: {
+            1: ('Erro: não é um boolean',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo boolean, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+        },
+        2: {
+            1: ('Erro: não é um DataFrame',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo DataFrame, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+            3: ('Erro: DataFrame vazio',),
+            4: ('O parâmetro', '{param_name}', 'não pode ser um DataFrame vazio.'),
+        },
+        3: {
+            1: ('Erro: não é um dict',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo dict, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+        },
+        4: {
+            1: ('Erro: não é um float ou integer',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo float ou integer, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+        },
+        5: {
+            1: ('Erro: não é um float',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo float, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+        },
+        6: {
+            1: ('Erro: não é um integer',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo integer, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+        },
+        7: {
+            1: ('Erro: não é uma lista',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo list, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+        },
+        8: {
+            1: ('Erro: não é um numpy array',),
+            2: ('O parâmetro', '{param_name}', 'deve ser um numpy array, mas obtivemos um parâmetro do tipo', '{type(value).__name__}'),
+            3: ('Erro: numpy array com mais de uma dimensão',),
+            4: ('O parâmetro', '{param_name}', 'deve ser um numpy array com uma dimensão, mas obtivemos um numpy array com '),
+            5: ('Erro: numpy array é vazio',),
+            6: ('O parâmetro', '{param_name}', 'não pode ser vazio, mas seu tamanho é'),
+        },
+        9: {
+            1: ('Erro: não é uma string',),
+            2: ('O parâmetro', '{param_name}', 'deve ser do tipo string, mas recebemos um parâmetro do tipo', '{type(value).__name__}'),
+            3: ('Erro: string vazia',),
+            4: ('O parâmetro', '{param_name}', 'não pode ser uma string vazia!'),
+        },
+        10: {
+            1: ('Erro: separador decimal não suportado',),
+            2: ('O parâmetro', '{param_name}', "aceita apenas a vírgula (',') ou o ponto ('.') como inputs, mas recebemos", '{decimal_separator}'),
+            3: ("O valor passado para o parãmetro 'local' (", '{local}', ') não é suportado.'),
+        },
+        11: {
+            1: ('Erro: número de observações muito pequeno',),
+            2: ("O número mínimo de observações para obter o valor tabelado do teste Shapiro Wilk é '3', mas obtivemos", '{n_rep}'),
+            3: ('ShapiroWilkResultado', 'tabelado', 'alfa'),
+        },
+        12: {
+            1: ('Erro: valor não suportado',),
+            2: ("O parâmetro 'conclusion' aceita apenas 'tabulate' ou 'p_value' como valores, mas obtivemos", '{conclusion}'),
+            3: ('Erro: valor não suportado',),
+            4: ("O parâmetro 'details' aceita apenas 'short' ou 'full' como valores, mas obtivemos", '{details}'),
+            5: ('Valor tabelado não disponível',),
+            6: ('O valor tabelado para alfa', '{alfa}', 'não está disponível. O teste de comparação será realizado utilizando o p-valor.'),
+            7: ('Como o p-valor (', '{p_value}', ') >= alfa (', '{alfa}', '), nós NÃO temos evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro-Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            8: ('Os dados são Normais com', '{100*(1-alfa)}', '% de confiança.'),
+            9: ('Como o p-valor (', '{p_value}', ') < alfa (', '{alfa}', '), nós TEMOS evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro-Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            10: ('Os dados não são Normais com', '{100*(1-alfa)}', '% de confiança.'),
+            11: ('Como o valor tabelado (', '{p_value}', ') <= estatística (', '{statistic}', '), nós NÃO temos evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro-Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            12: ('Como o valor tabelado (', '{tabulated}', ') > estatística (', '{statistic}', '), nós TEMOS evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro-Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            13: ('ResultadoShapiroWilk',),
+            14: ('Estatistica',),
+            15: ('Tabelado',),
+            16: ('p_valor',),
+            17: ('Alfa',),
+        },
+        13: {
+            1: ('Erro: fora do intervalo',),
+            2: ('O parâmetro', '{param_name}', 'deve ser um número entre', '{lower}', 'e', '{upper}', 'mas obtivemos', '{value}'),
+        },
+        14: {
+            1: ("O teste de Shapiro-Wilk não foi realizado. Utilize o método 'shapiro_wilk' para realizar o teste.",),
+            2: ('Teste de Normalidade de Shapiro-Wilk',),
+        },
+        15: {
+            1: ('Erro: valor negativo',),
+            2: ('O parâmetro', '{param_name}', 'deve ser maior do que zero (positivo), mas recebemos', '{value}'),
+        },
+        16: {
+            1: ('UserWarning: O arquivo', '{file}', 'já existe no diretório atual'),
+            2: ('O arquivo será exportado com o nome ', '{file_name}'),
+            3: ('O arquivo', '{file_name}', ' foi exportado!'),
+            4: ('Você não tem permissão para alterar o arquivo', '{file_name}', ''),
+            5: ('Dica ---> Talvez o arquivo', '{file_name}', 'esta aberto! Por favor, feche-o e tente novamente!'),
+            6: ('Dica ---> Se você esta criando o arquivo em uma subpasta, crie a pasta antes!',),
+        },
+        17: {
+            1: ('Erro: Caracter não permitido',),
+            2: ('O caractere', '{character}', 'não pode ser utilizado em um nome de arquivo.'),
+            3: ('Os caracteres não permitidos são:',),
+        },
+        18: {
+            1: ('O arquivo', '{file_name}', 'contém abas com os seguintes nomes:'),
+            2: ('E foi solicitado para salvar os dados nas seguintes abas:',),
+            3: ('Para evitar a perda de informação, novos nomes serão utilzados para as planilhas com nomes conflitantes',),
+            4: ('As planilhas originais não serão alteradas.',),
+            5: ('Os dados foram exportados para o arquivo', '{file_name}', ''),
+            6: ('Você não tem permissão para alterar o arquivo', '{file_name}', ''),
+            7: ('Dica ---> Talvez o arquivo', '{file_name}', 'esta aberto! Por favor, feche-o e tente novamente!'),
+            8: ('Dica ---> Se você esta criando o arquivo em uma subpasta, crie a pasta antes!',),
+        },
+        19: {
+            1: ('Alfa',),
+            2: ('*o valor crítico para alfa igual a 0,99 com 30 observações provavelmente tem um erro de digitação. O valor correto provavelmente é 0,990 em vez de 0,900.',),
+            3: ('Valores tabelados do teste de normalidade de Shapiro Wilk',),
+        },
+        20: {
+            1: ('Parametros',),
+            2: ('ShapiroWilkResultado',),
+            3: ('Estatistica',),
+            4: ('Tabelado',),
+            5: ('p_valor',),
+            6: ('Alfa',),
+            7: ('Mensagem',),
+            8: ('Dados',),
+            9: ('Valores',),
+        },
+        21: {
+            1: ('Erro: tamanho incompatível!',),
+            2: ('O parâmetro', '{parameter}', 'deve ter 2 elementos, mas recebemos', '{len(parameter)}'),
+            3: ('Parametros',),
+            4: ('ShapiroWilkResultado',),
+            5: ('Estatistica',),
+            6: ('Tabelado',),
+            7: ('p_valor',),
+            8: ('Alfa',),
+            9: ('Mensagem',),
+        },
+        22: {
+            1: ('Os dados não têm moda',),
+        },
+        23: {
+            1: ('O arquivo', '{file}', 'já existe no diretório atual.'),
+            2: ('AvisoUsuário',),
+            3: ('O arquivo foi exportado como', '{file_name}'),
+        },
+        24: {
+            1: ('O arquivo', '{file}', 'foi exportado!'),
+            2: ('Erro: Key não aceita',),
+            3: ('O parâmetro', '{param}', 'aceita apenas', '{scott}', 'ou', '{silverman}', 'como key, mas recebemos', '{bw_method}'),
+            4: ('Densidade não paramétrica', 'Média', 'Mediana', 'Moda'),
+            5: ('Densidade não paramétrica',),
+            6: ('UserWaring',),
+            7: ('Os dados não tem uma moda (todos os valores são únicos)',),
+            8: ('Os dados contém mais de uma moda (distribuições bi ou multi modais tendem a ser muito suavizadas)',),
+        },
+        25: {
+            1: ('Erro: idioma não válido',),
+            2: ('O idioma', '{language}', 'ainda não esta disponível.', 'Os idiomas disponíveis são:'),
+            3: ('A função', '{_func_name}', 'não tem tradução para o idioma ', '{language}', 'Os idiomas disponíveis para ', '{_func_name}', 'são'),
+            4: ('Caso tenha interesse, você pode contribuir com a tradução para o idioma', '{language}'),
+            5: ('O idioma atual é:', '{language}'),
+        },
+        26: {
+            1: ('O nível de significância atual é',),
+        },
+        27: {
+            1: ('O n_digits atual é',),
+        },
+        28: {
+            1: ('Erro: string contém valor em branco',),
+            2: ('O parâmetro', '{param_name}', 'tem pelo menos um espaço em branco'),
+        },
+        29: {
+            1: ('Erro: comprimento não confere',),
+            2: ('O comprimento do parâmetro', '{sep}', 'deve ser igual a 1, mas é ', '{len(sep)}'),
+            3: ('Dica',),
+        },
+        30: {
+            1: ('Erro: extensão não suportada',),
+            2: ('A extensão', '{extension}', 'não é aceita para o parâmetro', '{param_name}', ''),
+            3: ('As extensões atualmente permitadas são:',),
+        },
+        31: {
+            1: ('Erro: não é uma lista de listas',),
+            2: ('Pelo menos um elemento da lista', '{param_name}', 'não é uma lista'),
+        },
+        32: {
+            1: ('Erro: chave não encontrada',),
+            2: ('A chave', '{chave}', "não foi encontrada no dicionário 'plot_design'"),
+            3: ('As seguintes chaves são necessárias:',),
+            4: ('Erro: Número de chaves inconsistente',),
+            5: ("O número de chaves do dicionário 'plot_design' deve ser igual a", '{len}', 'mas seu tamanho é', '{len}'),
+            6: ("O parâmetro 'plot_design' deve ter estas, e apeas estas, chaves:",),
+            7: ('Erro: não é uma lista',),
+            8: ('O valor para a chave', '{key}', 'deve ser uma lista, mas é do tipo', '{type}'),
+            9: ('Erro: tamanhos não são iguais',),
+            10: ('O comprimento da lista contida na chave', '{chave}', 'deve ser', '{len}', 'mas seu compriemnto é', '{len}'),
+            11: ('Esta lista deve ser da seguinte forma:',),
+            12: ('Erro: os tipos não coincidem',),
+            13: ('O tipo do elemento', '{i}', 'da chave', '{chave}', 'deve ser', '{type}', 'mas é', '{type}'),
+        },
+        33: {
+            1: ('Erro: nenhuma correspondência de chave encontrada',),
+            2: ('A chave', '{value}', 'não é permitida'),
+            3: ('As chaves aceitas são:',),
+            4: ('Erro: combinação de chaves não suportada',),
+            5: ("A chave 'all' não pode ser combinada com outras chaves, mas obtivemos:",),
+        },
+        34: {
+            1: ('Erro: não é uma string',),
+            2: ('O nome do arquivo deve ser uma string, mas é do tipo', '{type}'),
+            3: ('Erro: string vazia',),
+            4: ('O nome do arquivo não pode ser vazio!',),
+        },
+        35: {
+            1: ("O teste de Kolmogorov Smirnov não foi realizado. Utilize o método 'fit' para realizar o teste.",),
+            2: ('Teste de Normalidade de Kolmogorov Smirnov',),
+        },
+        36: {
+            1: ('Erro: não é um matplotlib.axes.SubplotBase',),
+            2: ('O parâmetro', '{param_name}', "deve ser do tipo 'matplotlib.axes.SubplotBase', mas recebemos um parâmetro do tipo", '{type(value).__name__}'),
+        },
+        37: {
+            1: ("O teste de Lilliefors não foi realizado. Utilize o método 'fit' para realizar o teste.",),
+            2: ('Teste de Normalidade de Lilliefors',),
+        },
+        38: {
+            1: ('Alfa',),
+            2: ('Valores críticos do teste de', '{TestName}', ''),
+            3: ('Número de observações',),
+            4: ('Valores Críticos',),
+            5: ('O arquivo', '{file_name}', 'foi exportado!'),
+        },
+        39: {
+            1: ('Erro: número de observações muito pequeno',),
+            2: ('O número mínimo de observações para obter o valor crítico do teste de', '{TestName}', 'é', '{n}', 'mas obtivemos', '{n_rep}'),
+            3: ('Resultado', 'critico', 'alfa'),
+        },
+        40: {
+            1: ("O teste de AbdiMolin não foi realizado. Utilize o método 'fit' para realizar o teste.",),
+            2: ('Teste de Normalidade de AbdiMolin',),
+        },
+        41: {
+            1: ('Erro: tamanho incompatível!',),
+            2: ('O parâmetro', '{parameter}', 'deve ter 2 elementos, mas recebemos', '{len(parameter)}'),
+            3: ('Parametros',),
+            4: ('Resultado',),
+            5: ('Estatistica',),
+            6: ('Tabelado',),
+            7: ('p_valor',),
+            8: ('Alfa',),
+            9: ('Mensagem',),
+        },
+        42: {
+            1: ('Erro: valor muito pequeno',),
+            2: ('O parâmetro', '{param_name}', 'deve ser um número maior ou igual a', '{minimum}', 'mas obtivemos', '{value}'),
+        },
+        43: {
+            1: ('Parametros',),
+            2: ('Resultado',),
+            3: ('Estatistica',),
+            4: ('Tabelado',),
+            5: ('p_valor',),
+            6: ('Alfa',),
+            7: ('Mensagem',),
+            8: ('Dados',),
+            9: ('Valores',),
+        },
+        44: {
+            1: ('Erro: valor não suportado',),
+            2: ("O parâmetro 'details' aceita apenas 'short', 'full' ou 'binary' como valores, mas obtivemos", '{details}'),
+            3: ('O valor crítico para alfa', '{alfa}', 'não está disponível. Os valores de alfa disponíveis são:'),
+            4: ('Como o valor crítico (', '{critical}', ') >= estatística (', '{statistic}', '), nós NÃO temos evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de', '{test_name}', 'com', '{100*(1-alfa)}', '% de confiança.'),
+            5: ('Os dados são Normais com', '{100*(1-alfa)}', '% de confiança.'),
+            6: ('Como o valor crítico (', '{critical}', ') < estatística (', '{statistic}', '), nós TEMOS evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de', '{test_name}', 'com', '{100*(1-alfa)}', '% de confiança.'),
+            7: ('Os dados não são Normais com', '{100*(1-alfa)}', '% de confiança.'),
+            8: ('Como o p-valor (', '{p_value}', ') >= alfa (', '{alfa}', '), nós NÃO temos evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de', '{test_name}', 'com', '{100*(1-alfa)}', '% de confiança.'),
+            9: ('Como o p-valor (', '{p_value}', ') < alfa (', '{alfa}', '), nós TEMOS evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de', '{test_name}', 'com', '{100*(1-alfa)}', '% de confiança.'),
+            10: ('Resultado',),
+            11: ('Estatistica',),
+            12: ('Critico',),
+            13: ('p_valor',),
+            14: ('Alfa',),
+            15: ("O parâmetro 'comparison' aceita apenas 'critical' ou 'p-value' como valores, mas obtivemos", '{comparison}'),
+        },
+        45: {
+            1: ("O teste de AndersonDarling não foi realizado. Utilize o método 'fit' para realizar o teste.",),
+            2: ('Teste de Normalidade de AndersonDarling',),
+        },
+        46: {
+            1: ("O teste de ShapiroWilk não foi realizado. Utilize o método 'fit' para realizar o teste.",),
+            2: ('Teste de Normalidade de ShapiroWilk',),
+        },
+        47: {
+            1: ('Erro: valor não suportado',),
+            2: ("O parâmetro 'details' aceita apenas 'short' ou 'full' como valores, mas obtivemos", '{details}'),
+            3: ('O valor crítico para alfa', '{alfa}', 'não está disponível. Os valores de alfa disponíveis são:'),
+            4: ('Como o valor crítico (', '{critical}', ') <= estatística (', '{statistic}', '), nós NÃO temos evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            5: ('Os dados são Normais com', '{100*(1-alfa)}', '% de confiança.'),
+            6: ('Como o valor crítico (', '{critical}', ') > estatística (', '{statistic}', '), nós TEMOS evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            7: ('Os dados não são Normais com', '{100*(1-alfa)}', '% de confiança.'),
+            8: ('Como o p-valor (', '{p_value}', ') >= alfa (', '{alfa}', '), nós NÃO temos evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            9: ('Como o p-valor (', '{p_value}', ') < alfa (', '{alfa}', '), nós TEMOS evidências para rejeitar a hipótese de normalidade dos dados, de acordo com o teste de Shapiro Wilk com', '{100*(1-alfa)}', '% de confiança.'),
+            10: ('Resultado',),
+            11: ('Estatistica',),
+            12: ('Critico',),
+            13: ('p_valor',),
+            14: ('Alfa',),
+            15: ("O parâmetro 'conclusion' aceita apenas 'critical' ou 'p-value' como valores, mas obtivemos", '{conclusion}'),
+        },
+        48: {
+            1: ("O NormalityCheck ainda não foi realizado. Utilize o método 'check' para realizar o teste.",),
+            2: ('NormalityCheck',),
+            3: ('Erro: valor não permitido',),
+            4: ('O parâmetro', '{test}', 'não aceita o valor', '{test}', 'Os valores aceitos são', '{values}'),
+            5: ('UserWarning',),
+            6: ("O teste de Abdi-Molin não suporta o parâmetro 'conclusion'",),
+            7: ('A comparação será feita comparando a estatística do teste com o respectivo valor crítico',),
+            8: ('Conclusao',),
+            9: ('n',),
+        },
+        49: {
+            1: ('Erro: resultados não encontrados',),
+            2: ("Os cálculos ainda não foram realizados para esta amostra. Utilize o método 'fit' para estimar as estatísticas da", '{name}'),
+            3: ('Class de avaliação de uma amostra',),
+            4: ('Amostra',),
+            5: ('com média',),
+            6: ('Média',),
+            7: ('Variância',),
+            8: ('Desvio padrão',),
+            9: ('Intervalo de confiança', '{100*(1-alfa)}', '%'),
+            10: ('Coeficiente de variação (%)',),
+            11: ('com', '{100*(1-self.alfa)}', '% de confiança'),
+            12: ('Mínimo',),
+            13: ('Q1',),
+            14: ('Mediana',),
+            15: ('Q3',),
+            16: ('Máximo',),
+            17: ('Distância interquartílica',),
+            18: ('Erro: teste de Normalidade não avaliado',),
+            19: ("O teste de Normalidade precisa da amostra inteira, então não é avaliado quando os dados são lidos em partes ('x_source' ou 'numpy.memmap'). Utilize o método 'fit' com os dados em memória ('x_exp') para verificar a Normalidade da",),
+        },
+        50: {
+            1: ('Erro: o tamanho não confere',),
+            2: ('O parâmetro', '{param_name}', 'deve ter tamanho igual a', '{n}', 'mas seu tamanho é', '{len(value)}'),
+        },
+        51: {
+            1: ('Erro: Key não aceita',),
+            2: ('O parâmetro', '{which}', 'aceita apenas', '{bilateral}', 'ou', '{unilateral}', 'como key, mas recebemos', '{which}'),
+            3: ('Densidade de probabilidade',),
+            4: ('$t$ de Student',),
+            5: ('Erro: intevalo não permitido',),
+            6: ('O primeiro elemento do parâmetro', '{interval}', 'deve ser menor do que o seu segundo elemento, mas', '{interval[0] > interval[1]}'),
+            7: ('O primeiro elemento do parâmetro', '{interval}', 'deve ser menor do que o seu segundo elemento, mas eles são iguais', '{interval[0] = interval[1]}'),
+            8: ('UserWaring',),
+            9: ('Os intervalos não são simétricos! Isto faz com que o gráfico fique deslocado!',),
+            10: ('Região de rejeição',),
+            11: ('Região de aceitação',),
+            12: ('Distribuição t de Student',),
+            13: ('Student', 'Superior', 'Inferior', 'Alfa', 'Distribuicao'),
+            14: ('A média (', '{mean}', ') é igual a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            15: ('Como a estatística do teste (', '{statistic}', ') é um número entre os valores críticos (', '{critical_low},{Critical_high}', ') não existem evidências para rejeitar a hipótese nula, e podemos dizer que a média (', '{mean}', ') é igual a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            16: ('A média (', '{mean}', ') é diferente da constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            17: ('Como a estatística do teste (', '{statistic}', ') é maior do que o valor crítico superior (', '{critical_high}', ') temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{mean}', ') é diferente da constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            18: ('Como a estatística do teste (', '{statistic}', ') é menor do que o valor crítico inferior (', '{critical_low}', ') temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{mean}', ') é diferente da constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            19: ('Como o p-valor (', '{p_value}', ') é menor do que o nível de significância adotado (', '{alfa}', '),  temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{mean}', ') é diferente da constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            20: ('Como o p-valor (', '{p_value}', ') é maior do que o nível de significância adotado (', '{alfa}', '), nós não temos evidências para rejeitar a hipótese nula de igualdade entre a médias, e podemos dizer que a média (', '{mean}', ') é igual a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            21: ('OneSampleStudentComparison', 'estatistica', 'critico', 'p_valor', 'alfa'),
+            22: ('A média (', '{x_exp.mean}', ') é maior do que a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            23: ('Como a estatística do teste (', '{statistic}', ') é maior do que o valor crítico inferior (', '{critical.Lower}', '), não temos evidências para rejeitar a hipótese nula de igualdade entre a médias, e podemos dizer que a média (', '{mean}', ') é igual a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            24: ('Como a estatística do teste (', '{statistic}', ') é menor do que o valor crítico superior (', '{critical.Lower}', '), não temos evidências para rejeitar a hipótese nula de igualdade entre a médias, e podemos dizer que a média (', '{mean}', ') é igual a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            25: ('Como o p-valor (', '{p_value}', ') é menor do que o nível de significância adotado (', '{alfa}', '), temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{mean}', ') é maior do que a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            26: ('Como o p-valor (', '{p_value}', ') é maior do que o nível de signficância adotado (', '{alfa}', '), não temos evidências para rejeitar a hipótese nula de igualdade entre as médias, e podemos dizer que a média (', '{mean}', ') é igual a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            27: ('A constante (', '{value}', ') e a média (', '{mean}', ') são exatamente iguais'),
+            28: ('A média (', '{x_exp.mean}', ') é menor do que a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            29: ('Como a estatística do teste (', '{statistic}', ') é menor do que o valor crítico inferior (', '{critical[1]}', '), temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{x_exp.mean()}', ') é menor do que a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            30: ('Como o p-valor (', '{p_value}', ') é menor do que o nível de significância adotado (', '{alfa}', '), temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{mean}', ') é menor do que a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+            31: ('O parâmetro', '{param_name}', 'aceita como chave apenas', '{critical}', 'ou', '{p-value}', 'mas recebemos', '{comparison}'),
+            32: ('Como a estatística do teste (', '{statistic}', ') é maior do que o valor crítico superior (', '{critical_high}', ') temos evidências para rejeitar a hipótese nula de igualdade das médias, e podemos dizer que a média (', '{mean}', ') é maior do que a constante (', '{value}', ') (com', '{100*(1-alfa)}', '% de confiança)'),
+        },
+        52: {
+            1: ('Erro: Tamanho amostral não aceito',),
+            2: ('O tamanho amostral mínimo para o parâmetro', '{param_name}', 'é', '{value}', 'mas recebemos uma amostra com tamanho', '{array.size}'),
+        },
+        53: {
+            1: ('Erro: Separador de casas decimais não permitido',),
+            2: ('O caractere', '{character}', 'não pode ser utilizado como separador de casas decimais'),
+            3: ('Os caracteres permitidos são:',),
+        },
+        54: {
+            1: ('Erro: Divisão por zero/quase zero',),
+            2: ('O desvio padrão da amostra (', '{std}', ') é menor que 10E-6, o que torna os resultados imprecisos.'),
+            3: ('A Curtose é Normal (', '{100*(1-alfa}', '% de confiança)'),
+            4: ('A Curtose é NÃO Normal (', '{100*(1-alfa}', '% de confiança)'),
+            5: ('Como a estatistica calculada para a curtose (', '{kurtosis}', ') é um valor entre o valor crítico inferior (', '{lower}', ') e o valor critico superior (', '{upper}', '), não temos evidências para rejeitar a hipótese nula de que a distribuição apresenta curtose similar a curtose de uma distribuição Normal (com ', '{100*(1-alfa)}', '% de confiança).'),
+            6: ('Como a estatistica calculada para a curtose (', '{kurtosis}', ') é um valor maior do que o valor crítico superior (', '{upper}', '), temos evidências para rejeitar a hipótese nula, e podemos dizer que a distribuição não apresenta curtose similar a curtose de uma distribuição Normal (com', '{100*(1-alfa)}', '% de confiança).'),
+            7: ('Como a estatistica calculada para a curtose (', '{kurtosis}', ') é um valor menor do que o valor crítico inferior (', '{lower}', '), temos evidências para rejeitar a hipótese nula, e podemos dizer que a distribuição não apresenta curtose similar a curtose de uma distribuição Normal (com', '{100*(1-alfa)}', '% de confiança).'),
+            8: ('ResultadoCurtose', 'Estatistica', 'Critico', 'Alfa', 'ResultadoAssimetria'),
+            9: ('A Assimetria é Normal (', '{100*(1-alfa}', '% de confiança)'),
+            10: ('A Assimetria é NÃO Normal (', '{100*(1-alfa}', '% de confiança)'),
+            11: ('Como a estatistica calculada para a assimetria (', '{skewness}', ') é um valor entre o valor crítico inferior (', '{lower}', ') e o valor critico superior (', '{upper}', '), não temos evidências para rejeitar a hipótese nula de que a distribuição apresenta assimetria similar a assimetria de uma distribuição Normal (com ', '{100*(1-alfa)}', '% de confiança).'),
+            12: ('Como a estatistica calculada para a assimetria (', '{skewness}', ') é um valor maior do que o valor crítico superior (', '{upper}', '), temos evidências para rejeitar a hipótese nula, e podemos dizer que a distribuição não apresenta assimetria similar a assimetria de uma distribuição Normal (com', '{100*(1-alfa)}', '% de confiança).'),
+            13: ('Como a estatistica calculada para a assimetria (', '{skewness}', ') é um valor menor do que o valor crítico inferior (', '{lower}', '), temos evidências para rejeitar a hipótese nula, e podemos dizer que a distribuição não apresenta assimetria similar a assimetria de uma distribuição Normal (com', '{100*(1-alfa)}', '% de confiança).'),
+            14: ('Medidas de Curtose e Assimetria',),
+        },
+        55: {
+            1: ('Erro: ratio não permitido',),
+            2: ("O parâmetro 'ratio' não aceita a chave", '{ratio}', 'As chaves aceitas são as seguintes:'),
+            3: ('O valor inferior (', '{x_exp[0]}', ') talvez seja um outlier (com', '{100*(1-alfa)}', '% de confiança)'),
+            4: ('Como o valor da estatistica do teste (', '{q_low}', ') é maior do que o valor crítico (', '{critical}', '), temos evidências para rejeitar a hipótese nula de que a amostra não contém outliers, e talvez o valor inferior (', '{x_exp[0]}', ') seja um outlier (com', '{100*(1-alfa)}', '% de confiança)'),
+            5: ('Os dados não apresentam outliers (com', '{100*(1-alfa)}', '% de confiança)'),
+            6: ('Como o valor da estatistica do teste (', '{q_low}', ') é menor do que o valor crítico (', '{critical}', '), não temos evidências para rejeitar a hipótese nula de que a amostra não contém outliers (com', '{100*(1-alfa)}', '% de confiança)'),
+            7: ('O valor superior (', '{x_exp[-1]}', ') talvez seja um outlier (com', '{100*(1-alfa)}', '% de confiança)'),
+            8: ('Como o valor da estatistica do teste (', '{q_upper}', ') é maior do que o valor crítico (', '{critical}', '), temos evidências para rejeitar a hipótese nula de que a amostra não contém outliers, e talvez o valor superior (', '{x_exp[-1]}', ') seja um outlier (com', '{100*(1-alfa)}', '% de confiança)'),
+            9: ('Erro: chave não suportada', "O parâmetro 'which' aceita apenas 'min' or 'max' como chaves, mas recebemos", '{which}'),
+            10: ('Erro: Divisão por zero',),
+            11: ('Os valores nas posições', '{position_1}', '(', '{x_exp[position_1]}', ') e', '{position_2}', '(', '{x_exp[position_2]}', ') não podem ser iguais, pois isto leva a um erro de divisão por zero'),
+            12: ('Teste de Dixon para detecção de outliers',),
+        },
+        56: {
+            1: ('Erro: valor muito grande',),
+            2: ('O parâmetro', '{param_name}', 'deve ser um número menor ou igual a', '{maximum}', 'mas obtivemos', '{value}'),
+        },
+        57: {
+            1: ('Resultado', 'Critico', 'alfa', 'Estatistica', 'Outlier', 'Intervalo'),
+            2: ('O teste de', '{test_name}', "não foi realizado. Utilize o método 'fit' para realizar o teste."),
+            3: ('Erro: valor não suportado',),
+            4: ('O parâmetro', '{param_name}', 'aceita apenas os seguintes chaves', '{list_of_keys}', 'Mas recebemos', '{param_value}'),
+            5: ('Erro: Divisão por zero',),
+            6: ('O desvio padrão estimado para o conjunto de dados é igual ou muito próximo a zero, o que causou a um erro de divisão por zero.',),
+        },
+        58: {
+            1: ('Erro: chave não suportada', "O parâmetro 'which' aceita apenas 'min' or 'max' como chaves, mas recebemos", '{which}'),
+            2: ('O conjunto de dados não tem outliers',),
+            3: ('O conjunto de dados tem outliers',),
+            4: ('Teste Z para detecção de outliers',),
+            5: ('Teste Z Modificado para detecção de outliers',),
+            6: ('A mediana estimada dos desvios absolutos sobre a mediana para o conjunto de dados é igual ou muito próxima de zero, o que causou um erro de divisão por zero.',),
+            7: ('Erro: Divisão por zero',),
+            8: ('Teste de Tukey para detecção de outliers',),
+        },
+        59: {
+            1: ('Erro: Divisão por zero',),
+            2: ('Os valores nas posições', '{position_1}', '(', '{x_exp[position_1]}', ') e', '{position_2}', '(', '{x_exp[position_2]}', ') não podem ser iguais, pois isto leva a um erro de divisão por zero'),
+        },
+        60: {
+            1: ('ResultadoDistanciaInterquartilica', 'DistanciaInterquartilica', 'PrimeiroQuartil', 'TerceiroQuartil'),
+        },
+        61: {
+            1: ('Erro: kind não permitido',),
+            2: ("O parâmetro 'kind' não aceita a chave", '{kind}', 'As chaves aceitas são as seguintes:'),
+            3: ('Erro: alfa não encontrado',),
+            4: ('Teste de Grubbs para detecção de outliers',),
+            5: ('O desvio padrão da amostra não pode ser igual a zero, pois isto causa em erro de divisão por zero',),
+            6: ('Os dados não contém outliers (', '{100*(1-alfa)}', '% de confiança)'),
+            7: ('Como a estatística do teste (', '{statistic}', ') é menor do que o valor crítico (', '{critical}', '), nós não temos evidências para rejeitar a hipótese nula de que a amostra não contém outliers (', '{100*(1-alfa)}', '% de confiança)'),
+            8: ('A amostra', '{outlier}', 'talvez seja um outlier (', '{100*(1-alfa)}', '% de confiança)'),
+            9: ('Como a estatística do teste (', '{statistic}', ') é maior do que o valor crítico (', '{critical}', '), temos evidências para rejeitar a hipótese nula, e talvez a amostra', '{outlier}', 'seja um outlier (', '{100*(1-alfa)}', '% de confiança)'),
+            10: ('As amostras', '{outlier}', 'e', '{outlier}', 'talvez sejam outliers (', '{100*(1-alfa)}', '% de confiança)'),
+            11: ('Como a estatística do teste (', '{statistic}', ') é menor do que o valor crítico (', '{critical}', '), temos evidências para rejeitar a hipótese nula, e talvez aa amostras', '{outlier}', 'e', '{outlier}', 'sejam outliers (', '{100*(1-alfa)}', '% de confiança)'),
+            12: ('Como a estatística do teste (', '{statistic}', ') é maior do que o valor crítico (', '{critical}', '), nós não temos evidências para rejeitar a hipótese nula de que a amostra não contém outliers (', '{100*(1-alfa)}', '% de confiança)'),
+            13: ('Como a estatística do teste (', '{statistic}', ') é maior do que o valor crítico (', '{critical}', '), temos evidências para rejeitar a hipótese nula, e talvez as amostras', '{outlier}', 'e', '{outlier}', 'sejam outliers (', '{100*(1-alfa)}', '% de confiança)'),
+        },
+        62: {
+            1: ('Erro: não é um numpy array',),
+            2: ('O parâmetro', '{param_name}', 'deve ser um numpy array, mas obtivemos um parâmetro do tipo', '{type(value).__name__}'),
+            3: ('Erro: numpy array sem duas dimensões',),
+            4: ('O parâmetro', '{param_name}', 'deve ser um numpy array com duas dimensões, mas obtivemos um numpy array com '),
+            5: ('Erro: numpy array é vazio',),
+            6: ('O parâmetro', '{param_name}', 'não pode ser vazio, mas seu formato é'),
+        },
+        64: {
+            1: ('Executor paralelo com o número de processos igual a',),
+            2: ('ParallelExecutor',),
+            3: ('Erro: teste inválido',),
+            4: ('O teste deve ser uma classe com o método', '{method}', ', mas recebemos', '{test}'),
+        },
+        65: {
+            1: ('Tabela Monte Carlo de valores críticos com o número de replicações igual a',),
+            2: ('MonteCarloTable',),
+        },
+        66: {
+            1: ('Erro: resultados não encontrados',),
+            2: ("Nenhum dado foi adicionado a esta amostra ainda. Utilize o método 'push' para adicionar dados à", '{name}'),
+            3: ('Classe de avaliação de uma amostra contínua',),
+            4: ('Amostra contínua',),
+            5: ('Erro: as amostras não podem ser combinadas',),
+            6: ("O parâmetro 'other' deve ser um StreamingSample, mas recebemos",),
+        },
+        67: {
+            1: ('Sketch de quantis com erro de posto normalizado de',),
+            2: ('QuantileSketch',),
+            3: ('Erro: os sketches não podem ser combinados',),
+            4: ("O parâmetro 'other' deve ser um QuantileSketch, mas recebemos",),
+            5: ('Erro: o sketch está vazio',),
+            6: ("Utilize o método 'push' para adicionar dados ao sketch",),
+        },
+        68: {
+            1: ("Os parâmetros 'x_exp' e 'x_source' não podem ser usados juntos",),
+            2: ("Use o parâmetro 'x_exp' para dados em memória ou o parâmetro 'x_source' para dados lidos em partes, mas não ambos.",),
+        },
+        69: {
+            1: ("O parâmetro 'x_source' não é válido",),
+            2: ("O parâmetro 'x_source' deve ser o caminho de um arquivo, um numpy array ou um iterável de numpy arrays, mas recebemos",),
+            3: ('A fonte de dados só pode ser lida uma vez',),
+            4: ("Este teste lê os dados duas vezes, então 'x_source' deve ser o caminho de um arquivo, um numpy array ou uma lista de numpy arrays (não um iterador).",),
+        },
+    },
+}
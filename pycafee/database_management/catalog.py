@@ -0,0 +1,206 @@
+"""This module compiles the messages stored on ``main_database.db`` into a plain Python module (``pycafee/data/messages_catalog.py``)
+
+The compiled module is what the library reads at runtime, so the messages are available with a simple import, without opening SQLite.
+The database is still the source of truth: after editing it (e.g., with :func:`_add_messages`), the catalog must be rebuilt with::
+
+    python -m pycafee.database_management.catalog
+
+"""
+
+# Function list:
+#     - _add_messages(func_name, messages, database_name="main_database.db", fk_id_contributor=1)
+#     - _read_database(database_name="main_database.db")
+#     - _render_catalog(languages, functions, messages, schema_version)
+#     - build_catalog(database_name="main_database.db", output=None)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+from pathlib import Path
+
+###### Third part ######
+
+
+###### Home made ######
+from pycafee.database_management import management
+
+
+###########################################
+################ Functions ################
+###########################################
+
+
+def _add_messages(func_name, messages, database_name="main_database.db", fk_id_contributor=1):
+    """Adds new messages to the database (authoring only)
+
+    The function is created on the ``Funcao`` table if it does not exist yet. For each position, the ``'univ'`` template is created from the ``'en'`` message, replacing the text slices by ``'Text'`` and keeping the placeholders (the slices between braces).
+
+    Parameters
+    ----------
+    func_name : ``str``
+        The name of the function (``Funcao.nome``)
+    messages : ``dict``
+        A dict in the form ``{language: {position: (slice, slice, ...)}}``. It must contain the ``'en'`` language.
+    database_name : ``str``
+        The name of the database stored on the ``'../data/'`` folder (default = ``"main_database.db"``)
+    fk_id_contributor : ``int``
+        The id of the contributor (default = ``1``)
+
+    Notes
+    -----
+    The positions must be new: the ``UNIQUE(fk_id_function, position, fk_id_language)`` constraint rejects changes on existing messages.
+    Remember to rebuild the catalog afterwards.
+
+    """
+    _cursor, _connection = management._connecting_to_database(database_name)
+    try:
+        _cursor.execute("INSERT OR IGNORE INTO Funcao (nome) VALUES (?)", (func_name,))
+        _cursor.execute("SELECT id_funcao FROM Funcao WHERE nome = ?", (func_name,))
+        fk_id_function = _cursor.fetchone()[0]
+        _cursor.execute("SELECT language, id_language FROM Language")
+        languages = dict(_cursor.fetchall())
+
+        messages = dict(messages)
+        messages["univ"] = {
+            position: tuple(slice if slice.startswith("{") and slice.endswith("}") else "Text" for slice in slices)
+            for position, slices in messages["en"].items()
+        }
+        for language, positions in messages.items():
+            for position, slices in positions.items():
+                _cursor.execute(
+                    "INSERT INTO Message (position, fk_id_function, fk_id_contributor, fk_id_language) VALUES (?, ?, ?, ?)",
+                    (position, fk_id_function, fk_id_contributor, languages[language])
+                )
+                fk_id_message = _cursor.lastrowid
+                _cursor.executemany(
+                    "INSERT INTO Message_Slices (message, fk_id_message) VALUES (?, ?)",
+                    [(slice, fk_id_message) for slice in slices]
+                )
+        _connection.commit()
+    except Exception:
+        _connection.rollback()
+        raise
+    finally:
+        _cursor.close()
+        _connection.close()
+    return fk_id_function
+
+def _read_database(database_name="main_database.db"):
+    """Reads all the languages, functions and messages of the database
+
+    Parameters
+    ----------
+    database_name : ``str``
+        The name of the database stored on the ``'../data/'`` folder (default = ``"main_database.db"``)
+
+    Returns
+    -------
+    languages : ``dict``
+        A dict in the form ``{language: id_language}`` (including ``'univ'``)
+    functions : ``dict``
+        A dict in the form ``{nome: id_funcao}``
+    messages : ``dict``
+        A dict in the form ``{id_language: {fk_id_function: {position: (slice, slice, ...)}}}``
+
+    """
+    _cursor, _connection = management._connecting_to_database(database_name)
+    _cursor.execute("SELECT language, id_language FROM Language ORDER BY id_language")
+    languages = dict(_cursor.fetchall())
+    _cursor.execute("SELECT nome, id_funcao FROM Funcao ORDER BY id_funcao")
+    functions = dict(_cursor.fetchall())
+    _cursor.execute("""
+    SELECT
+        Message.fk_id_language,
+        Message.fk_id_function,
+        Message.position,
+        Message_slices.message
+    FROM
+        Message_slices
+    LEFT JOIN
+        Message
+    ON
+        Message.id_message = Message_Slices.fk_id_message
+    ORDER BY
+        Message.fk_id_language, Message.fk_id_function, Message.position, Message_Slices.id_message_slice
+    ;
+    """)
+    query = _cursor.fetchall()
+    _cursor.close()
+    _connection.close()
+
+    messages = {}
+    for fk_id_language, fk_id_function, position, message in query:
+        positions = messages.setdefault(fk_id_language, {}).setdefault(fk_id_function, {})
+        positions[position] = positions.get(position, ()) + (message,)
+    return languages, functions, messages
+
+def _render_catalog(languages, functions, messages, schema_version):
+    """Renders the source code of the catalog module
+
+    Each message is written on its own line, so a change on the database gives a readable diff on the generated file.
+    """
+    lines = [
+        '"""Messages catalog compiled from ``main_database.db``',
+        '',
+        'This file is generated by ``python -m pycafee.database_management.catalog``. Do not edit it by hand.',
+        '"""',
+        '',
+        '# the schema version (PRAGMA user_version) of the database the catalog was compiled from',
+        f'SCHEMA_VERSION = {schema_version!r}',
+        '',
+        '# {language: id_language}',
+        'LANGUAGES = {',
+    ]
+    lines.extend(f"    {language!r}: {id_language!r}," for language, id_language in languages.items())
+    lines.append("}")
+    lines.append("")
+    lines.append("# {nome: id_funcao}")
+    lines.append("FUNCTIONS = {")
+    lines.extend(f"    {nome!r}: {id_funcao!r}," for nome, id_funcao in functions.items())
+    lines.append("}")
+    lines.append("")
+    lines.append("# {id_language: {fk_id_function: {position: (slice, ...)}}}")
+    lines.append("MESSAGES = {")
+    for fk_id_language, functions_messages in messages.items():
+        lines.append(f"    {fk_id_language!r}: {{")
+        for fk_id_function, positions in functions_messages.items():
+            lines.append(f"        {fk_id_function!r}: {{")
+            lines.extend(f"            {position!r}: {slices!r}," for position, slices in positions.items())
+            lines.append("        },")
+        lines.append("    },")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+def build_catalog(database_name="main_database.db", output=None):
+    """Compiles the messages of the database into ``pycafee/data/messages_catalog.py``
+
+    The database is migrated to the newest schema version before being read.
+
+    Parameters
+    ----------
+    database_name : ``str``
+        The name of the database stored on the ``'../data/'`` folder (default = ``"main_database.db"``)
+    output : ``str``, ``Path`` or ``None``
+        The path of the generated file. If ``None`` (default), the file is written at ``pycafee/data/messages_catalog.py``
+
+    Returns
+    -------
+    output : ``Path``
+        The path of the generated file
+
+    """
+    if output is None:
+        output = Path(__file__).parent / "../data/messages_catalog.py"
+    output = Path(output)
+    schema_version = management._migrate_database(database_name)
+    languages, functions, messages = _read_database(database_name)
+    output.write_text(_render_catalog(languages, functions, messages, schema_version), encoding="utf-8")
+    return output
+
+
+
+if __name__ == "__main__":
+    print(build_catalog().resolve())
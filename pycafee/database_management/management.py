@@ -4,10 +4,19 @@
 
 # Function list:
 #     - _connecting_to_database(database_name="main_database.db")
+#     - _get_read_only_connection()
+#     - _close_read_only_connection()
 #     - _get_all_available_languages()
 #     - _get_all_languages_for_func(func_name)
 #     - _get_current_default_language()
 #     - _get_messages(fk_id_function, language, func_name=None)
+#     - _load_language_ids()
+#     - _load_function_ids()
+#     - _load_messages_catalog(fk_id_language)
+#     - _clear_messages_cache()
+#     - _get_schema_version(_cursor)
+#     - _apply_migrations(_connection)
+#     - _migrate_database(database_name="main_database.db")
 #     - _query_func_id(func_name)
 #     - set_default_language(new_language)
 #     - display_all_available_languages()
@@ -21,8 +30,10 @@
 ###### Standard ######
 from collections import defaultdict
 import logging
+import os
 from pathlib import Path
 import sqlite3
+import threading
 import traceback
 
 ###### Third part ######
@@ -30,6 +41,58 @@ import traceback
 
 ###### Home made ######
 from pycafee.utils import general
+# catalog compiled from main_database.db (see pycafee.database_management.catalog)
+try:
+    from pycafee.data import messages_catalog
+except ImportError:
+    messages_catalog = None
+
+
+#####################################################
+################ Process-wide caches ################
+#####################################################
+
+# The messages never change at runtime (only the default language does), so the catalog is
+# read once per language and kept in memory. When the compiled catalog is available it is
+# used as is, and SQLite is only opened as a fallback. The lock guards the first load, when
+# several threads may try to fill the same language at the same time.
+_CATALOG_LOCK = threading.RLock()
+# {nome: id_funcao}
+_FUNCTION_IDS = {}
+# {language: id_language}, including 'univ'
+_LANGUAGE_IDS = {}
+# {id_language: {fk_id_function: {position: (slice, ...)}}}
+_MESSAGES_CATALOG = {}
+# {default_parameter: default_input}, read from the Default_Values table
+_DEFAULT_VALUES = {}
+# one long-lived read-only connection per thread (see _get_read_only_connection)
+_THREAD_LOCAL = threading.local()
+
+
+###############################################
+################ Schema versions ################
+###############################################
+
+# Each migration is a (version, statements) pair, applied in order to any database whose
+# 'PRAGMA user_version' is lower than the version. The shipped database is already migrated;
+# the list lets an older copy (or one edited with an older schema) catch up on its own.
+# Never change an applied migration: always append a new one.
+_MIGRATIONS = [
+    (1, (
+        # _get_messages/_load_messages_catalog join the slices to the message through fk_id_message,
+        # which had no index, so each lookup was a full scan of Message_Slices
+        """CREATE INDEX IF NOT EXISTS idx_message_slices_fk_id_message
+            ON Message_Slices (fk_id_message, id_message_slice, message)""",
+        # filtering by function and language (_get_messages, _get_all_languages_for_func)
+        """CREATE INDEX IF NOT EXISTS idx_message_fk_id_function_fk_id_language
+            ON Message (fk_id_function, fk_id_language, position, id_message)""",
+        """CREATE INDEX IF NOT EXISTS idx_message_fk_id_language
+            ON Message (fk_id_language, fk_id_function, position, id_message)""",
+    )),
+]
+
+# the version of the newest migration
+SCHEMA_VERSION = _MIGRATIONS[-1][0]
 
 
 ###########################################
@@ -97,20 +160,55 @@ def _connecting_to_database(database_name="main_database.db"):
 
     return _cursor, _connection
 
+def _get_read_only_connection():
+    """Returns the read-only connection to ``main_database.db`` of the current thread
+
+    The connection is opened on the first call of each thread and then kept open, so the reading helpers do not pay for
+    opening the database (and sqlite3 reuses its prepared statements). The callers must not close it.
+
+    Returns
+    -------
+    _connection : <class 'sqlite3.Connection'>
+
+    Notes
+    -----
+    The database is opened with ``mode=ro``, but not as ``immutable``, because :func:`set_default_language` may change it.
+    A connection inherited from a parent process (``fork``) is never reused.
+
+    """
+    _connection = getattr(_THREAD_LOCAL, "connection", None)
+    if _connection is None or _THREAD_LOCAL.pid != os.getpid():
+        database = (Path(__file__).parent / "../data/main_database.db").resolve()
+        if database.exists() == False:
+            try:
+                raise FileNotFoundError("FileNotFoundError")
+            except FileNotFoundError:
+                general._display_two_line_attention(
+                    text1 = f"The 'main_database.db' does not exist. Please, check the instalation files.",
+                    text2 =  "Most likely it will be necessary to reinstall the library or recreate the database!"
+                    )
+                raise
+        _connection = sqlite3.connect(f"{database.as_uri()}?mode=ro", uri=True)
+        _THREAD_LOCAL.connection = _connection
+        _THREAD_LOCAL.pid = os.getpid()
+    return _connection
+
+def _close_read_only_connection():
+    """Closes the read-only connection of the current thread, if it is open
+    """
+    _connection = getattr(_THREAD_LOCAL, "connection", None)
+    if _connection is not None:
+        if _THREAD_LOCAL.pid == os.getpid():
+            _connection.close()
+        _THREAD_LOCAL.connection = None
+
 # with tests (OK)
 def _get_all_available_languages():
     """Return all the languages available
     """
-    _cursor, _connection = _connecting_to_database()
-    ## quering
-    # getting all the available languages
-    _cursor.execute("SELECT language, id_language FROM Language")
-    all_languages = dict(_cursor.fetchall())
+    all_languages = dict(_load_language_ids())
     # removindo the 'universal' language to avoid problems
     all_languages.pop('univ', None)
-    # closing the _cursor/_connection
-    _cursor.close()
-    _connection.close()
     return all_languages
 
 # with tests (OK)
@@ -129,39 +227,11 @@ def _get_all_languages_for_func(func_name):
             raise
     # obtendo o id da função
     func_id = _query_func_id(func_name)
-    # conectando com a database
-    _cursor, _connection = _connecting_to_database()
-    # fazendo a query
-    _cursor.execute("""
-        SELECT DISTINCT
-            Language.language,
-            Message.fk_id_language
-        FROM
-            (Message_Slices
-        LEFT JOIN
-            Message
-        ON
-            Message.id_message = Message_Slices.fk_id_message)
-        LEFT JOIN
-            Language
-        ON
-            Language.id_language = Message.fk_id_language
-        WHERE
-            Message.fk_id_function = ?
-        ;
-    """, (func_id,))
-
-    all_languages_for_func = _cursor.fetchall()
-
-    # verificando se a quary retornou algo diferente de None, o que não deve acontecer
-    if all_languages_for_func is None:
-        try:
-            raise ValueError("FunctionNotFound")
-        except ValueError:
-            general._display_one_line_attention(
-                text = f"No language found for {func_name}."
-            )
-            raise
+    # buscando os idiomas que possuem mensagens para a função
+    all_languages_for_func = [
+        (language, id_language) for language, id_language in _load_language_ids().items()
+        if func_id in _load_messages_catalog(id_language)
+    ]
 
     # transformando em um dicionário
     all_languages_for_func = dict(all_languages_for_func)
@@ -190,40 +260,40 @@ def _get_all_languages_for_func(func_name):
                 text2 = f"This is a very unexpected error. Please, send details to andersonmdcanteli@gmail.com."
             )
             raise
-    # closing the _cursor/_connection
-    _cursor.close()
-    _connection.close()
     # retornando todos os idiomas disponíveis
     return all_languages_for_func
 
 # with tests (OK)
 def _get_current_default_language():
     """Gets the current default language
+
+    The value is read once per process and kept until :func:`set_default_language` changes it.
     """
-    _cursor, _connection = _connecting_to_database()
-    _cursor.execute("SELECT default_input FROM Default_Values WHERE default_parameter = 'language'")
-    default_language = _cursor.fetchone()
-    # closing the _cursor/_connection
-    _cursor.close()
-    _connection.close()
+    default_language = _DEFAULT_VALUES.get("language")
+    if default_language is None:
+        with _CATALOG_LOCK:
+            _cursor = _get_read_only_connection().execute("SELECT default_input FROM Default_Values WHERE default_parameter = 'language'")
+            default_language = _cursor.fetchone()[0]
+            _cursor.close()
+            _DEFAULT_VALUES["language"] = default_language
 
-    return default_language[0]
+    return default_language
 
 # with A test (OK)
 # maybe, add a detault text just for testing on the database
-def _get_messages(fk_id_function, language, func_name):
+def _get_messages(fk_id_function, language, func_name=None):
     """
-    Function to get the messages for each function on the database
+    Function to get the messages for each function on the database.
+
+    The messages are served from an in-memory catalog, which is loaded once per language (see :func:`_load_messages_catalog`).
+    The returned value is a copy, so the caller may change it freely.
     """
-    _cursor, _connection = _connecting_to_database()
+    language_ids = _load_language_ids()
 
     # obtendo a id_language
-    _cursor.execute("""
-        SELECT id_language FROM Language WHERE language = ?;
-    """, (language,))
-
-    result = _cursor.fetchone()
-    if result is None:
+    if language in language_ids:
+        fk_id_language = language_ids[language]
+    else:
         # aqui a ideia é aoi inves de retornar para o ingles, que retorne para o padrão. Mas por enquanto, fica assim mesmo.
         # current_default_language = _get_current_default_language()
         # print(current_default_language)
@@ -232,55 +302,106 @@ def _get_messages(fk_id_function, language, func_name):
             text2 = "The English language will be used."
         )
         fk_id_language = 2 # en
-    else:
-        fk_id_language = result[0]
-
 
-    # fazendo a query
-    _cursor.execute("""
-    SELECT
-        Message.position,
-        Message_slices.message
-    FROM
-        Message_slices
-    LEFT JOIN
-        Message
-    ON
-        Message.id_message = Message_Slices.fk_id_message
-    WHERE
-        Message.fk_id_function = ? AND Message.fk_id_language = ?
-    ;
-    """, (fk_id_function, fk_id_language))
-
-    query = _cursor.fetchall()
+    catalog = _load_messages_catalog(fk_id_language)
     messages = defaultdict(list)
-    for x, y in query:
-        messages[x].append([y])
-    # print(query)
-    # fechando o cursor/connection
-    _cursor.close()
-    _connection.close()
+    for position, slices in catalog.get(fk_id_function, {}).items():
+        messages[position] = [[slice] for slice in slices]
     return messages
 
+def _load_language_ids():
+    """Returns the ``{language: id_language}`` dict (including ``'univ'``), reading the compiled catalog (or the database) only on the first call.
+    """
+    if not _LANGUAGE_IDS:
+        with _CATALOG_LOCK:
+            if not _LANGUAGE_IDS and messages_catalog is not None:
+                _LANGUAGE_IDS.update(messages_catalog.LANGUAGES)
+            elif not _LANGUAGE_IDS:
+                _cursor = _get_read_only_connection().execute("SELECT language, id_language FROM Language")
+                _LANGUAGE_IDS.update(_cursor.fetchall())
+                _cursor.close()
+    return _LANGUAGE_IDS
+
+def _load_function_ids():
+    """Returns the ``{nome: id_funcao}`` dict of the ``Funcao`` table, reading the compiled catalog (or the database) only on the first call.
+    """
+    if not _FUNCTION_IDS:
+        with _CATALOG_LOCK:
+            if not _FUNCTION_IDS and messages_catalog is not None:
+                _FUNCTION_IDS.update(messages_catalog.FUNCTIONS)
+            elif not _FUNCTION_IDS:
+                _cursor = _get_read_only_connection().execute("SELECT nome, id_funcao FROM Funcao")
+                _FUNCTION_IDS.update(_cursor.fetchall())
+                _cursor.close()
+    return _FUNCTION_IDS
+
+def _load_messages_catalog(fk_id_language):
+    """Returns all the messages of one language, reading the compiled catalog (or the database) only on the first call.
+
+    Parameters
+    ----------
+    fk_id_language : ``int``
+        The id of the language (see the ``Language`` table)
+
+    Returns
+    -------
+    catalog : ``dict``
+        A dict in the form ``{fk_id_function: {position: (slice, slice, ...)}}``. It is shared by the whole process and must not be changed.
+
+    """
+    catalog = _MESSAGES_CATALOG.get(fk_id_language)
+    if catalog is None:
+        with _CATALOG_LOCK:
+            catalog = _MESSAGES_CATALOG.get(fk_id_language)
+            if catalog is None and messages_catalog is not None:
+                catalog = messages_catalog.MESSAGES.get(fk_id_language, {})
+                _MESSAGES_CATALOG[fk_id_language] = catalog
+            elif catalog is None:
+                _cursor = _get_read_only_connection().execute("""
+                SELECT
+                    Message.fk_id_function,
+                    Message.position,
+                    Message_slices.message
+                FROM
+                    Message_slices
+                LEFT JOIN
+                    Message
+                ON
+                    Message.id_message = Message_Slices.fk_id_message
+                WHERE
+                    Message.fk_id_language = ?
+                ORDER BY
+                    Message_Slices.id_message_slice
+                ;
+                """, (fk_id_language,))
+                query = _cursor.fetchall()
+                _cursor.close()
+                catalog = {}
+                for fk_id_function, position, message in query:
+                    positions = catalog.setdefault(fk_id_function, {})
+                    positions[position] = positions.get(position, ()) + (message,)
+                _MESSAGES_CATALOG[fk_id_language] = catalog
+    return catalog
+
+def _clear_messages_cache():
+    """Drops everything that was cached from the database (including the default language), so the next call reads it again.
+    """
+    with _CATALOG_LOCK:
+        _DEFAULT_VALUES.clear()
+        _FUNCTION_IDS.clear()
+        _LANGUAGE_IDS.clear()
+        _MESSAGES_CATALOG.clear()
+
 # with tests (OK)
 def _query_func_id(func_name):
     """
     Retorna o id_funcao de uma função.
     func_name é uma string com o nome da função desejada
     """
-    # conectando na database raiz
-    _cursor, _connection = _connecting_to_database()
-    # fazendo a query
-    _cursor.execute("""
-        SELECT
-            id_funcao
-        FROM
-            Funcao
-        WHERE
-            nome = ?
-    ;
-    """, (func_name,) )
-    func_id = _cursor.fetchone()
+    # buscando no catálogo em memória
+    func_id = None
+    if isinstance(func_name, str):
+        func_id = _load_function_ids().get(func_name)
     # verificando se a query foi sucesso. Se não, levantar ValueError
     if func_id is None:
         try:
@@ -292,7 +413,7 @@ def _query_func_id(func_name):
             raise
 
     # Verificando se o resultado é do tipo inteiro. Se não, levantar ValueError
-    if isinstance(func_id[0], int) == False:
+    if isinstance(func_id, int) == False:
         try:
             raise ValueError("IdNotInteger")
         except ValueError:
@@ -301,11 +422,77 @@ def _query_func_id(func_name):
                 text2 = f"This is a very unspected error. Please, send details to andersonmdcanteli@gmail.com."
             )
             raise
-    # fechando cursor e connection
+    # retornando apenas o id (como um int)
+    return func_id
+
+def _get_schema_version(_cursor):
+    """Returns the schema version (``PRAGMA user_version``) of the database
+    """
+    _cursor.execute("PRAGMA user_version")
+    return _cursor.fetchone()[0]
+
+def _apply_migrations(_connection):
+    """Applies, in order, all the migrations newer than the schema version of the database
+
+    Parameters
+    ----------
+    _connection : <class 'sqlite3.Connection'>
+        A read-write connection to the database
+
+    Returns
+    -------
+    version : ``int``
+        The schema version after the migrations
+
+    Notes
+    -----
+    Each migration runs in its own transaction, together with the update of the ``user_version``, so a failure leaves the database at the last successful version.
+
+    """
+    _cursor = _connection.cursor()
+    version = _get_schema_version(_cursor)
+    for migration_version, statements in _MIGRATIONS:
+        if migration_version <= version:
+            continue
+        try:
+            _cursor.execute("BEGIN")
+            for statement in statements:
+                _cursor.execute(statement)
+            # PRAGMA does not accept parameters
+            _cursor.execute(f"PRAGMA user_version = {int(migration_version)}")
+            _cursor.execute("COMMIT")
+        except sqlite3.Error:
+            if _connection.in_transaction:
+                _cursor.execute("ROLLBACK")
+            raise
+        version = migration_version
+    _cursor.close()
+    return version
+
+def _migrate_database(database_name="main_database.db"):
+    """Brings the database stored on the '../data/' folder to the newest schema version
+
+    Parameters
+    ----------
+    database_name : ``str``
+        The name of the database (default = ``"main_database.db"``)
+
+    Returns
+    -------
+    version : ``int``
+        The schema version of the database. If the database can not be written (e.g., a read-only installation), the current version is returned unchanged.
+
+    """
+    _cursor, _connection = _connecting_to_database(database_name)
+    try:
+        version = _apply_migrations(_connection)
+    except sqlite3.OperationalError:
+        # read-only filesystems: the compiled catalog is used at runtime, so an old schema is harmless
+        logging.warning(f"It was not possible to migrate the '{database_name}' database:\n" + traceback.format_exc())
+        version = _get_schema_version(_cursor)
     _cursor.close()
     _connection.close()
-    # retornando apenas o id (como um int)
-    return func_id[0]
+    return version
 
 # with just some tests (needs improvement)
 def set_default_language(new_language):
@@ -322,6 +509,9 @@ def set_default_language(new_language):
     To get all available languages, use the :func:`easy_stat.database_management.management.display_all_available_languages()` function.
 
     """
+    # making sure that the database uses the current schema before writing on it
+    _migrate_database()
+
     # getting the default language
     default_language = _get_current_default_language()
 
@@ -404,6 +594,8 @@ def set_default_language(new_language):
             _cursor.execute("UPDATE Default_Values SET default_input = ? WHERE default_parameter = 'language'", (new_language,))
             # commiting
             _connection.commit()
+            # anything cached from the database may depend on the old default
+            _clear_messages_cache()
             # closing the _cursor
             _cursor.close()
             # closing the connection
@@ -411,13 +603,10 @@ def set_default_language(new_language):
             # old language
             old_language = default_language
 
-            # connection to the database
-            _cursor, _connection = _connecting_to_database()
-
             # making a query to get all the messages of the default language
             default_language = _get_current_default_language()
             # making a query to update the messages
-            _cursor.execute("""
+            _cursor = _get_read_only_connection().execute("""
                 SELECT
                     Default_Messages.position,
                     Default_Messages_slices.message_slice
@@ -429,8 +618,6 @@ def set_default_language(new_language):
             data = _cursor.fetchall()
             # closing the _cursor
             _cursor.close()
-            # closing the connection
-            _connection.close()
 
             # turning the result into a list dictionary
             messages = defaultdict(list)
@@ -464,16 +651,7 @@ def set_default_language(new_language):
 def display_all_available_languages():
     """Prints all the languages available
     """
-    _cursor, _connection = _connecting_to_database()
-    ## quering
-    # getting all the available languages
-    _cursor.execute("SELECT language, id_language FROM Language")
-    all_languages = dict(_cursor.fetchall())
-    # removindo the 'universal' language to avoid problems
-    all_languages.pop('univ', None)
-    # closing the _cursor/_connection
-    _cursor.close()
-    _connection.close()
+    all_languages = _get_all_available_languages()
     for language in all_languages.keys():
         print("   --->   ", language)
 
@@ -481,14 +659,7 @@ def display_all_available_languages():
 def display_current_default_language():
     """Prints the current default language
     """
-    _cursor, _connection = _connecting_to_database()
-    _cursor.execute("SELECT default_input FROM Default_Values WHERE default_parameter = 'language'")
-    default_language = _cursor.fetchone()
-    # closing the _cursor/_connection
-    _cursor.close()
-    _connection.close()
-
-    print("   --->   " + default_language[0])
+    print("   --->   " + _get_current_default_language())
 
 
 
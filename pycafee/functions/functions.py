@@ -3,16 +3,16 @@
 
 # Function list:
 #
-#     - multimode(x_exp, language=None)
+#     - interquartile_range(x_exp, method=None, language=None, rank_error=None, assume_sorted=False)
+#     - _order_statistics(x_exp, method=None, is_sorted=False, overwrite_input=False)
+#     - multimode(x_exp, language=None, tolerance=None)
+#     - _row_modes(rows)
 
 #########################################
 ################ Imports ################
 #########################################
 
 ###### Standard ######
-from collections import Counter
-from itertools import takewhile
-from collections import namedtuple
 
 ###### Third part ######
 import numpy as np
@@ -22,6 +22,8 @@ import numpy as np
 from pycafee.database_management import management
 from pycafee.utils import checkers
 from pycafee.utils import general
+from pycafee.utils import helpers
+from pycafee.functions.quantilesketch import QuantileSketch
 
 
 
@@ -31,13 +33,13 @@ from pycafee.utils import general
 
 
 # with tests, with data, with text, with docstring
-def interquartile_range(x_exp, method=None, language=None):
+def interquartile_range(x_exp, method=None, language=None, rank_error=None, assume_sorted=False):
     """This function estimates the interquartile range of a data set
 
     Parameters
     ----------
-    x_exp : 1D :doc:`numpy array <numpy:reference/generated/numpy.array>`
-        Array with the sample data
+    x_exp : 1D :doc:`numpy array <numpy:reference/generated/numpy.array>` or :class:`~pycafee.functions.quantilesketch.QuantileSketch`
+        Array with the sample data, or a sketch of the data (e.g., built chunk by chunk for data that does not fit in memory)
     method : ``str``, optional
         The method used to estimate the quartiles.
 
@@ -45,6 +47,10 @@ def interquartile_range(x_exp, method=None, language=None):
 
     language : ``str``, optional
         The language code. Default is ``None`` which results in ``en``.
+    rank_error : ``float``, optional
+        The normalized rank error of a :class:`~pycafee.functions.quantilesketch.QuantileSketch` used to estimate the quartiles without sorting the data (default is ``None``, which means the exact quartiles). When the sample is small enough to be kept whole by the sketch, the exact quartiles are returned.
+    assume_sorted : ``bool``, optional
+        If ``True``, ``x_exp`` is assumed to be sorted in ascending order, so it is not sorted (nor copied) and the halves are views of ``x_exp`` (default is ``False``). The order is not checked.
 
     Returns
     -------
@@ -56,9 +62,9 @@ def interquartile_range(x_exp, method=None, language=None):
         q3 : ``float``
             The third quartile, e.g., the median of the upper half
     x_low : 1D :doc:`numpy array <numpy:reference/generated/numpy.array>`
-        Array with the lower half data
+        Array with the lower half data (``None`` if the quartiles were estimated with a sketch)
     x_upper : 1D :doc:`numpy array <numpy:reference/generated/numpy.array>`
-        Array with the upper half data
+        Array with the upper half data (``None`` if the quartiles were estimated with a sketch)
 
 
     Notes
@@ -71,6 +77,8 @@ def interquartile_range(x_exp, method=None, language=None):
 
             IR = Q_3 - Q_1
 
+    With a sketch, :math:`Q_1` and :math:`Q_3` are the estimated ``0.25`` and ``0.75`` quantiles. The difference to the Tukey quartiles is lower than one observation in rank, which is much lower than the error of the sketch.
+
 
     References
     ----------
@@ -106,7 +114,7 @@ def interquartile_range(x_exp, method=None, language=None):
             raise ValueError("Error: language not valid")
         except ValueError:
             all_formated_languages = [f"  --->  {lang}" for lang in all_languages]
-            fk_id_function = management._query_func_id("LanguageManagment")
+            fk_id_function = management._query_func_id("LanguageManagement")
 
             messages = management._get_messages(fk_id_function, current_default_language)
             msg = [
@@ -120,10 +128,24 @@ def interquartile_range(x_exp, method=None, language=None):
             raise
 
 
-    # cheking if the input is a 1D numpy array
-    checkers._check_is_numpy_1_D(x_exp, "x_exp", language)
-    # ordenando os dados
-    x_exp = np.sort(x_exp, kind='quicksort')
+    checkers._check_is_bool(assume_sorted, "assume_sorted", language)
+
+    # the sketch is only used when it has discarded values (otherwise the data is whole)
+    sketch = None
+    if isinstance(x_exp, QuantileSketch):
+        x_exp._check_is_not_empty()
+        if x_exp.is_exact():
+            x_exp = x_exp._levels[0]
+        else:
+            sketch = x_exp
+    else:
+        # cheking if the input is a 1D numpy array
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", language)
+        if rank_error is not None:
+            sketch = QuantileSketch(rank_error=rank_error, language=language)
+            sketch.push(x_exp)
+            if sketch.is_exact():
+                sketch = None
 
     # cheking the method
     if method is None:
@@ -147,35 +169,36 @@ def interquartile_range(x_exp, method=None, language=None):
                 raise
 
 
-
-
-    # mediana
-    median = np.median(x_exp)
-
-    # sample size
-    n_rep = x_exp.size
+    if sketch is not None:
+        # the 0.25 and 0.75 quantiles estimated by the sketch
+        q1, q3 = sketch.quantile(np.array([0.25, 0.75]))
+        x_low = None
+        x_upper = None
 
     # if method is Tukey
-    if method == "tukey":
+    elif method == "tukey":
+        # ordenando os dados (the halves are returned sorted)
+        if not assume_sorted:
+            x_exp = np.sort(x_exp, kind='quicksort')
+        # sample size
+        n_rep = x_exp.size
         half = int(n_rep/2) # get half size, round to lowest int
         # if size is even
         if n_rep % 2 == 0:
             x_low = x_exp[:half] # get the lower dataset from 0 to half
             x_upper = x_exp[half:] # get the upper dataset, from hatl to -1
-            q1 = np.median(x_low) # get the median from lower dataset
-            q3 = np.median(x_upper) # get the median from upper dataset
         else: # if size is odd
             x_low = x_exp[:half+1] # get the lower dataset from 0 to half + 1 (to include the median)
             x_upper = x_exp[half:] # get the upper dataset, from hatl to -1
-            q1 = np.median(x_low) # get the median from lower dataset
-            q3 = np.median(x_upper) # get the median from upper dataset
+        # the medians of the halves are read from the sorted data
+        _, q1, _, q3, _ = _order_statistics(x_exp, method="tukey", is_sorted=True)
 
     # interquartile range
     interquartile_range = q3 - q1
     ### quering
     fk_id_function = management._query_func_id("interquartile_range")
     messages = management._get_messages(fk_id_function, language, "interquartile_range")
-    result = namedtuple(messages[1][0][0], (messages[1][1][0], messages[1][2][0], messages[1][3][0]))
+    result = helpers._get_result_class(messages[1][0][0], (messages[1][1][0], messages[1][2][0], messages[1][3][0]), ("interquartile_range", "first_quartile", "third_quartile"))
     return result(interquartile_range, q1, q3), x_low, x_upper
 
 
@@ -187,16 +210,98 @@ def interquartile_range(x_exp, method=None, language=None):
 
 
 
+# with tests, with docstring, without text
+def _order_statistics(x_exp, method=None, is_sorted=False, overwrite_input=False):
+    """This function calculates the minimum, the first quartile, the median, the third quartile and the maximum with only one ``np.partition``
+
+    Parameters
+    ----------
+    x_exp : 1D :doc:`numpy array <numpy:reference/generated/numpy.array>`
+        Array with the sample data (it is not checked).
+    method : ``str``, optional
+        The method used to estimate the quartiles.
+
+        * If ``method="linear"`` (or ``None``), the quartiles are the same of ``np.quantile(x_exp, [0.25, 0.75])``;
+        * If ``method="tukey"``, the quartiles are the medians of the lower and upper halves (the same of ``interquartile_range(x_exp, method="tukey")``).
+
+    is_sorted : ``bool``, optional
+        If ``True``, ``x_exp`` is already sorted and the values are read directly (default is ``False``).
+    overwrite_input : ``bool``, optional
+        If ``True``, ``x_exp`` is partitioned in place instead of a copy (default is ``False``).
+
+    Returns
+    -------
+    order_statistics : ``tuple`` with
+        min : ``float``
+        q1 : ``float``
+        median : ``float``
+            The same value of ``np.median(x_exp)``.
+        q3 : ``float``
+        max : ``float``
+
+    Notes
+    -----
+    All the positions needed (at most ``8``) are passed to a single ``np.partition``, so the data is copied and swept only once, instead of once for each ``np.median``/``np.quantile``/``min``/``max`` call.
+
+    """
+    n = x_exp.size
+    # the median is the mean of two positions (equal when n is odd)
+    median = ((n - 1)//2, n//2)
+    # each quartile is (lower position, upper position, weight of the upper position)
+    if method is None or method == "linear":
+        quartiles = []
+        for probability in [0.25, 0.75]:
+            index = (n - 1)*probability
+            lower = int(np.floor(index))
+            quartiles.append((lower, min(lower + 1, n - 1), index - lower))
+    else:
+        half = n//2
+        size = half + n % 2
+        quartiles = [((size - 1)//2, size//2, 0.5), (half + (size - 1)//2, half + size//2, 0.5)]
+
+    if is_sorted:
+        part = x_exp
+    else:
+        kth = sorted({0, n - 1, *median, *quartiles[0][:2], *quartiles[1][:2]})
+        if overwrite_input:
+            x_exp.partition(kth)
+            part = x_exp
+        else:
+            part = np.partition(x_exp, kth)
+
+    if method is None or method == "linear":
+        # the same interpolation of np.quantile
+        values = []
+        for lower, upper, weight in quartiles:
+            difference = part[upper] - part[lower]
+            if weight >= 0.5:
+                values.append(part[upper] - difference*(1 - weight))
+            else:
+                values.append(part[lower] + difference*weight)
+        q1, q3 = values
+    else:
+        q1, q3 = [(part[lower] + part[upper])/2 for lower, upper, weight in quartiles]
+    return part[0], q1, (part[median[0]] + part[median[1]])/2, q3, part[n - 1]
+
+
+
+
+
+
+
+
 # with tests, with text, with database, with docstring
-def multimode(x_exp, language=None):
+def multimode(x_exp, language=None, tolerance=None):
     """This function calculates the mode(s) for a numerical sample, returning a dictionary of key-value pairs, where the key is the mode and the value is the count of that mode. If the sample has more than one mode, all modes will be returned.
 
     Parameters
     ----------
-    x_exp : 1D :doc:`numpy array <numpy:reference/generated/numpy.array>`
-        Array with the sample data
+    x_exp : 1D or 2D :doc:`numpy array <numpy:reference/generated/numpy.array>`
+        Array with the sample data. If it is a 2D array, each row is a sample.
     language : ``str``, optional
         The language code. Default is ``None`` which results in ``en``.
+    tolerance : ``int`` or ``float``, optional
+        The width of the bins used to group close values of continuous data (default is ``None``, which means that only equal values are grouped). Each value is assigned to the nearest multiple of ``tolerance``, rounded to the decimal places of ``tolerance``, which is the key of the mode.
 
     Notes
     -----
@@ -204,9 +309,11 @@ def multimode(x_exp, language=None):
 
     The function ``statistics.multimode()`` [3]_ was not used due to python version (added in python version 3.8). Consider using it in the future.
 
+    The modes are found with a run length encoding of the sorted data (a stable ``np.argsort`` of each row), without creating a Python object for each value. When there are many modes, they are returned in the order of their first occurrence in the data.
+
     Returns
     -------
-    multimode : ``dict`` of pairs, where
+    multimode : ``dict`` of pairs (or a ``list`` with one ``dict`` for each row of a 2D array), where
 
         * ``keys`` are the modes
         * ``values`` are the respective count
@@ -249,6 +356,13 @@ def multimode(x_exp, language=None):
     >>> print(result)
     {None: 'The data has no mode.'}
 
+    >>> from pycafee.functions.functions import multimode
+    >>> import numpy as np
+    >>> x = np.array([[1.02, 0.98, 2.0, 3.1], [1, 2, 2, 5]])
+    >>> result = multimode(x, tolerance=0.1)
+    >>> print(result)
+    [{1.0: 2}, {2.0: 2}]
+
 
     """
     all_languages = management._get_all_available_languages()
@@ -262,7 +376,7 @@ def multimode(x_exp, language=None):
             raise ValueError("Error: language not valid")
         except ValueError:
             all_formated_languages = [f"  --->  {lang}" for lang in all_languages]
-            fk_id_function = management._query_func_id("LanguageManagment")
+            fk_id_function = management._query_func_id("LanguageManagement")
 
             messages = management._get_messages(fk_id_function, current_default_language)
             msg = [
@@ -274,24 +388,68 @@ def multimode(x_exp, language=None):
             msg = list(msg)
             general._display_n_line_attention(msg)
             raise
-    # cheking if the input is a 1D numpy array
-    checkers._check_is_numpy_1_D(x_exp, "x_exp", language)
-    # making a counter with the data
-    freq = Counter(x_exp)
-    # getting the most_common frequency
-    mostfreq = freq.most_common()
-    # making a list with the most comum with how much counts for each mode
-    mode = list(takewhile(lambda x_f: x_f[1] == mostfreq[0][1], mostfreq))
-    mode = dict(mode)
-    no_mode = all(value == 1 for value in mode.values())
-    if no_mode:
-        ### querring ###
-        func_name = "multimode"
-        fk_id_function = management._query_func_id(func_name)
-        messages = management._get_messages(fk_id_function, language, func_name)
-        return {None: messages[1][0][0]}
+    # cheking if the input is a 1D (or 2D) numpy array
+    if isinstance(x_exp, np.ndarray) and x_exp.ndim == 2:
+        checkers._check_is_numpy_2_D(x_exp, "x_exp", language)
+        rows = x_exp
     else:
-        return mode
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", language)
+        rows = x_exp[np.newaxis, :]
+
+    # grouping close values
+    if tolerance is not None:
+        checkers._check_is_float_or_int(tolerance, "tolerance", language)
+        checkers._check_is_positive(tolerance, "tolerance", language)
+        # o múltiplo é arredondado nas casas decimais de tolerance (0.30000000000000004 -> 0.3)
+        decimals = len(np.format_float_positional(tolerance, trim="-").partition(".")[2])
+        rows = np.round(np.round(rows/tolerance)*tolerance, decimals)
+
+    modes = _row_modes(rows)
+    ### querring ###
+    func_name = "multimode"
+    fk_id_function = management._query_func_id(func_name)
+    messages = management._get_messages(fk_id_function, language, func_name)
+    # a sample without repeated values has no mode
+    modes = [mode if len(mode) > 0 else {None: messages[1][0][0]} for mode in modes]
+    if x_exp.ndim == 2:
+        return modes
+    return modes[0]
+
+
+def _row_modes(rows):
+    """This function finds the modes of each row with a run length encoding of the sorted rows
+
+    Parameters
+    ----------
+    rows : 2D :doc:`numpy array <numpy:reference/generated/numpy.array>`
+        One sample per row.
+
+    Returns
+    -------
+    modes : ``list`` of ``dict``
+        The modes (keys) and their counts (values) of each row, in the order of the first occurrence. The ``dict`` is empty if the row has no repeated value.
+
+    """
+    n_rows, n_cols = rows.shape
+    # the stable sort keeps the first occurrence at the start of each run
+    order = np.argsort(rows, axis=1, kind="stable")
+    rows_sorted = np.take_along_axis(rows, order, axis=1)
+    starts = np.ones(rows.shape, dtype=bool)
+    starts[:, 1:] = rows_sorted[:, 1:] != rows_sorted[:, :-1]
+    starts = np.flatnonzero(starts)
+    counts = np.diff(np.append(starts, rows.size))
+    run_rows = starts//n_cols
+    # the first run of each row starts at the first column
+    highest = np.maximum.reduceat(counts, np.flatnonzero(starts % n_cols == 0))
+    runs = np.flatnonzero((counts == highest[run_rows]) & (counts > 1))
+    first = order.ravel()[starts[runs]]
+    runs = runs[np.lexsort((first, run_rows[runs]))]
+
+    values = rows_sorted.ravel()[starts[runs]]
+    modes = [{} for _ in range(n_rows)]
+    for row, value, count in zip(run_rows[runs], values, counts[runs]):
+        modes[row][value] = int(count)
+    return modes
 
 
 
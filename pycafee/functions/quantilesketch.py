@@ -0,0 +1,279 @@
+"""This module implements a mergeable quantile sketch, which estimates quantiles of large data sets (or data streams) with bounded memory.
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - QuantileSketch(LanguageManagement)
+#     - __init__(self, rank_error=None, seed=None, language=None, **kwargs)
+#     - push(self, x_exp)
+#     - merge(self, other)
+#     - quantile(self, q)
+#     - is_exact(self)
+#     - _capacity(self, level)
+#     - _compress(self)
+#     - _check_is_not_empty(self)
+#     - __str__(self)
+#     - __repr__(self)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+import math
+
+###### Third part ######
+import numpy as np
+
+###### Home made ######
+from pycafee.database_management import management
+from pycafee.utils import checkers
+from pycafee.utils import general
+from pycafee.utils.helpers import LanguageManagement
+
+
+###########################################
+################ Functions ################
+###########################################
+
+# number of values added to the sketch at once (bounds the memory used by push)
+CHUNK_SIZE = 2**16
+
+
+class QuantileSketch(LanguageManagement):
+    """This class instantiates a KLL quantile sketch [1]_
+
+    The sketch keeps a few sorted buffers (compactors). The buffer of level ``h`` stores values that represent ``2**h`` observations each. When a buffer is full, it is sorted and every other value (starting at a random position) is moved to the next level, so the memory is bounded by about ``3*k`` values, where ``k`` depends on the ``rank_error``.
+
+    Attributes
+    ----------
+    rank_error : ``float``
+        The normalized rank error (e.g., ``0.01`` means that the rank of an estimated quantile is usually within ``1%`` of the sample size from the requested rank).
+    k : ``int``
+        The capacity of the highest level.
+    n : ``int``
+        The number of observations added so far.
+    min : ``float``
+        The lowest observation (exact).
+    max : ``float``
+        The highest observation (exact).
+
+    Methods
+    -------
+    push(x_exp)
+        Adds a batch of observations.
+    merge(other)
+        Adds the observations summarized by another sketch.
+    quantile(q)
+        Estimates the quantile(s).
+    is_exact()
+        ``True`` while no value was discarded (the quantiles are exact).
+
+    Notes
+    -----
+    While the number of observations is lower than ``k`` no value is discarded and :meth:`quantile` returns the same values of ``np.quantile``.
+
+    References
+    ----------
+    .. [1] KARNIN, Z.; LANG, K.; LIBERTY, E. Optimal quantile approximation in streams. IEEE 57th Annual Symposium on Foundations of Computer Science (FOCS), p. 71-78, 2016.
+
+    Examples
+    --------
+
+    >>> from pycafee.functions.quantilesketch import QuantileSketch
+    >>> import numpy as np
+    >>> x = np.random.default_rng(0).normal(size=1000000)
+    >>> sketch = QuantileSketch(rank_error=0.01)
+    >>> sketch.push(x)
+    >>> print(np.round(sketch.quantile(np.array([0.25, 0.5, 0.75])), 2))
+    [-0.67  0.    0.67]
+
+    """
+
+    def __init__(self, rank_error=None, seed=None, language=None, **kwargs):
+        super().__init__(language=language, **kwargs)
+        if rank_error is None:
+            rank_error = 0.01
+        else:
+            checkers._check_is_float(rank_error, "rank_error", self.language)
+            checkers._check_data_in_range(rank_error, "rank_error", 0.0, 1.0, self.language)
+        if seed is None:
+            seed = 0
+        else:
+            checkers._check_is_integer(seed, "seed", self.language)
+            checkers._check_value_is_equal_or_higher_than(seed, "seed", 0, self.language)
+        self.rank_error = rank_error
+        self.k = max(8, math.ceil(3/rank_error))
+        self.n = 0
+        self.min = None
+        self.max = None
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    # with tests, with docstring, without text
+    def push(self, x_exp):
+        """This function adds a batch of observations to the sketch
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with the new observations. Large arrays are added in chunks, so only a chunk is copied at a time.
+
+        """
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        for start in range(0, x_exp.size, CHUNK_SIZE):
+            chunk = np.asarray(x_exp[start:start + CHUNK_SIZE], dtype=float)
+            if self.n == 0:
+                self.min = float(chunk.min())
+                self.max = float(chunk.max())
+            else:
+                self.min = min(self.min, float(chunk.min()))
+                self.max = max(self.max, float(chunk.max()))
+            self.n += chunk.size
+            self._levels[0] = np.concatenate((self._levels[0], chunk))
+            self._compress()
+
+    # with tests, with docstring, with text
+    def merge(self, other):
+        """This function adds the observations summarized by another sketch to this sketch
+
+        Parameters
+        ----------
+        other : :class:`QuantileSketch`
+            The sketch to be merged (it is not changed).
+
+        Returns
+        -------
+        self : :class:`QuantileSketch`
+            The merged sketch (this object).
+
+        Notes
+        -----
+        The capacity of this sketch is kept, so the ``rank_error`` of the result is the ``rank_error`` of this sketch (if both sketches have the same ``rank_error``).
+
+        """
+        if not isinstance(other, QuantileSketch):
+            fk_id_function = management._query_func_id("QuantileSketch")
+            messages = management._get_messages(fk_id_function, self.language, "QuantileSketch")
+            try:
+                error = messages[3][0][0]
+                raise ValueError(error)
+            except ValueError:
+                general._display_one_line_attention(f"{messages[4][0][0]} '{type(other).__name__}'")
+                raise
+        if other.n > 0:
+            if self.n == 0:
+                self.min = other.min
+                self.max = other.max
+            else:
+                self.min = min(self.min, other.min)
+                self.max = max(self.max, other.max)
+            self.n += other.n
+            for level, values in enumerate(other._levels):
+                if level == len(self._levels):
+                    self._levels.append(np.empty(0))
+                self._levels[level] = np.concatenate((self._levels[level], values))
+            self._compress()
+        return self
+
+    # with tests, with docstring, with text
+    def quantile(self, q):
+        """This function estimates quantiles of the observations
+
+        Parameters
+        ----------
+        q : ``float`` or ``numpy array``
+            The probability (or a one dimension ``numpy array`` of probabilities) between ``0`` and ``1`` (inclusive).
+
+        Returns
+        -------
+        quantile : ``float`` or ``numpy array``
+            The estimated quantile(s). The quantiles ``0`` and ``1`` are always the exact minimum and maximum.
+
+        """
+        self._check_is_not_empty()
+        if isinstance(q, np.ndarray):
+            checkers._check_is_numpy_1_D(q, "q", self.language)
+            probabilities = q
+        else:
+            checkers._check_is_float_or_int(q, "q", self.language)
+            probabilities = np.array([q], dtype=float)
+        for value in probabilities:
+            checkers._check_value_is_equal_or_higher_than(value, "q", 0, self.language)
+            checkers._check_value_is_equal_or_lower_than(value, "q", 1, self.language)
+
+        if self.is_exact():
+            result = np.quantile(self._levels[0], probabilities)
+        else:
+            values = np.concatenate(self._levels)
+            weights = np.concatenate([np.full(level.size, 2.0**h) for h, level in enumerate(self._levels)])
+            order = np.argsort(values, kind="stable")
+            values = values[order]
+            cumulative = np.cumsum(weights[order])
+            # the value with the rank q*n (1 based) in the weighted sorted values
+            positions = np.searchsorted(cumulative, probabilities*cumulative[-1], side="left")
+            result = values[np.minimum(positions, values.size - 1)]
+            result = np.where(probabilities == 0, self.min, np.where(probabilities == 1, self.max, result))
+
+        if isinstance(q, np.ndarray):
+            return result
+        return float(result[0])
+
+    # with tests, with docstring, without text
+    def is_exact(self):
+        """This function checks if the sketch still keeps all the observations
+
+        Returns
+        -------
+        ``True`` if no value was discarded (the quantiles are exact) and ``False`` otherwise.
+
+        """
+        return len(self._levels) == 1
+
+    def _capacity(self, level):
+        """Returns the capacity of a level (the capacities decrease geometrically from the highest level)"""
+        depth = len(self._levels) - 1 - level
+        return max(2, math.ceil(self.k*(2/3)**depth))
+
+    def _compress(self):
+        """Compacts the levels above its capacity, from the lowest level"""
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if values.size > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                values = np.sort(values)
+                # an odd value stays on the level
+                even = values.size - values.size % 2
+                offset = self._rng.integers(2)
+                self._levels[level + 1] = np.concatenate((self._levels[level + 1], values[offset:even:2]))
+                self._levels[level] = values[even:]
+                # the capacities of the lower levels may have decreased
+                level = 0
+            else:
+                level += 1
+
+    def _check_is_not_empty(self):
+        """Raises ``ValueError`` if no observation was added"""
+        if self.n == 0:
+            fk_id_function = management._query_func_id("QuantileSketch")
+            messages = management._get_messages(fk_id_function, self.language, "QuantileSketch")
+            try:
+                error = messages[5][0][0]
+                raise ValueError(error)
+            except ValueError:
+                general._display_one_line_attention(messages[6][0][0])
+                raise
+
+    def __str__(self):
+        fk_id_function = management._query_func_id("QuantileSketch")
+        messages = management._get_messages(fk_id_function, self.language, "QuantileSketch")
+        return f"{messages[1][0][0]} {self.rank_error}"
+
+    def __repr__(self):
+        fk_id_function = management._query_func_id("QuantileSketch")
+        messages = management._get_messages(fk_id_function, self.language, "QuantileSketch")
+        return messages[2][0][0]
@@ -13,32 +13,36 @@
 #     - get_critical_value(self, n_rep, alfa=None)
 #     - draw_critical_values(self, ax=None, export=None, extension=None, file_name=None, dpi=None, decimal_separator=None, local=None)
 #     - fit(self, x_exp, alfa=None, details=None)
+#     - _fit_block(self, x_block, alfa, comparison)
+#     - _raises_critical_not_found(self, alfa)
 #     - to_xlsx(self, file_name=None, sheet_names=None)
 #     - to_csv(self, file_name=None, sep=",")
 #     - fn_abdi_molin(self, n_rep)
 #     - __str__(self)
 #     - __repr__(self)
+#
+# - _fn_abdi_molin(n_rep)
 
 #########################################
 ################ Imports ################
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from statsmodels.stats.diagnostic import lilliefors as lilliefors_statsmodel
 
 
 
 ###### Home made ######
 
 from pycafee.database_management import management
+from pycafee.normalitycheck import kernels
 from pycafee.utils import checkers
+from pycafee.utils import criticaltables
 from pycafee.utils import general
 from pycafee.utils import helpers
 from pycafee.utils.helpers import AlphaManagement, NDigitsManagement, PlotsManagement
@@ -71,6 +75,8 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
         The experimental data where the test was applied.
     ABDIMOLIN_TABLE : ``dict``
         The critical data of the correction proposed by Abdi & Molin.
+    ABDIMOLIN_DENSE_TABLE : ``DenseTable``
+        The critical data converted to ``numpy arrays``, with the interpolation used by ``get_critical_value``.
 
 
     Methods
@@ -127,6 +133,11 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
                     0.1106, 0.1095, 0.1083, 0.1071, 0.1062, 0.1040, 0.1047, 0.1030
                 ]
         }
+    ABDIMOLIN_DENSE_TABLE = criticaltables._build_dense_table(
+        ABDIMOLIN_TABLE,
+        asymptotic={0.01: 1.035, 0.05: 0.895, 0.10: 0.819, 0.15: 0.775, 0.20: 0.741},
+        divisor=lambda n_rep: _fn_abdi_molin(n_rep),
+        )
 
     def __init__(self, alfa=None, language=None, n_digits=None, **kwargs):
         super().__init__(alfa=alfa, language=language, n_digits=n_digits, **kwargs)
@@ -166,7 +177,7 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
             - 85% (``ɑ = 0.15``);
             - 80% (``ɑ = 0.20``);
 
-        The function returns ``None`` for other confidence levels.
+        For other confidence levels between ``0.01`` and ``0.20``, the critical value is a monotone cubic interpolation (PCHIP) in ``log(alfa)``. The function returns ``None`` for confidence levels outside this range.
 
 
         See also
@@ -206,8 +217,6 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
         fk_id_function = management._query_func_id("get_critical_value")
         messages = management._get_messages(fk_id_function, self.language, "get_critical_value")
 
-        am_table = AbdiMolin.ABDIMOLIN_TABLE
-
 
         ### checking alpha value ###
         if alfa is None:
@@ -233,37 +242,15 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
                 raise
 
         ### getting the critical value ###
-        if alfa == 0.01:
-            if n_rep < 51:
-                critical = am_table[alfa][n_rep - 4]
-            else:
-                critical = 1.035/self.fn_abdi_molin(n_rep)
-        elif alfa == 0.05:
-            if n_rep < 51:
-                critical = am_table[alfa][n_rep - 4]
-            else:
-                critical = 0.895/self.fn_abdi_molin(n_rep)
-        elif alfa == 0.10:
-            if n_rep < 51:
-                critical = am_table[alfa][n_rep - 4]
-            else:
-                critical = 0.819/self.fn_abdi_molin(n_rep)
-        elif alfa == 0.15:
-            if n_rep < 51:
-                critical = am_table[alfa][n_rep - 4]
-            else:
-                critical = 0.775/self.fn_abdi_molin(n_rep)
-        elif alfa == 0.20:
-            if n_rep < 51:
-                critical = am_table[alfa][n_rep - 4]
-            else:
-                critical = 0.741/self.fn_abdi_molin(n_rep)
-        else:
+        critical = criticaltables._lookup_critical_values(AbdiMolin.ABDIMOLIN_DENSE_TABLE, n_rep, alfa)
+        if np.isnan(critical):
             critical = None
+        else:
+            critical = float(critical)
 
         name = "AbdiMolin" + messages[3][0][0]
         ### return the tabulated value and the graph axis ###
-        result = namedtuple(name, (messages[3][1][0], messages[3][2][0]))
+        result = helpers._get_result_class(name, (messages[3][1][0], messages[3][2][0]), ("critical", "alpha"))
         return result(critical, alfa)
 
     # with tet, tieh text, with database, with docstring
@@ -594,25 +581,15 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
         critical = result[0] # interessa apenas o primero valor
 
         ### calculating the test statistic value ###
-        statistic, p_value = lilliefors_statsmodel(x_exp, dist='norm', pvalmethod='table')
+        # the Lilliefors statistic (the critical values are the ones from Abdi and Molin)
+        statistic = kernels._ks_statistic(kernels._sort_and_standardize(x_exp))
         # atrbuindo None ao pvalor para evitar preblemas
         p_value = None
 
         # ### writing the test conclusion ###
         ## The test conclustion based on tabulated value depends on whether tabulated value exists. If not, Raise a error ##
         if critical is None:
-            try:
-                error = messages[1][0][0]
-                raise ValueError(error)
-            except ValueError:
-                msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
-                p_values = list(AbdiMolin.ABDIMOLIN_TABLE.keys())
-                p_values.pop(0)
-                alfa_list = [msg]
-                for item in p_values:
-                    alfa_list.append(f"   --->    {item}")
-                general._display_n_line_attention(alfa_list)
-                raise
+            self._raises_critical_not_found(alfa)
         else: # if there is a tabulated value
             if critical >= statistic:
                 if details == 'full':
@@ -630,13 +607,72 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
                     msg = f"{messages[7][0][0]} {100*(1-alfa)}{messages[7][2][0]}"
 
         name = "AbdiMolin" + messages[10][0][0]
-        result = namedtuple(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]))
+        result = helpers._get_result_class(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]), ("statistic", "critical", "p_value", "alpha"))
         self.msg = msg
         self.statistic = statistic
         self.critical = critical
         self.p_value = p_value
         return result(self.statistic, self.critical, self.p_value, self.alfa), self.msg
 
+    # with tests, with docstring
+    def _fit_block(self, x_block, alfa, comparison):
+        """Applies the Abdi Molin test to each row of ``x_block``. This is the batch counterpart of :meth:`fit`, used by :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        Parameters
+        ----------
+        x_block : ``numpy array``
+            Two dimension array where each row is one sample (all samples have the same size).
+        alfa : ``float``
+            The level of significance (already checked).
+        comparison : ``str``
+            Not used, since this test has only the comparison with the critical value (kept for a uniform signature).
+
+        Returns
+        -------
+        statistic, critical, p_value : ``numpy array``
+            The results for each row (``nan`` when not available).
+        conclusion : ``numpy array``
+            ``1`` if :math:`H_0` is rejected, ``0`` otherwise.
+
+        """
+        statistic = kernels._ks_statistic(kernels._sort_and_standardize(x_block))
+        critical = self.get_critical_value(n_rep=x_block.shape[1], alfa=alfa)[0]
+        if critical is None:
+            self._raises_critical_not_found(alfa)
+        conclusion = statistic > critical
+        critical = np.full(x_block.shape[0], critical)
+        p_value = np.full(x_block.shape[0], np.nan)
+        return statistic, critical, p_value, conclusion.astype(int)
+
+    # with tests, with text, with database, with docstring
+    def _raises_critical_not_found(self, alfa):
+        """Raises the (translated) error when there is no critical value for ``alfa``, showing the allowed significance levels. Used by :meth:`fit` and :meth:`_fit_block`.
+
+        Parameters
+        ----------
+        alfa : ``float``
+            The level of significance.
+
+        Returns
+        -------
+        ``ValueError``
+
+        """
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
+            p_values = list(AbdiMolin.ABDIMOLIN_TABLE.keys())
+            p_values.pop(0)
+            alfa_list = [msg]
+            for item in p_values:
+                alfa_list.append(f"   --->    {item}")
+            general._display_n_line_attention(alfa_list)
+            raise
+
     # with tests, with text, with database, with docstring
     def to_xlsx(self, file_name=None, sheet_names=None):
         """This method exports the data to ``.xlsx``.
@@ -940,8 +976,7 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
         checkers._check_is_integer(n_rep, "n_rep", self.language)
         checkers._check_is_positive(n_rep, "n_rep", self.language)
         checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 51, self.language)
-        fn = (0.83 + n_rep)/np.sqrt(n_rep) - 0.01
-        return fn
+        return _fn_abdi_molin(n_rep)
 
 
     def __str__(self):
@@ -958,5 +993,9 @@ class AbdiMolin(AlphaManagement, NDigitsManagement, PlotsManagement):
         return messages[2][0][0]
 
 
+def _fn_abdi_molin(n_rep):
+    """The divisor of the correction proposed by Abdi & Molin (works with ``numpy arrays``)"""
+    return (0.83 + n_rep)/np.sqrt(n_rep) - 0.01
+
 
 # omae no sono konjoo tataki naosu zo https://youtu.be/LcYnfUt6Vvg?t=73
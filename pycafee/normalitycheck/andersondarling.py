@@ -8,6 +8,8 @@
 
 # - AndersonDarling(AlphaManagement, NDigitsManagement, PlotsManagement)
 #         - fit(x_exp, alfa=None, n_digits=None, conclusion=None, details=None)
+#         - fit_many(X, alfa=None, comparison=None, axis=1)
+#         - _fit_block(x_block, alfa, comparison)
 #         - to_csv(file_name=None, sep=",")
 #         - to_xlsx(file_name=None, sheet_names=None)
 #         - __str__(self)
@@ -18,21 +20,19 @@
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from statsmodels.stats.diagnostic import normal_ad as ad_statsmodel
-from scipy.stats import anderson as ad_scipy
 
 
 
 ###### Home made ######
 
 from pycafee.database_management import management
+from pycafee.normalitycheck import kernels
 from pycafee.utils import checkers
 from pycafee.utils import general
 from pycafee.utils import helpers
@@ -70,6 +70,8 @@ class AndersonDarling(AlphaManagement, NDigitsManagement, PlotsManagement):
     -------
     fit(x_exp, alfa=None, n_digits=None, comparison=None, details=None)
         Performs the AndersonDarling test.
+    fit_many(X, alfa=None, comparison=None, axis=1)
+        Performs the AndersonDarling test on many samples at once.
     to_csv(file_name=None, sep=",")
         Exports the results to a pre-formatted csv file.
     to_xlsx(file_name=None, sheet_names=None)
@@ -315,10 +317,14 @@ class AndersonDarling(AlphaManagement, NDigitsManagement, PlotsManagement):
         aceita = 0
         rejeita = 1
 
+        ### calculating the test statistic value ###
+        # the same as scipy.stats.anderson(x_exp)[0] (critical) and statsmodels normal_ad(x_exp)[0] (p-value)
+        statistic = kernels._anderson_darling_statistic(kernels._sort_and_standardize(x_exp), log_sf=(comparison != "p-value"))
+
         # ### writing the test conclusion ###
         if comparison == "p-value":
             critical = None
-            statistic, p_value = ad_statsmodel(x_exp)
+            p_value = kernels._anderson_darling_p_value(statistic, x_exp.size)
             if p_value >= alfa:
                 if details == 'full':
                     msg = f"{messages[8][0][0]}{helpers._truncate(p_value, self.language, decs=self.n_digits)}{messages[8][2][0]}{alfa}{messages[8][4][0]} AndersonDarling {messages[8][6][0]} {100*(1-alfa)}{messages[8][8][0]}"
@@ -334,30 +340,11 @@ class AndersonDarling(AlphaManagement, NDigitsManagement, PlotsManagement):
                 else:
                     msg = f"{messages[7][0][0]} {100*(1-alfa)}{messages[7][2][0]}"
         else:
-            p_values = [0.15, 0.10, 0.05, 0.025, 0.01]
+            p_values = list(kernels.AD_SIGNIFICANCE_LEVELS)
             if alfa not in p_values:
-                try:
-                    error = messages[1][0][0]
-                    raise ValueError(error)
-                except ValueError:
-                    msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
-                    alfa_list = [msg]
-                    for item in p_values:
-                        alfa_list.append(f"   --->    {item}")
-                    general._display_n_line_attention(alfa_list)
-                    raise
+                self._raises_critical_not_found(alfa)
             else: # if there is a tabulated value
-                statistic, critical_values, sig_level = ad_scipy(x_exp)
-                if alfa == 0.15:
-                    critical = critical_values[0]
-                elif alfa == 0.10:
-                    critical = critical_values[1]
-                elif alfa == 0.05:
-                    critical = critical_values[2]
-                elif alfa == 0.025:
-                    critical = critical_values[3]
-                else:
-                    critical = critical_values[4]
+                critical = kernels._anderson_darling_critical_values(x_exp.size)[p_values.index(alfa)]
                 p_value = None
                 if critical >= statistic:
                     if details == 'full':
@@ -375,13 +362,121 @@ class AndersonDarling(AlphaManagement, NDigitsManagement, PlotsManagement):
                         msg = f"{messages[7][0][0]} {100*(1-alfa)}{messages[7][2][0]}"
 
         name = "AndersonDarling" + messages[10][0][0]
-        result = namedtuple(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]))
+        result = helpers._get_result_class(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]), ("statistic", "critical", "p_value", "alpha"))
         self.msg = msg
         self.statistic = statistic
         self.critical = critical
         self.p_value = p_value
         return result(self.statistic, self.critical, self.p_value, self.alfa), self.msg
 
+    # with tests, with docstring
+    def fit_many(self, X, alfa=None, comparison=None, axis=1):
+        """Applies the Anderson Darling test to many samples at once.
+
+        The statistic of all samples with the same size is calculated in a single vectorized pass, and the small sample correction and the critical values are calculated only once for each sample size.
+
+        Parameters
+        ----------
+        X : ``numpy array`` or ``list``
+            A two dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` where each row (or each column, see ``axis``) is one sample, or a ``list`` of one dimension :doc:`numpy arrays <numpy:reference/generated/numpy.array>`.
+        alfa : ``float``, optional
+            The level of significance (``ɑ``). Default is ``None`` which results in ``0.05`` (``ɑ = 5%``).
+        comparison : ``str``, optional
+            ``"critical"`` (or ``None``, e.g, the default) or ``"p-value"`` (see :meth:`fit`).
+        axis : ``int``, optional
+            Only used if ``X`` is a two dimension array. If ``1`` (default), each row is a sample. If ``0``, each column is a sample.
+
+        Returns
+        -------
+        result : ``pandas DataFrame``
+            One row for each sample, with the same columns of :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        See Also
+        --------
+        fit : performs the Anderson Darling test on one sample.
+
+        Examples
+        --------
+        >>> from pycafee.normalitycheck import AndersonDarling
+        >>> import numpy as np
+        >>> rng = np.random.default_rng(42)
+        >>> X = rng.normal(size=(3, 10))
+        >>> ad_test = AndersonDarling()
+        >>> print(ad_test.fit_many(X, comparison="p-value"))
+           Statistic  Critical   p_value  Alpha   n  Conclusion
+        0   0.174751       NaN  0.896474   0.05  10           0
+        1   0.422931       NaN  0.255178   0.05  10           0
+        2   0.332352       NaN  0.437492   0.05  10           0
+
+        """
+        # imported here to avoid a circular import (NormalityCheck uses AndersonDarling)
+        from pycafee.normalitycheck.normalitycheck import NormalityCheck
+        normality_check = NormalityCheck(alfa=self.alfa, language=self.language, n_digits=self.n_digits)
+        return normality_check.fit_many(X, test="ad", alfa=alfa, comparison=comparison, axis=axis)
+
+    # with tests, with docstring
+    def _fit_block(self, x_block, alfa, comparison):
+        """Applies the Anderson Darling test to each row of ``x_block``. This is the batch counterpart of :meth:`fit`, used by :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        Parameters
+        ----------
+        x_block : ``numpy array``
+            Two dimension array where each row is one sample (all samples have the same size).
+        alfa : ``float``
+            The level of significance (already checked).
+        comparison : ``str``
+            ``"critical"`` or ``"p-value"`` (already checked).
+
+        Returns
+        -------
+        statistic, critical, p_value : ``numpy array``
+            The results for each row (``nan`` when not available).
+        conclusion : ``numpy array``
+            ``1`` if :math:`H_0` is rejected, ``0`` otherwise.
+
+        """
+        statistic = kernels._anderson_darling_statistic(kernels._sort_and_standardize(x_block), log_sf=(comparison != "p-value"))
+        critical = np.full(x_block.shape[0], np.nan)
+        p_value = np.full(x_block.shape[0], np.nan)
+        if comparison == "p-value":
+            p_value = kernels._anderson_darling_p_value(statistic, x_block.shape[1])
+            conclusion = p_value < alfa
+        else:
+            if alfa not in kernels.AD_SIGNIFICANCE_LEVELS:
+                self._raises_critical_not_found(alfa)
+            position = kernels.AD_SIGNIFICANCE_LEVELS.index(alfa)
+            critical[:] = kernels._anderson_darling_critical_values(x_block.shape[1])[position]
+            conclusion = statistic > critical
+        return statistic, critical, p_value, conclusion.astype(int)
+
+    # with tests, with text, with database, with docstring
+    def _raises_critical_not_found(self, alfa):
+        """Raises the (translated) error when there is no critical value for ``alfa``, showing the allowed significance levels. Used by :meth:`fit` and :meth:`_fit_block`.
+
+        Parameters
+        ----------
+        alfa : ``float``
+            The level of significance.
+
+        Returns
+        -------
+        ``ValueError``
+
+        """
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
+            p_values = list(kernels.AD_SIGNIFICANCE_LEVELS)
+            alfa_list = [msg]
+            for item in p_values:
+                alfa_list.append(f"   --->    {item}")
+            general._display_n_line_attention(alfa_list)
+            raise
+
     # with tests, with text, with database, with docstring
     def to_xlsx(self, file_name=None, sheet_names=None):
         """This method exports the data to excel type files.
@@ -13,7 +13,6 @@ desc
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
@@ -271,7 +270,7 @@ class Gaussian(PlotsManagement, AlphaManagement, NDigitsManagement):
 
         ### making namedtuple
 
-        result = namedtuple(messages[8][0][0], (messages[8][1][0], messages[8][2][0], messages[8][3][0]))
+        result = helpers._get_result_class(messages[8][0][0], (messages[8][1][0], messages[8][2][0], messages[8][3][0]), ("statistic", "critical", "alpha"))
         return result(kurtosis_z, [z_lower, z_upper], alfa), conclusion
 
 
@@ -468,7 +467,7 @@ class Gaussian(PlotsManagement, AlphaManagement, NDigitsManagement):
                 conclusion = rejeita
 
 
-        result = namedtuple(messages[8][4][0], (messages[8][1][0], messages[8][2][0], messages[8][3][0]))
+        result = helpers._get_result_class(messages[8][4][0], (messages[8][1][0], messages[8][2][0], messages[8][3][0]), ("statistic", "critical", "alpha"))
         return result(skewness_z, [z_lower, z_upper], alfa), conclusion
 
 
@@ -0,0 +1,387 @@
+"""This module concentrates the numerical kernels shared by the Normality tests.
+
+All kernels work on the last axis, so they accept one sample (a one dimension ``numpy array``) or a batch of samples with the same size (a two dimension ``numpy array`` with one sample per row).
+
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - _sort_and_standardize(x)
+# - _ks_statistic(z_sorted)
+# - _ks_p_value(statistic, n)
+# - _lilliefors_p_value(statistic, n)
+# - _shapiro_wilk_coefficients(n)
+# - _shapiro_wilk_p_value_parameters(n)
+# - _shapiro_wilk_statistic(x, is_sorted=False)
+# - _shapiro_wilk_p_value(statistic, n)
+# - _shapiro_wilk_critical_value(n, alfa)
+# - _anderson_darling_statistic(z_sorted, log_sf=True)
+# - _anderson_darling_p_value(statistic, n)
+# - _anderson_darling_critical_values(n)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+import functools
+import warnings
+
+###### Third part ######
+import numpy as np
+from scipy.special import log_ndtr, ndtr, ndtri
+from scipy.stats import anderson
+
+try:
+    from scipy.stats import kstwo
+except ImportError: # scipy < 1.5
+    kstwo = None
+    from scipy.stats import ksone, kstwobign
+
+try:
+    from statsmodels.stats._lilliefors import get_lilliefors_table
+    _LILLIEFORS_TABLE = get_lilliefors_table(dist="norm")
+except ImportError: # the table is built at import time on older statsmodels
+    from statsmodels.stats._lilliefors import lilliefors_table as _LILLIEFORS_TABLE
+
+
+###### Home made ######
+
+
+###########################################
+################ Constants ################
+###########################################
+
+# polynomial coefficients of the Royston (1995) approximation (algorithm AS R94), in increasing order
+SW_C1 = (0.0, 0.221157, -0.147981, -2.07119, 4.434685, -2.706056)
+SW_C2 = (0.0, 0.042981, -0.293762, -1.752461, 5.682633, -3.582633)
+SW_C3 = (0.5440, -0.39978, 0.025054, -6.714e-4)
+SW_C4 = (1.3822, -0.77857, 0.062767, -0.0020322)
+SW_C5 = (-1.5861, -0.31082, -0.083751, 0.0038915)
+SW_C6 = (-0.4803, -0.082676, 0.0030302)
+SW_G = (-2.273, 0.459)
+
+# significance levels of the Anderson Darling critical values (the ones returned by scipy.stats.anderson)
+AD_SIGNIFICANCE_LEVELS = (0.15, 0.10, 0.05, 0.025, 0.01)
+
+
+###########################################
+################ Functions ################
+###########################################
+
+
+def _sort_and_standardize(x):
+    """Sorts the sample(s) and standardizes them with the sample mean and the sample standard deviation (``ddof=1``)
+
+    Parameters
+    ----------
+    x : ``numpy array``
+        One sample (1 D) or one sample per row (2 D).
+
+    Returns
+    -------
+    z_sorted : ``numpy array``
+        The standardized values, sorted along the last axis.
+
+    """
+    mean = x.mean(axis=-1, keepdims=True)
+    std = x.std(axis=-1, ddof=1, keepdims=True)
+    return (np.sort(x, axis=-1) - mean) / std
+
+
+def _ks_statistic(z_sorted):
+    """Calculates the two-sided Kolmogorov Smirnov statistic against the standard Normal distribution
+
+    Parameters
+    ----------
+    z_sorted : ``numpy array``
+        The output of :func:`_sort_and_standardize`.
+
+    Returns
+    -------
+    statistic : ``float`` or ``numpy array``
+        ``D = max(D+, D-)`` for each sample.
+
+    """
+    n = z_sorted.shape[-1]
+    cdf = ndtr(z_sorted)
+    d_plus = (np.arange(1, n + 1) / n - cdf).max(axis=-1)
+    d_minus = (cdf - np.arange(n) / n).max(axis=-1)
+    return np.maximum(d_plus, d_minus)
+
+
+def _ks_p_value(statistic, n):
+    """Calculates the two-sided p-value of the Kolmogorov Smirnov statistic (the same value returned by ``scipy.stats.kstest``)
+
+    Parameters
+    ----------
+    statistic : ``float`` or ``numpy array``
+        The output of :func:`_ks_statistic`.
+    n : ``int``
+        The sample size.
+
+    Returns
+    -------
+    p_value : ``float`` or ``numpy array``
+
+    """
+    if kstwo is not None:
+        return np.clip(kstwo.sf(statistic, n), 0.0, 1.0)
+    # same rule used by scipy.stats.kstest (mode="approx") before the exact distribution was available
+    p_value = kstwobign.sf(statistic * np.sqrt(n))
+    if n <= 2666:
+        p_value = np.where(p_value > 0.80 - n * 0.3 / 1000, p_value, 2 * ksone.sf(statistic, n))
+    return np.clip(p_value, 0.0, 1.0)
+
+
+def _lilliefors_p_value(statistic, n):
+    """Calculates the p-value of the Lilliefors statistic interpolating the statsmodels table (the same as ``pvalmethod='table'``)
+
+    Parameters
+    ----------
+    statistic : ``float`` or ``numpy array``
+        The output of :func:`_ks_statistic`.
+    n : ``int``
+        The sample size.
+
+    Returns
+    -------
+    p_value : ``float`` or ``numpy array``
+
+    """
+    statistic = np.asarray(statistic, dtype=float)
+    return np.asarray(_LILLIEFORS_TABLE.prob(statistic, n), dtype=float).reshape(statistic.shape)[()]
+
+
+@functools.lru_cache(maxsize=128)
+def _shapiro_wilk_coefficients(n):
+    """Calculates the Shapiro Wilk coefficients using the Royston (1995) approximation (algorithm AS R94, the one used by ``scipy.stats.shapiro``)
+
+    The result is cached for each sample size.
+
+    Parameters
+    ----------
+    n : ``int``
+        The sample size (at least ``3``).
+
+    Returns
+    -------
+    coefficients : ``numpy array``
+        Read-only array with ``n`` coefficients (antisymmetric, the middle one is zero when ``n`` is odd), to be multiplied by the sorted sample.
+
+    """
+    n_half = n // 2
+    a = np.empty(n_half)
+    if n == 3:
+        a[0] = np.sqrt(0.5)
+    else:
+        m = ndtri((np.arange(1, n_half + 1) - 0.375) / (n + 0.25))
+        summ2 = 2 * np.sum(m**2)
+        ssumm2 = np.sqrt(summ2)
+        rsn = 1 / np.sqrt(n)
+        a[0] = np.polynomial.polynomial.polyval(rsn, SW_C1) - m[0] / ssumm2
+        if n > 5:
+            start = 2
+            a[1] = np.polynomial.polynomial.polyval(rsn, SW_C2) - m[1] / ssumm2
+            fac = np.sqrt((summ2 - 2 * m[0]**2 - 2 * m[1]**2) / (1 - 2 * a[0]**2 - 2 * a[1]**2))
+        else:
+            start = 1
+            fac = np.sqrt((summ2 - 2 * m[0]**2) / (1 - 2 * a[0]**2))
+        a[start:] = -m[start:] / fac
+    coefficients = np.zeros(n)
+    coefficients[:n_half] = -a
+    coefficients[n - n_half:] = a[::-1]
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+@functools.lru_cache(maxsize=128)
+def _shapiro_wilk_p_value_parameters(n):
+    """Calculates the parameters of the Normal approximation of the Shapiro Wilk statistic (Royston, 1995)
+
+    The result is cached for each sample size.
+
+    Parameters
+    ----------
+    n : ``int``
+        The sample size (at least ``4``).
+
+    Returns
+    -------
+    gamma : ``float`` or ``None``
+        The bound of the ``log(1 - W)`` transformation for ``n <= 11`` (``None`` otherwise).
+    mean : ``float``
+        The mean of the transformed statistic.
+    std : ``float``
+        The standard deviation of the transformed statistic.
+
+    """
+    if n <= 11:
+        gamma = np.polynomial.polynomial.polyval(n, SW_G)
+        mean = np.polynomial.polynomial.polyval(n, SW_C3)
+        std = np.exp(np.polynomial.polynomial.polyval(n, SW_C4))
+    else:
+        gamma = None
+        mean = np.polynomial.polynomial.polyval(np.log(n), SW_C5)
+        std = np.exp(np.polynomial.polynomial.polyval(np.log(n), SW_C6))
+    return gamma, mean, std
+
+
+def _shapiro_wilk_statistic(x, is_sorted=False):
+    """Calculates the Shapiro Wilk statistic
+
+    Parameters
+    ----------
+    x : ``numpy array``
+        One sample (1 D) or one sample per row (2 D), with at least ``3`` values.
+    is_sorted : ``bool``, optional
+        If ``True``, ``x`` is already sorted along the last axis (e.g., the output of :func:`_sort_and_standardize`, since the statistic does not change with location and scale). Default is ``False``.
+
+    Returns
+    -------
+    statistic : ``float`` or ``numpy array``
+        The ``W`` statistic for each sample (``1`` if the sample has range zero, as ``scipy.stats.shapiro`` does).
+
+    """
+    x_sorted = x if is_sorted else np.sort(x, axis=-1)
+    numerator = (x_sorted @ _shapiro_wilk_coefficients(x.shape[-1]))**2
+    denominator = ((x - x.mean(axis=-1, keepdims=True))**2).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistic = np.where(denominator > 0, numerator / denominator, 1.0)
+    return np.minimum(statistic, 1.0)[()]
+
+
+def _shapiro_wilk_p_value(statistic, n):
+    """Calculates the p-value of the Shapiro Wilk statistic (Royston, 1995)
+
+    Parameters
+    ----------
+    statistic : ``float`` or ``numpy array``
+        The output of :func:`_shapiro_wilk_statistic`.
+    n : ``int``
+        The sample size.
+
+    Returns
+    -------
+    p_value : ``float`` or ``numpy array``
+
+    """
+    statistic = np.asarray(statistic, dtype=float)
+    if n == 3:
+        p_value = 6 / np.pi * (np.arcsin(np.sqrt(statistic)) - np.arcsin(np.sqrt(0.75)))
+        return np.maximum(p_value, 0.0)[()]
+    gamma, mean, std = _shapiro_wilk_p_value_parameters(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.log(1 - statistic)
+        if gamma is None:
+            return ndtr(-(y - mean) / std)[()]
+        # AS R94 returns a tiny p-value when the transformation is out of its domain
+        p_value = ndtr(-(-np.log(gamma - y) - mean) / std)
+    return np.where(y >= gamma, 1e-99, p_value)[()]
+
+
+def _shapiro_wilk_critical_value(n, alfa):
+    """Calculates the critical value of the Shapiro Wilk statistic with the Normal approximation of ``log(1 - W)`` (Royston, 1995)
+
+    Parameters
+    ----------
+    n : ``int`` or ``numpy array`` of ``int``
+        The sample sizes (at least ``12``).
+    alfa : ``float`` or ``numpy array``
+        The significance levels (broadcast against ``n``).
+
+    Returns
+    -------
+    critical : ``float`` or ``numpy array``
+        The value of ``W`` with ``P(W < critical) = alfa``.
+
+    """
+    log_n = np.log(np.asarray(n, dtype=float))
+    mean = np.polynomial.polynomial.polyval(log_n, SW_C5)
+    std = np.exp(np.polynomial.polynomial.polyval(log_n, SW_C6))
+    return (1 - np.exp(mean + std*ndtri(1 - np.asarray(alfa, dtype=float))))[()]
+
+
+def _anderson_darling_statistic(z_sorted, log_sf=True):
+    """Calculates the Anderson Darling statistic (``A²``) against the standard Normal distribution
+
+    Parameters
+    ----------
+    z_sorted : ``numpy array``
+        The output of :func:`_sort_and_standardize`.
+    log_sf : ``bool``, optional
+        If ``True`` (default), ``log(1 - F(z))`` is evaluated as ``log(F(-z))``, as ``scipy.stats.anderson`` does. If ``False``, it is evaluated as ``log1p(-F(z))``, as ``statsmodels.stats.diagnostic.normal_ad`` does. Both are equal up to rounding errors.
+
+    Returns
+    -------
+    statistic : ``float`` or ``numpy array``
+        The ``A²`` statistic for each sample (without the small sample correction).
+
+    """
+    n = z_sorted.shape[-1]
+    weights = (2 * np.arange(1, n + 1) - 1.0) / n
+    if log_sf:
+        terms = log_ndtr(z_sorted) + log_ndtr(-z_sorted)[..., ::-1]
+    else:
+        cdf = ndtr(z_sorted)
+        with np.errstate(divide="ignore"):
+            terms = np.log(cdf) + np.log1p(-cdf[..., ::-1])
+    return -n - np.sum(weights * terms, axis=-1)
+
+
+def _anderson_darling_p_value(statistic, n):
+    """Calculates the p-value of the Anderson Darling statistic (the same approximation used by ``statsmodels.stats.diagnostic.normal_ad``)
+
+    Parameters
+    ----------
+    statistic : ``float`` or ``numpy array``
+        The output of :func:`_anderson_darling_statistic`.
+    n : ``int``
+        The sample size.
+
+    Returns
+    -------
+    p_value : ``float`` or ``numpy array``
+
+    """
+    # small sample correction, the same for all samples of the batch
+    ad2a = np.asarray(statistic, dtype=float) * (1 + 0.75 / n + 2.25 / n**2)
+    with np.errstate(over="ignore"):
+        p_value = np.select(
+            [ad2a < 0.200, ad2a < 0.340, ad2a < 0.600, ad2a <= 13],
+            [
+                1 - np.exp(-13.436 + 101.14 * ad2a - 223.73 * ad2a**2),
+                1 - np.exp(-8.318 + 42.796 * ad2a - 59.938 * ad2a**2),
+                np.exp(0.9177 - 4.279 * ad2a - 1.38 * ad2a**2),
+                np.exp(1.2937 - 5.709 * ad2a + 0.0186 * ad2a**2),
+            ],
+            default=0.0,
+        )
+    return p_value[()]
+
+
+@functools.lru_cache(maxsize=128)
+def _anderson_darling_critical_values(n):
+    """Gets the Anderson Darling critical values for a sample size
+
+    The critical values depend only on the sample size, so they are taken once from ``scipy.stats.anderson`` (keeping the same values of the installed scipy version) and cached.
+
+    Parameters
+    ----------
+    n : ``int``
+        The sample size.
+
+    Returns
+    -------
+    critical_values : ``numpy array``
+        Read-only array with the critical values for the significance levels of ``AD_SIGNIFICANCE_LEVELS``.
+
+    """
+    with warnings.catch_warnings():
+        # newer scipy versions warn about the p-value method, which is not used here
+        warnings.simplefilter("ignore", FutureWarning)
+        critical_values = np.array(anderson(np.arange(n, dtype=float), dist="norm")[1], dtype=float)
+    critical_values.flags.writeable = False
+    return critical_values
@@ -11,6 +11,8 @@
 #     - get_critical_value(self, n_rep, alfa=None)
 #     - draw_critical_values(self, ax=None, export=None, extension=None, file_name=None, dpi=None, decimal_separator=None, local=None)
 #     - fit(self, x_exp, alfa=None, n_digits=None, comparison=None, details=None)
+#     - _fit_block(self, x_block, alfa, comparison)
+#     - _raises_critical_not_found(self, alfa)
 #     - to_xlsx(self, file_name=None, sheet_names=None)
 #     - to_csv(self, file_name=None, sep=",")
 #     - __str__(self)
@@ -21,20 +23,20 @@
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.stats import kstest as kolmolgorov_smirnov_scipy
 
 
 ###### Home made ######
 
 from pycafee.database_management import management
+from pycafee.normalitycheck import kernels
 from pycafee.utils import checkers
+from pycafee.utils import criticaltables
 from pycafee.utils import general
 from pycafee.utils import helpers
 from pycafee.utils.helpers import AlphaManagement, NDigitsManagement, PlotsManagement
@@ -67,6 +69,8 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
         The experimental data where the test was applied.
     KOLMOGOROV_SMIRNOV_TABLE : ``dict``
         The tabulated data of the Kolmogorov Smirnov test.
+    KOLMOGOROV_SMIRNOV_DENSE_TABLE : ``DenseTable``
+        The tabulated data converted to ``numpy arrays``, with the interpolation used by ``get_critical_value``.
 
 
     Methods
@@ -104,6 +108,11 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
                 0.995, 0.929, 0.828, 0.733, 0.669, 0.618, 0.577, 0.543, 0.514, 0.490, 0.468, 0.450, 0.433, 0.418, 0.404, 0.392, 0.381, 0.371, 0.363, 0.356, 0.32, 0.29, 0.27
                 ]
         }
+    KOLMOGOROV_SMIRNOV_DENSE_TABLE = criticaltables._build_dense_table(
+        KOLMOGOROV_SMIRNOV_TABLE,
+        asymptotic={0.20: 1.07, 0.15: 1.14, 0.10: 1.22, 0.05: 1.36, 0.01: 1.63},
+        divisor=np.sqrt,
+        )
 
 
     def __init__(self, alfa=None, language=None, n_digits=None, **kwargs):
@@ -135,10 +144,8 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
         Notes
         -----
 
-        * For data with sample size between ``21`` and ``24`` (``20 < n_rep < 25``), the critical value returned is the value for ``25`` observations;
-        * For data with sample size between ``26`` and ``29`` (``25 < n_rep < 30``), the critical value returned is the value for ``30`` observations;
-        * For data with sample size between ``31`` and ``34`` (``30 < n_rep < 35``), the critical value returned is the value for ``35`` observations;
-        * For data with a sample size higher than ``36`` (``n_rep > 35``), the critical value returned is the aproximation proposed by the authors.
+        * For data with sample size between ``21`` and ``34`` that is not tabulated (e.g., ``n_rep = 23``), the critical value returned is a monotone cubic interpolation (PCHIP) in ``1/sqrt(n_rep)`` of the tabulated values;
+        * For data with a sample size higher than ``35`` (``n_rep > 35``), the critical value returned is the aproximation proposed by the authors.
 
         This function has tabulated values for the following confidence levels [1]_:
 
@@ -148,7 +155,7 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
             - 85% (``ɑ = 0.15``);
             - 80% (``ɑ = 0.20``);
 
-        The function returns None for other confidence levels.
+        For other confidence levels between ``0.01`` and ``0.20``, the critical value is a monotone cubic interpolation (PCHIP) in ``log(alfa)``. The function returns None for confidence levels outside this range.
 
         See also
         --------
@@ -180,9 +187,6 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
         KolmogorovSmirnovResult(tabulate=0.49, alpha=0.01)
 
         """
-        kolmogorov_smirnov = KolmogorovSmirnov.KOLMOGOROV_SMIRNOV_TABLE
-
-
         ### quering ###
 
         fk_id_function = management._query_func_id("get_critical_value")
@@ -208,75 +212,16 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
             except ValueError:
                 general._display_one_line_attention(f"{messages[2][0][0]} Kolmogorov Smirnov {messages[2][2][0]} '2' {messages[2][4][0]} '{n_rep}'",)
                 raise
-        elif n_rep < 21:
-            if alfa == 0.01:
-                tabulated = kolmogorov_smirnov[0.01][n_rep - 1]
-            elif alfa == 0.05:
-                tabulated = kolmogorov_smirnov[0.05][n_rep - 1]
-            elif alfa == 0.10:
-                tabulated = kolmogorov_smirnov[0.10][n_rep - 1]
-            elif alfa == 0.15:
-                tabulated = kolmogorov_smirnov[0.15][n_rep - 1]
-            elif alfa == 0.20:
-                tabulated = kolmogorov_smirnov[0.20][n_rep - 1]
-            else:
-                tabulated = None #
-        elif n_rep < 26:
-            if alfa == 0.01:
-                tabulated = kolmogorov_smirnov[0.01][20]
-            elif alfa == 0.05:
-                tabulated = kolmogorov_smirnov[0.05][20]
-            elif alfa == 0.10:
-                tabulated = kolmogorov_smirnov[0.10][20]
-            elif alfa == 0.15:
-                tabulated = kolmogorov_smirnov[0.15][20]
-            elif alfa == 0.20:
-                tabulated = kolmogorov_smirnov[0.20][20]
-            else:
-                tabulated = None #
-        elif n_rep < 31:
-            if alfa == 0.01:
-                tabulated = kolmogorov_smirnov[0.01][21]
-            elif alfa == 0.05:
-                tabulated = kolmogorov_smirnov[0.05][21]
-            elif alfa == 0.10:
-                tabulated = kolmogorov_smirnov[0.10][21]
-            elif alfa == 0.15:
-                tabulated = kolmogorov_smirnov[0.15][21]
-            elif alfa == 0.20:
-                tabulated = kolmogorov_smirnov[0.20][21]
-            else:
-                tabulated = None #
-        elif n_rep < 36:
-            if alfa == 0.01:
-                tabulated = kolmogorov_smirnov[0.01][22]
-            elif alfa == 0.05:
-                tabulated = kolmogorov_smirnov[0.05][22]
-            elif alfa == 0.10:
-                tabulated = kolmogorov_smirnov[0.10][22]
-            elif alfa == 0.15:
-                tabulated = kolmogorov_smirnov[0.15][22]
-            elif alfa == 0.20:
-                tabulated = kolmogorov_smirnov[0.20][22]
-            else:
-                tabulated = None #
-        else: ## if n_rep is higher than 25, return the aproximation value
-            if alfa == 0.01:
-                tabulated = 1.63/np.sqrt(n_rep)
-            elif alfa == 0.05:
-                tabulated = 1.36/np.sqrt(n_rep)
-            elif alfa == 0.1:
-                tabulated = 1.22/np.sqrt(n_rep)
-            elif alfa == 0.15:
-                tabulated = 1.14/np.sqrt(n_rep)
-            elif alfa == 0.2:
-                tabulated = 1.07/np.sqrt(n_rep)
-            else:
-                tabulated = None # if you don't have a tabulated value for the chosen alpha value, return None #
+        ## the table lookup (nan if alfa is outside the tabulated range) ##
+        tabulated = criticaltables._lookup_critical_values(KolmogorovSmirnov.KOLMOGOROV_SMIRNOV_DENSE_TABLE, n_rep, alfa)
+        if np.isnan(tabulated):
+            tabulated = None # if you don't have a tabulated value for the chosen alpha value, return None #
+        else:
+            tabulated = float(tabulated)
 
         ### return the tabulated value and the graph axis ###
         name = "KolmogorovSmirnov" + messages[3][0][0]
-        result = namedtuple(name, (messages[3][1][0], messages[3][2][0]))
+        result = helpers._get_result_class(name, (messages[3][1][0], messages[3][2][0]), ("critical", "alpha"))
         return result(tabulated, alfa)
 
     # with tests, with text, with database, with docstring
@@ -647,8 +592,9 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
         critical = result[0] # interessa apenas o primero valor
 
         ### calculating the test statistic value ###
-        # statistic, p_value = kolmolgorov_smirnov_scipy(x_exp, cdf='norm', args=(x_exp.mean(), x_exp.std(ddof=1)), N = x_exp.size)
-        statistic, p_value = kolmolgorov_smirnov_scipy(x_exp, cdf='norm', args=(x_exp.mean(), x_exp.std(ddof=1)))
+        # the same as scipy.stats.kstest(x_exp, cdf='norm', args=(x_exp.mean(), x_exp.std(ddof=1)))
+        statistic = kernels._ks_statistic(kernels._sort_and_standardize(x_exp))
+        p_value = kernels._ks_p_value(statistic, x_exp.size)
 
         aceita = 0
         rejeita = 1
@@ -672,18 +618,7 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
         else:
             ## The test conclustion based on tabulated value depends on whether tabulated value exists. If not, Raise a error ##
             if critical is None:
-                try:
-                    error = messages[1][0][0]
-                    raise ValueError(error)
-                except ValueError:
-                    msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
-                    p_values = list(KolmogorovSmirnov.KOLMOGOROV_SMIRNOV_TABLE.keys())
-                    p_values.pop(0)
-                    alfa_list = [msg]
-                    for item in p_values:
-                        alfa_list.append(f"   --->    {item}")
-                    general._display_n_line_attention(alfa_list)
-                    raise
+                self._raises_critical_not_found(alfa)
             else: # if there is a tabulated value
                 if critical >= statistic:
                     if details == 'full':
@@ -701,13 +636,75 @@ class KolmogorovSmirnov(AlphaManagement, NDigitsManagement, PlotsManagement):
                         msg = f"{messages[7][0][0]} {100*(1-alfa)}{messages[7][2][0]}"
 
         name = "KolmogorovSmirnov" + messages[10][0][0]
-        result = namedtuple(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]))
+        result = helpers._get_result_class(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]), ("statistic", "critical", "p_value", "alpha"))
         self.msg = msg
         self.statistic = statistic
         self.critical = critical
         self.p_value = p_value
         return result(self.statistic, self.critical, self.p_value, self.alfa), self.msg
 
+    # with tests, with docstring
+    def _fit_block(self, x_block, alfa, comparison):
+        """Applies the Kolmogorov Smirnov test to each row of ``x_block``. This is the batch counterpart of :meth:`fit`, used by :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        Parameters
+        ----------
+        x_block : ``numpy array``
+            Two dimension array where each row is one sample (all samples have the same size).
+        alfa : ``float``
+            The level of significance (already checked).
+        comparison : ``str``
+            ``"critical"`` or ``"p-value"`` (already checked).
+
+        Returns
+        -------
+        statistic, critical, p_value : ``numpy array``
+            The results for each row (``nan`` when not available).
+        conclusion : ``numpy array``
+            ``1`` if :math:`H_0` is rejected, ``0`` otherwise.
+
+        """
+        statistic = kernels._ks_statistic(kernels._sort_and_standardize(x_block))
+        p_value = kernels._ks_p_value(statistic, x_block.shape[1])
+        critical = self.get_critical_value(n_rep=x_block.shape[1], alfa=alfa)[0]
+        if comparison == "p-value":
+            conclusion = p_value < alfa
+        else:
+            if critical is None:
+                self._raises_critical_not_found(alfa)
+            conclusion = statistic > critical
+        critical = np.full(x_block.shape[0], np.nan if critical is None else critical)
+        return statistic, critical, p_value, conclusion.astype(int)
+
+    # with tests, with text, with database, with docstring
+    def _raises_critical_not_found(self, alfa):
+        """Raises the (translated) error when there is no critical value for ``alfa``, showing the allowed significance levels. Used by :meth:`fit` and :meth:`_fit_block`.
+
+        Parameters
+        ----------
+        alfa : ``float``
+            The level of significance.
+
+        Returns
+        -------
+        ``ValueError``
+
+        """
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
+            p_values = list(KolmogorovSmirnov.KOLMOGOROV_SMIRNOV_TABLE.keys())
+            p_values.pop(0)
+            alfa_list = [msg]
+            for item in p_values:
+                alfa_list.append(f"   --->    {item}")
+            general._display_n_line_attention(alfa_list)
+            raise
+
     # with docstring, with text, with database, with test,
     def to_xlsx(self, file_name=None, sheet_names=None):
         """This method exports the data to excel type files.
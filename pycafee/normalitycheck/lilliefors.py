@@ -8,6 +8,7 @@
 
 # - Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement)
 #         - fit(x_exp, alfa=None, n_digits=None, comparison=None, details=None)
+#         - _fit_block(x_block, alfa, comparison)
 #         - to_csv(file_name=None, sep=",")
 #         - to_xlsx(file_name=None, sheet_names=None)
 #         - get_critical_value(n_rep, alfa=None)
@@ -20,21 +21,21 @@
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from statsmodels.stats.diagnostic import lilliefors as lilliefors_statsmodel
 
 
 
 ###### Home made ######
 
 from pycafee.database_management import management
+from pycafee.normalitycheck import kernels
 from pycafee.utils import checkers
+from pycafee.utils import criticaltables
 from pycafee.utils import general
 from pycafee.utils import helpers
 from pycafee.utils.helpers import AlphaManagement, NDigitsManagement, PlotsManagement
@@ -67,6 +68,8 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
         The experimental data where the test was applied.
     LILLIEFORS_TABLE : ``dict``
         The table with the Lilliefors test critical data.
+    LILLIEFORS_DENSE_TABLE : ``DenseTable``
+        The critical data converted to ``numpy arrays``, with the interpolation used by ``get_critical_value``.
 
 
     Methods
@@ -110,6 +113,11 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
                     0.163, 0.160, 0.149, 0.131
                 ]
         }
+    LILLIEFORS_DENSE_TABLE = criticaltables._build_dense_table(
+        LILLIEFORS_TABLE,
+        asymptotic={0.20: 0.736, 0.15: 0.768, 0.10: 0.805, 0.05: 0.866, 0.01: 1.031},
+        divisor=np.sqrt,
+        )
 
     def __init__(self, alfa=None, language=None, n_digits=None, **kwargs):
         super().__init__(alfa=alfa, language=language, n_digits=n_digits, **kwargs)
@@ -140,8 +148,7 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
         Notes
         -----
 
-        * For data with sample size between ``21`` and ``24`` (``20 < n_rep < 25``), the critical value returned is the value for ``25`` observations;
-        * For data with sample size between ``26`` and ``29`` (``25 < n_rep < 30``), the critical value returned is the value for ``30`` observations;
+        * For data with sample size between ``21`` and ``29`` that is not tabulated (e.g., ``n_rep = 23``), the critical value returned is a monotone cubic interpolation (PCHIP) in ``1/sqrt(n_rep)`` of the tabulated values;
         * For data with a sample size higher than ``31`` (``n_rep > 30``), the critical value returned is the aproximation proposed by the authors.
 
         This function has tabulated values for the following confidence levels:
@@ -152,7 +159,7 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
             - 85% (``ɑ = 0.15``);
             - 80% (``ɑ = 0.20``);
 
-        The function returns ``None`` for other confidence levels.
+        For other confidence levels between ``0.01`` and ``0.20``, the critical value is a monotone cubic interpolation (PCHIP) in ``log(alfa)``. The function returns ``None`` for confidence levels outside this range.
 
 
         See also
@@ -212,58 +219,15 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
             except ValueError:
                 general._display_one_line_attention(f"{messages[2][0][0]} Lilliefors {messages[2][2][0]} '4' {messages[2][4][0]} '{n_rep}'",)
                 raise
-        lilli_table = Lilliefors.LILLIEFORS_TABLE
-        if alfa == 0.01:
-            if n_rep < 21:
-                tabulated = lilli_table[alfa][n_rep - 4]
-            elif 20 < n_rep < 26:
-                tabulated = lilli_table[alfa][17]
-            elif 25 < n_rep < 31:
-                tabulated = lilli_table[alfa][18]
-            else:
-                tabulated = 1.031/np.sqrt(n_rep)
-        elif alfa == 0.05:
-            if n_rep < 21:
-                tabulated = lilli_table[alfa][n_rep - 4]
-            elif 20 < n_rep < 26:
-                tabulated = lilli_table[alfa][17]
-            elif 25 < n_rep < 31:
-                tabulated = lilli_table[alfa][18]
-            else:
-                tabulated = 0.866/np.sqrt(n_rep)
-        elif alfa == 0.10:
-            if n_rep < 21:
-                tabulated = lilli_table[alfa][n_rep - 4]
-            elif 20 < n_rep < 26:
-                tabulated = lilli_table[alfa][17]
-            elif 25 < n_rep < 31:
-                tabulated = lilli_table[alfa][18]
-            else:
-                tabulated = 0.805/np.sqrt(n_rep)
-        elif alfa == 0.15:
-            if n_rep < 21:
-                tabulated = lilli_table[alfa][n_rep - 4]
-            elif 20 < n_rep < 26:
-                tabulated = lilli_table[alfa][17]
-            elif 25 < n_rep < 31:
-                tabulated = lilli_table[alfa][18]
-            else:
-                tabulated = 0.768/np.sqrt(n_rep)
-        elif alfa == 0.20:
-            if n_rep < 21:
-                tabulated = lilli_table[alfa][n_rep - 4]
-            elif 20 < n_rep < 26:
-                tabulated = lilli_table[alfa][17]
-            elif 25 < n_rep < 31:
-                tabulated = lilli_table[alfa][18]
-            else:
-                tabulated = 0.736/np.sqrt(n_rep)
-        else:
+        tabulated = criticaltables._lookup_critical_values(Lilliefors.LILLIEFORS_DENSE_TABLE, n_rep, alfa)
+        if np.isnan(tabulated):
             tabulated = None
+        else:
+            tabulated = float(tabulated)
 
         name = "Lilliefors" + messages[3][0][0]
         ### return the tabulated value and the graph axis ###
-        result = namedtuple(name, (messages[3][1][0], messages[3][2][0]))
+        result = helpers._get_result_class(name, (messages[3][1][0], messages[3][2][0]), ("critical", "alpha"))
         return result(tabulated, alfa)
 
 
@@ -640,7 +604,9 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
         critical = result[0] # interessa apenas o primero valor
 
         ### calculating the test statistic value ###
-        statistic, p_value = lilliefors_statsmodel(x_exp, dist='norm', pvalmethod='table')
+        # the same as statsmodels.stats.diagnostic.lilliefors(x_exp, dist='norm', pvalmethod='table')
+        statistic = kernels._ks_statistic(kernels._sort_and_standardize(x_exp))
+        p_value = kernels._lilliefors_p_value(statistic, x_exp.size)
 
         aceita = 0
         rejeita = 1
@@ -664,18 +630,7 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
         else:
             ## The test conclustion based on tabulated value depends on whether tabulated value exists. If not, Raise a error ##
             if critical is None:
-                try:
-                    error = messages[1][0][0]
-                    raise ValueError(error)
-                except ValueError:
-                    msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
-                    p_values = list(Lilliefors.LILLIEFORS_TABLE.keys())
-                    p_values.pop(0)
-                    alfa_list = [msg]
-                    for item in p_values:
-                        alfa_list.append(f"   --->    {item}")
-                    general._display_n_line_attention(alfa_list)
-                    raise
+                self._raises_critical_not_found(alfa)
             else: # if there is a tabulated value
                 if critical >= statistic:
                     if details == 'full':
@@ -693,13 +648,75 @@ class Lilliefors(AlphaManagement, NDigitsManagement, PlotsManagement):
                         msg = f"{messages[7][0][0]} {100*(1-alfa)}{messages[7][2][0]}"
 
         name = "Lilliefors" + messages[10][0][0]
-        result = namedtuple(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]))
+        result = helpers._get_result_class(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]), ("statistic", "critical", "p_value", "alpha"))
         self.msg = msg
         self.statistic = statistic
         self.critical = critical
         self.p_value = p_value
         return result(self.statistic, self.critical, self.p_value, self.alfa), self.msg
 
+    # with tests, with docstring
+    def _fit_block(self, x_block, alfa, comparison):
+        """Applies the Lilliefors test to each row of ``x_block``. This is the batch counterpart of :meth:`fit`, used by :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        Parameters
+        ----------
+        x_block : ``numpy array``
+            Two dimension array where each row is one sample (all samples have the same size).
+        alfa : ``float``
+            The level of significance (already checked).
+        comparison : ``str``
+            ``"critical"`` or ``"p-value"`` (already checked).
+
+        Returns
+        -------
+        statistic, critical, p_value : ``numpy array``
+            The results for each row (``nan`` when not available).
+        conclusion : ``numpy array``
+            ``1`` if :math:`H_0` is rejected, ``0`` otherwise.
+
+        """
+        statistic = kernels._ks_statistic(kernels._sort_and_standardize(x_block))
+        p_value = kernels._lilliefors_p_value(statistic, x_block.shape[1])
+        critical = self.get_critical_value(n_rep=x_block.shape[1], alfa=alfa)[0]
+        if comparison == "p-value":
+            conclusion = p_value < alfa
+        else:
+            if critical is None:
+                self._raises_critical_not_found(alfa)
+            conclusion = statistic > critical
+        critical = np.full(x_block.shape[0], np.nan if critical is None else critical)
+        return statistic, critical, p_value, conclusion.astype(int)
+
+    # with tests, with text, with database, with docstring
+    def _raises_critical_not_found(self, alfa):
+        """Raises the (translated) error when there is no critical value for ``alfa``, showing the allowed significance levels. Used by :meth:`fit` and :meth:`_fit_block`.
+
+        Parameters
+        ----------
+        alfa : ``float``
+            The level of significance.
+
+        Returns
+        -------
+        ``ValueError``
+
+        """
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
+            p_values = list(Lilliefors.LILLIEFORS_TABLE.keys())
+            p_values.pop(0)
+            alfa_list = [msg]
+            for item in p_values:
+                alfa_list.append(f"   --->    {item}")
+            general._display_n_line_attention(alfa_list)
+            raise
+
     # with tests, with text, with database, with docstring
     def to_xlsx(self, file_name=None, sheet_names=None):
         """This method exports the data to excel type files.
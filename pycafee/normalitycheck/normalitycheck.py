@@ -9,6 +9,10 @@
 # - NormalityCheck(AlphaManagement, NDigitsManagement)
 #     - __init__(self, alfa=None, language=None, n_digits=None, **kwargs)
 #     - fit(self, x_exp, test=None, alfa=None, n_digits=None, comparison=None, details=None)
+#     - fit_all(self, x_exp, alfa=None, comparison=None)
+#     - fit_many(self, X, test=None, alfa=None, comparison=None, axis=1)
+#     - _check_alfa_and_comparison(self, alfa, comparison, messages_fit)
+#     - _get_normality_test(self, test, comparison, messages)
 #     - __str__(self)
 #     - __repr__(self)
 
@@ -19,9 +23,12 @@
 ###### Standard ######
 
 ###### Third part ######
+import numpy as np
+import pandas as pd
 
 ###### Home made ######
 from pycafee.database_management import management
+from pycafee.normalitycheck import kernels
 
 from pycafee.normalitycheck.abdimolin import AbdiMolin
 from pycafee.normalitycheck.andersondarling import AndersonDarling
@@ -217,6 +224,306 @@ class NormalityCheck(AlphaManagement, NDigitsManagement):
 
 
 
+        """
+        fk_id_function = management._query_func_id("NormalityCheck")
+        messages = management._get_messages(fk_id_function, self.language, "NormalityCheck")
+        normality_test, self.normality_test = self._get_normality_test(test, comparison, messages)
+        if self.normality_test == "Abdi-Molin":
+            result, conclusion = normality_test.fit(
+                        x_exp=x_exp, alfa=alfa, details=details
+                    )
+        else:
+            result, conclusion = normality_test.fit(
+                        x_exp=x_exp, alfa=alfa, comparison=comparison, details=details
+                    )
+
+        self.statistic = result[0]
+        self.critical = result[1]
+        self.p_value = result[2]
+        self.x_exp = x_exp
+        self.msg = conclusion
+
+        return result, conclusion
+
+
+
+
+    # with tests, with text, with database, with docstring
+    def fit_all(self, x_exp, alfa=None, comparison=None):
+        """This function applies all available Normality tests to the same sample.
+
+        The sample is checked, sorted and standardized only once, and the statistics of all tests are calculated from these shared values (the Abdi-Molin, Kolmogorov-Smirnov and Lilliefors tests even share the same statistic).
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least ``4`` sample data.
+        alfa : ``float``, optional
+            The level of significance (``ɑ``). Default is ``None`` which results in ``0.05`` (``ɑ = 5%``).
+        comparison : ``str``, optional
+            ``"critical"`` (or ``None``, e.g, the default) or ``"p-value"`` (see :meth:`fit`). The Abdi-Molin test is always performed with the critical value.
+
+        Returns
+        -------
+        result : ``pandas DataFrame``
+            One row for each test (``"Abdi-Molin"``, ``"Anderson-Darling"``, ``"Kolmogorov-Smirnov"``, ``"Lilliefors"`` and ``"Shapiro-Wilk"``) with the test statistic, the critical value, the p-value, the significance level and the conclusion (``1`` if :math:`H_0` is rejected and ``0`` otherwise). Values that are not available are ``nan``.
+
+        See Also
+        --------
+        fit : applies one Normality test.
+        fit_many : applies one Normality test to many samples.
+
+        Examples
+        --------
+        >>> from pycafee.normalitycheck import NormalityCheck
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> normality_test = NormalityCheck()
+        >>> print(normality_test.fit_all(x))
+                            Statistic  Critical   p_value  Alpha  Conclusion
+        Abdi-Molin           0.154599    0.2616       NaN   0.05           0
+        Anderson-Darling     0.226879    0.6850       NaN   0.05           0
+        Kolmogorov-Smirnov   0.154599    0.4100  0.941977   0.05           0
+        Lilliefors           0.154599    0.2580  0.710464   0.05           0
+        Shapiro-Wilk         0.969812    0.8420  0.889095   0.05           0
+
+        """
+        fk_id_function = management._query_func_id("NormalityCheck")
+        messages = management._get_messages(fk_id_function, self.language, "NormalityCheck")
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages_fit = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+
+        alfa, comparison = self._check_alfa_and_comparison(alfa, comparison, messages_fit)
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        n_rep = x_exp.size
+
+        normality_tests = {
+            "Abdi-Molin": AbdiMolin(language=self.language, n_digits=self.n_digits),
+            "Anderson-Darling": AndersonDarling(language=self.language, n_digits=self.n_digits),
+            "Kolmogorov-Smirnov": KolmogorovSmirnov(language=self.language, n_digits=self.n_digits),
+            "Lilliefors": Lilliefors(language=self.language, n_digits=self.n_digits),
+            "Shapiro-Wilk": ShapiroWilk(language=self.language, n_digits=self.n_digits),
+        }
+
+        ### getting the tabulated values (it also checks the minimum sample size of each test) ###
+        critical = {}
+        for name in ["Abdi-Molin", "Kolmogorov-Smirnov", "Lilliefors", "Shapiro-Wilk"]:
+            critical[name] = normality_tests[name].get_critical_value(n_rep=n_rep, alfa=alfa)[0]
+        if comparison == "p-value" or alfa not in kernels.AD_SIGNIFICANCE_LEVELS:
+            critical["Anderson-Darling"] = None
+        else:
+            critical["Anderson-Darling"] = kernels._anderson_darling_critical_values(n_rep)[kernels.AD_SIGNIFICANCE_LEVELS.index(alfa)]
+
+        ### calculating the test statistics from the shared sorted and standardized sample ###
+        z_sorted = kernels._sort_and_standardize(x_exp)
+        ks_statistic = kernels._ks_statistic(z_sorted)
+        ad_statistic = kernels._anderson_darling_statistic(z_sorted, log_sf=(comparison != "p-value"))
+        statistic = {
+            "Abdi-Molin": ks_statistic,
+            "Anderson-Darling": ad_statistic,
+            "Kolmogorov-Smirnov": ks_statistic,
+            "Lilliefors": ks_statistic,
+            "Shapiro-Wilk": kernels._shapiro_wilk_statistic(z_sorted, is_sorted=True),
+        }
+        p_value = {
+            "Abdi-Molin": None,
+            "Anderson-Darling": kernels._anderson_darling_p_value(ad_statistic, n_rep) if comparison == "p-value" else None,
+            "Kolmogorov-Smirnov": kernels._ks_p_value(ks_statistic, n_rep),
+            "Lilliefors": kernels._lilliefors_p_value(ks_statistic, n_rep),
+            "Shapiro-Wilk": kernels._shapiro_wilk_p_value(statistic["Shapiro-Wilk"], n_rep),
+        }
+
+        ### writing the test conclusions ###
+        conclusion = {}
+        for name, normality_test in normality_tests.items():
+            if comparison == "p-value" and name != "Abdi-Molin":
+                conclusion[name] = int(p_value[name] < alfa)
+            elif critical[name] is None:
+                # fit raises the (translated) error about the missing critical value
+                if name == "Abdi-Molin":
+                    normality_test.fit(x_exp, alfa=alfa)
+                else:
+                    normality_test.fit(x_exp, alfa=alfa, comparison=comparison)
+            elif name == "Shapiro-Wilk":
+                conclusion[name] = int(statistic[name] < critical[name])
+            else:
+                conclusion[name] = int(statistic[name] > critical[name])
+
+        names = list(normality_tests)
+        self.x_exp = x_exp
+        return pd.DataFrame({
+            messages_fit[11][0][0]: [statistic[name] for name in names],
+            messages_fit[12][0][0]: [np.nan if critical[name] is None else critical[name] for name in names],
+            messages_fit[13][0][0]: [np.nan if p_value[name] is None else p_value[name] for name in names],
+            messages_fit[14][0][0]: [alfa] * len(names),
+            messages[8][0][0]: [conclusion[name] for name in names],
+        }, index=names)
+
+    # with tests, with text, with database, with docstring
+    def fit_many(self, X, test=None, alfa=None, comparison=None, axis=1):
+        """This function applies a Normality test to many samples at once.
+
+        The parameters are checked only once and the test objects are reused for all samples, so this method is much faster than calling :meth:`fit` inside a loop.
+
+        Parameters
+        ----------
+        X : ``numpy array`` or ``list``
+            The samples to be tested:
+
+            * A two dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` where each row (or each column, see ``axis``) is one sample;
+            * A ``list`` of one dimension :doc:`numpy arrays <numpy:reference/generated/numpy.array>`, which may have different sizes.
+
+        test : ``str``, optional
+            The test that will be applied (see :meth:`fit`). Default is ``None`` which results in the :ref:`Shapiro Wilk normality <shapiro_wilk>` test.
+        alfa : ``float``, optional
+            The level of significance (``ɑ``). Default is ``None`` which results in ``0.05`` (``ɑ = 5%``).
+        comparison : ``str``, optional
+            ``"critical"`` (or ``None``, e.g, the default) or ``"p-value"`` (see :meth:`fit`).
+        axis : ``int``, optional
+            Only used if ``X`` is a two dimension array. If ``1`` (default), each row is a sample. If ``0``, each column is a sample.
+
+        Returns
+        -------
+        result : ``pandas DataFrame``
+            One row for each sample (in the same order as ``X``) with the test statistic, the critical value, the p-value, the significance level, the sample size and the conclusion (``1`` if :math:`H_0` is rejected and ``0`` otherwise). Values that are not available are ``nan``.
+
+        Notes
+        -----
+        The samples of a ``list`` are grouped by size, so each group shares the same critical value.
+
+        See Also
+        --------
+        fit : applies the Normality test to one sample.
+
+        Examples
+        --------
+        >>> from pycafee.normalitycheck import NormalityCheck
+        >>> import numpy as np
+        >>> rng = np.random.default_rng(42)
+        >>> X = rng.normal(size=(3, 10))
+        >>> normality_test = NormalityCheck()
+        >>> result = normality_test.fit_many(X)
+        >>> print(result)
+           Statistic  Critical   p_value  Alpha   n  Conclusion
+        0   0.967704     0.842  0.868783   0.05  10           0
+        1   0.899780     0.842  0.217883   0.05  10           0
+        2   0.941894     0.842  0.574273   0.05  10           0
+
+        """
+        fk_id_function = management._query_func_id("NormalityCheck")
+        messages = management._get_messages(fk_id_function, self.language, "NormalityCheck")
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages_fit = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+
+        normality_test, self.normality_test = self._get_normality_test(test, comparison, messages)
+
+        alfa, comparison = self._check_alfa_and_comparison(alfa, comparison, messages_fit)
+
+        ### checking input data and grouping the samples by size ###
+        if isinstance(X, list):
+            for sample in X:
+                checkers._check_is_numpy_1_D(sample, "X", self.language)
+            sizes = np.array([sample.size for sample in X], dtype=int)
+            blocks = []
+            for size in np.unique(sizes):
+                index = np.flatnonzero(sizes == size)
+                blocks.append((index, np.vstack([X[i] for i in index])))
+        else:
+            checkers._check_is_numpy_2_D(X, "X", self.language)
+            checkers._check_is_integer(axis, "axis", self.language)
+            if axis not in (0, 1):
+                fk_id_function = management._query_func_id("generic")
+                messages_generic = management._get_messages(fk_id_function, self.language, "generic")
+                try:
+                    error = messages_generic[3][0][0]
+                    raise ValueError(error)
+                except ValueError:
+                    msg = [f"{messages_generic[4][0][0]} 'axis' {messages_generic[4][2][0]}:"]
+                    for item in (0, 1):
+                        msg.append(f"   --->    {item}")
+                    msg.append(f"{messages_generic[4][4][0]}:")
+                    msg.append(f"   --->    {axis}")
+                    general._display_n_line_attention(msg)
+                    raise
+            if axis == 0:
+                X = X.T
+            sizes = np.full(X.shape[0], X.shape[1])
+            blocks = [(np.arange(X.shape[0]), X)]
+
+        statistic = np.empty(sizes.size)
+        critical = np.empty(sizes.size)
+        p_value = np.empty(sizes.size)
+        conclusion = np.empty(sizes.size, dtype=int)
+        for index, x_block in blocks:
+            statistic[index], critical[index], p_value[index], conclusion[index] = normality_test._fit_block(x_block, alfa, comparison)
+
+        return pd.DataFrame({
+            messages_fit[11][0][0]: statistic,
+            messages_fit[12][0][0]: critical,
+            messages_fit[13][0][0]: p_value,
+            messages_fit[14][0][0]: np.full(sizes.size, alfa),
+            messages[9][0][0]: sizes,
+            messages[8][0][0]: conclusion,
+        })
+
+    def _check_alfa_and_comparison(self, alfa, comparison, messages_fit):
+        """Checks the ``alfa`` and ``comparison`` parameters of the batch methods, returning their values with the defaults applied
+
+        Parameters
+        ----------
+        alfa : ``float`` or ``None``
+            The level of significance.
+        comparison : ``str`` or ``None``
+            ``"critical"`` or ``"p-value"``.
+        messages_fit : ``dict``
+            The ``normalitycheck_fit`` messages.
+
+        Returns
+        -------
+        alfa : ``float``
+        comparison : ``str``
+
+        """
+        ### getting the default alpha value ###
+        if alfa is None:
+            alfa = self.alfa
+        else:
+            checkers._check_is_float(alfa, "alfa", self.language)
+            checkers._check_data_in_range(alfa, "alfa", 0.0, 1.0, self.language)
+
+        ### checking the comparison parameter ###
+        if comparison is None:
+            comparison = "critical"
+        else:
+            checkers._check_is_str(comparison, "comparison", self.language)
+            if comparison not in ["critical", "p-value"]:
+                try:
+                    error = messages_fit[1][0][0]
+                    raise ValueError(error)
+                except ValueError:
+                    general._display_one_line_attention(f"{messages_fit[15][0][0]} '{comparison}'",)
+                    raise
+        return alfa, comparison
+
+    def _get_normality_test(self, test, comparison, messages):
+        """Checks the ``test`` parameter and instantiates the chosen test
+
+        Parameters
+        ----------
+        test : ``str`` or ``None``
+            The test name (see :meth:`fit`).
+        comparison : ``str`` or ``None``
+            Only used to warn that the Abdi-Molin test does not support this parameter.
+        messages : ``dict``
+            The ``NormalityCheck`` messages.
+
+        Returns
+        -------
+        normality_test : ``object``
+            The test instance, with the same ``language`` and ``n_digits``.
+        name : ``str``
+            The name of the test (e.g., ``"Shapiro-Wilk"``).
+
         """
         normality_tests = [
                 "am", "abdi-molin",
@@ -225,8 +532,6 @@ class NormalityCheck(AlphaManagement, NDigitsManagement):
                 "li", "lilliefors",
                 "sw", "shapiro-wilk"
                 ]
-        fk_id_function = management._query_func_id("NormalityCheck")
-        messages = management._get_messages(fk_id_function, self.language, "NormalityCheck")
         if test is not None:
             checkers._check_is_str(test, "test", self.language)
             if test not in normality_tests:
@@ -247,14 +552,8 @@ class NormalityCheck(AlphaManagement, NDigitsManagement):
                     general._display_n_line_attention(msg)
                     raise
         if (test is None or test == "sw" or test == "shapiro-wilk"):
-            normality_test = ShapiroWilk(language=self.language, n_digits=self.n_digits)
-            result, conclusion = normality_test.fit(
-                        x_exp=x_exp, alfa=alfa, comparison=comparison, details=details
-                    )
-            self.normality_test = "Shapiro-Wilk"
-
+            return ShapiroWilk(language=self.language, n_digits=self.n_digits), "Shapiro-Wilk"
         elif (test == "am" or test == "abdi-molin"):
-            normality_test = AbdiMolin(language=self.language, n_digits=self.n_digits)
             if comparison is not None:
                 general._display_n_line_warn(
                     [
@@ -262,43 +561,13 @@ class NormalityCheck(AlphaManagement, NDigitsManagement):
                     messages[6][0][0],
                     messages[7][0][0]
                     ])
-
-            result, conclusion = normality_test.fit(
-                        x_exp=x_exp, alfa=alfa, details=details
-                    )
-            self.normality_test = "Abdi-Molin"
-
+            return AbdiMolin(language=self.language, n_digits=self.n_digits), "Abdi-Molin"
         elif (test == "ad" or test == "anderson-darling"):
-            normality_test = AndersonDarling(language=self.language, n_digits=self.n_digits)
-            result, conclusion = normality_test.fit(
-                        x_exp=x_exp, alfa=alfa, comparison=comparison, details=details
-                    )
-            self.normality_test = "Anderson-Darling"
-
+            return AndersonDarling(language=self.language, n_digits=self.n_digits), "Anderson-Darling"
         elif (test == "ks" or test == "kolmogorov-smirnov"):
-            normality_test = KolmogorovSmirnov(language=self.language, n_digits=self.n_digits)
-            result, conclusion = normality_test.fit(
-                        x_exp=x_exp, alfa=alfa, comparison=comparison, details=details
-                    )
-            self.normality_test = "Kolmogorov-Smirnov"
-
+            return KolmogorovSmirnov(language=self.language, n_digits=self.n_digits), "Kolmogorov-Smirnov"
         else:
-            normality_test = Lilliefors(language=self.language, n_digits=self.n_digits)
-            result, conclusion = normality_test.fit(
-                        x_exp=x_exp, alfa=alfa, comparison=comparison, details=details
-                    )
-            self.normality_test = "Lilliefors"
-
-        self.statistic = result[0]
-        self.critical = result[1]
-        self.p_value = result[2]
-        self.x_exp = x_exp
-        self.msg = conclusion
-
-        return result, conclusion
-
-
-
+            return Lilliefors(language=self.language, n_digits=self.n_digits), "Lilliefors"
 
     def __str__(self):
         if self.msg is None:
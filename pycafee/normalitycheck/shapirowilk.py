@@ -11,30 +11,35 @@
 #     - get_critical_value(self, n_rep, alfa=None)
 #     - draw_critical_values(self, ax=None, export=None, extension=None, file_name=None, dpi=None, decimal_separator=None, local=None)
 #     - fit(self, x_exp, alfa=None, n_digits=None, comparison=None, details=None)
+#     - fit_many(self, X, alfa=None, comparison=None, axis=1)
+#     - _fit_block(self, x_block, alfa, comparison)
+#     - _raises_critical_not_found(self, alfa)
 #     - to_xlsx(self, file_name=None, sheet_names=None)
 #     - to_csv(self, file_name=None, sep=",")
 #     - __str__(self)
 #     - __repr__(self)
+#
+# - _extrapolate_critical_value(n_rep, alfa, critical)
 
 #########################################
 ################ Imports ################
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.stats import shapiro as shapiro_scipy
 
 
 ###### Home made ######
 
 from pycafee.database_management import management
+from pycafee.normalitycheck import kernels
 from pycafee.utils import checkers
+from pycafee.utils import criticaltables
 from pycafee.utils import general
 from pycafee.utils import helpers
 from pycafee.utils.helpers import AlphaManagement, NDigitsManagement, PlotsManagement
@@ -67,12 +72,16 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
         The experimental data where the test was applied.
     SHAPIRO_WILK_TABLE : ``dict``
         The tabulated data of the Shapiro Wilk test.
+    SHAPIRO_WILK_DENSE_TABLE : ``DenseTable``
+        The tabulated data (``0.01``, ``0.02``, ``0.05``, ``0.10`` and ``0.50``) converted to ``numpy arrays``, with the interpolation used by ``get_critical_value``.
 
 
     Methods
     -------
     fit(x_exp, alfa=None, n_digits=None, comparison=None, details=None)
         Performs the Shapiro Wilk test.
+    fit_many(X, alfa=None, comparison=None, axis=1)
+        Performs the Shapiro Wilk test on many samples at once.
     to_csv(file_name=None, sep=",")
         Exports the results to a pre-formatted csv file.
     to_xlsx(file_name=None, sheet_names=None)
@@ -119,6 +128,11 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
         'Note':
                 "*the critical value for alpha equal to 0.99 with 30 observations probably has a typo. The correct value is probably 0.990 instead of 0.900."
     }
+    SHAPIRO_WILK_DENSE_TABLE = criticaltables._build_dense_table(
+        SHAPIRO_WILK_TABLE,
+        alphas=[0.01, 0.02, 0.05, 0.10, 0.50],
+        extrapolation=lambda n_rep, alfa, critical: _extrapolate_critical_value(n_rep, alfa, critical),
+        )
 
 
     def __init__(self, alfa=None, language=None, n_digits=None, **kwargs):
@@ -152,7 +166,7 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
 
         The critical value is returned only if the number of observations is at least ``3`` (``n_rep >= 3``).
 
-        If the number of repetitions is higher than ``50`` (``n_rep > 50``),  the function returns the tabulated value for ``50`` (``n_rep = 50``) observations.
+        If the number of repetitions is higher than ``50`` (``n_rep > 50``), the tabulated value for ``50`` observations is extrapolated with the Normal approximation of ``log(1 - W)`` proposed by Royston [2]_ (the ratio between ``1 - W`` for ``n_rep`` and for ``50`` observations).
 
         This function has tabulated values for the following confidence levels [1]_:
 
@@ -162,7 +176,7 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
             * 90% (ɑ = 0.10);
             * 50% (ɑ = 0.50);
 
-        The function returns ``None`` for other confidence levels.
+        For other confidence levels between ``0.01`` and ``0.50``, the critical value is a monotone cubic interpolation (PCHIP) in ``log(alfa)``. The function returns ``None`` for confidence levels outside this range.
 
         See also
         --------
@@ -174,6 +188,8 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
 
         .. [1] SHAPIRO, S. S.; WILK, M. B. An Analysis of Variance Test for Normality (Complete Samples). Biometrika, v. 52, n. 3, p. 591–611, 1965. DOI: `10.2307/2333709 <https://doi.org/10.2307/2333709>`_.
 
+        .. [2] ROYSTON, P. Remark AS R94: A Remark on Algorithm AS 181: The W-test for Normality. Journal of the Royal Statistical Society. Series C (Applied Statistics), v. 44, n. 4, p. 547–551, 1995.
+
 
 
 
@@ -197,9 +213,6 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
         ShapiroWilkResult(critical=0.781, alpha=0.01)
 
         """
-        shapiro_wilk_table = ShapiroWilk.SHAPIRO_WILK_TABLE
-
-
         ### quering ###
 
         fk_id_function = management._query_func_id("get_critical_value")
@@ -225,36 +238,16 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
             except ValueError:
                 general._display_one_line_attention(f"{messages[2][0][0]} Shapiro Wilk {messages[2][2][0]} '3' {messages[2][4][0]} '{n_rep}'",)
                 raise
-        elif n_rep < 51: ## if n_rep is between 3 and 50 return the tabulated value ##
-            if alfa == 0.01:
-                tabulated = shapiro_wilk_table[0.01][n_rep - 3]
-            elif alfa == 0.02:
-                tabulated = shapiro_wilk_table[0.02][n_rep - 3]
-            elif alfa == 0.05:
-                tabulated = shapiro_wilk_table[0.05][n_rep - 3]
-            elif alfa == 0.1:
-                tabulated = shapiro_wilk_table[0.10][n_rep - 3]
-            elif alfa == 0.5:
-                tabulated = shapiro_wilk_table[0.50][n_rep - 3]
-            else:
-                tabulated = None # if you don't have a tabulated value for the chosen alpha value, return None #
-        else: ## if n_rep is higher than 50, return tabulated value for 50 observations ##
-            if alfa == 0.01:
-                tabulated = shapiro_wilk_table[0.01][-1]
-            elif alfa == 0.02:
-                tabulated = shapiro_wilk_table[0.02][-1]
-            elif alfa == 0.05:
-                tabulated = shapiro_wilk_table[0.05][-1]
-            elif alfa == 0.1:
-                tabulated = shapiro_wilk_table[0.10][-1]
-            elif alfa == 0.5:
-                tabulated = shapiro_wilk_table[0.50][-1]
-            else:
-                tabulated = None # if you don't have a tabulated value for the chosen alpha value, return None #
+        ## the tabulated (or interpolated) value, extrapolated when n_rep is higher than 50 ##
+        tabulated = criticaltables._lookup_critical_values(ShapiroWilk.SHAPIRO_WILK_DENSE_TABLE, n_rep, alfa)
+        if np.isnan(tabulated):
+            tabulated = None # if you don't have a tabulated value for the chosen alpha value, return None #
+        else:
+            tabulated = float(tabulated)
 
         ### return the tabulated value and the graph axis ###
         name = "ShapiroWilk" + messages[3][0][0]
-        result = namedtuple(name, (messages[3][1][0], messages[3][2][0]))
+        result = helpers._get_result_class(name, (messages[3][1][0], messages[3][2][0]), ("critical", "alpha"))
         return result(tabulated, alfa)
 
     # with tests, with text, with database, with docstring
@@ -626,8 +619,9 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
         critical = result[0] # interessa apenas o primero valor
 
         ### calculating the test statistic value ###
-        # statistic, p_value = kolmolgorov_smirnov_scipy(x_exp, cdf='norm', args=(x_exp.mean(), x_exp.std(ddof=1)), N = x_exp.size)
-        statistic, p_value = shapiro_scipy(x_exp)
+        # the same as scipy.stats.shapiro(x_exp), but the coefficients are cached for each sample size
+        statistic = kernels._shapiro_wilk_statistic(x_exp)
+        p_value = kernels._shapiro_wilk_p_value(statistic, x_exp.size)
 
         aceita = 0
         rejeita = 1
@@ -651,18 +645,7 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
         else:
             ## The test conclustion based on tabulated value depends on whether tabulated value exists. If not, Raise a error ##
             if critical is None:
-                try:
-                    error = messages[1][0][0]
-                    raise ValueError(error)
-                except ValueError:
-                    msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
-                    # p_values = list(ShapiroWilk.SHAPIRO_WILK_TABLE.keys())
-                    p_values = [0.01, 0.02, 0.05, 0.1, 0.5]
-                    alfa_list = [msg]
-                    for item in p_values:
-                        alfa_list.append(f"   --->    {item}")
-                    general._display_n_line_attention(alfa_list)
-                    raise
+                self._raises_critical_not_found(alfa)
             else: # if there is a tabulated value
                 if critical <= statistic:
                     if details == 'full':
@@ -680,13 +663,119 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
                         msg = f"{messages[7][0][0]} {100*(1-alfa)}{messages[7][2][0]}"
 
         name = "ShapiroWilk" + messages[10][0][0]
-        result = namedtuple(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]))
+        result = helpers._get_result_class(name, (messages[11][0][0], messages[12][0][0], messages[13][0][0], messages[14][0][0]), ("statistic", "critical", "p_value", "alpha"))
         self.msg = msg
         self.statistic = statistic
         self.critical = critical
         self.p_value = p_value
         return result(self.statistic, self.critical, self.p_value, self.alfa), self.msg
 
+    # with tests, with docstring
+    def fit_many(self, X, alfa=None, comparison=None, axis=1):
+        """Applies the Shapiro Wilk test to many samples at once.
+
+        The Shapiro Wilk coefficients are calculated only once for each sample size, and all samples with the same size are tested with a single matrix-vector product.
+
+        Parameters
+        ----------
+        X : ``numpy array`` or ``list``
+            A two dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` where each row (or each column, see ``axis``) is one sample, or a ``list`` of one dimension :doc:`numpy arrays <numpy:reference/generated/numpy.array>`.
+        alfa : ``float``, optional
+            The level of significance (``ɑ``). Default is ``None`` which results in ``0.05`` (``ɑ = 5%``).
+        comparison : ``str``, optional
+            ``"critical"`` (or ``None``, e.g, the default) or ``"p-value"`` (see :meth:`fit`).
+        axis : ``int``, optional
+            Only used if ``X`` is a two dimension array. If ``1`` (default), each row is a sample. If ``0``, each column is a sample.
+
+        Returns
+        -------
+        result : ``pandas DataFrame``
+            One row for each sample, with the same columns of :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        See Also
+        --------
+        fit : performs the Shapiro Wilk test on one sample.
+
+        Examples
+        --------
+        >>> from pycafee.normalitycheck import ShapiroWilk
+        >>> import numpy as np
+        >>> rng = np.random.default_rng(42)
+        >>> X = rng.normal(size=(3, 10))
+        >>> sw_test = ShapiroWilk()
+        >>> print(sw_test.fit_many(X))
+           Statistic  Critical   p_value  Alpha   n  Conclusion
+        0   0.967704     0.842  0.868783   0.05  10           0
+        1   0.899780     0.842  0.217883   0.05  10           0
+        2   0.941894     0.842  0.574273   0.05  10           0
+
+        """
+        # imported here to avoid a circular import (NormalityCheck uses ShapiroWilk)
+        from pycafee.normalitycheck.normalitycheck import NormalityCheck
+        normality_check = NormalityCheck(alfa=self.alfa, language=self.language, n_digits=self.n_digits)
+        return normality_check.fit_many(X, test="sw", alfa=alfa, comparison=comparison, axis=axis)
+
+    # with tests, with docstring
+    def _fit_block(self, x_block, alfa, comparison):
+        """Applies the Shapiro Wilk test to each row of ``x_block``. This is the batch counterpart of :meth:`fit`, used by :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>`.
+
+        Parameters
+        ----------
+        x_block : ``numpy array``
+            Two dimension array where each row is one sample (all samples have the same size).
+        alfa : ``float``
+            The level of significance (already checked).
+        comparison : ``str``
+            ``"critical"`` or ``"p-value"`` (already checked).
+
+        Returns
+        -------
+        statistic, critical, p_value : ``numpy array``
+            The results for each row (``nan`` when not available).
+        conclusion : ``numpy array``
+            ``1`` if :math:`H_0` is rejected, ``0`` otherwise.
+
+        """
+        statistic = kernels._shapiro_wilk_statistic(x_block)
+        p_value = kernels._shapiro_wilk_p_value(statistic, x_block.shape[1])
+        critical = self.get_critical_value(n_rep=x_block.shape[1], alfa=alfa)[0]
+        if comparison == "p-value":
+            conclusion = p_value < alfa
+        else:
+            if critical is None:
+                self._raises_critical_not_found(alfa)
+            conclusion = statistic < critical
+        critical = np.full(x_block.shape[0], np.nan if critical is None else critical)
+        return statistic, critical, p_value, conclusion.astype(int)
+
+    # with tests, with text, with database, with docstring
+    def _raises_critical_not_found(self, alfa):
+        """Raises the (translated) error when there is no critical value for ``alfa``, showing the allowed significance levels. Used by :meth:`fit` and :meth:`_fit_block`.
+
+        Parameters
+        ----------
+        alfa : ``float``
+            The level of significance.
+
+        Returns
+        -------
+        ``ValueError``
+
+        """
+        fk_id_function = management._query_func_id("normalitycheck_fit")
+        messages = management._get_messages(fk_id_function, self.language, "normalitycheck_fit")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            msg = f"{messages[3][0][0]} '{alfa}' {messages[3][2][0]}"
+            p_values = [0.01, 0.02, 0.05, 0.1, 0.5]
+            alfa_list = [msg]
+            for item in p_values:
+                alfa_list.append(f"   --->    {item}")
+            general._display_n_line_attention(alfa_list)
+            raise
+
     # with docstring, with text, with database, with test,
     def to_xlsx(self, file_name=None, sheet_names=None):
         """This method exports the data to excel type files.
@@ -957,3 +1046,9 @@ class ShapiroWilk(AlphaManagement, NDigitsManagement, PlotsManagement):
         fk_id_function = management._query_func_id("ShapiroWilk")
         messages = management._get_messages(fk_id_function, self.language, "ShapiroWilk")
         return messages[2][0][0]
+
+
+def _extrapolate_critical_value(n_rep, alfa, critical):
+    """Extrapolates the critical value for ``50`` observations to larger samples, keeping the ratio of ``1 - W`` given by the Royston approximation"""
+    ratio = (1 - kernels._shapiro_wilk_critical_value(n_rep, alfa))/(1 - kernels._shapiro_wilk_critical_value(50, alfa))
+    return 1 - (1 - critical)*ratio
@@ -0,0 +1,278 @@
+"""This module runs the tests of pycafee on large batches of samples using many processes.
+
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - ParallelExecutor(LanguageManagement)
+#     - __init__(self, max_workers=None, chunk_size=None, language=None, **kwargs)
+#     - map(self, test_class, X, method="fit", init_kwargs=None, method_kwargs=None)
+#     - __str__(self)
+#     - __repr__(self)
+# - _initialize_worker(language)
+# - _attach_shared_memory(name)
+# - _run_chunk(test_class, method, init_kwargs, method_kwargs, data, bounds)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+
+try:
+    from multiprocessing import shared_memory
+except ImportError: # python < 3.8
+    shared_memory = None
+
+###### Third part ######
+import numpy as np
+
+###### Home made ######
+from pycafee.database_management import management
+from pycafee.utils import checkers
+from pycafee.utils import general
+from pycafee.utils.helpers import LanguageManagement
+
+
+###########################################
+################ Functions ################
+###########################################
+
+
+def _initialize_worker(language):
+    """Loads the messages catalog once per worker, so the tests do not need to read it again for each sample
+
+    Parameters
+    ----------
+    language : ``str``
+        The language code used by the tests.
+
+    """
+    management._load_function_ids()
+    language_ids = management._load_language_ids()
+    management._load_messages_catalog(language_ids.get(language, 2))
+    management._get_current_default_language()
+
+
+def _attach_shared_memory(name):
+    """Attaches to a shared memory block created by the parent process (which is the one that removes it)
+
+    Parameters
+    ----------
+    name : ``str``
+        The name of the shared memory block.
+
+    Returns
+    -------
+    shm : ``SharedMemory``
+
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError: # python < 3.13
+        # the workers share the resource tracker of the parent, so the block is still registered only once
+        return shared_memory.SharedMemory(name=name)
+
+
+def _run_chunk(test_class, method, init_kwargs, method_kwargs, data, bounds):
+    """Applies ``method`` of ``test_class`` to each sample of one chunk
+
+    Parameters
+    ----------
+    test_class : ``class``
+        The test class (e.g., ``NormalityCheck``).
+    method : ``str``
+        The name of the method to call for each sample.
+    init_kwargs : ``dict``
+        Parameters used to instantiate ``test_class`` (once per chunk).
+    method_kwargs : ``dict``
+        Parameters passed to ``method``.
+    data : ``tuple`` or ``numpy array``
+        Either ``(name, dtype, size)`` of the shared memory block with all samples concatenated, or the concatenated samples of the chunk.
+    bounds : ``list`` of ``tuple``
+        The ``(start, stop)`` positions of each sample of the chunk on ``data``.
+
+    Returns
+    -------
+    results : ``list``
+        The results of ``method`` for each sample of the chunk, in order.
+
+    """
+    shm = None
+    if isinstance(data, tuple):
+        name, dtype, size = data
+        shm = _attach_shared_memory(name)
+        data = np.ndarray((size,), dtype=dtype, buffer=shm.buf)
+    try:
+        instance = test_class(**init_kwargs)
+        function = getattr(instance, method)
+        # each sample is copied, so the results never keep references to the shared memory
+        return [function(np.array(data[start:stop]), **method_kwargs) for start, stop in bounds]
+    finally:
+        if shm is not None:
+            del data
+            shm.close()
+
+
+class ParallelExecutor(LanguageManagement):
+    """This class instantiates an object to apply a test to many samples using many processes
+
+    The samples are sent to the workers through shared memory (when available) instead of being pickled, and the results are returned in the same order as the samples.
+
+    Attributes
+    ----------
+    chunk_size : ``int`` or ``None``
+        The number of samples sent to a worker at once (``None`` means automatic).
+    language : ``str``
+        The language code used for the interface.
+    max_workers : ``int``
+        The number of worker processes.
+
+    Methods
+    -------
+    map(test_class, X, method="fit", init_kwargs=None, method_kwargs=None)
+        Applies the test to each sample.
+
+    Notes
+    -----
+    Use it for tests that do not vectorize (e.g., the outlier tests). For normality tests on samples with the same size, :meth:`NormalityCheck.fit_many() <pycafee.normalitycheck.normalitycheck.NormalityCheck.fit_many>` is usually faster, since it does not start new processes.
+
+    On platforms that start the workers with ``spawn`` (e.g., Windows and macOS), the code that calls :meth:`map` must be protected by ``if __name__ == "__main__":``.
+
+    """
+
+    def __init__(self, max_workers=None, chunk_size=None, language=None, **kwargs):
+        super().__init__(language=language, **kwargs)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        else:
+            checkers._check_is_integer(max_workers, "max_workers", self.language)
+            checkers._check_is_positive(max_workers, "max_workers", self.language)
+        if chunk_size is not None:
+            checkers._check_is_integer(chunk_size, "chunk_size", self.language)
+            checkers._check_is_positive(chunk_size, "chunk_size", self.language)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    # with tests, with text, with database, with docstring
+    def map(self, test_class, X, method="fit", init_kwargs=None, method_kwargs=None):
+        """Applies a test to each sample of a batch, using many processes.
+
+        Parameters
+        ----------
+        test_class : ``class``
+            The test class, e.g., :class:`NormalityCheck <pycafee.normalitycheck.normalitycheck.NormalityCheck>`, :class:`Grubbs <pycafee.sample.outliers.Grubbs>` or :class:`Dixon <pycafee.sample.outliers.Dixon>`. It is instantiated once per chunk.
+        X : ``numpy array`` or ``list``
+            A two dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` where each row is one sample, or a ``list`` of one dimension :doc:`numpy arrays <numpy:reference/generated/numpy.array>`.
+        method : ``str``, optional
+            The name of the method applied to each sample (default is ``"fit"``).
+        init_kwargs : ``dict``, optional
+            Parameters used to instantiate ``test_class`` (default is ``None``, which uses the ``language`` of the executor).
+        method_kwargs : ``dict``, optional
+            Parameters passed to ``method`` (e.g., ``{"alfa": 0.01, "details": "binary"}``). Default is ``None`` (no parameters).
+
+        Returns
+        -------
+        results : ``list``
+            The results of ``method`` for each sample, in the same order as ``X``.
+
+        Examples
+        --------
+        >>> from pycafee.parallel import ParallelExecutor
+        >>> from pycafee.sample.outliers import Grubbs
+        >>> import numpy as np
+        >>> X = np.random.default_rng(42).normal(size=(1000, 20))
+        >>> executor = ParallelExecutor(max_workers=4)
+        >>> results = executor.map(Grubbs, X, method_kwargs={"details": "binary"})
+        >>> print(results[0])
+        (GrubbsResult(Statistic=2.204265665008194, Critical=2.709, alpha=0.05, kind='one', outlier=-1.9510351886538364), 0)
+
+        """
+        fk_id_function = management._query_func_id("ParallelExecutor")
+        messages = management._get_messages(fk_id_function, self.language, "ParallelExecutor")
+
+        ### checking the test and the method ###
+        checkers._check_is_str(method, "method", self.language)
+        if isinstance(test_class, type) == False or callable(getattr(test_class, method, None)) == False:
+            try:
+                error = messages[3][0][0]
+                raise ValueError(error)
+            except ValueError:
+                general._display_one_line_attention(f"{messages[4][0][0]} '{method}' {messages[4][2][0]} '{test_class}'")
+                raise
+        if init_kwargs is None:
+            init_kwargs = {"language": self.language}
+        else:
+            checkers._check_is_dict(init_kwargs, "init_kwargs", self.language)
+        if method_kwargs is None:
+            method_kwargs = {}
+        else:
+            checkers._check_is_dict(method_kwargs, "method_kwargs", self.language)
+
+        ### checking the samples and concatenating them in a flat array ###
+        if isinstance(X, list):
+            for sample in X:
+                checkers._check_is_numpy_1_D(sample, "X", self.language)
+            sizes = np.array([sample.size for sample in X], dtype=int)
+            flat = np.concatenate(X) if len(X) > 0 else np.empty(0)
+        else:
+            checkers._check_is_numpy_2_D(X, "X", self.language)
+            sizes = np.full(X.shape[0], X.shape[1])
+            flat = np.ascontiguousarray(X).ravel()
+        stops = np.cumsum(sizes)
+        bounds = list(zip((stops - sizes).tolist(), stops.tolist()))
+        if len(bounds) == 0:
+            return []
+
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            # about four chunks per worker, to balance the load without too much overhead
+            chunk_size = max(1, math.ceil(len(bounds) / (4 * self.max_workers)))
+        chunks = [bounds[i:i + chunk_size] for i in range(0, len(bounds), chunk_size)]
+
+        ### running in this process ###
+        if self.max_workers == 1 or len(chunks) == 1:
+            results = []
+            for chunk in chunks:
+                results.extend(_run_chunk(test_class, method, init_kwargs, method_kwargs, flat, chunk))
+            return results
+
+        ### running in the workers ###
+        shm = None
+        if shared_memory is not None and flat.nbytes > 0:
+            shm = shared_memory.SharedMemory(create=True, size=flat.nbytes)
+            np.ndarray(flat.shape, dtype=flat.dtype, buffer=shm.buf)[:] = flat
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_initialize_worker, initargs=(self.language,)) as executor:
+                futures = []
+                for chunk in chunks:
+                    if shm is None:
+                        # without shared memory, only the samples of the chunk are pickled
+                        data = flat[chunk[0][0]:chunk[-1][1]]
+                        chunk = [(start - chunk[0][0], stop - chunk[0][0]) for start, stop in chunk]
+                    else:
+                        data = (shm.name, flat.dtype.str, flat.size)
+                    futures.append(executor.submit(_run_chunk, test_class, method, init_kwargs, method_kwargs, data, chunk))
+                results = []
+                for future in futures:
+                    results.extend(future.result())
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        return results
+
+    def __str__(self):
+        fk_id_function = management._query_func_id("ParallelExecutor")
+        messages = management._get_messages(fk_id_function, self.language, "ParallelExecutor")
+        return f"{messages[1][0][0]} {self.max_workers}"
+
+    def __repr__(self):
+        fk_id_function = management._query_func_id("ParallelExecutor")
+        messages = management._get_messages(fk_id_function, self.language, "ParallelExecutor")
+        return messages[2][0][0]
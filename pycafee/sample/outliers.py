@@ -7,7 +7,7 @@
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
+import functools
 
 ###### Third part ######
 import numpy as np
@@ -21,8 +21,12 @@ from pycafee.functions.functions import interquartile_range
 from pycafee.utils import helpers
 from pycafee.utils import general
 from pycafee.utils import checkers
+from pycafee.utils import criticaltables
+from pycafee.tables import MonteCarloTable
+from pycafee.functions.quantilesketch import QuantileSketch
+from pycafee.sample.streamingsample import _check_source, _read_chunks, _check_is_reiterable, _scan_chunks
 
-from pycafee.utils.helpers import AlphaManagement, NDigitsManagement, LanguageManagement
+from pycafee.utils.helpers import AlphaManagement, NDigitsManagement, LanguageManagement, SortedCacheManagement
 from pycafee.functions import functions
 
 
@@ -48,7 +52,7 @@ class ZScore(LanguageManagement):
 
 
 
-    def fit(self, x_exp, which=None, critical=None, details=None):
+    def fit(self, x_exp=None, which=None, critical=None, details=None, x_source=None):
         """This function applies the Z-score test for outlier detection
 
         Parameters
@@ -71,6 +75,8 @@ class ZScore(LanguageManagement):
 
         critical : ``int`` or ``float``, optional
             The critical value of the test (default is ``3``).
+        x_source : ``str``, ``numpy array`` or ``iterable``, optional
+            The data read in chunks, with bounded memory, instead of ``x_exp``: the path of a ``.npy`` file or of a raw binary file of ``float64`` values, a :class:`numpy.memmap`, or an iterable of one dimension ``numpy arrays`` (default is ``None``). A :class:`numpy.memmap` passed to ``x_exp`` is also read in chunks.
 
         Returns
         -------
@@ -115,6 +121,8 @@ class ZScore(LanguageManagement):
            else:
                Data has a outlier
 
+        When the data is read in chunks (``x_source``), the mean, the standard deviation and the extreme values are accumulated in a single pass, so the result is the same of the data in memory.
+
 
 
         References
@@ -140,15 +148,26 @@ class ZScore(LanguageManagement):
         """
 
         ### checking input data ###
-        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        source = _check_source(x_exp, x_source, self.language)
+        if source is None:
+            checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+            moments = None
+            n_rep = x_exp.size
+        else:
+            # a single pass over the chunks (bounded memory)
+            moments, _ = _scan_chunks(_read_chunks(source, self.language))
+            n_rep = moments[0]
         self.x_exp = x_exp
 
-        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+        checkers._check_value_is_equal_or_higher_than(n_rep, "size", 3, language=self.language)
 
 
         ### checking the which parameter ###
         if which is None:
-            which = _check_outermost_observation(x_exp)
+            if source is None:
+                which = _check_outermost_observation(x_exp)
+            else:
+                which = _check_outermost_value(moments[1], moments[5], moments[6])
         else:
             checkers._check_is_str(which, "which", language=self.language)
             if which not in ["min", "max"]:
@@ -163,11 +182,7 @@ class ZScore(LanguageManagement):
 
 
         ### Cheking the critical parameter
-        if critical is None:
-            critical = 3
-        else:
-            checkers._check_is_float_or_int(critical, "critical", self.language)
-            checkers._check_is_positive(critical, "critical", self.language)
+        critical = self._check_critical(critical)
 
         ### checking the details parameter ###
         if details == None:
@@ -201,20 +216,12 @@ class ZScore(LanguageManagement):
 
 
         ## Basic stats
-        mean = np.mean(x_exp)
-        std = np.std(x_exp, ddof=1)
-        if std <= 10e-7:
-            try:
-                fk_id_function = management._query_func_id("generic")
-                messages = management._get_messages(fk_id_function, self.language, "generic")
-                error = messages[5][0][0]
-                raise ZeroDivisionError(error)
-            except ZeroDivisionError:
-                general._display_one_line_attention(messages[6][0][0])
-                raise
+        mean, std = self._mean_std(x_exp, moments)
 
         ## Z-score
-        if which == "min":
+        if source is not None:
+            outlier = moments[5] if which == "min" else moments[6]
+        elif which == "min":
             outlier = np.min(x_exp)
         else:
             outlier = np.max(x_exp)
@@ -250,7 +257,7 @@ class ZScore(LanguageManagement):
         self.x_exp = x_exp
         ### making the named tuple
         name = "ZScore" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][3][0], messages[1][1][0], "outlier"))
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], "outlier"), ("statistic", "critical", "outlier"))
         return result(statistic, critical, outlier), conclusion
 
 
@@ -259,6 +266,126 @@ class ZScore(LanguageManagement):
 
 
 
+    # with tests, with docstring, without text
+    def score_all(self, x_exp):
+        """This function calculates the Z-score of every observation
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least 3 sample data.
+
+        Returns
+        -------
+        statistic : ``numpy array``
+            The Z-score of each observation (same order of ``x_exp``).
+
+        See Also
+        --------
+        pycafee.sample.outliers.ZScore.flag_all
+        pycafee.sample.outliers.ZScore.fit
+
+        Notes
+        -----
+        The mean and the standard deviation are calculated only once and the scores are obtained with array operations, so this function can be used with millions of observations.
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.outliers import ZScore
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> test = ZScore()
+        >>> print(test.score_all(x).round(3))
+        [0.824 0.137 0.549 0.892 0.481 1.853 0.892 0.481 1.579 0.137]
+
+        """
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+        mean, std = self._mean_std(x_exp)
+        return np.abs(x_exp - mean)/std
+
+    # with tests, with docstring, without text
+    def flag_all(self, x_exp, critical=None):
+        """This function applies the Z-score test to every observation
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least 3 sample data.
+        critical : ``int`` or ``float``, optional
+            The critical value of the test (default is ``3``).
+
+        Returns
+        -------
+        result : ``tuple`` with
+            statistic : ``numpy array``
+                The Z-score of each observation.
+            critical : ``float``
+                The critical value.
+            outlier : ``numpy array`` of ``bool``
+                ``True`` for the observations with Z-score higher than ``critical``.
+
+        See Also
+        --------
+        pycafee.sample.outliers.ZScore.score_all
+        pycafee.sample.outliers.ZScore.fit
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.outliers import ZScore
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> test = ZScore()
+        >>> result = test.flag_all(x, critical=1.5)
+        >>> print(x[result.outlier])
+        [5.4 4.4]
+
+        """
+        critical = self._check_critical(critical)
+        statistic = self.score_all(x_exp)
+
+        ### quering
+        fk_id_function = management._query_func_id("generic")
+        messages = management._get_messages(fk_id_function, self.language, "generic")
+
+        ### making the named tuple
+        name = "ZScoreAll" + messages[1][0][0]
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], messages[1][4][0]), ("statistic", "critical", "outlier"))
+        return result(statistic, critical, statistic > critical)
+
+    def _check_critical(self, critical):
+        """Checks the critical value (``None`` means ``3``)"""
+        if critical is None:
+            critical = 3
+        else:
+            checkers._check_is_float_or_int(critical, "critical", self.language)
+            checkers._check_is_positive(critical, "critical", self.language)
+        return critical
+
+    def _mean_std(self, x_exp, moments=None):
+        """Calculates the mean and the sample standard deviation, from the data or from the accumulated ``moments`` (raises ``ZeroDivisionError`` if the standard deviation is zero)"""
+        if moments is None:
+            mean = np.mean(x_exp)
+            std = np.std(x_exp, ddof=1)
+        else:
+            mean = moments[1]
+            std = np.sqrt(moments[2]/(moments[0] - 1))
+        if std <= 10e-7:
+            try:
+                fk_id_function = management._query_func_id("generic")
+                messages = management._get_messages(fk_id_function, self.language, "generic")
+                error = messages[5][0][0]
+                raise ZeroDivisionError(error)
+            except ZeroDivisionError:
+                general._display_one_line_attention(messages[6][0][0])
+                raise
+        return mean, std
+
+
+
+
     def __str__(self):
         if self.conclusion is None:
             fk_id_function = management._query_func_id("generic")
@@ -288,7 +415,7 @@ class ModifiedZScore(LanguageManagement):
 
 
 
-    def fit(self, x_exp, which=None, critical=None, details=None):
+    def fit(self, x_exp=None, which=None, critical=None, details=None, x_source=None, rank_error=None):
         """This function applies the Modified Z-score test for outlier detection [1]_.
 
         Parameters
@@ -311,6 +438,10 @@ class ModifiedZScore(LanguageManagement):
 
         critical : ``int`` or ``float``, optional
             The critical value of the test (default is ``3.5``).
+        x_source : ``str``, ``numpy array`` or ``iterable``, optional
+            The data read in chunks, with bounded memory, instead of ``x_exp``: the path of a ``.npy`` file or of a raw binary file of ``float64`` values, a :class:`numpy.memmap`, or a container (e.g., a ``list``) of one dimension ``numpy arrays``, since the data is read twice (default is ``None``). A :class:`numpy.memmap` passed to ``x_exp`` is also read in chunks.
+        rank_error : ``float``, optional
+            The normalized rank error of the :class:`~pycafee.functions.quantilesketch.QuantileSketch` used to estimate the median and the ``MAD`` when the data is read in chunks (default is ``None``, which means ``0.01``).
 
         Returns
         -------
@@ -357,6 +488,8 @@ class ModifiedZScore(LanguageManagement):
            else:
                Data has a outlier
 
+        When the data is read in chunks (``x_source``), the median is estimated with a quantile sketch on a first pass and the ``MAD`` with another sketch of the absolute deviations on a second pass. Both are exact while the sample has fewer values than the capacity of the sketch.
+
 
 
         References
@@ -381,15 +514,28 @@ class ModifiedZScore(LanguageManagement):
         """
 
         ### checking input data ###
-        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        source = _check_source(x_exp, x_source, self.language)
+        if source is None:
+            checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+            sketch = None
+            n_rep = x_exp.size
+        else:
+            # the median and the MAD need two passes over the chunks
+            _check_is_reiterable(source, self.language)
+            sketch = QuantileSketch(rank_error=rank_error, language=self.language)
+            moments, _ = _scan_chunks(_read_chunks(source, self.language), sketch=sketch)
+            n_rep = moments[0]
         self.x_exp = x_exp
 
-        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+        checkers._check_value_is_equal_or_higher_than(n_rep, "size", 3, language=self.language)
 
 
         ### checking the which parameter ###
         if which is None:
-            which = _check_outermost_observation(x_exp)
+            if source is None:
+                which = _check_outermost_observation(x_exp)
+            else:
+                which = _check_outermost_value(moments[1], moments[5], moments[6])
         else:
             checkers._check_is_str(which, "which", language=self.language)
             if which not in ["min", "max"]:
@@ -404,11 +550,7 @@ class ModifiedZScore(LanguageManagement):
 
 
         ### Cheking the critical parameter
-        if critical is None:
-            critical = 3.5
-        else:
-            checkers._check_is_float_or_int(critical, "critical", self.language)
-            checkers._check_is_positive(critical, "critical", self.language)
+        critical = self._check_critical(critical)
 
         ### checking the details parameter ###
         if details == None:
@@ -440,21 +582,12 @@ class ModifiedZScore(LanguageManagement):
 
 
         ## Basic stats
-        mediana = np.median(x_exp)
-        mad_vector = np.abs(x_exp-mediana)
-        mad_median = np.median(mad_vector)
-        if mad_median <= 10e-7:
-            try:
-                fk_id_function = management._query_func_id("outliers")
-                messages = management._get_messages(fk_id_function, self.language, "outliers")
-                error = messages[7][0][0]
-                raise ZeroDivisionError(error)
-            except ZeroDivisionError:
-                general._display_one_line_attention(messages[6][0][0])
-                raise
+        mediana, mad_median = self._median_mad(x_exp, source, sketch)
 
         ## Z-score
-        if which == "min":
+        if source is not None:
+            outlier = moments[5] if which == "min" else moments[6]
+        elif which == "min":
             outlier = np.min(x_exp)
         else:
             outlier = np.max(x_exp)
@@ -490,7 +623,7 @@ class ModifiedZScore(LanguageManagement):
         self.x_exp = x_exp
         ### making the named tuple
         name = "ModifiedZScore" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][3][0], messages[1][1][0], "outlier"))
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], "outlier"), ("statistic", "critical", "outlier"))
         return result(statistic, critical, outlier), conclusion
 
 
@@ -499,6 +632,131 @@ class ModifiedZScore(LanguageManagement):
 
 
 
+    # with tests, with docstring, without text
+    def score_all(self, x_exp):
+        """This function calculates the modified Z-score of every observation
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least 3 sample data.
+
+        Returns
+        -------
+        statistic : ``numpy array``
+            The modified Z-score of each observation (same order of ``x_exp``).
+
+        See Also
+        --------
+        pycafee.sample.outliers.ModifiedZScore.flag_all
+        pycafee.sample.outliers.ModifiedZScore.fit
+
+        Notes
+        -----
+        The median and the median absolute deviation are calculated only once, with ``np.partition`` instead of sorting the data, and the scores are obtained with array operations, so this function can be used with millions of observations.
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.outliers import ModifiedZScore
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> test = ModifiedZScore()
+        >>> print(test.score_all(x).round(3))
+        [0.674 0.    0.675 1.012 0.337 1.686 1.012 0.337 1.686 0.   ]
+
+        """
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+        mediana, mad_median = self._median_mad(x_exp)
+        return 0.6745*np.abs(x_exp - mediana)/mad_median
+
+    # with tests, with docstring, without text
+    def flag_all(self, x_exp, critical=None):
+        """This function applies the modified Z-score test to every observation
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least 3 sample data.
+        critical : ``int`` or ``float``, optional
+            The critical value of the test (default is ``3.5``).
+
+        Returns
+        -------
+        result : ``tuple`` with
+            statistic : ``numpy array``
+                The modified Z-score of each observation.
+            critical : ``float``
+                The critical value.
+            outlier : ``numpy array`` of ``bool``
+                ``True`` for the observations with modified Z-score higher than ``critical``.
+
+        See Also
+        --------
+        pycafee.sample.outliers.ModifiedZScore.score_all
+        pycafee.sample.outliers.ModifiedZScore.fit
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.outliers import ModifiedZScore
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> test = ModifiedZScore()
+        >>> result = test.flag_all(x, critical=1.5)
+        >>> print(x[result.outlier])
+        [5.4 4.4]
+
+        """
+        critical = self._check_critical(critical)
+        statistic = self.score_all(x_exp)
+
+        ### quering
+        fk_id_function = management._query_func_id("generic")
+        messages = management._get_messages(fk_id_function, self.language, "generic")
+
+        ### making the named tuple
+        name = "ModifiedZScoreAll" + messages[1][0][0]
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], messages[1][4][0]), ("statistic", "critical", "outlier"))
+        return result(statistic, critical, statistic > critical)
+
+    def _check_critical(self, critical):
+        """Checks the critical value (``None`` means ``3.5``)"""
+        if critical is None:
+            critical = 3.5
+        else:
+            checkers._check_is_float_or_int(critical, "critical", self.language)
+            checkers._check_is_positive(critical, "critical", self.language)
+        return critical
+
+    def _median_mad(self, x_exp, source=None, sketch=None):
+        """Calculates the median and the median absolute deviation, from the data or from a data ``source`` already pushed to the ``sketch`` (raises ``ZeroDivisionError`` if the deviation is zero)"""
+        if source is None:
+            mediana = functions._order_statistics(x_exp)[2]
+            # the deviations are a temporary array, so they are partitioned in place
+            mad_median = functions._order_statistics(np.abs(x_exp - mediana), overwrite_input=True)[2]
+        else:
+            mediana = sketch.quantile(0.5)
+            # second pass: the deviations from the median
+            deviations = QuantileSketch(rank_error=sketch.rank_error, language=self.language)
+            for chunk in _read_chunks(source, self.language):
+                deviations.push(np.abs(chunk - mediana))
+            mad_median = deviations.quantile(0.5)
+        if mad_median <= 10e-7:
+            try:
+                fk_id_function = management._query_func_id("outliers")
+                messages = management._get_messages(fk_id_function, self.language, "outliers")
+                error = messages[7][0][0]
+                raise ZeroDivisionError(error)
+            except ZeroDivisionError:
+                general._display_one_line_attention(messages[6][0][0])
+                raise
+        return mediana, mad_median
+
+
+
+
     def __str__(self):
         if self.conclusion is None:
             fk_id_function = management._query_func_id("generic")
@@ -528,7 +786,7 @@ class Tukey(LanguageManagement):
 
 
 
-    def fit(self, x_exp, which=None, critical=None, details=None):
+    def fit(self, x_exp=None, which=None, critical=None, details=None, rank_error=None, x_source=None, assume_sorted=False):
         """This function applies the Tukey method (Boxplot) for outlier detection [1]_.
 
         Parameters
@@ -556,6 +814,13 @@ class Tukey(LanguageManagement):
             * If ``critical="mild"``, the critical value is ``1.5``;
             * If a number, it must higher than zero (``0``);
 
+        rank_error : ``float``, optional
+            The normalized rank error used to estimate the quartiles with a :class:`~pycafee.functions.quantilesketch.QuantileSketch`, without sorting the data (default is ``None``, which means the exact quartiles). Useful for very large samples, since small samples are evaluated exactly anyway. When the data is read in chunks, the quartiles are always estimated with the sketch (``None`` means ``0.01``).
+        x_source : ``str``, ``numpy array`` or ``iterable``, optional
+            The data read in chunks, with bounded memory, instead of ``x_exp``: the path of a ``.npy`` file or of a raw binary file of ``float64`` values, a :class:`numpy.memmap`, or an iterable of one dimension ``numpy arrays`` (default is ``None``). A :class:`numpy.memmap` passed to ``x_exp`` is also read in chunks.
+        assume_sorted : ``bool``, optional
+            If ``True``, ``x_exp`` is assumed to be sorted in ascending order and the quartiles are read directly from it, without partitioning (or copying) the data (default is ``False``). The order is not checked.
+
         Returns
         -------
         result : ``tuple`` with
@@ -644,17 +909,30 @@ class Tukey(LanguageManagement):
 
 
         """
+        checkers._check_is_bool(assume_sorted, "assume_sorted", self.language)
+
 
         ### checking input data ###
-        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        source = _check_source(x_exp, x_source, self.language)
+        if source is None:
+            checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+            n_rep = x_exp.size
+        else:
+            # a single pass over the chunks (bounded memory)
+            sketch = QuantileSketch(rank_error=rank_error, language=self.language)
+            moments, _ = _scan_chunks(_read_chunks(source, self.language), sketch=sketch)
+            n_rep = moments[0]
         self.x_exp = x_exp
 
-        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+        checkers._check_value_is_equal_or_higher_than(n_rep, "size", 3, language=self.language)
 
 
         ### checking the which parameter ###
         if which is None:
-            which = _check_outermost_observation(x_exp)
+            if source is None:
+                which = _check_outermost_observation(x_exp)
+            else:
+                which = _check_outermost_value(moments[1], moments[5], moments[6])
         else:
             checkers._check_is_str(which, "which", language=self.language)
             if which not in ["min", "max"]:
@@ -669,32 +947,7 @@ class Tukey(LanguageManagement):
 
 
         ### Cheking the critical parameter
-        if critical is None:
-            critical = 3
-        elif type(critical) == str:
-            checkers._check_is_str(critical, "critical", self.language)
-            if critical == "mild":
-                critical = 1.5
-            elif critical == "extreme":
-                critical = 3
-            else:
-                fk_id_function = management._query_func_id("generic")
-                messages = management._get_messages(fk_id_function, self.language, "generic")
-                try:
-                    error = messages[3][0][0]
-                    raise ValueError(error)
-                except ValueError:
-                    msg = [f"{messages[4][0][0]} 'critical' {messages[4][2][0]}:"]
-                    values = ['mild', 'extreme']
-                    for item in values:
-                        msg.append(f"   --->    '{item}'")
-                    msg.append(f"{messages[4][4][0]}:")
-                    msg.append(f"   --->    '{critical}'")
-                    general._display_n_line_attention(msg)
-                    raise
-        else:
-            checkers._check_is_float_or_int(critical, "critical", self.language)
-            checkers._check_is_positive(critical, "critical", self.language)
+        critical = self._check_critical(critical)
 
         ### checking the details parameter ###
         if details == None:
@@ -723,23 +976,34 @@ class Tukey(LanguageManagement):
 
 
 
-        # ordenando os dados
-        x_exp = np.sort(x_exp, kind='quicksort')
-
         # obtendo a dstancia interquerlica
-        result, x_low, x_upper = interquartile_range(x_exp,method="tukey",language=self.language)
-        DI = result[0]
-        q1 = result[1]
-        q3 = result[2]
+        if source is not None:
+            result, x_low, x_upper = interquartile_range(sketch, method="tukey", language=self.language)
+            DI = result[0]
+            q1 = result[1]
+            q3 = result[2]
+            x_min = moments[5]
+            x_max = moments[6]
+        elif rank_error is None:
+            # one partition gives the quartiles and the extremes (no sorting)
+            x_min, q1, _, q3, x_max = functions._order_statistics(x_exp, method="tukey", is_sorted=assume_sorted)
+            DI = q3 - q1
+        else:
+            result, x_low, x_upper = interquartile_range(x_exp,method="tukey",language=self.language,rank_error=rank_error)
+            DI = result[0]
+            q1 = result[1]
+            q3 = result[2]
+            x_min = np.min(x_exp)
+            x_max = np.max(x_exp)
 
 
         ## interval
         interval_lower = q1 - critical*DI
         interval_upper = q3 + critical*DI
         if which == "min":
-            outlier = np.min(x_exp)
+            outlier = x_min
         else:
-            outlier = np.max(x_exp)
+            outlier = x_max
 
 
         aceita = 0
@@ -763,15 +1027,147 @@ class Tukey(LanguageManagement):
         ### quering
         fk_id_function = management._query_func_id("generic")
         messages = management._get_messages(fk_id_function, self.language, "generic")
-        self.conclusion = conclusion
-        self.interval = [interval_lower, interval_upper]
-        self.critical = critical
-        self.x_exp = x_exp
+        self.conclusion = conclusion
+        self.interval = [interval_lower, interval_upper]
+        self.critical = critical
+        self.x_exp = x_exp
+        ### making the named tuple
+
+        name = "Tukey" + messages[1][0][0]
+        result = helpers._get_result_class(name, (messages[1][5][0], messages[1][1][0], messages[1][4][0]), ("interval", "critical", "outlier"))
+        return result(self.interval, critical, outlier), conclusion
+
+
+
+
+    # with tests, with docstring, without text
+    def score_all(self, x_exp):
+        """This function calculates the distance of every observation to the quartiles, in units of the interquartile range
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least 3 sample data.
+
+        Returns
+        -------
+        statistic : ``numpy array``
+            The score of each observation (same order of ``x_exp``), e.g., ``(q1 - x)/IQR`` below the first quartile, ``(x - q3)/IQR`` above the third quartile and a negative value between them. An observation is outside the Tukey fences when its score is higher than the ``critical`` value.
+
+        See Also
+        --------
+        pycafee.sample.outliers.Tukey.flag_all
+        pycafee.sample.outliers.Tukey.fit
+
+        Notes
+        -----
+        The quartiles are obtained with only one ``np.partition`` (no sorting) and the scores with array operations, so this function can be used with millions of observations. If the interquartile range is zero, the score is ``inf`` outside the quartiles.
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.outliers import Tukey
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> test = Tukey()
+        >>> print(test.score_all(x).round(3))
+        [ 0.25 -0.25 -0.25  0.    0.    1.    0.    0.    0.5  -0.25]
+
+        """
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+        _, q1, _, q3, _ = functions._order_statistics(x_exp, method="tukey")
+        return _tukey_scores(x_exp, q3 - q1, q1, q3)
+
+    # with tests, with docstring, without text
+    def flag_all(self, x_exp, critical=None):
+        """This function applies the Tukey method (Boxplot) to every observation
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least 3 sample data.
+        critical : ``str``, ``int`` or ``float``, optional
+            The multiplier of the interquartile range: ``"extreme"`` (or ``None``, the default, equal to ``3``), ``"mild"`` (equal to ``1.5``) or a positive number.
+
+        Returns
+        -------
+        result : ``tuple`` with
+            statistic : ``numpy array``
+                The score of each observation (see :meth:`score_all`).
+            interval : ``list``
+                The lower and upper fences.
+            critical : ``float``
+                The critical value.
+            outlier : ``numpy array`` of ``bool``
+                ``True`` for the observations outside the fences.
+
+        See Also
+        --------
+        pycafee.sample.outliers.Tukey.score_all
+        pycafee.sample.outliers.Tukey.fit
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.outliers import Tukey
+        >>> import numpy as np
+        >>> x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        >>> test = Tukey()
+        >>> result = test.flag_all(x, critical=0.75)
+        >>> print(x[result.outlier])
+        [5.4]
+
+        """
+        critical = self._check_critical(critical)
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        checkers._check_value_is_equal_or_higher_than(x_exp.size, "size", 3, language=self.language)
+
+        _, q1, _, q3, _ = functions._order_statistics(x_exp, method="tukey")
+        DI = q3 - q1
+        interval_lower = q1 - critical*DI
+        interval_upper = q3 + critical*DI
+        statistic = _tukey_scores(x_exp, DI, q1, q3)
+        outlier = (x_exp < interval_lower) | (x_exp > interval_upper)
+
+        ### quering
+        fk_id_function = management._query_func_id("generic")
+        messages = management._get_messages(fk_id_function, self.language, "generic")
+
         ### making the named tuple
+        name = "TukeyAll" + messages[1][0][0]
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][5][0], messages[1][1][0], messages[1][4][0]), ("statistic", "interval", "critical", "outlier"))
+        return result(statistic, [interval_lower, interval_upper], critical, outlier)
 
-        name = "Tukey" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][5][0], messages[1][1][0], messages[1][4][0]))
-        return result(self.interval, critical, outlier), conclusion
+    def _check_critical(self, critical):
+        """Checks the critical value (``None`` or ``"extreme"`` means ``3`` and ``"mild"`` means ``1.5``)"""
+        if critical is None:
+            critical = 3
+        elif type(critical) == str:
+            checkers._check_is_str(critical, "critical", self.language)
+            if critical == "mild":
+                critical = 1.5
+            elif critical == "extreme":
+                critical = 3
+            else:
+                fk_id_function = management._query_func_id("generic")
+                messages = management._get_messages(fk_id_function, self.language, "generic")
+                try:
+                    error = messages[3][0][0]
+                    raise ValueError(error)
+                except ValueError:
+                    msg = [f"{messages[4][0][0]} 'critical' {messages[4][2][0]}:"]
+                    values = ['mild', 'extreme']
+                    for item in values:
+                        msg.append(f"   --->    '{item}'")
+                    msg.append(f"{messages[4][4][0]}:")
+                    msg.append(f"   --->    '{critical}'")
+                    general._display_n_line_attention(msg)
+                    raise
+        else:
+            checkers._check_is_float_or_int(critical, "critical", self.language)
+            checkers._check_is_positive(critical, "critical", self.language)
+        return critical
 
 
 
@@ -792,7 +1188,7 @@ class Tukey(LanguageManagement):
 
 
 
-class Dixon(AlphaManagement, NDigitsManagement):
+class Dixon(AlphaManagement, NDigitsManagement, SortedCacheManagement):
     """This class instantiates an object to apply the Dixon test for detecting oultliers
 
     """
@@ -941,8 +1337,20 @@ class Dixon(AlphaManagement, NDigitsManagement):
                 ]
         }
 
-    def __init__(self, name=None, alfa=None, language=None, n_digits=None, **kwargs):
-        super().__init__(alfa=alfa, language=language, n_digits=n_digits, **kwargs)
+    DIXON_DENSE_TABLES = {
+        "r10" : criticaltables._build_dense_table(DIXON_TABLE_r10),
+        "r11" : criticaltables._build_dense_table(DIXON_TABLE_r11),
+        "r12" : criticaltables._build_dense_table(DIXON_TABLE_r12),
+        "r20" : criticaltables._build_dense_table(DIXON_TABLE_r20),
+        "r21" : criticaltables._build_dense_table(DIXON_TABLE_r21),
+        "r22" : criticaltables._build_dense_table(DIXON_TABLE_r22),
+        }
+
+    # number of simulated samples above the tables
+    MONTE_CARLO_REPLICATES = 100000
+
+    def __init__(self, name=None, alfa=None, language=None, n_digits=None, cache_sorted=False, **kwargs):
+        super().__init__(alfa=alfa, language=language, n_digits=n_digits, cache_sorted=cache_sorted, **kwargs)
         self.conclusion = None
         self.statistic = None
         self.critical = None
@@ -960,7 +1368,7 @@ class Dixon(AlphaManagement, NDigitsManagement):
         ratio : ``str``, optional
             The ratio. It can be ``"r10"`` (or ``None``), ``"r11"``, ``"r12"``, ``"r20"``, ``"r21"`` or ``"r22"``.
         alfa : ``float``
-            The significance level (between ``0.0`` and ``1.0``, default = ``0.05``)
+            The significance level (between ``0.01`` and ``0.20``, default = ``0.05``)
 
         Returns
         -------
@@ -982,6 +1390,10 @@ class Dixon(AlphaManagement, NDigitsManagement):
         * For ``ratio="r21"`` there are critical values within this range ``5<=n_rep<=30``;
         * For ``ratio="r22"`` there are critical values within this range ``6<=n_rep<=30``;
 
+        For other significance levels between ``0.01`` and ``0.20``, the critical value is a monotone cubic interpolation (PCHIP) in ``log(alfa)``. Significance levels outside this range raise a ``ValueError``, for any ``n_rep``.
+
+        For ``n_rep > 30``, the critical value is simulated with :class:`MonteCarloTable <pycafee.tables.montecarlo.MonteCarloTable>` (``MONTE_CARLO_REPLICATES`` samples) and stored on the cache file, so only the first call for each ``n_rep``, ``ratio`` and ``alfa`` is slow.
+
 
         References
         ----------
@@ -1036,25 +1448,24 @@ class Dixon(AlphaManagement, NDigitsManagement):
             checkers._check_is_str(ratio, "ratio", language=self.language)
 
 
-        checkers._check_value_is_equal_or_lower_than(n_rep, "n_rep", 30, language=self.language)
         if ratio == "r10":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 3, language=self.language)
-            table_data = Dixon.DIXON_TABLE_r10
+            table_data = Dixon.DIXON_DENSE_TABLES["r10"]
         elif ratio == "r11":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 4, language=self.language)
-            table_data = Dixon.DIXON_TABLE_r11
+            table_data = Dixon.DIXON_DENSE_TABLES["r11"]
         elif ratio == "r12":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 5, language=self.language)
-            table_data = Dixon.DIXON_TABLE_r12
+            table_data = Dixon.DIXON_DENSE_TABLES["r12"]
         elif ratio == "r20":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 4, language=self.language)
-            table_data = Dixon.DIXON_TABLE_r20
+            table_data = Dixon.DIXON_DENSE_TABLES["r20"]
         elif ratio == "r21":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 5, language=self.language)
-            table_data = Dixon.DIXON_TABLE_r21
+            table_data = Dixon.DIXON_DENSE_TABLES["r21"]
         elif ratio == "r22":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 6, language=self.language)
-            table_data = Dixon.DIXON_TABLE_r22
+            table_data = Dixon.DIXON_DENSE_TABLES["r22"]
         else:
             fk_id_function = management._query_func_id("Dixon")
             messages = management._get_messages(fk_id_function, self.language, "Dixon")
@@ -1076,8 +1487,17 @@ class Dixon(AlphaManagement, NDigitsManagement):
                 )
                 raise
 
+        ### Checking if the alfa value is inside the tabulated range (for any n_rep) ###
+        checkers._check_value_is_equal_or_higher_than(alfa, "alfa", float(table_data.alphas[0]), language=self.language)
+        checkers._check_value_is_equal_or_lower_than(alfa, "alfa", float(table_data.alphas[-1]), language=self.language)
+
         ### getting the critical value ###
-        critical = table_data[alfa][n_rep-table_data['n_rep'][0]]
+        if n_rep <= table_data.n_rep[-1]:
+            critical = float(criticaltables._lookup_critical_values(table_data, n_rep, alfa))
+        else:
+            # acima da tabela, os valores críticos são simulados (com cache em disco)
+            table = MonteCarloTable(replicates=Dixon.MONTE_CARLO_REPLICATES, language=self.language)
+            critical = table.get_critical_value("dixon_" + ratio, n_rep, alfa=alfa)[0]
 
         ### quering
         fk_id_function = management._query_func_id("generic")
@@ -1085,13 +1505,13 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
         ### making the named tuple
         name = "Dixon" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][1][0], messages[1][2][0]))
+        result = helpers._get_result_class(name, (messages[1][1][0], messages[1][2][0]), ("critical", "alpha"))
         return result(critical, alfa)
 
 
 
     # with tests, with text, with database (Dixon), with docstring
-    def fit(self, x_exp, ratio=None, which=None, alfa=None, details=None):
+    def fit(self, x_exp=None, ratio=None, which=None, alfa=None, details=None, x_source=None, assume_sorted=False):
         """This function applies the Dixon test to identify outliers in Normal data with few samples [1]_.
 
         Parameters
@@ -1114,6 +1534,10 @@ class Dixon(AlphaManagement, NDigitsManagement):
             * If it is ``None`` (default), the outlier is automatically inferred as the farthest observation from the mean
             * If it is ``"max"``, the highest value is checked if it is a possible outlier.
             * If it is ``"min"``, the lowest value is checked if it is a possible outlier.
+        x_source : ``str``, ``numpy array`` or ``iterable``, optional
+            The data read in chunks, with bounded memory, instead of ``x_exp``: the path of a ``.npy`` file or of a raw binary file of ``float64`` values, a :class:`numpy.memmap`, or an iterable of one dimension ``numpy arrays`` (default is ``None``). A :class:`numpy.memmap` passed to ``x_exp`` is also read in chunks. Only the three lowest and the three highest values are kept (the ratios do not use the other values), so the result is the same of the data in memory.
+        assume_sorted : ``bool``, optional
+            If ``True``, ``x_exp`` is assumed to be sorted in ascending order and it is used as it is, without being sorted or copied (default is ``False``). The order is not checked. If ``False``, ``x_exp`` is sorted on each call, unless the object was created with ``cache_sorted=True``: then the sorted copy of the last ``x_exp`` is kept on the object, so fitting the same array again does not sort it again (call :meth:`invalidate_sorted` after changing the array in place).
 
         Returns
         -------
@@ -1161,7 +1585,7 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
         There are critical values for alpha equal to ``0.20``, ``0.10``, ``0.05``, ``0.04``, ``0.02`` and ``0.01``. These values are for the **two-tailed Dixon distribution** [2]_.
 
-        The minimum number of samples needed to apply the test varies depending on the ratio parameter, while the maximum number for all cases is 30. The available ranges are:
+        The minimum number of samples needed to apply the test varies depending on the ratio parameter. The tabulated ranges are:
 
         * For ``ratio="r10"`` :math:`\\rightarrow 3 \\leq n \\leq 30`;
         * For ``ratio="r11"`` :math:`\\rightarrow 4 \\leq n \\leq 30`;
@@ -1170,12 +1594,14 @@ class Dixon(AlphaManagement, NDigitsManagement):
         * For ``ratio="r21"`` :math:`\\rightarrow 5 \\leq n \\leq 30`;
         * For ``ratio="r22"`` :math:`\\rightarrow 6 \\leq n \\leq 30`;
 
+        For larger samples, the critical values are simulated (see :meth:`get_critical_value`): the first call for each ``n``, ``ratio`` and ``alfa`` draws ``MONTE_CARLO_REPLICATES`` (``100000``) normal samples, which may take a while, and writes the critical value to a cache file on disk (the ``PYCAFEE_CACHE_DIR`` folder, or ``pycafee`` inside ``~/.cache``, see :mod:`pycafee.tables.cache`). The next calls read the cache. In all cases, ``alfa`` must be between ``0.01`` and ``0.20``.
+
         The ``ratio`` parameter determines which equation will be used to apply the test. If ``ratio=None`` (default), the general rule [2]_ is used to determine outliers:
 
         * If :math:`3 \\leq n \\leq 7` then ``ratio=r10`` is used;
         * If :math:`8 \\leq n \\leq 10` then ``ratio=r11`` is used;
         * If :math:`10 \\leq n \\leq 13` then ``ratio=r21`` is used;
-        * If :math:`14 \\leq n \\leq 30` then ``ratio=r22`` is used;
+        * If :math:`n \\geq 14` then ``ratio=r22`` is used;
 
         The equations to calculate the test statistic (for the minimum or maximum values) depend on the ratio parameter, and are calculated as follows:
 
@@ -1259,6 +1685,8 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
 
         """
+        checkers._check_is_bool(assume_sorted, "assume_sorted", self.language)
+
 
 
         ### getting the default alpha value ###
@@ -1271,7 +1699,12 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
 
         ### checking input data ###
-        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        source = _check_source(x_exp, x_source, self.language)
+        if source is None:
+            checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        else:
+            # a single pass over the chunks, keeping the three values at each end
+            moments, ends = _scan_chunks(_read_chunks(source, self.language), n_ends=3)
         self.x_exp = x_exp
 
         ### checking the details parameter ###
@@ -1296,8 +1729,10 @@ class Dixon(AlphaManagement, NDigitsManagement):
                     raise
 
         # finding the n_rep
-        n_rep = x_exp.size
-        checkers._check_value_is_equal_or_lower_than(n_rep, "n_rep", 30, language=self.language)
+        if source is None:
+            n_rep = x_exp.size
+        else:
+            n_rep = moments[0]
 
         ### checking the ratio ###
         if ratio is None:
@@ -1308,7 +1743,10 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
         ### checking the which ###
         if which is None:
-            which = _check_outermost_observation(x_exp)
+            if source is None:
+                which = _check_outermost_observation(x_exp)
+            else:
+                which = _check_outermost_value(moments[1], moments[5], moments[6])
         else:
             checkers._check_is_str(which, "which", language=self.language)
             if which not in ["min", "max"]:
@@ -1323,7 +1761,10 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
 
         # ordenando os dados
-        x_exp = np.sort(x_exp, kind='quicksort')
+        if source is None:
+            x_exp = self._get_sorted(x_exp, assume_sorted)
+        else:
+            x_exp = ends
 
         # quering
         fk_id_function = management._query_func_id("Dixon")
@@ -1388,14 +1829,14 @@ class Dixon(AlphaManagement, NDigitsManagement):
                 if details == "short":
                     conclusion = f"{messages[3][0][0]}{value_tested}{messages[3][2][0]} {100*(1-alfa)}{messages[3][4][0]}."
                 elif details == "full":
-                    conclusion = f"{messages[4][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[4][2][0]}{critical}{messages[4][4][0]}{value_tested}{messages[4][6][0]} {100*(1-alfa)}{messages[4][8][0]}."
+                    conclusion = f"{messages[4][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[4][2][0]}{helpers._truncate(critical, language=self.language, decs=self.n_digits)}{messages[4][4][0]}{value_tested}{messages[4][6][0]} {100*(1-alfa)}{messages[4][8][0]}."
                 else:
                     conclusion = 1
             else:
                 if details == "short":
                     conclusion = f"{messages[5][0][0]} {100*(1-alfa)}{messages[5][2][0]}."
                 elif details == "full":
-                    conclusion = f"{messages[6][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[6][2][0]}{critical}{messages[6][4][0]} {100*(1-alfa)}{messages[6][6][0]}."
+                    conclusion = f"{messages[6][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[6][2][0]}{helpers._truncate(critical, language=self.language, decs=self.n_digits)}{messages[6][4][0]} {100*(1-alfa)}{messages[6][6][0]}."
                 else:
                     conclusion = 0
 
@@ -1454,14 +1895,14 @@ class Dixon(AlphaManagement, NDigitsManagement):
                 if details == "short":
                     conclusion = f"{messages[7][0][0]}{value_tested}{messages[7][2][0]} {100*(1-alfa)}{messages[7][4][0]}."
                 elif details == "full":
-                    conclusion = f"{messages[8][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[8][2][0]}{critical}{messages[8][4][0]}{value_tested}{messages[8][6][0]} {100*(1-alfa)}{messages[8][8][0]}."
+                    conclusion = f"{messages[8][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[8][2][0]}{helpers._truncate(critical, language=self.language, decs=self.n_digits)}{messages[8][4][0]}{value_tested}{messages[8][6][0]} {100*(1-alfa)}{messages[8][8][0]}."
                 else:
                     conclusion = 1
             else:
                 if details == "short":
                     conclusion = f"{messages[5][0][0]} {100*(1-alfa)}{messages[5][2][0]}."
                 elif details == "full":
-                    conclusion = f"{messages[6][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[6][2][0]}{critical}{messages[6][4][0]} {100*(1-alfa)}{messages[6][6][0]}."
+                    conclusion = f"{messages[6][0][0]}{helpers._truncate(statistic, language=self.language, decs=self.n_digits)}{messages[6][2][0]}{helpers._truncate(critical, language=self.language, decs=self.n_digits)}{messages[6][4][0]} {100*(1-alfa)}{messages[6][6][0]}."
                 else:
                     conclusion = 0
 
@@ -1471,10 +1912,11 @@ class Dixon(AlphaManagement, NDigitsManagement):
         self.conclusion = conclusion
         self.statistic = statistic
         self.critical = critical
-        self.x_exp = x_exp
+        if source is None:
+            self.x_exp = x_exp
         ### making the named tuple
         name = "Dixon" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][3][0], messages[1][1][0], messages[1][2][0], "ratio"))
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], messages[1][2][0], "ratio"), ("statistic", "critical", "alpha", "ratio"))
         return result(statistic, critical, alfa, ratio), conclusion
 
 
@@ -1929,7 +2371,7 @@ class Dixon(AlphaManagement, NDigitsManagement):
 
 
 
-class Grubbs(AlphaManagement, NDigitsManagement):
+class Grubbs(AlphaManagement, NDigitsManagement, SortedCacheManagement):
     """This class instantiates an object to apply the Grubbs test for detecting oultliers
 
     """
@@ -1981,11 +2423,20 @@ class Grubbs(AlphaManagement, NDigitsManagement):
                 ]
         }
 
+    GRUBBS_DENSE_TABLES = {
+        "one" : criticaltables._build_dense_table(GRUBBS_ONE_TABLE),
+        "two" : criticaltables._build_dense_table(GRUBBS_TWO_TABLE),
+        "three" : criticaltables._build_dense_table(GRUBBS_THREE_TABLE),
+        }
+
+    # number of simulated samples for the kinds "two" and "three" above the tables
+    MONTE_CARLO_REPLICATES = 100000
+
 
 
 
-    def __init__(self, name=None, alfa=None, language=None, n_digits=None, **kwargs):
-        super().__init__(alfa=alfa, language=language, n_digits=n_digits, **kwargs)
+    def __init__(self, name=None, alfa=None, language=None, n_digits=None, cache_sorted=False, **kwargs):
+        super().__init__(alfa=alfa, language=language, n_digits=n_digits, cache_sorted=cache_sorted, **kwargs)
         self.conclusion = None
         self.statistic = None
         self.critical = None
@@ -1999,7 +2450,7 @@ class Grubbs(AlphaManagement, NDigitsManagement):
         Parameters
         ----------
         n_rep : ``int``
-            The total number of observations (``3 <= n_rep <= 30``, vary).
+            The total number of observations (``n_rep >= 3``, vary).
         kind : ``str``, optional
             The type of the test.
 
@@ -2009,7 +2460,7 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
 
         alfa : ``float``
-            The significance level (``0.10``, ``0.05`` (default) or ``0.01``)
+            The significance level (between ``0.01`` and ``0.10``, default = ``0.05``). The critical values are tabulated for ``0.10``, ``0.05`` and ``0.01``; other levels are interpolated (monotone cubic interpolation in ``log(alfa)``).
 
         Returns
         -------
@@ -2021,11 +2472,11 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
         Notes
         -----
-        For :math:`G^{'}` (``kind="one"``) the critical values are limited for sample sizes between ``3`` and ``30``. For larger sample size, check [2]_
+        For :math:`G^{'}` (``kind="one"``) the critical values are tabulated for sample sizes between ``3`` and ``30``. For larger sample sizes, the critical value is calculated through the t distribution [2]_ (see :func:`_grubbs_critical_values`), which reproduces the table.
 
-        For :math:`G^{''}` (``kind="two"``) the critical values are limited for sample sizes between ``3`` and ``20``. For larger sample size, check [3]_.
+        For :math:`G^{''}` (``kind="two"``) the critical values are tabulated for sample sizes between ``3`` and ``20``, and for :math:`G^{'''}` (``kind="three"``) between ``4`` and ``30``. For larger sample sizes, the critical values are simulated with :class:`MonteCarloTable <pycafee.tables.montecarlo.MonteCarloTable>` (``MONTE_CARLO_REPLICATES`` samples) and stored on the cache file.
 
-        For :math:`G^{'''}` (``kind="three"``) the critical values are limited for sample sizes between ``4`` and ``30``. For larger sample size, check [2]_.
+        The significance level must be between ``0.01`` and ``0.10`` for any sample size (the same range of the tables), otherwise a ``ValueError`` is raised.
 
 
 
@@ -2090,17 +2541,15 @@ class Grubbs(AlphaManagement, NDigitsManagement):
             checkers._check_is_str(kind, "kind", language=self.language)
 
 
-        checkers._check_value_is_equal_or_lower_than(n_rep, "n_rep", 30, language=self.language)
         if kind == "one":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 3, language=self.language)
-            table_data = Grubbs.GRUBBS_ONE_TABLE
+            table_data = Grubbs.GRUBBS_DENSE_TABLES["one"]
         elif kind == "two":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 3, language=self.language)
-            checkers._check_value_is_equal_or_lower_than(n_rep, "n_rep", 20, language=self.language)
-            table_data = Grubbs.GRUBBS_TWO_TABLE
+            table_data = Grubbs.GRUBBS_DENSE_TABLES["two"]
         elif kind == "three":
             checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 4, language=self.language)
-            table_data = Grubbs.GRUBBS_THREE_TABLE
+            table_data = Grubbs.GRUBBS_DENSE_TABLES["three"]
         else:
             fk_id_function = management._query_func_id("Grubbs")
             messages = management._get_messages(fk_id_function, self.language, "Grubbs")
@@ -2122,30 +2571,27 @@ class Grubbs(AlphaManagement, NDigitsManagement):
                 )
                 raise
 
-        # Checking if the alfa value is valid #
-        if alfa not in table_data.keys():
-            fk_id_function = management._query_func_id("Grubbs")
-            messages = management._get_messages(fk_id_function, self.language, "Grubbs")
-            try:
-                error = messages[1][0][0]
-                raise ValueError(error)
-            except ValueError:
-                fk_id_function = management._query_func_id("generic")
-                messages = management._get_messages(fk_id_function, self.language, "generic")
-                msg = [f"{messages[4][0][0]} 'alfa' {messages[4][2][0]}:"]
-                values = ['0.01', '0.05', '0.10']
-                for item in values:
-                    msg.append(f"   --->    {item}")
-                msg.append(f"{messages[4][4][0]}:")
-                msg.append(f"   --->    {alfa}")
-                general._display_n_line_attention(msg)
-                raise
-
-
+        ### getting the critical value ###
+        if n_rep <= table_data.n_rep[-1]:
+            critical = criticaltables._lookup_critical_values(table_data, n_rep, alfa)
 
+            # Checking if the alfa value is inside the tabulated range #
+            if np.isnan(critical):
+                checkers._check_value_is_equal_or_higher_than(alfa, "alfa", float(table_data.alphas[0]), language=self.language)
+                checkers._check_value_is_equal_or_lower_than(alfa, "alfa", float(table_data.alphas[-1]), language=self.language)
 
-        ### getting the critical value ###
-        critical = table_data[alfa][n_rep-table_data['n_rep'][0]]
+            critical = float(critical)
+        else:
+            # acima da tabela, o alfa deve estar na mesma faixa da tabela
+            checkers._check_value_is_equal_or_higher_than(alfa, "alfa", float(table_data.alphas[0]), language=self.language)
+            checkers._check_value_is_equal_or_lower_than(alfa, "alfa", float(table_data.alphas[-1]), language=self.language)
+            if kind == "one":
+                # o valor crítico vem da distribuição t
+                critical = _get_grubbs_critical_value(n_rep, alfa)
+            else:
+                # os valores críticos são simulados (com cache em disco)
+                table = MonteCarloTable(replicates=Grubbs.MONTE_CARLO_REPLICATES, language=self.language)
+                critical = table.get_critical_value("grubbs_" + kind, n_rep, alfa=alfa)[0]
 
         ### quering
         fk_id_function = management._query_func_id("generic")
@@ -2153,13 +2599,13 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
         ### making the named tuple
         name = "Grubbs" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][1][0], messages[1][2][0]))
+        result = helpers._get_result_class(name, (messages[1][1][0], messages[1][2][0]), ("critical", "alpha"))
         return result(critical, alfa)
 
 
 
     # with tests, with text, without database, with docstring
-    def fit(self, x_exp, kind=None, which=None, alfa=None, details=None):
+    def fit(self, x_exp=None, kind=None, which=None, alfa=None, details=None, x_source=None, assume_sorted=False):
         """This function applies the Grubbs test to identify outliers in Normal data with a few samples [1]_.
 
         Parameters
@@ -2174,7 +2620,7 @@ class Grubbs(AlphaManagement, NDigitsManagement):
             * If ``kind="three"``, the function returns the critical value for :math:`G^{'''}`
 
         alfa : ``float``
-            The significance level (``0.10``, ``0.05`` (default) or ``0.01``)
+            The significance level (between ``0.01`` and ``0.10``, default = ``0.05``). The critical values are tabulated for ``0.10``, ``0.05`` and ``0.01``; other levels are interpolated (monotone cubic interpolation in ``log(alfa)``).
         details : ``str``, optional
             The ``details`` parameter determines the amount of information presented about the hypothesis test.
 
@@ -2191,6 +2637,11 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
             The ``which`` parameter has no effect when ``kind="two"``.
 
+        x_source : ``str``, ``numpy array`` or ``iterable``, optional
+            The data read in chunks, with bounded memory, instead of ``x_exp``: the path of a ``.npy`` file or of a raw binary file of ``float64`` values, a :class:`numpy.memmap`, or an iterable of one dimension ``numpy arrays`` (default is ``None``). A :class:`numpy.memmap` passed to ``x_exp`` is also read in chunks. Only the moments and the two values at each end are kept (the data is not sorted), and the result is the same of the data in memory.
+        assume_sorted : ``bool``, optional
+            If ``True``, ``x_exp`` is assumed to be sorted in ascending order and it is used as it is, without being sorted or copied (default is ``False``). The order is not checked. If ``False``, ``x_exp`` is sorted on each call, unless the object was created with ``cache_sorted=True``: then the sorted copy of the last ``x_exp`` is kept on the object, so fitting the same array again does not sort it again (call :meth:`invalidate_sorted` after changing the array in place).
+
         Returns
         -------
         result : ``tuple`` with
@@ -2320,12 +2771,14 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
         There are critical values for alpha equal to ``0.10``, ``0.05`` and ``0.01``. These values are for the **two-tailed Grubbs distribution** [2]_.
 
-        The minimum and maximum number of samples needed to apply the test varies depending on the ``kind`` parameter. The range for each option is as follows:
+        The minimum number of samples needed to apply the test varies depending on the ``kind`` parameter. The tabulated range for each option is as follows:
 
         * If ``kind="one"``: ``3<=n<=30``;
         * If ``kind="two"``: ``3<=n<=20``;
         * If ``kind="three"``: ``4<=n<=30``;
 
+        For larger samples, the critical values are calculated or simulated (see :meth:`get_critical_value`). For ``kind="one"`` the critical value comes from the t distribution. For ``kind="two"`` and ``kind="three"`` the first call for each ``n`` and ``alfa`` draws ``MONTE_CARLO_REPLICATES`` (``100000``) normal samples, which may take a while, and writes the critical value to a cache file on disk (the ``PYCAFEE_CACHE_DIR`` folder, or ``pycafee`` inside ``~/.cache``, see :mod:`pycafee.tables.cache`). The next calls read the cache. In all cases, ``alfa`` must be between ``0.01`` and ``0.10``.
+
 
 
         References
@@ -2391,6 +2844,8 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
 
         """
+        checkers._check_is_bool(assume_sorted, "assume_sorted", self.language)
+
 
 
         ### getting the default alpha value ###
@@ -2403,7 +2858,12 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
 
         ### checking input data ###
-        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        source = _check_source(x_exp, x_source, self.language)
+        if source is None:
+            checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        else:
+            # a single pass over the chunks, keeping the two values at each end
+            moments, ends = _scan_chunks(_read_chunks(source, self.language), n_ends=2)
         self.x_exp = x_exp
 
         ### checking the details parameter ###
@@ -2428,8 +2888,10 @@ class Grubbs(AlphaManagement, NDigitsManagement):
                     raise
 
         # finding the n_rep
-        n_rep = x_exp.size
-        checkers._check_value_is_equal_or_lower_than(n_rep, "n_rep", 30, language=self.language)
+        if source is None:
+            n_rep = x_exp.size
+        else:
+            n_rep = moments[0]
 
         ### checking the ratio and getting the critical value ###
         if kind == None or kind == "one":
@@ -2465,12 +2927,17 @@ class Grubbs(AlphaManagement, NDigitsManagement):
                 raise
 
         # ordenando os dados
-        x_exp = np.sort(x_exp, kind='quicksort')
+        if source is None:
+            x_exp = self._get_sorted(x_exp, assume_sorted)
+            ends = x_exp
 
 
         ### checking the which ###
         if which is None:
-            which = _check_outermost_observation(x_exp)
+            if source is None:
+                which = _check_outermost_observation(x_exp)
+            else:
+                which = _check_outermost_value(moments[1], moments[5], moments[6])
         else:
             checkers._check_is_str(which, "which", language=self.language)
             if which not in ["min", "max"]:
@@ -2494,12 +2961,15 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
         if kind == "one":
             if which == "min":
-                outlier = x_exp[0]
+                outlier = ends[0]
             else:
-                outlier = x_exp[-1]
+                outlier = ends[-1]
             # getting the statistic
-            statistic = self._one(x_exp, which)
-            critical = self.get_critical_value(n_rep=x_exp.size, kind=kind, alfa=alfa)[0]
+            if source is None:
+                statistic = self._one(x_exp, which)
+            else:
+                statistic = self._from_moments(moments, ends, kind, which)
+            critical = self.get_critical_value(n_rep=n_rep, kind=kind, alfa=alfa)[0]
 
             if statistic <= critical:
                 if details == "short":
@@ -2517,10 +2987,13 @@ class Grubbs(AlphaManagement, NDigitsManagement):
                     conclusion = rejeita
 
         elif kind == "two":
-            outlier = [x_exp[0], x_exp[-1]]
+            outlier = [ends[0], ends[-1]]
             # getting the statistic
-            statistic = self._two(x_exp)
-            critical = self.get_critical_value(n_rep=x_exp.size, kind=kind, alfa=alfa)[0]
+            if source is None:
+                statistic = self._two(x_exp)
+            else:
+                statistic = self._from_moments(moments, ends, kind, which)
+            critical = self.get_critical_value(n_rep=n_rep, kind=kind, alfa=alfa)[0]
 
             if statistic <= critical:
                 if details == "short":
@@ -2540,12 +3013,15 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
         else:
             if which == "min":
-                outlier = [x_exp[0], x_exp[1]]
+                outlier = [ends[0], ends[1]]
             else:
-                outlier = [x_exp[-2], x_exp[-1]]
+                outlier = [ends[-2], ends[-1]]
             # getting the statistic
-            statistic = self._three(x_exp, which)
-            critical = self.get_critical_value(n_rep=x_exp.size, kind=kind, alfa=alfa)[0]
+            if source is None:
+                statistic = self._three(x_exp, which)
+            else:
+                statistic = self._from_moments(moments, ends, kind, which)
+            critical = self.get_critical_value(n_rep=n_rep, kind=kind, alfa=alfa)[0]
 
             if statistic > critical:
                 if details == "short":
@@ -2570,13 +3046,117 @@ class Grubbs(AlphaManagement, NDigitsManagement):
         self.conclusion = conclusion
         self.statistic = statistic
         self.critical = critical
-        self.x_exp = x_exp
+        if source is None:
+            self.x_exp = x_exp
         ### making the named tuple
         name = "Grubbs" + messages[1][0][0]
-        result = namedtuple(name, (messages[1][3][0], messages[1][1][0], messages[1][2][0], "kind", "outlier"))
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], messages[1][2][0], "kind", "outlier"), ("statistic", "critical", "alpha", "kind", "outlier"))
         return result(statistic, critical, alfa, kind, outlier), conclusion
 
 
+    # with tests, with text, without database, with docstring
+    def fit_iterative(self, x_exp, max_outliers=None, alfa=None):
+        """This function applies the generalized ESD (Extreme Studentized Deviate) test [1]_, which is the Grubbs test (:math:`G^{'}`) repeated to identify up to ``max_outliers`` outliers.
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with at least ``3`` sample data.
+        max_outliers : ``int``, optional
+            The maximum number of outliers (between ``1`` and ``x_exp.size - 2``). If ``None`` (default), ``10%`` of the sample size is used (at least ``1``).
+        alfa : ``float``, optional
+            The significance level (between ``0.0`` and ``1.0``, default = ``0.05``).
+
+        Returns
+        -------
+        result : ``tuple`` with
+            statistic : ``numpy array``
+                The test statistic of each step (``max_outliers`` values).
+            critical : ``numpy array``
+                The critical value of each step (``max_outliers`` values).
+            alpha : ``float``
+                The significance level used.
+            outlier : ``numpy array``
+                The values identified as outliers (empty if there are no outliers).
+            indices : ``numpy array``
+                The positions of the outliers on ``x_exp``, in the order they were removed.
+
+        See Also
+        --------
+        fit
+        _generalized_esd
+
+        Notes
+        -----
+        At each step ``i`` (from ``1`` to ``max_outliers``), the observation farthest from the mean of the remaining data is removed, and its statistic is:
+
+        .. math::
+
+            R_i = \\frac{\\max|x - \\overline{x}|}{s}
+
+        The critical value of each step is the critical value of :math:`G^{'}` for the remaining ``n - i + 1`` observations, calculated through the t distribution (see :func:`_grubbs_critical_values`). The number of outliers is the highest ``i`` with :math:`R_i > \\lambda_i`, so an outlier can be identified even if it hides behind a larger one (masking).
+
+        The data is sorted only once: the removed observation is always at one of the ends of the remaining data, and the mean and the standard deviation are updated in :math:`O(1)` per step.
+
+        References
+        ----------
+        .. [1] ROSNER, B. Percentage Points for a Generalized ESD Many-Outlier Procedure. Technometrics, v. 25, n. 2, p. 165–172, 1983.
+
+        Examples
+        --------
+        >>> from pycafee.sample.outliers import Grubbs
+        >>> import numpy as np
+        >>> x = np.array([159, 153, 184, 153, 156, 150, 147, 140, 210, 151])
+        >>> test = Grubbs()
+        >>> result = test.fit_iterative(x, max_outliers=3)
+        >>> print(result.indices)
+        [8 2]
+        >>> print(result.Outlier)
+        [210 184]
+
+        """
+        ### getting the default alpha value ###
+        if alfa is None:
+            alfa = self.alfa
+        else:
+            checkers._check_is_float(alfa, "alfa", self.language)
+            checkers._check_data_in_range(alfa, "alfa", 0.0, 1.0, self.language)
+
+        ### checking input data ###
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        n_rep = x_exp.size
+        checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", 3, language=self.language)
+        _check_grubbs_division_by_zero(x_exp, self.language)
+
+        ### checking the maximum number of outliers ###
+        if max_outliers is None:
+            max_outliers = max(1, int(0.1*n_rep))
+        else:
+            checkers._check_is_integer(max_outliers, "max_outliers", self.language)
+            checkers._check_is_positive(max_outliers, "max_outliers", self.language)
+        checkers._check_value_is_equal_or_lower_than(max_outliers, "max_outliers", n_rep - 2, language=self.language)
+
+        statistic, removed = _generalized_esd(x_exp, max_outliers)
+        critical = _grubbs_critical_values(n_rep - np.arange(max_outliers), alfa)
+        critical = np.atleast_1d(critical)
+
+        # o número de outliers é o último passo com estatística acima do valor crítico
+        exceeded = np.flatnonzero(statistic > critical)
+        n_outliers = exceeded[-1] + 1 if exceeded.size > 0 else 0
+        indices = removed[:n_outliers]
+
+        ### quering
+        fk_id_function = management._query_func_id("generic")
+        messages = management._get_messages(fk_id_function, self.language, "generic")
+        self.statistic = statistic
+        self.critical = critical
+        self.x_exp = x_exp
+        ### making the named tuple
+        name = "Grubbs" + messages[1][0][0]
+        result = helpers._get_result_class(name, (messages[1][3][0], messages[1][1][0], messages[1][2][0], messages[1][4][0], "indices"), ("statistic", "critical", "alpha", "outlier", "indices"))
+        return result(statistic, critical, alfa, x_exp[indices], indices)
+
+
     # with tests, with text, without database, with docstring
     def _one(self, x_exp, which):
         """
@@ -2792,6 +3372,60 @@ class Grubbs(AlphaManagement, NDigitsManagement):
         return statistic
 
 
+    # with tests, without text, without database, with docstring
+    def _from_moments(self, moments, ends, kind, which):
+        """This function calculates the Grubbs statistic from the moments accumulated in chunks
+
+        Parameters
+        ----------
+        moments : ``tuple``
+            ``(n, mean, M2, M3, M4, min, max)`` of the sample (see :func:`pycafee.sample.streamingsample._scan_chunks`).
+        ends : ``numpy array``
+            The two lowest values followed by the two highest values, sorted.
+        kind : ``str``
+            The type of the test (``"one"``, ``"two"`` or ``"three"``).
+        which : ``str``
+            The side that should be evaluated (``"min"`` or ``"max"``).
+
+        Returns
+        -------
+        statistic : ``float``
+            The same statistic of :meth:`_one`, :meth:`_two` or :meth:`_three`.
+
+        Notes
+        -----
+        For ``kind="three"``, the two values are removed from the sum of squares with the inverse of the Welford update:
+
+        .. math::
+
+                \\overline{x}_{n-1} = \\frac{n \\overline{x}_n - x}{n - 1} \\qquad M_{2, n-1} = M_{2, n} - (x - \\overline{x}_n)(x - \\overline{x}_{n-1})
+
+        """
+        n, mean, m2 = moments[0], moments[1], moments[2]
+        std = np.sqrt(m2/(n - 1))
+        _check_grubbs_division_by_zero(None, self.language, std=std)
+        if kind == "one":
+            if which == "min":
+                statistic = (mean - ends[0])/std
+            else:
+                statistic = (ends[-1] - mean)/std
+        elif kind == "two":
+            statistic = (ends[-1] - ends[0])/std
+        else:
+            if which == "min":
+                removed = ends[:2]
+            else:
+                removed = ends[-2:]
+            n_trim, mean_trim, m2_trim = n, mean, m2
+            for value in removed:
+                mean_next = (n_trim*mean_trim - value)/(n_trim - 1)
+                m2_trim = m2_trim - (value - mean_trim)*(value - mean_next)
+                n_trim, mean_trim = n_trim - 1, mean_next
+            var = m2_trim/(n_trim - 1)
+            statistic = (n - 3)*var/((n - 1)*std**2)
+        return statistic
+
+
 
     # with tests, with text, with database (Dixon), with docstring
     def __str__(self):
@@ -2811,8 +3445,132 @@ class Grubbs(AlphaManagement, NDigitsManagement):
 
 
 
+# with tests, without database, with docstring
+def _grubbs_critical_values(n_rep, alfa):
+    """This function calculates the critical values of :math:`G^{'}` (two-tailed) through the t distribution [1]_.
+
+    Parameters
+    ----------
+    n_rep : ``int`` or ``numpy array`` of ``int``
+        The sample sizes (``n_rep >= 3``).
+    alfa : ``float`` or ``numpy array`` of ``float``
+        The significance levels (broadcast against ``n_rep``).
+
+    Returns
+    -------
+    critical : ``float`` or ``numpy array``
+        The critical values.
+
+    Notes
+    -----
+    The critical value is calculated as:
+
+    .. math::
+
+        G_{crit} = \\frac{n-1}{\\sqrt{n}} \\sqrt{\\frac{t^2}{n-2+t^2}}
+
+    where :math:`t` is the upper critical value of the t distribution with :math:`n-2` degrees of freedom at the significance level :math:`\\alpha/(2n)`. This equation reproduces the tabulated values of pycafee (``GRUBBS_ONE_TABLE``).
+
+    The parameters are not checked.
+
+    References
+    ----------
+    .. [1] GRUBBS, F. E.; BECK, G. Extension of Sample Sizes and Percentage Points for Significance Tests of Outlying Observations. Technometrics, v. 14, n. 4, p. 847–854, 1972.
+
+    Examples
+    --------
+    >>> from pycafee.sample.outliers import _grubbs_critical_values
+    >>> import numpy as np
+    >>> print(_grubbs_critical_values(np.array([10, 100, 1000]), 0.05))
+    [2.28995408 3.3840829  4.03997816]
+
+    """
+    n_rep = np.asarray(n_rep, dtype=float)
+    t = stats.t.isf(np.asarray(alfa, dtype=float)/(2*n_rep), n_rep - 2)
+    return ((n_rep - 1)/np.sqrt(n_rep)*np.sqrt(t**2/(n_rep - 2 + t**2)))[()]
+
+
+# with tests, without database, with docstring
+@functools.lru_cache(maxsize=1024)
+def _get_grubbs_critical_value(n_rep, alfa):
+    """This function returns the critical value of :math:`G^{'}` for one pair of ``n_rep`` and ``alfa``, with cache (see :func:`_grubbs_critical_values`).
+
+    Parameters
+    ----------
+    n_rep : ``int``
+        The sample size (``n_rep >= 3``).
+    alfa : ``float``
+        The significance level.
+
+    Returns
+    -------
+    critical : ``float``
+        The critical value.
+
+    """
+    return float(_grubbs_critical_values(n_rep, alfa))
+
+
+# with tests, without database, with docstring
+def _generalized_esd(x_exp, max_outliers):
+    """This function calculates the statistics of the generalized ESD test, removing the observation farthest from the mean at each step.
+
+    Parameters
+    ----------
+    x_exp : ``numpy array``
+        One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` (not necessarily ordered).
+    max_outliers : ``int``
+        The number of steps (at most ``x_exp.size - 2``).
+
+    Returns
+    -------
+    statistic : ``numpy array``
+        The statistic :math:`R_i` of each step.
+    removed : ``numpy array``
+        The position on ``x_exp`` of the observation removed at each step.
+
+    Notes
+    -----
+    The data is sorted once, so the observation farthest from the mean is always one of the ends of the remaining data. The sum and the sum of squares of the remaining data (centered on the mean of ``x_exp``, to reduce the rounding errors) are updated at each step, so each step is :math:`O(1)`.
+
+    The parameters are not checked. If the remaining data has no variance, the statistic is ``0``.
+
+    """
+    order = np.argsort(x_exp, kind="quicksort")
+    x_sorted = np.asarray(x_exp, dtype=float)[order]
+    x_sorted = x_sorted - x_sorted.mean()
+    total = x_sorted.sum()
+    squares = np.dot(x_sorted, x_sorted)
+    low = 0
+    high = x_sorted.size - 1
+
+    statistic = np.empty(max_outliers)
+    removed = np.empty(max_outliers, dtype=int)
+    for i in range(max_outliers):
+        size = high - low + 1
+        mean = total/size
+        var = max(squares - total*mean, 0.0)/(size - 1)
+        lower = mean - x_sorted[low]
+        upper = x_sorted[high] - mean
+        # o mesmo critério de _check_outermost_observation (empate -> maior valor)
+        if upper >= lower:
+            position = high
+            high = high - 1
+            deviation = upper
+        else:
+            position = low
+            low = low + 1
+            deviation = lower
+        statistic[i] = deviation/np.sqrt(var) if var > 0 else 0.0
+        removed[i] = order[position]
+        total = total - x_sorted[position]
+        squares = squares - x_sorted[position]**2
+    return statistic, removed
+
+
 # with tests, with text, with database (Dixon), with docstring
-def _check_grubbs_division_by_zero(x_exp, language):
+def _check_grubbs_division_by_zero(x_exp, language, std=None):
+
     """This function checks if the sample standart deviaation is zero
 
     Parameters
@@ -2821,6 +3579,8 @@ def _check_grubbs_division_by_zero(x_exp, language):
         One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>`
     language : ``str``
         The language code
+    std : ``float``, optional
+        The sample standard deviation, when it is already known (e.g., accumulated in chunks). In this case ``x_exp`` is not used.
 
     Returns
     -------
@@ -2835,7 +3595,9 @@ def _check_grubbs_division_by_zero(x_exp, language):
 
     """
 
-    if np.std(x_exp, ddof=1) < 10e-7:
+    if std is None:
+        std = np.std(x_exp, ddof=1)
+    if std < 10e-7:
         fk_id_function = management._query_func_id("Dixon")
         messages = management._get_messages(fk_id_function, language, "Dixon")
         try:
@@ -2898,20 +3660,30 @@ def _check_dixon_division_by_zero(x_exp, position_1, position_2, language):
     return True
 
 
+def _tukey_scores(x_exp, DI, q1, q3):
+    """Calculates the distance of each observation to the nearest quartile, in units of the interquartile range (negative between the quartiles)
 
+    Parameters
+    ----------
+    x_exp : ``numpy array``
+        One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>`.
+    DI : ``float``
+        The interquartile range.
+    q1 : ``float``
+        The first quartile.
+    q3 : ``float``
+        The third quartile.
 
+    Returns
+    -------
+    statistic : ``numpy array``
 
-
-
-
-
-
-
-
-
-
-
-
+    """
+    distance = np.maximum(q1 - x_exp, x_exp - q3)
+    if DI > 0:
+        return distance/DI
+    # all the central data are equal: the distance can not be scaled
+    return np.where(distance > 0, np.inf, np.where(distance < 0, -np.inf, 0.0))
 
 
 # with tests, with docstring, without text
@@ -2945,10 +3717,31 @@ def _check_outermost_observation(x):
     # obtendo o menor valor
     min = np.min(x)
 
+    return _check_outermost_value(mean, min, max)
+
+
+def _check_outermost_value(mean, x_min, x_max):
+    """This function determines which is the outermost point from the mean, given the mean and the extreme values (e.g., accumulated in chunks)
+
+    Parameters
+    ----------
+    mean : ``float``
+        The sample mean
+    x_min : ``float``
+        The lowest value
+    x_max : ``float``
+        The highest value
+
+    Returns
+    -------
+    which : ``str``
+        Which value is the outermost (``"max"`` or ``"min"``, see :func:`_check_outermost_observation`)
+
+    """
     # calculando a diferença entre a média e o menor valor (resultado positivo)
-    lower = mean - min
+    lower = mean - x_min
     # calculando a diferença entre o maior valor e a média (resultado positivo)
-    upper = max - mean
+    upper = x_max - mean
 
     # verificando qual é o ponto mais distante
     if upper >= lower:
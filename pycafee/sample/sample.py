@@ -22,6 +22,8 @@ from pycafee.utils import checkers
 
 from pycafee.utils.helpers import AlphaManagement, NDigitsManagement
 from pycafee.functions import functions
+from pycafee.functions.quantilesketch import QuantileSketch
+from pycafee.sample.streamingsample import _check_source, _read_chunks, _scan_chunks
 
 
 from pycafee.normalitycheck.normalitycheck import NormalityCheck
@@ -68,6 +70,10 @@ class Sample(AlphaManagement, NDigitsManagement):
         df : :doc:`DataFrame <pandas:reference/api/pandas.DataFrame>`
             A DataFrame with the Normality test results
 
+        Notes
+        -----
+        The Normality test is not evaluated when the data is read in chunks (``x_source`` or :class:`numpy.memmap`), so this method raises a ``ValueError`` after such a fit.
+
         """
 
         checkers._check_is_bool(show, "show", self.language)
@@ -75,6 +81,18 @@ class Sample(AlphaManagement, NDigitsManagement):
         if self.mean is None:
             helpers._raises_when_fit_was_not_applied("Sample", self.language, self.name)
 
+        elif self.normality_result is None:
+            # o fit foi feito em partes (x_source), sem o teste de Normalidade
+            fk_id_function = management._query_func_id("Sample")
+            messages = management._get_messages(fk_id_function, self.language, "Sample")
+            try:
+                raise ValueError(messages[18][0][0])
+            except ValueError:
+                general._display_one_line_attention(
+                    f"{messages[19][0][0]} {self.name}",
+                                    )
+                raise
+
         else:
             colalign = []
             data = self.normality_result._asdict()
@@ -269,7 +287,7 @@ class Sample(AlphaManagement, NDigitsManagement):
         pass
 
 
-    def fit(self, x_exp, norm_test=None, alfa=None, comparison=None, details=None):
+    def fit(self, x_exp=None, norm_test=None, alfa=None, comparison=None, details=None, rank_error=None, x_source=None):
         """É o principal método onde a mágica não acontece.
 
         Parameters
@@ -285,6 +303,11 @@ class Sample(AlphaManagement, NDigitsManagement):
 
         details : ``str``
 
+        rank_error : ``float``, optional
+            The normalized rank error used to estimate the median and the quartiles with a :class:`~pycafee.functions.quantilesketch.QuantileSketch` (default is ``None``, which means the exact values). Useful for very large samples, since the sketch does not sort the data. When the data is read in chunks, the sketch is always used (``None`` means ``0.01``).
+
+        x_source : ``str``, ``numpy array`` or ``iterable``, optional
+            The data read in chunks, with bounded memory, instead of ``x_exp``: the path of a ``.npy`` file or of a raw binary file of ``float64`` values, a :class:`numpy.memmap`, or an iterable of one dimension ``numpy arrays`` (default is ``None``). A :class:`numpy.memmap` passed to ``x_exp`` is also read in chunks. The mean, the standard deviation and the extreme values are accumulated in a single pass and the quartiles are estimated with the sketch. The mode and the Normality test need the whole sample, so they are not evaluated (``None``) and :meth:`normality_check` raises a ``ValueError``.
 
 
         """
@@ -294,6 +317,11 @@ class Sample(AlphaManagement, NDigitsManagement):
             self.alfa = alfa
         self.x_exp = x_exp
 
+        source = _check_source(x_exp, x_source, self.language)
+        if source is not None:
+            self._fit_chunks(source, rank_error)
+            return
+
         #########################
         ### Normal like stats ###
         #########################
@@ -310,11 +338,15 @@ class Sample(AlphaManagement, NDigitsManagement):
         ### Not Normal like stats ###
         ############################
         # with tests
-        self.median = np.median(self.x_exp)
-        self.min = self.x_exp.min()
-        self.max = self.x_exp.max()
-        self.Q1 = np.quantile(self.x_exp, 0.25, interpolation="linear") # vai precisar implementar outros métodos no futuro
-        self.Q3 = np.quantile(self.x_exp, 0.75, interpolation="linear") # vai precisar implementar outros métodos no futuro
+        if rank_error is None:
+            # one partition for all order statistics (linear quartiles, as np.quantile)
+            self.min, self.Q1, self.median, self.Q3, self.max = functions._order_statistics(self.x_exp, method="linear") # vai precisar implementar outros métodos no futuro
+        else:
+            sketch = QuantileSketch(rank_error=rank_error, language=self.language)
+            sketch.push(self.x_exp)
+            self.min = sketch.min
+            self.max = sketch.max
+            self.Q1, self.median, self.Q3 = sketch.quantile(np.array([0.25, 0.5, 0.75]))
         self.DI = self.Q3 - self.Q1
         self.mode = functions.multimode(self.x_exp)
 
@@ -339,6 +371,44 @@ class Sample(AlphaManagement, NDigitsManagement):
         self.normality_test = normality_test.normality_test
 
 
+    def _fit_chunks(self, source, rank_error):
+        """Calculates the sample statistics reading a data source in chunks (see :meth:`fit`)
+
+        Parameters
+        ----------
+        source : ``str``, ``numpy array`` or ``iterable``
+            The data source (see :func:`pycafee.sample.streamingsample._read_chunks`).
+        rank_error : ``float`` or ``None``
+            The normalized rank error of the sketch used for the quartiles.
+
+        """
+        # a single pass over the chunks (bounded memory)
+        sketch = QuantileSketch(rank_error=rank_error, language=self.language)
+        moments, _ = _scan_chunks(_read_chunks(source, self.language), sketch=sketch)
+        n_rep = moments[0]
+        checkers._check_value_is_equal_or_higher_than(n_rep, "size", 3, language=self.language)
+
+        ### Normal like stats ###
+        self.mean = moments[1]
+        self.variance = moments[2]/(n_rep - 1)
+        self.std = np.sqrt(self.variance)
+        self.cv = 100*self.std/self.mean
+        self.t_student = np.abs(stats.t.ppf(self.alfa/2, n_rep - 1))
+        self.t_interval = self.std*self.t_student/np.sqrt(n_rep)
+
+        ### Not Normal like stats ###
+        self.min = moments[5]
+        self.max = moments[6]
+        self.Q1, self.median, self.Q3 = sketch.quantile(np.array([0.25, 0.5, 0.75]))
+        self.DI = self.Q3 - self.Q1
+        self.mode = None
+
+        ### Normality test ###
+        self.normality_result = None
+        self.normality_conclusion = None
+        self.normality_test = None
+
+
 
 
     def __str__(self):
@@ -0,0 +1,623 @@
+"""This module concentrates the evaluation of samples that arrive in batches (streams), without storing the raw data.
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - StreamingSample(AlphaManagement, NDigitsManagement)
+#     - __init__(self, name=None, alfa=None, language=None, n_digits=None, rank_error=None, **kwargs)
+#     - push(self, x_exp)
+#     - merge(self, other)
+#     - summary(self, show=True)
+#     - standard_interval(self, show=True)
+#     - confidencial_interval(self, show=True)
+#     - positional_summary(self, show=True)
+#     - _update_statistics(self)
+#     - _get_t_interval(self)
+#     - __str__(self)
+#     - __repr__(self)
+# - _batch_moments(x_exp)
+# - _combine_moments(moments_a, moments_b)
+# - _check_source(x_exp, x_source, language)
+# - _read_chunks(x_source, language)
+# - _check_is_reiterable(x_source, language)
+# - _scan_chunks(chunks, n_ends=0, sketch=None)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+from collections.abc import Iterable
+import os
+
+###### Third part ######
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+import scipy.stats as stats
+
+###### Home made ######
+from pycafee.utils import helpers
+from pycafee.utils import general
+from pycafee.utils import checkers
+
+from pycafee.utils.helpers import AlphaManagement, NDigitsManagement
+from pycafee.functions.quantilesketch import QuantileSketch
+
+from pycafee.database_management import management
+
+###########################################
+################ Functions ################
+###########################################
+
+# number of values read from a data source at once (8 MB of float64)
+CHUNK_SIZE = 2**20
+
+
+class StreamingSample(AlphaManagement, NDigitsManagement):
+    """This class instantiates an object that accumulates the statistics of a sample that arrives in batches
+
+    Only the count, the mean, the central moments (second to fourth order), the minimum, the maximum and a quantile sketch are stored, so the memory does not grow with the data. Accumulators built on different shards (or processes) can be combined with :meth:`merge`.
+
+    Parameters
+    ----------
+    rank_error : ``float``, optional
+        The normalized rank error of the :class:`~pycafee.functions.quantilesketch.QuantileSketch` used by :meth:`positional_summary` (default is ``None``, which means ``0.01``).
+
+    Attributes
+    ----------
+    n : ``int``
+        The number of observations added so far.
+    mean : ``float``
+        The sample mean (``None`` before the first :meth:`push`).
+    variance : ``float``
+        The sample variance (``ddof=1``).
+    std : ``float``
+        The sample standard deviation (``ddof=1``).
+    cv : ``float``
+        The coefficient of variation (%).
+    skewness : ``float``
+        The sample skewness (the same value of ``scipy.stats.skew(x)``).
+    kurtosis : ``float``
+        The sample excess kurtosis (the same value of ``scipy.stats.kurtosis(x)``).
+    min : ``float``
+        The lowest observation.
+    max : ``float``
+        The highest observation.
+
+    Notes
+    -----
+    Each batch is reduced with numpy (two passes over the batch) and combined with the accumulated values using the pairwise update formulas of Chan et al. [1]_ and Pébay [2]_, which generalize the Welford algorithm to batches and to higher moments. The same formulas are used by :meth:`merge`, so the result does not depend on how the data was split.
+
+    References
+    ----------
+    .. [1] CHAN, T. F.; GOLUB, G. H.; LEVEQUE, R. J. Updating formulae and a pairwise algorithm for computing sample variances. Technical Report STAN-CS-79-773, Stanford University, 1979.
+    .. [2] PÉBAY, P. Formulas for robust, one-pass parallel computation of covariances and arbitrary-order statistical moments. Technical Report SAND2008-6212, Sandia National Laboratories, 2008.
+
+    Examples
+    --------
+
+    >>> from pycafee.sample.streamingsample import StreamingSample
+    >>> import numpy as np
+    >>> sample = StreamingSample()
+    >>> sample.push(np.array([5.1, 4.9, 4.7, 4.6, 5.0]))
+    >>> sample.push(np.array([5.4, 4.6, 5.0, 4.4, 4.9]))
+    >>> print(sample)
+    Streaming sample with mean = 4.859 +/- 0.291
+
+    """
+
+    def __init__(self, name=None, alfa=None, language=None, n_digits=None, rank_error=None, **kwargs):
+        super().__init__(alfa=alfa, language=language, n_digits=n_digits, **kwargs)
+        self._sketch = QuantileSketch(rank_error=rank_error, language=self.language)
+        if name is None:
+            fk_id_function = management._query_func_id("StreamingSample")
+            messages = management._get_messages(fk_id_function, self.language, "StreamingSample")
+            self.name = messages[4][0][0]
+        else:
+            checkers._check_is_str(name, "name", self.language)
+            self.name = name
+        self.n = 0
+        self.mean = None
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+        self.min = None
+        self.max = None
+        self.variance = None
+        self.std = None
+        self.cv = None
+        self.skewness = None
+        self.kurtosis = None
+
+    # with tests, with docstring, the database comes from StreamingSample
+    def push(self, x_exp):
+        """This function adds a batch of observations to the sample
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` with the new observations.
+
+        """
+        checkers._check_is_numpy_1_D(x_exp, "x_exp", self.language)
+        batch = _batch_moments(x_exp)
+        if self.n == 0:
+            moments = batch
+        else:
+            moments = _combine_moments((self.n, self.mean, self._m2, self._m3, self._m4, self.min, self.max), batch)
+        self.n, self.mean, self._m2, self._m3, self._m4, self.min, self.max = moments
+        self._sketch.push(x_exp)
+        self._update_statistics()
+
+    # with tests, with docstring, the database comes from StreamingSample
+    def merge(self, other):
+        """This function adds the observations accumulated by another ``StreamingSample`` to this sample
+
+        Parameters
+        ----------
+        other : :class:`StreamingSample`
+            The sample to be merged (it is not changed).
+
+        Returns
+        -------
+        self : :class:`StreamingSample`
+            The merged sample (this object).
+
+        Examples
+        --------
+
+        >>> from pycafee.sample.streamingsample import StreamingSample
+        >>> import numpy as np
+        >>> shard_a = StreamingSample()
+        >>> shard_a.push(np.array([5.1, 4.9, 4.7, 4.6, 5.0]))
+        >>> shard_b = StreamingSample()
+        >>> shard_b.push(np.array([5.4, 4.6, 5.0, 4.4, 4.9]))
+        >>> print(shard_a.merge(shard_b).n)
+        10
+
+        """
+        if not isinstance(other, StreamingSample):
+            fk_id_function = management._query_func_id("StreamingSample")
+            messages = management._get_messages(fk_id_function, self.language, "StreamingSample")
+            try:
+                error = messages[5][0][0]
+                raise ValueError(error)
+            except ValueError:
+                general._display_one_line_attention(f"{messages[6][0][0]} '{type(other).__name__}'")
+                raise
+        if other.n > 0:
+            moments_b = (other.n, other.mean, other._m2, other._m3, other._m4, other.min, other.max)
+            if self.n == 0:
+                moments = moments_b
+            else:
+                moments = _combine_moments((self.n, self.mean, self._m2, self._m3, self._m4, self.min, self.max), moments_b)
+            self.n, self.mean, self._m2, self._m3, self._m4, self.min, self.max = moments
+            self._sketch.merge(other._sketch)
+            self._update_statistics()
+        return self
+
+    # with tests, with docstring, the database comes from Sample
+    def summary(self, show=True):
+        """This function prints a table with a summary of the sample, which contains the mean, the variance, the standard deviation, the estimated confidence interval with alpha significance level, and the coefficient of variation.
+
+        Parameters
+        ----------
+        show : ``bool``, optional
+            This parameter defines whether the results will be printed (``True``) or not (``False``).
+
+        Returns
+        -------
+        df : :doc:`DataFrame <pandas:reference/api/pandas.DataFrame>`
+            A DataFrame with the summarized data.
+
+        """
+        checkers._check_is_bool(show, "show", self.language)
+
+        if self.mean is None:
+            helpers._raises_when_fit_was_not_applied("StreamingSample", self.language, self.name)
+        else:
+            fk_id_function = management._query_func_id("Sample")
+            messages = management._get_messages(fk_id_function, self.language, "Sample")
+            ic = f"{messages[9][0][0]} ({100*(1-self.alfa)}%)"
+            data = {
+                messages[6][0][0]: [self.mean],
+                messages[7][0][0]: [self.variance],
+                messages[8][0][0]: [self.std],
+                ic: [self._get_t_interval()],
+                messages[10][0][0]: [self.cv]
+            }
+            colalign = ["center", "center", "center", "center", "center"]
+            if show:
+                print(self.name)
+                print(tabulate(data, headers="keys", tablefmt="rst", floatfmt=(f".{self.n_digits}f"), colalign=colalign))
+            df = pd.DataFrame(data)
+            return df
+
+    # with tests, with docstring, the database comes from Sample
+    def standard_interval(self, show=True):
+        """This function prints a table with the estimated standard deviation range for the sample.
+
+        Parameters
+        ----------
+        show : ``bool``, optional
+            This parameter defines whether the results will be printed (``True``) or not (``False``).
+
+        Returns
+        -------
+        df : :doc:`DataFrame <pandas:reference/api/pandas.DataFrame>`
+            A DataFrame with the standard table.
+
+        """
+        checkers._check_is_bool(show, "show", self.language)
+
+        if self.mean is None:
+            helpers._raises_when_fit_was_not_applied("StreamingSample", self.language, self.name)
+        else:
+            fk_id_function = management._query_func_id("Sample")
+            messages = management._get_messages(fk_id_function, self.language, "Sample")
+            data = {
+                f"{messages[6][0][0]} - s": [self.mean - self.std],
+                f"{messages[6][0][0]}": [self.mean],
+                f"{messages[6][0][0]} + s": [self.mean + self.std],
+            }
+            colalign = ["center", "center", "center"]
+            if show:
+                print(self.name)
+                print(tabulate(data, headers="keys", tablefmt="rst", floatfmt=(f".{self.n_digits}f"), colalign=colalign))
+            df = pd.DataFrame(data)
+            return df
+
+    # with tests, with docstring, the database comes from Sample
+    def confidencial_interval(self, show=True):
+        """This function prints a table with the estimated confidential interval range for the sample.
+
+        Parameters
+        ----------
+        show : ``bool``, optional
+            This parameter defines whether the results will be printed (``True``) or not (``False``).
+
+        Returns
+        -------
+        df : :doc:`DataFrame <pandas:reference/api/pandas.DataFrame>`
+            A DataFrame with the confidential interval table.
+
+        """
+        checkers._check_is_bool(show, "show", self.language)
+
+        if self.mean is None:
+            helpers._raises_when_fit_was_not_applied("StreamingSample", self.language, self.name)
+        else:
+            fk_id_function = management._query_func_id("Sample")
+            messages = management._get_messages(fk_id_function, self.language, "Sample")
+            t_interval = self._get_t_interval()
+            data = {
+                f"{messages[6][0][0]} - IC": [self.mean - t_interval],
+                f"{messages[6][0][0]}": [self.mean],
+                f"{messages[6][0][0]} + IC": [self.mean + t_interval],
+            }
+            colalign = ["center", "center", "center"]
+            if show:
+                print(self.name)
+                print(tabulate(data, headers="keys", tablefmt="rst", floatfmt=(f".{self.n_digits}f"), colalign=colalign))
+                print(f"{messages[11][0][0]} {100*(1-self.alfa)}{messages[11][2][0]}.")
+            df = pd.DataFrame(data)
+            return df
+
+    # with tests, with docstring, the database comes from Sample
+    def positional_summary(self, show=True):
+        """This function prints a table with the minimum, the first quartile, the median, the third quartile, the maximum, and the interquartile range estimated for the sample.
+
+        Parameters
+        ----------
+        show : ``bool``, optional
+            This parameter defines whether the results will be printed (``True``) or not (``False``).
+
+        Returns
+        -------
+        df : :doc:`DataFrame <pandas:reference/api/pandas.DataFrame>`
+            A DataFrame with the positional summary.
+
+        Notes
+        -----
+        The quartiles and the median are estimated by the quantile sketch (the same values of ``np.quantile`` while the sample is smaller than the capacity of the sketch). The minimum and the maximum are exact.
+
+        """
+        checkers._check_is_bool(show, "show", self.language)
+
+        if self.mean is None:
+            helpers._raises_when_fit_was_not_applied("StreamingSample", self.language, self.name)
+        else:
+            fk_id_function = management._query_func_id("Sample")
+            messages = management._get_messages(fk_id_function, self.language, "Sample")
+            q1, median, q3 = self._sketch.quantile(np.array([0.25, 0.5, 0.75]))
+            data = {
+                messages[12][0][0]: [self.min],
+                messages[13][0][0]: [q1],
+                messages[14][0][0]: [median],
+                messages[15][0][0]: [q3],
+                messages[16][0][0]: [self.max],
+                messages[17][0][0]: [q3 - q1]
+            }
+            colalign = ["center", "center", "center", "center", "center", "center"]
+            if show:
+                print(self.name)
+                print(tabulate(data, headers="keys", tablefmt="rst", floatfmt=(f".{self.n_digits}f"), colalign=colalign))
+            df = pd.DataFrame(data)
+            return df
+
+    def _update_statistics(self):
+        """Updates the statistics from the accumulated moments"""
+        if self.n > 1:
+            self.variance = self._m2/(self.n - 1)
+        else:
+            self.variance = np.nan
+        self.std = np.sqrt(self.variance)
+        self.cv = 100*self.std/self.mean
+        if self._m2 > 0:
+            self.skewness = np.sqrt(self.n)*self._m3/self._m2**1.5
+            self.kurtosis = self.n*self._m4/self._m2**2 - 3
+        else:
+            self.skewness = np.nan
+            self.kurtosis = np.nan
+
+    def _get_t_interval(self):
+        """Calculates the half width of the confidence interval for the mean with the current ``alfa``"""
+        t_student = np.abs(stats.t.ppf(self.alfa/2, self.n - 1))
+        return self.std*t_student/np.sqrt(self.n)
+
+    def __str__(self):
+        if self.mean is None:
+            fk_id_function = management._query_func_id("StreamingSample")
+            messages = management._get_messages(fk_id_function, self.language, "StreamingSample")
+            return f"{messages[2][0][0]} {self.name}"
+        else:
+            fk_id_function = management._query_func_id("Sample")
+            messages = management._get_messages(fk_id_function, self.language, "Sample")
+            return f"{self.name} {messages[5][0][0]} = {helpers._truncate(self.mean, self.language, decs=self.n_digits)} +/- {helpers._truncate(self.std, self.language, decs=self.n_digits)}"
+
+    def __repr__(self):
+        fk_id_function = management._query_func_id("StreamingSample")
+        messages = management._get_messages(fk_id_function, self.language, "StreamingSample")
+        return messages[3][0][0]
+
+
+# with tests, with docstring, without text
+def _batch_moments(x_exp):
+    """Calculates the count, the mean, the sums of the centered powers (second to fourth order), the minimum and the maximum of a batch
+
+    Parameters
+    ----------
+    x_exp : ``numpy array``
+        One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>`.
+
+    Returns
+    -------
+    moments : ``tuple``
+        ``(n, mean, M2, M3, M4, min, max)``, where ``Mk`` is the sum of ``(x - mean)**k``.
+
+    """
+    n = x_exp.size
+    mean = np.mean(x_exp)
+    deviation = x_exp - mean
+    square = deviation*deviation
+    m2 = np.sum(square)
+    m3 = np.dot(square, deviation)
+    m4 = np.dot(square, square)
+    return n, float(mean), float(m2), float(m3), float(m4), float(np.min(x_exp)), float(np.max(x_exp))
+
+
+# with tests, with docstring, without text
+def _combine_moments(moments_a, moments_b):
+    """Combines the moments of two disjoint sets of observations
+
+    Parameters
+    ----------
+    moments_a : ``tuple``
+        ``(n, mean, M2, M3, M4, min, max)`` of the first set (see :func:`_batch_moments`).
+    moments_b : ``tuple``
+        ``(n, mean, M2, M3, M4, min, max)`` of the second set.
+
+    Returns
+    -------
+    moments : ``tuple``
+        ``(n, mean, M2, M3, M4, min, max)`` of the union of both sets.
+
+    Notes
+    -----
+    The central moments are combined with the pairwise formulas of Pébay (2008):
+
+    .. math::
+
+            M_{2} = M_{2,a} + M_{2,b} + \\delta^{2}\\frac{n_a n_b}{n}
+
+            M_{3} = M_{3,a} + M_{3,b} + \\delta^{3}\\frac{n_a n_b (n_a - n_b)}{n^{2}} + 3\\delta\\frac{n_a M_{2,b} - n_b M_{2,a}}{n}
+
+            M_{4} = M_{4,a} + M_{4,b} + \\delta^{4}\\frac{n_a n_b (n_a^{2} - n_a n_b + n_b^{2})}{n^{3}} + 6\\delta^{2}\\frac{n_a^{2} M_{2,b} + n_b^{2} M_{2,a}}{n^{2}} + 4\\delta\\frac{n_a M_{3,b} - n_b M_{3,a}}{n}
+
+    where :math:`\\delta = \\overline{x}_b - \\overline{x}_a` and :math:`n = n_a + n_b`.
+
+    """
+    n_a, mean_a, m2_a, m3_a, m4_a, min_a, max_a = moments_a
+    n_b, mean_b, m2_b, m3_b, m4_b, min_b, max_b = moments_b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    delta_n = delta/n
+    mean = mean_a + n_b*delta_n
+    m2 = m2_a + m2_b + delta*delta_n*n_a*n_b
+    m3 = (m3_a + m3_b + delta_n*delta_n*delta*n_a*n_b*(n_a - n_b)
+          + 3*delta_n*(n_a*m2_b - n_b*m2_a))
+    m4 = (m4_a + m4_b + delta_n*delta_n*delta_n*delta*n_a*n_b*(n_a*n_a - n_a*n_b + n_b*n_b)
+          + 6*delta_n*delta_n*(n_a*n_a*m2_b + n_b*n_b*m2_a)
+          + 4*delta_n*(n_a*m3_b - n_b*m3_a))
+    return n, mean, m2, m3, m4, min(min_a, min_b), max(max_a, max_b)
+
+
+# with tests, with docstring, with text
+def _check_source(x_exp, x_source, language):
+    """This function decides if the data must be read in chunks
+
+    Parameters
+    ----------
+    x_exp : ``numpy array`` or ``None``
+        The data passed to the ``x_exp`` parameter of a ``fit()`` method.
+    x_source : ``str``, ``numpy array``, ``iterable`` or ``None``
+        The data passed to the ``x_source`` parameter of a ``fit()`` method.
+    language : ``str``
+        The language code.
+
+    Returns
+    -------
+    source : ``str``, ``numpy array``, ``iterable`` or ``None``
+        The data that must be read in chunks (``x_source``, or ``x_exp`` if it is a :class:`numpy.memmap`), or ``None`` if the data is in memory.
+
+    Notes
+    -----
+    Raises ``ValueError`` if both parameters are used.
+
+    """
+    if x_source is None:
+        if isinstance(x_exp, np.memmap):
+            return x_exp
+        return None
+    if x_exp is not None:
+        fk_id_function = management._query_func_id("_check_source")
+        messages = management._get_messages(fk_id_function, language, "_check_source")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            general._display_one_line_attention(messages[2][0][0])
+            raise
+    return x_source
+
+
+# with tests, with docstring, with text
+def _read_chunks(x_source, language):
+    """This function reads the observations of a data source in chunks
+
+    Parameters
+    ----------
+    x_source : ``str``, ``numpy array`` or ``iterable``
+        The data source:
+
+        * the path of a ``.npy`` file, or of a raw binary file of ``float64`` values (any other extension), which is memory mapped;
+        * a one dimension :doc:`numpy array <numpy:reference/generated/numpy.array>` (e.g., a :class:`numpy.memmap`);
+        * an iterable (e.g., a generator) of one dimension ``numpy arrays``.
+
+    language : ``str``
+        The language code.
+
+    Yields
+    ------
+    chunk : ``numpy array``
+        A ``float`` copy of at most ``CHUNK_SIZE`` observations, so only one chunk is kept in memory at a time.
+
+    """
+    if isinstance(x_source, (str, os.PathLike)):
+        path = os.fspath(x_source)
+        if path.endswith(".npy"):
+            x_source = np.load(path, mmap_mode="r")
+        else:
+            x_source = np.memmap(path, dtype=np.float64, mode="r")
+    if isinstance(x_source, np.ndarray):
+        arrays = [x_source]
+    elif isinstance(x_source, Iterable):
+        arrays = x_source
+    else:
+        fk_id_function = management._query_func_id("_read_chunks")
+        messages = management._get_messages(fk_id_function, language, "_read_chunks")
+        try:
+            error = messages[1][0][0]
+            raise ValueError(error)
+        except ValueError:
+            general._display_one_line_attention(f"{messages[2][0][0]} '{type(x_source).__name__}'")
+            raise
+    for array in arrays:
+        checkers._check_is_numpy_1_D(array, "x_source", language)
+        for start in range(0, array.size, CHUNK_SIZE):
+            yield np.asarray(array[start:start + CHUNK_SIZE], dtype=float)
+
+
+# with tests, with docstring, with text
+def _check_is_reiterable(x_source, language):
+    """This function checks if a data source can be read more than once
+
+    Parameters
+    ----------
+    x_source : ``str``, ``numpy array`` or ``iterable``
+        The data source (see :func:`_read_chunks`).
+    language : ``str``
+        The language code.
+
+    Returns
+    -------
+    ``True`` if the source is a path, a ``numpy array`` or a container (e.g., a ``list``) of arrays.
+
+    Raises ``ValueError`` if the source is an iterator (e.g., a generator), which is exhausted after the first reading.
+
+    """
+    if isinstance(x_source, (str, os.PathLike, np.ndarray)):
+        return True
+    if isinstance(x_source, Iterable) and iter(x_source) is x_source:
+        fk_id_function = management._query_func_id("_read_chunks")
+        messages = management._get_messages(fk_id_function, language, "_read_chunks")
+        try:
+            error = messages[3][0][0]
+            raise ValueError(error)
+        except ValueError:
+            general._display_one_line_attention(messages[4][0][0])
+            raise
+    return True
+
+
+# with tests, with docstring, without text
+def _scan_chunks(chunks, n_ends=0, sketch=None):
+    """This function reduces a sequence of chunks in a single pass, keeping only the moments and the values at both ends of the sorted sample
+
+    Parameters
+    ----------
+    chunks : ``iterable``
+        The chunks (one dimension ``numpy arrays``), e.g., from :func:`_read_chunks`.
+    n_ends : ``int``, optional
+        The number of lowest and highest values to keep (default is ``0``).
+    sketch : :class:`~pycafee.functions.quantilesketch.QuantileSketch`, optional
+        A sketch that also receives each chunk (default is ``None``).
+
+    Returns
+    -------
+    moments : ``tuple``
+        ``(n, mean, M2, M3, M4, min, max)`` of all observations (see :func:`_batch_moments`). If there are no observations, ``n`` is ``0`` and the other values are ``nan``.
+    ends : ``numpy array``
+        The ``n_ends`` lowest values followed by the ``n_ends`` highest values, sorted. If the sample has at most ``2*n_ends`` observations, the whole sorted sample.
+
+    """
+    moments = None
+    lowest = np.empty(0)
+    highest = np.empty(0)
+    for chunk in chunks:
+        batch = _batch_moments(chunk)
+        if moments is None:
+            moments = batch
+        else:
+            moments = _combine_moments(moments, batch)
+        if n_ends > 0:
+            if chunk.size > n_ends:
+                lowest = np.concatenate((lowest, np.partition(chunk, n_ends - 1)[:n_ends]))
+                highest = np.concatenate((highest, np.partition(chunk, chunk.size - n_ends)[-n_ends:]))
+            else:
+                lowest = np.concatenate((lowest, chunk))
+                highest = np.concatenate((highest, chunk))
+            lowest = np.sort(lowest)[:n_ends]
+            highest = np.sort(highest)[-n_ends:]
+        if sketch is not None:
+            sketch.push(chunk)
+
+    if moments is None:
+        return (0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan), np.empty(0)
+    # the ends overlap when the sample is small
+    n_upper = min(highest.size, moments[0] - lowest.size)
+    ends = np.concatenate((lowest, highest[highest.size - n_upper:]))
+    return moments, ends
@@ -13,7 +13,6 @@ desc
 #########################################
 
 ###### Standard ######
-from collections import namedtuple
 
 
 ###### Third part ######
@@ -709,7 +708,7 @@ class StudentDistribution(PlotsManagement, AlphaManagement, NDigitsManagement):
         fk_id_function = management._query_func_id("StudentDistribution")
         messages = management._get_messages(fk_id_function, self.language, "StudentDistribution")
 
-        result = namedtuple(messages[13][0][0], (messages[13][1][0], messages[13][2][0], messages[13][3][0], messages[13][4][0]))
+        result = helpers._get_result_class(messages[13][0][0], (messages[13][1][0], messages[13][2][0], messages[13][3][0], messages[13][4][0]), ("upper", "lower", "alpha", "which"))
 
         return result(t_student[1], t_student[0], alfa, which)
 
@@ -1127,7 +1126,7 @@ class StudentDistribution(PlotsManagement, AlphaManagement, NDigitsManagement):
                             conclusion = aceita
 
 
-        result = namedtuple(messages[21][0][0], (messages[21][1][0], messages[21][2][0], messages[21][3][0], "which", messages[21][4][0]))
+        result = helpers._get_result_class(messages[21][0][0], (messages[21][1][0], messages[21][2][0], messages[21][3][0], "which", messages[21][4][0]), ("statistic", "critical", "p_value", "which", "alpha"))
         # print(critical)
         return result(statistic, [critical[0], critical[1]], p_value, which, alfa), conclusion
 
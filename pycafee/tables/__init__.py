@@ -0,0 +1 @@
+from .montecarlo import MonteCarloTable
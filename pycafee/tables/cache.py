@@ -0,0 +1,146 @@
+"""This module stores the simulated critical values on a local cache file, so each critical value is simulated only once per machine.
+
+The cache is a ``json`` file (``critical_values.json``) with one entry per ``(test, n_rep, alfa, replicates, seed)``. The folder is, in order of priority, the ``cache_dir`` parameter, the ``PYCAFEE_CACHE_DIR`` environment variable, or ``pycafee`` inside the user cache folder (``XDG_CACHE_HOME`` or ``~/.cache``). The file is also kept in memory after the first read.
+
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - _get_cache_path(cache_dir=None)
+# - _make_key(test, n_rep, alfa, replicates, seed)
+# - _read_cache(path)
+# - _write_cache(path, entries)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+import json
+import os
+import tempfile
+
+###### Third part ######
+
+###### Home made ######
+
+
+###########################################
+################ Functions ################
+###########################################
+
+CACHE_FILE_NAME = "critical_values.json"
+
+# {path: {key: critical value}}
+_MEMORY = {}
+
+
+def _get_cache_path(cache_dir=None):
+    """Finds the path of the cache file
+
+    Parameters
+    ----------
+    cache_dir : ``str``, optional
+        The folder of the cache. If ``None`` (default), the ``PYCAFEE_CACHE_DIR`` environment variable is used and, if it is not defined, the ``pycafee`` folder inside the user cache folder.
+
+    Returns
+    -------
+    path : ``str``
+
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get("PYCAFEE_CACHE_DIR")
+    if cache_dir is None:
+        user_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(user_cache, "pycafee")
+    return os.path.join(os.path.abspath(cache_dir), CACHE_FILE_NAME)
+
+
+def _make_key(test, n_rep, alfa, replicates, seed):
+    """Builds the key of one critical value
+
+    Parameters
+    ----------
+    test : ``str``
+        The name of the statistic.
+    n_rep : ``int``
+        The sample size.
+    alfa : ``float``
+        The significance level.
+    replicates : ``int``
+        The number of simulated samples.
+    seed : ``int``
+        The seed of the simulation.
+
+    Returns
+    -------
+    key : ``str``
+
+    """
+    return f"{test}|{int(n_rep)}|{float(alfa)!r}|{int(replicates)}|{int(seed)}"
+
+
+def _read_cache(path):
+    """Reads the cache file (only once per path)
+
+    Parameters
+    ----------
+    path : ``str``
+        The path of the cache file.
+
+    Returns
+    -------
+    entries : ``dict``
+        The cached critical values (an empty ``dict`` if the file does not exist or cannot be read).
+
+    """
+    if path not in _MEMORY:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError):
+            entries = {}
+        _MEMORY[path] = entries
+    return _MEMORY[path]
+
+
+def _write_cache(path, entries):
+    """Adds critical values to the cache
+
+    The file is read again before writing, so entries saved by other processes are kept, and it is replaced atomically (a temporary file is written and renamed). If the folder cannot be written, the entries are kept only in memory.
+
+    Parameters
+    ----------
+    path : ``str``
+        The path of the cache file.
+    entries : ``dict``
+        The new critical values (``{key: critical value}``).
+
+    """
+    memory = _read_cache(path)
+    memory.update(entries)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            on_disk = json.load(file)
+        if isinstance(on_disk, dict):
+            on_disk.update(memory)
+            memory.update(on_disk)
+    except (OSError, ValueError):
+        pass
+    try:
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=folder, prefix=".critical_values", suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(memory, file, indent=0, sort_keys=True)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+    except OSError:
+        pass
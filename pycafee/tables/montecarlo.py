@@ -0,0 +1,304 @@
+"""This module simulates the critical values of the tests that have no table for the sample size (e.g., Grubbs and Dixon above ``30`` observations).
+
+The null distribution of the statistic is simulated with normal samples drawn in blocks (each block is a two dimension ``numpy array`` sorted once), optionally using many processes, and the quantiles are stored on a local cache file (see :mod:`pycafee.tables.cache`).
+
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - MonteCarloTable(LanguageManagement)
+#     - __init__(self, replicates=None, seed=None, max_workers=None, cache_dir=None, language=None, **kwargs)
+#     - get_critical_value(self, test, n_rep, alfa=None)
+#     - simulate(self, test, n_rep)
+#     - _check_test(self, test, n_rep)
+#     - __str__(self)
+#     - __repr__(self)
+# - _get_blocks(n_rep, replicates, seed)
+# - _simulate_block(test, n_rep, rows, seed_sequence)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+from concurrent.futures import ProcessPoolExecutor
+import math
+
+###### Third part ######
+import numpy as np
+
+###### Home made ######
+from pycafee.database_management import management
+from pycafee.tables import cache
+from pycafee.tables.statistics import STATISTICS
+from pycafee.utils import checkers
+from pycafee.utils import general
+from pycafee.utils import helpers
+from pycafee.utils.helpers import LanguageManagement
+
+
+###########################################
+################ Functions ################
+###########################################
+
+# number of values drawn per block (8 MB of float64)
+BLOCK_SIZE = 2**20
+
+
+def _get_blocks(n_rep, replicates, seed):
+    """Splits the simulation in blocks
+
+    The blocks depend only on ``n_rep``, ``replicates`` and ``seed``, so the simulated statistics are the same for any number of processes.
+
+    Parameters
+    ----------
+    n_rep : ``int``
+        The sample size.
+    replicates : ``int``
+        The number of simulated samples.
+    seed : ``int``
+        The seed of the simulation.
+
+    Returns
+    -------
+    blocks : ``list`` of ``tuple``
+        The number of samples and the ``SeedSequence`` of each block.
+
+    """
+    rows = max(1, BLOCK_SIZE // n_rep)
+    n_blocks = math.ceil(replicates / rows)
+    seed_sequences = np.random.SeedSequence(seed).spawn(n_blocks)
+    return [(min(rows, replicates - i*rows), seed_sequence) for i, seed_sequence in enumerate(seed_sequences)]
+
+
+def _simulate_block(test, n_rep, rows, seed_sequence):
+    """Simulates the statistic for one block of normal samples
+
+    Parameters
+    ----------
+    test : ``str``
+        The name of the statistic (a key of ``STATISTICS``).
+    n_rep : ``int``
+        The sample size.
+    rows : ``int``
+        The number of samples of the block.
+    seed_sequence : ``SeedSequence``
+        The seed of the block.
+
+    Returns
+    -------
+    statistics : ``numpy array``
+        The statistic of each sample of the block.
+
+    """
+    x = np.random.default_rng(seed_sequence).standard_normal((rows, n_rep))
+    x.sort(axis=1)
+    return STATISTICS[test].function(x)
+
+
+class MonteCarloTable(LanguageManagement):
+    """This class instantiates an object to simulate critical values with a cache on disk
+
+    Attributes
+    ----------
+    cache_dir : ``str`` or ``None``
+        The folder of the cache file (``None`` means the default folder, see :mod:`pycafee.tables.cache`).
+    language : ``str``
+        The language code used for the interface.
+    max_workers : ``int``
+        The number of processes used to simulate.
+    replicates : ``int``
+        The number of simulated samples.
+    seed : ``int``
+        The seed of the simulation.
+
+    Methods
+    -------
+    get_critical_value(test, n_rep, alfa=None)
+        Returns the simulated critical value (from the cache when it was already simulated).
+    simulate(test, n_rep)
+        Returns the simulated statistics, sorted.
+
+    Notes
+    -----
+    The available tests are ``"grubbs_one"``, ``"grubbs_two"``, ``"grubbs_three"``, ``"dixon_r10"``, ``"dixon_r11"``, ``"dixon_r12"``, ``"dixon_r20"``, ``"dixon_r21"``, ``"dixon_r22"`` and ``"shapiro_wilk"``. They follow the same convention of the tables of pycafee: the Grubbs and Dixon statistics take the most extreme end of the sample.
+
+    The standard error of a simulated quantile is about ``sqrt(alfa*(1 - alfa)/replicates)`` in probability, so use at least ``100/alfa`` replicates.
+
+    """
+
+    def __init__(self, replicates=None, seed=None, max_workers=None, cache_dir=None, language=None, **kwargs):
+        super().__init__(language=language, **kwargs)
+        if replicates is None:
+            replicates = 100000
+        else:
+            checkers._check_is_integer(replicates, "replicates", self.language)
+            checkers._check_is_positive(replicates, "replicates", self.language)
+        if seed is None:
+            seed = 0
+        else:
+            checkers._check_is_integer(seed, "seed", self.language)
+            checkers._check_value_is_equal_or_higher_than(seed, "seed", 0, self.language)
+        if max_workers is None:
+            max_workers = 1
+        else:
+            checkers._check_is_integer(max_workers, "max_workers", self.language)
+            checkers._check_is_positive(max_workers, "max_workers", self.language)
+        if cache_dir is not None:
+            checkers._check_is_str(cache_dir, "cache_dir", self.language)
+        self.replicates = replicates
+        self.seed = seed
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+
+    # with tests, with text, with database, with docstring
+    def get_critical_value(self, test, n_rep, alfa=None):
+        """Returns the simulated critical value of a test
+
+        The critical values are read from the cache file. When some significance level is not on the cache, the statistic is simulated once for all missing levels and the cache is updated.
+
+        Parameters
+        ----------
+        test : ``str``
+            The name of the test (see the Notes of :class:`MonteCarloTable`).
+        n_rep : ``int``
+            The sample size.
+        alfa : ``float`` or ``list`` of ``float``, optional
+            The significance level (default is ``None``, which means ``0.05``). Use a ``list`` to get many levels with only one simulation.
+
+        Returns
+        -------
+        result : ``tuple`` with
+            critical : ``float`` or ``numpy array``
+                The critical value (one per level if ``alfa`` is a ``list``).
+            alpha : ``float`` or ``list``
+                The significance level.
+
+        Examples
+        --------
+        >>> from pycafee.tables import MonteCarloTable
+        >>> table = MonteCarloTable(replicates=20000)
+        >>> result = table.get_critical_value("grubbs_one", 10)
+        >>> print(result)
+        MonteCarloTableResult(Critical=2.296414269940773, alpha=0.05)
+
+        """
+        self._check_test(test, n_rep)
+
+        ### checking alpha value ###
+        if alfa is None:
+            alfa = 0.05
+        if isinstance(alfa, list):
+            alphas = alfa
+        else:
+            alphas = [alfa]
+        for value in alphas:
+            checkers._check_is_float(value, "alfa", self.language)
+            checkers._check_data_in_range(value, "alfa", 0.0, 1.0, self.language)
+
+        ### reading the cache ###
+        path = cache._get_cache_path(self.cache_dir)
+        entries = cache._read_cache(path)
+        keys = [cache._make_key(test, n_rep, value, self.replicates, self.seed) for value in alphas]
+        missing = [i for i, key in enumerate(keys) if key not in entries]
+
+        ### simulating the missing levels ###
+        if len(missing) > 0:
+            statistics = self.simulate(test, n_rep)
+            if STATISTICS[test].upper:
+                probabilities = [1 - alphas[i] for i in missing]
+            else:
+                probabilities = [alphas[i] for i in missing]
+            quantiles = np.quantile(statistics, probabilities)
+            cache._write_cache(path, {keys[i]: float(quantile) for i, quantile in zip(missing, quantiles)})
+            entries = cache._read_cache(path)
+
+        critical = np.array([entries[key] for key in keys])
+        if not isinstance(alfa, list):
+            critical = float(critical[0])
+
+        ### quering
+        fk_id_function = management._query_func_id("generic")
+        messages = management._get_messages(fk_id_function, self.language, "generic")
+
+        ### making the named tuple
+        name = "MonteCarloTable" + messages[1][0][0]
+        result = helpers._get_result_class(name, (messages[1][1][0], messages[1][2][0]), ("critical", "alpha"))
+        return result(critical, alfa)
+
+    # with tests, with text, with database, with docstring
+    def simulate(self, test, n_rep):
+        """Simulates the null distribution of a test statistic (without the cache)
+
+        Parameters
+        ----------
+        test : ``str``
+            The name of the test (see the Notes of :class:`MonteCarloTable`).
+        n_rep : ``int``
+            The sample size.
+
+        Returns
+        -------
+        statistics : ``numpy array``
+            The simulated statistics (``replicates`` values), sorted.
+
+        Notes
+        -----
+        The statistics are the same for any ``max_workers``, since each block has its own seed.
+
+        """
+        self._check_test(test, n_rep)
+        blocks = _get_blocks(n_rep, self.replicates, self.seed)
+        if self.max_workers == 1 or len(blocks) == 1:
+            results = [_simulate_block(test, n_rep, rows, seed_sequence) for rows, seed_sequence in blocks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(blocks))) as executor:
+                futures = [executor.submit(_simulate_block, test, n_rep, rows, seed_sequence) for rows, seed_sequence in blocks]
+                results = [future.result() for future in futures]
+        statistics = np.concatenate(results)
+        statistics.sort()
+        return statistics
+
+    def _check_test(self, test, n_rep):
+        """Checks the name of the test and the sample size
+
+        Parameters
+        ----------
+        test : ``str``
+            The name of the test.
+        n_rep : ``int``
+            The sample size.
+
+        """
+        ### checking the test ###
+        checkers._check_is_str(test, "test", self.language)
+        if test not in STATISTICS:
+            fk_id_function = management._query_func_id("generic")
+            messages = management._get_messages(fk_id_function, self.language, "generic")
+            try:
+                error = messages[3][0][0]
+                raise ValueError(error)
+            except ValueError:
+                msg = [f"{messages[4][0][0]} 'test' {messages[4][2][0]}:"]
+                for item in STATISTICS.keys():
+                    msg.append(f"   --->    '{item}'")
+                msg.append(f"{messages[4][4][0]}:")
+                msg.append(f"   --->    '{test}'")
+                general._display_n_line_attention(msg)
+                raise
+
+        ### checking the number of observations ###
+        checkers._check_is_integer(n_rep, "n_rep", self.language)
+        checkers._check_value_is_equal_or_higher_than(n_rep, "n_rep", STATISTICS[test].n_min, self.language)
+
+    def __str__(self):
+        fk_id_function = management._query_func_id("MonteCarloTable")
+        messages = management._get_messages(fk_id_function, self.language, "MonteCarloTable")
+        return f"{messages[1][0][0]} {self.replicates}"
+
+    def __repr__(self):
+        fk_id_function = management._query_func_id("MonteCarloTable")
+        messages = management._get_messages(fk_id_function, self.language, "MonteCarloTable")
+        return messages[2][0][0]
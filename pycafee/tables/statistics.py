@@ -0,0 +1,187 @@
+"""This module concentrates the vectorized statistics used to simulate the null distribution of the tests that use tabulated critical values.
+
+All functions receive a two dimension ``numpy array`` with one **sorted** sample per row (the rows are sorted once for all statistics) and return a one dimension ``numpy array`` with the statistic of each row.
+
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - _grubbs_one(x_sorted)
+# - _grubbs_two(x_sorted)
+# - _grubbs_three(x_sorted)
+# - _dixon(x_sorted, gap, trim)
+# - _dixon_r10(x_sorted)
+# - _dixon_r11(x_sorted)
+# - _dixon_r12(x_sorted)
+# - _dixon_r20(x_sorted)
+# - _dixon_r21(x_sorted)
+# - _dixon_r22(x_sorted)
+# - _shapiro_wilk(x_sorted)
+# - Statistic (namedtuple)
+# - STATISTICS (dict)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+from collections import namedtuple
+
+###### Third part ######
+import numpy as np
+
+###### Home made ######
+from pycafee.normalitycheck import kernels
+
+
+###########################################
+################ Functions ################
+###########################################
+
+
+def _grubbs_one(x_sorted):
+    """Calculates the Grubbs statistic for one outlier (:math:`G^{'}`), taking the most extreme value of each sample
+
+    Parameters
+    ----------
+    x_sorted : ``numpy array``
+        One sorted sample per row.
+
+    Returns
+    -------
+    statistic : ``numpy array``
+
+    """
+    mean = x_sorted.mean(axis=1)
+    std = x_sorted.std(axis=1, ddof=1)
+    return np.maximum(x_sorted[:, -1] - mean, mean - x_sorted[:, 0])/std
+
+
+def _grubbs_two(x_sorted):
+    """Calculates the Grubbs statistic for two outliers, one at each end (:math:`G^{''}`)
+
+    Parameters
+    ----------
+    x_sorted : ``numpy array``
+        One sorted sample per row.
+
+    Returns
+    -------
+    statistic : ``numpy array``
+
+    """
+    return (x_sorted[:, -1] - x_sorted[:, 0])/x_sorted.std(axis=1, ddof=1)
+
+
+def _grubbs_three(x_sorted):
+    """Calculates the Grubbs statistic for two outliers on the same side (:math:`G^{'''}`), taking the lowest of both ends of each sample
+
+    Parameters
+    ----------
+    x_sorted : ``numpy array``
+        One sorted sample per row.
+
+    Returns
+    -------
+    statistic : ``numpy array``
+
+    """
+    n = x_sorted.shape[1]
+    var = np.minimum(x_sorted[:, :-2].var(axis=1, ddof=1), x_sorted[:, 2:].var(axis=1, ddof=1))
+    return (n - 3)*var/((n - 1)*x_sorted.var(axis=1, ddof=1))
+
+
+def _dixon(x_sorted, gap, trim):
+    """Calculates a Dixon ratio at both ends of each sample and returns the highest one
+
+    Parameters
+    ----------
+    x_sorted : ``numpy array``
+        One sorted sample per row.
+    gap : ``int``
+        The position of the neighbour of the suspected value (``1`` for ``r1j`` and ``2`` for ``r2j``).
+    trim : ``int``
+        The number of values disregarded at the opposite end (``j`` in ``rij``).
+
+    Returns
+    -------
+    statistic : ``numpy array``
+
+    """
+    n = x_sorted.shape[1]
+    lower = (x_sorted[:, gap] - x_sorted[:, 0])/(x_sorted[:, n - 1 - trim] - x_sorted[:, 0])
+    upper = (x_sorted[:, -1] - x_sorted[:, n - 1 - gap])/(x_sorted[:, -1] - x_sorted[:, trim])
+    return np.maximum(lower, upper)
+
+
+def _dixon_r10(x_sorted):
+    """Calculates the Dixon ``r10`` ratio (highest of both ends)"""
+    return _dixon(x_sorted, 1, 0)
+
+
+def _dixon_r11(x_sorted):
+    """Calculates the Dixon ``r11`` ratio (highest of both ends)"""
+    return _dixon(x_sorted, 1, 1)
+
+
+def _dixon_r12(x_sorted):
+    """Calculates the Dixon ``r12`` ratio (highest of both ends)"""
+    return _dixon(x_sorted, 1, 2)
+
+
+def _dixon_r20(x_sorted):
+    """Calculates the Dixon ``r20`` ratio (highest of both ends)"""
+    return _dixon(x_sorted, 2, 0)
+
+
+def _dixon_r21(x_sorted):
+    """Calculates the Dixon ``r21`` ratio (highest of both ends)"""
+    return _dixon(x_sorted, 2, 1)
+
+
+def _dixon_r22(x_sorted):
+    """Calculates the Dixon ``r22`` ratio (highest of both ends)"""
+    return _dixon(x_sorted, 2, 2)
+
+
+def _shapiro_wilk(x_sorted):
+    """Calculates the Shapiro Wilk statistic (``W``)
+
+    Parameters
+    ----------
+    x_sorted : ``numpy array``
+        One sorted sample per row.
+
+    Returns
+    -------
+    statistic : ``numpy array``
+
+    """
+    return kernels._shapiro_wilk_statistic(x_sorted, is_sorted=True)
+
+
+Statistic = namedtuple("Statistic", ["function", "upper", "n_min"])
+Statistic.__doc__ = """A statistic that can be simulated
+
+function : ``callable``
+    The vectorized statistic (receives one sorted sample per row).
+upper : ``bool``
+    ``True`` if the test rejects the null hypothesis for high values of the statistic (the critical value is the ``1 - alfa`` quantile) and ``False`` if it rejects for low values (the critical value is the ``alfa`` quantile).
+n_min : ``int``
+    The smallest sample size.
+"""
+
+STATISTICS = {
+    "grubbs_one": Statistic(_grubbs_one, True, 3),
+    "grubbs_two": Statistic(_grubbs_two, True, 3),
+    "grubbs_three": Statistic(_grubbs_three, False, 4),
+    "dixon_r10": Statistic(_dixon_r10, True, 3),
+    "dixon_r11": Statistic(_dixon_r11, True, 4),
+    "dixon_r12": Statistic(_dixon_r12, True, 5),
+    "dixon_r20": Statistic(_dixon_r20, True, 4),
+    "dixon_r21": Statistic(_dixon_r21, True, 5),
+    "dixon_r22": Statistic(_dixon_r22, True, 6),
+    "shapiro_wilk": Statistic(_shapiro_wilk, False, 3),
+}
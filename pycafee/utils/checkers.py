@@ -14,6 +14,7 @@
 #     - _check_is_float(value, param_name, language)
 #     - _check_is_list(value, param_name, language)
 #     - _check_is_numpy_1_D(value, param_name, language)
+#     - _check_is_numpy_2_D(value, param_name, language)
 #     - _check_is_positive(value, param_name, language)
 #     - _check_is_str(value, param_name, language)
 #     - _check_is_subplots(value, param_name, language)
@@ -68,12 +69,11 @@ def _check_array_lower_size(array, value, param_name, language):
     Raises ``ValueError`` if the size of the ``array`` is lower than ``value``;
 
     """
-    ### quering ###
-    func_name = "_check_array_lower_size"
-    fk_id_function = management._query_func_id(func_name)
-    messages = management._get_messages(fk_id_function, language, func_name)
-
     if array.size < value :
+        ### quering ###
+        func_name = "_check_array_lower_size"
+        fk_id_function = management._query_func_id(func_name)
+        messages = management._get_messages(fk_id_function, language, func_name)
         try:
             error = messages[1][0][0]
             raise ValueError(error)
@@ -175,12 +175,11 @@ def _check_is_bool(value, param_name, language):
 
 
     """
-    ### quering ###
-    func_name = "_check_is_bool"
-    fk_id_function = management._query_func_id(func_name)
-    messages = management._get_messages(fk_id_function, language, func_name)
-
     if isinstance(value, bool) == False:
+        ### quering ###
+        func_name = "_check_is_bool"
+        fk_id_function = management._query_func_id(func_name)
+        messages = management._get_messages(fk_id_function, language, func_name)
         try:
             raise ValueError(messages[1][0][0])
         except ValueError:
@@ -464,6 +463,10 @@ def _check_is_numpy_1_D(value, param_name, language):
     Raises ``ValueError`` if ``value`` is not a non-empty ``1-dimensional numpy array``
 
     """
+    # the messages are only needed when the check fails
+    if isinstance(value, np.ndarray) and value.ndim == 1 and value.size > 0:
+        return True
+
     ### quering ###
     func_name = "_check_is_numpy_1_D"
     fk_id_function = management._query_func_id(func_name)
@@ -496,6 +499,64 @@ def _check_is_numpy_1_D(value, param_name, language):
     else:
         return True
 
+# with tests, with text, with database
+def _check_is_numpy_2_D(value, param_name, language):
+    """This function checks if a ``value`` is an ``numpy array`` of 2 dimensions
+
+    Parameters
+    ----------
+    value : any
+        The value to check if it is a non-empty 2-dimensional numpy array.
+    param_name : ``str``
+        The original name of the parameter passed through the parameter ``value``.
+    language : ``str``
+        The language code
+
+    Notes
+    -----
+    The parameter ``param_name`` isn't checked if it is a ``str``.
+    The parameter ``language`` isn't checked if it is a ``str``.
+
+    Returns
+    -------
+    ``True`` if ``value`` is a non-empty ``2-dimensional numpy array``
+    Raises ``ValueError`` if ``value`` is not a non-empty ``2-dimensional numpy array``
+
+    """
+    # the messages are only needed when the check fails
+    if isinstance(value, np.ndarray) and value.ndim == 2 and value.size > 0:
+        return True
+
+    ### quering ###
+    func_name = "_check_is_numpy_2_D"
+    fk_id_function = management._query_func_id(func_name)
+    messages = management._get_messages(fk_id_function, language, func_name)
+
+    if isinstance(value, np.ndarray) == False:
+        try:
+            raise ValueError(messages[1][0][0])
+        except ValueError:
+            general._display_one_line_attention(
+                                f"{messages[2][0][0]} '{param_name}' {messages[2][2][0]} '{type(value).__name__}'",
+                                )
+            raise
+    elif value.ndim != 2:
+        try:
+            raise ValueError(messages[3][0][0])
+        except ValueError:
+            general._display_one_line_attention(
+                                f"{messages[4][0][0]} '{param_name}' {messages[4][2][0]} ndim = '{value.ndim}'",
+                                )
+            raise
+    else:
+        try:
+            raise ValueError(messages[5][0][0])
+        except ValueError:
+            general._display_one_line_attention(
+                                f"{messages[6][0][0]} '{param_name}' {messages[6][2][0]} = '{value.shape}'",
+                                )
+            raise
+
 # with tests, with text, with database
 def _check_is_positive(value, param_name, language):
     """This function checks if ``value`` is a positive number.
@@ -560,6 +621,10 @@ def _check_is_str(value, param_name, language):
     Raises ``ValueError`` is value is not a valid ``str``.
 
     """
+    # the messages are only needed when the check fails
+    if isinstance(value, str) and len(value) > 0:
+        return True
+
     ### quering ###
     func_name = "_check_is_str"
     fk_id_function = management._query_func_id(func_name)
@@ -610,12 +675,11 @@ def _check_is_subplots(value, param_name, language):
 
 
     """
-    ### quering ###
-    func_name = "_check_is_subplots"
-    fk_id_function = management._query_func_id(func_name)
-    messages = management._get_messages(fk_id_function, language, func_name)
-
     if isinstance(value, matplotlib.axes.SubplotBase) == False:
+        ### quering ###
+        func_name = "_check_is_subplots"
+        fk_id_function = management._query_func_id(func_name)
+        messages = management._get_messages(fk_id_function, language, func_name)
         try:
             error = messages[1][0][0]
             raise ValueError(error)
@@ -0,0 +1,210 @@
+"""This module concentrates the dense (array indexed) critical value tables shared by the tests that use tabulated critical values.
+
+The tables of the library are written as ``dict`` of ``list`` (``{"n_rep": [...], alfa: [...], ...}``), which is easy to read and to plot. At import time, each table is converted into a two dimension ``numpy array`` indexed by ``(alpha index, n_rep - n_min)``:
+
+* the sample sizes that are not tabulated are filled with a monotone cubic (PCHIP) interpolation in ``1/sqrt(n_rep)``;
+* the derivatives of a monotone cubic interpolation in ``log(alfa)`` are stored next to the values.
+
+So the lookup of any pair of ``n_rep`` and ``alfa`` (inside the tabulated range of ``alfa``) is a fancy indexing plus a cubic Hermite evaluation, which accepts arrays of ``n_rep`` and ``alfa``. The tabulated values are returned unchanged.
+
+"""
+
+##########################################
+################ Summmary ################
+##########################################
+
+# - DenseTable (namedtuple)
+# - _pchip_slopes(x, y)
+# - _hermite(x, y, slopes, x_new, index)
+# - _build_dense_table(table, alphas=None, asymptotic=None, divisor=None, extrapolation=None)
+# - _lookup_critical_values(dense_table, n_rep, alfa, atol=1e-9)
+
+#########################################
+################ Imports ################
+#########################################
+
+###### Standard ######
+from collections import namedtuple
+
+###### Third part ######
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+###### Home made ######
+
+
+###########################################
+################ Functions ################
+###########################################
+
+DenseTable = namedtuple("DenseTable", ["alphas", "n_rep", "values", "slopes", "asymptotic", "asymptotic_slopes", "divisor", "extrapolation"])
+DenseTable.__doc__ = """A critical value table converted to ``numpy arrays``
+
+alphas : ``numpy array``
+    The tabulated significance levels, in increasing order (one per row of ``values``).
+n_rep : ``numpy array``
+    Every sample size between the smallest and the largest tabulated sample size (one per column of ``values``).
+values : ``numpy array``
+    The critical values, with shape ``(alphas.size, n_rep.size)``.
+slopes : ``numpy array``
+    The derivatives of ``values`` with respect to ``log(alfa)`` (same shape as ``values``).
+asymptotic : ``numpy array`` or ``None``
+    The numerator of the approximation used above the largest tabulated sample size (one per alpha).
+asymptotic_slopes : ``numpy array`` or ``None``
+    The derivatives of ``asymptotic`` with respect to ``log(alfa)``.
+divisor : ``callable`` or ``None``
+    The function of ``n_rep`` that divides ``asymptotic``.
+extrapolation : ``callable`` or ``None``
+    A function of ``(n_rep, alfa, critical)`` used above the largest tabulated sample size when there is no ``asymptotic`` approximation (``critical`` is the critical value for the largest tabulated sample size).
+"""
+
+
+def _pchip_slopes(x, y):
+    """Calculates the derivatives of the monotone cubic (PCHIP) interpolation of ``y`` on the nodes ``x``
+
+    Parameters
+    ----------
+    x : ``numpy array``
+        The nodes, in increasing order (one dimension).
+    y : ``numpy array``
+        The values on the nodes, along the first axis.
+
+    Returns
+    -------
+    slopes : ``numpy array``
+        The derivatives on the nodes (same shape as ``y``).
+
+    """
+    return PchipInterpolator(x, y, axis=0).derivative()(x)
+
+
+def _hermite(x, y, slopes, x_new, index):
+    """Evaluates a cubic Hermite interpolation
+
+    Parameters
+    ----------
+    x : ``numpy array``
+        The nodes, in increasing order.
+    y, slopes : ``numpy array``
+        The values and the derivatives on the nodes, along the first axis.
+    x_new : ``numpy array``
+        Where to evaluate.
+    index : ``tuple``
+        The index of the other axes of ``y`` and ``slopes`` (broadcast against ``x_new``).
+
+    Returns
+    -------
+    result : ``numpy array``
+        The interpolated values. When ``x_new`` is a node, the value on the node is returned unchanged.
+
+    """
+    i = np.clip(np.searchsorted(x, x_new, side="right") - 1, 0, x.size - 2)
+    h = x[i + 1] - x[i]
+    t = (x_new - x[i])/h
+    h00 = (1 + 2*t)*(1 - t)**2
+    h10 = t*(1 - t)**2
+    h01 = t**2*(3 - 2*t)
+    h11 = t**2*(t - 1)
+    return h00*y[(i,) + index] + h10*h*slopes[(i,) + index] + h01*y[(i + 1,) + index] + h11*h*slopes[(i + 1,) + index]
+
+
+def _build_dense_table(table, alphas=None, asymptotic=None, divisor=None, extrapolation=None):
+    """Converts a critical value table (``dict`` of ``list``) into a ``DenseTable``
+
+    Sample sizes that are not tabulated are filled with a monotone cubic (PCHIP) interpolation in ``1/sqrt(n_rep)``. The tabulated values are kept unchanged.
+
+    Parameters
+    ----------
+    table : ``dict``
+        A dict in the form ``{"n_rep": [...], alfa: [...], ...}``. If the lists of critical values are shorter than ``"n_rep"``, only the sample sizes with critical values are used.
+    alphas : ``list``, optional
+        The significance levels to keep. If ``None`` (default), every key of ``table`` except ``"n_rep"`` is used.
+    asymptotic : ``dict``, optional
+        A dict in the form ``{alfa: numerator}`` with the approximation used above the largest tabulated sample size.
+    divisor : ``callable``, optional
+        The function of ``n_rep`` that divides the ``asymptotic`` numerator (required when ``asymptotic`` is not ``None``).
+    extrapolation : ``callable``, optional
+        A function of ``(n_rep, alfa, critical)`` used above the largest tabulated sample size when ``asymptotic`` is ``None``, where ``critical`` is the critical value for the largest tabulated sample size.
+
+    Returns
+    -------
+    dense_table : ``DenseTable``
+
+    """
+    if alphas is None:
+        alphas = [key for key in table.keys() if key != "n_rep"]
+    alphas = sorted(alphas)
+    size = min(len(table[alfa]) for alfa in alphas)
+    tabulated_n = np.asarray(table["n_rep"][:size], dtype=int)
+    tabulated = np.asarray([table[alfa][:size] for alfa in alphas], dtype=float)
+    n_rep = np.arange(tabulated_n[0], tabulated_n[-1] + 1)
+
+    ## interpolação em 1/sqrt(n), com os nós em ordem crescente ##
+    u = 1/np.sqrt(tabulated_n[::-1])
+    values = PchipInterpolator(u, tabulated[:, ::-1], axis=1)(1/np.sqrt(n_rep))
+    values[:, tabulated_n - n_rep[0]] = tabulated
+
+    log_alphas = np.log(alphas)
+    slopes = _pchip_slopes(log_alphas, values)
+    alphas = np.asarray(alphas, dtype=float)
+    if asymptotic is not None:
+        asymptotic = np.asarray([asymptotic[alfa] for alfa in alphas], dtype=float)
+        asymptotic_slopes = _pchip_slopes(log_alphas, asymptotic)
+        asymptotic_slopes.setflags(write=False)
+        asymptotic.setflags(write=False)
+    else:
+        asymptotic_slopes = None
+    for array in (alphas, values, slopes):
+        array.setflags(write=False)
+    return DenseTable(alphas, n_rep, values, slopes, asymptotic, asymptotic_slopes, divisor, extrapolation)
+
+
+def _lookup_critical_values(dense_table, n_rep, alfa, atol=1e-9):
+    """Finds the critical values for arrays of sample sizes and significance levels
+
+    Parameters
+    ----------
+    dense_table : ``DenseTable``
+        The table built by ``_build_dense_table``.
+    n_rep : ``int`` or ``numpy array`` of ``int``
+        The sample sizes.
+    alfa : ``float`` or ``numpy array`` of ``float``
+        The significance levels (broadcast against ``n_rep``). A level that differs from a tabulated level by at most ``atol`` gets the tabulated value; the other levels are interpolated.
+    atol : ``float``, optional
+        The absolute tolerance used to match the significance levels (default = ``1e-9``).
+
+    Returns
+    -------
+    critical : ``float`` or ``numpy array``
+        The critical values. It is ``nan`` where ``alfa`` is outside the tabulated range, where ``n_rep`` is lower than the smallest tabulated sample size, and where ``n_rep`` is higher than the largest tabulated sample size and the table has no approximation for larger samples.
+
+    """
+    n_rep, alfa = np.broadcast_arrays(np.asarray(n_rep), np.asarray(alfa, dtype=float))
+    alphas = dense_table.alphas
+    log_alphas = np.log(alphas)
+
+    ## snapping alfa to the tabulated levels ##
+    nearest = np.clip(np.searchsorted(alphas, alfa), 1, alphas.size - 1)
+    nearest = np.where(np.abs(alfa - alphas[nearest - 1]) <= np.abs(alfa - alphas[nearest]), nearest - 1, nearest)
+    snap = np.abs(alfa - alphas[nearest]) <= atol
+    alfa = np.where(snap, alphas[nearest], alfa)
+    inside = (alfa >= alphas[0]) & (alfa <= alphas[-1])
+    alfa = np.clip(alfa, alphas[0], alphas[-1])
+    log_alfa = np.log(alfa)
+
+    n_min = dense_table.n_rep[0]
+    n_max = dense_table.n_rep[-1]
+    column = np.clip(n_rep - n_min, 0, dense_table.n_rep.size - 1)
+    critical = np.array(_hermite(log_alphas, dense_table.values, dense_table.slopes, log_alfa, (column,)), dtype=float)
+
+    above = n_rep > n_max
+    if np.any(above):
+        if dense_table.asymptotic is not None:
+            numerator = _hermite(log_alphas, dense_table.asymptotic, dense_table.asymptotic_slopes, log_alfa[above], ())
+            critical[above] = numerator/dense_table.divisor(n_rep[above])
+        elif dense_table.extrapolation is not None:
+            critical[above] = dense_table.extrapolation(n_rep[above], alfa[above], critical[above])
+        else:
+            critical[above] = np.nan
+    critical = np.where(inside & (n_rep >= n_min), critical, np.nan)
+    return critical[()]
@@ -23,6 +23,11 @@
 #         - set_n_digits(self, n_digits)
 #         - __str__(self)
 #         - __repr__(self)
+#
+#     - SortedCacheManagement
+#         - invalidate_sorted(self)
+#         - _find_sorted(self, x_exp, assume_sorted=False)
+#         - _get_sorted(self, x_exp, assume_sorted=False)
 
 #     - _change_decimal_separator_x_axis(fig, axes, decimal_separator)
 #     - _change_locale(language, decimal_separator=".", local="pt_BR")
@@ -39,7 +44,9 @@
 #     - _export_to_csv(df, file_name="my_data", sep=',', language)
 #     - _export_to_xlsx(df_list, language, file_name=None, sheet_names=[None,None])
 #     - _flat_list_of_lists(my_list, param_name, language)
+#     - _get_result_class(name, field_names, aliases=None)
 #     - _raises_when_fit_was_not_applied(func_name, language, name)
+#     - _rebuild_result(name, field_names, aliases, values)
 #     - _replace_last_occurrence(value, old, new, occurrence)
 #     - _sep_checker(sep, language)
 #     - _truncate(value, language, decs=None)
@@ -51,8 +58,11 @@
 #########################################
 
 ###### Standard ######
+from collections import namedtuple
+import functools
 import locale
 import logging
+from operator import itemgetter
 from pathlib import Path
 import traceback
 
@@ -94,20 +104,20 @@ class LanguageManagement:
         The method does not allow the input of values that are not of type string and that have lenght higher than 5 (due to the database restrictions)
 
         """
-        all_languages = management._get_all_available_languages()
-        current_default_language = management._get_current_default_language()
-
         # Obtendo o idioma padrão #
+        # (both the default language and the available languages are cached by management, so no I/O happens here)
         if language is None:
             self.language = management._get_current_default_language()
         # Caso queria alterar o valor diretamente ao instanciar a classe
         else:
+            all_languages = management._get_all_available_languages()
+            current_default_language = management._get_current_default_language()
             # verificando se o valor passado é uma string
             checkers._check_is_str(language, "language", current_default_language)
             # agora verificando se o valor passado é um idioma válido
             if language not in all_languages.keys():
                 all_formated_languages = [f"  --->  {lang}" for lang in all_languages]
-                fk_id_function = management._query_func_id("LanguageManagment")
+                fk_id_function = management._query_func_id("LanguageManagement")
                 messages = management._get_messages(fk_id_function, current_default_language)
                 try:
                     raise ValueError(messages[1][0][0])
@@ -148,7 +158,7 @@ class LanguageManagement:
         # agora verificando se o valor passado é um idioma válido
         if language not in all_languages.keys():
             all_formated_languages = [f"  --->  {lang}" for lang in all_languages]
-            fk_id_function = management._query_func_id("LanguageManagment")
+            fk_id_function = management._query_func_id("LanguageManagement")
             messages = management._get_messages(fk_id_function, self.language)
             try:
                 raise ValueError(messages[1][0][0])
@@ -403,6 +413,90 @@ class PlotsManagement:
         return legend_label
 
 
+# with test, without database, with docstring
+class SortedCacheManagement(LanguageManagement):
+    """This class keeps the sorted copy of the last sample evaluated, so repeated tests on the same array do not sort (nor copy) it again. This class inherits from :class:`.LanguageManagement` and it is primarily for internal use.
+
+    The cache is disabled by default (``cache_sorted=False``). When enabled, the cache is keyed by the identity of the array and by a generation counter. The cache holds a reference to the array, so its identity cannot be reused by another array while it is cached, and the sorted copy is read only.
+
+    Notes
+    -----
+    The cache cannot detect changes made in place (e.g., a rolling window updated with ``x[:] = ...``). With ``cache_sorted=True``, call :meth:`invalidate_sorted` after changing the array.
+
+    """
+    def __init__(self, cache_sorted=False, **kwargs):
+        super().__init__(**kwargs)
+        """Constructs the sorted data cache
+
+        Parameters
+        ----------
+        cache_sorted : ``bool``, optional
+            If ``True``, the sorted copy of the last sample is kept on the object and reused while the same array is evaluated again (default is ``False``).
+
+        """
+        checkers._check_is_bool(cache_sorted, "cache_sorted", self.language)
+        self.cache_sorted = cache_sorted
+        self.generation = 0
+        self._sorted_key = None
+        self._sorted_source = None
+        self._sorted_values = None
+
+    def invalidate_sorted(self):
+        """Increases the generation counter, so the next evaluation sorts the data again (use it after changing the sample in place)
+        """
+        self.generation += 1
+
+    def _find_sorted(self, x_exp, assume_sorted=False):
+        """Returns the sorted data without sorting it
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>`.
+        assume_sorted : ``bool``, optional
+            If ``True``, ``x_exp`` is already sorted and it is returned as it is (default is ``False``).
+
+        Returns
+        -------
+        x_sorted : ``numpy array`` or ``None``
+            The sorted data, or ``None`` if the data is not on the cache (always ``None`` if the cache is disabled and ``assume_sorted=False``).
+
+        """
+        if assume_sorted:
+            return x_exp
+        if not self.cache_sorted:
+            return None
+        if self._sorted_source is x_exp and self._sorted_key == (id(x_exp), self.generation, x_exp.shape):
+            return self._sorted_values
+        return None
+
+    def _get_sorted(self, x_exp, assume_sorted=False):
+        """Returns the sorted data, sorting it only if it is not on the cache (the sorted copy is stored only if ``cache_sorted=True``)
+
+        Parameters
+        ----------
+        x_exp : ``numpy array``
+            One dimension :doc:`numpy array <numpy:reference/generated/numpy.array>`.
+        assume_sorted : ``bool``, optional
+            If ``True``, ``x_exp`` is already sorted and it is returned as it is, without being cached (default is ``False``).
+
+        Returns
+        -------
+        x_sorted : ``numpy array``
+            The sorted data.
+
+        """
+        x_sorted = self._find_sorted(x_exp, assume_sorted)
+        if x_sorted is None:
+            x_sorted = np.sort(x_exp, kind='quicksort')
+            x_sorted.flags.writeable = False
+            if self.cache_sorted:
+                self._sorted_key = (id(x_exp), self.generation, x_exp.shape)
+                self._sorted_source = x_exp
+                self._sorted_values = x_sorted
+        return x_sorted
+
+
 # with some test, no text, no database, with docstring
 def _change_decimal_separator_x_axis(fig, axes, decimal_separator):
     """Esta função altera o separador de casa decimal através da mudança do seu label
@@ -1087,10 +1181,10 @@ def _check_which_density_gaussian_kernal_plot(which, language):
 
     which = which.split(",")
     for value in which:
-        func_name = "_check_which_density_gaussian_kernal_plot"
-        fk_id_function = management._query_func_id(func_name)
-        messages = management._get_messages(fk_id_function, language, func_name)
         if value not in list_accepted_keys:
+            func_name = "_check_which_density_gaussian_kernal_plot"
+            fk_id_function = management._query_func_id(func_name)
+            messages = management._get_messages(fk_id_function, language, func_name)
             try:
                 error = messages[1][0][0]
                 raise ValueError(error)
@@ -1105,10 +1199,10 @@ def _check_which_density_gaussian_kernal_plot(which, language):
                 general._display_n_line_attention(msg)
                 raise
     if "all" in which:
-        func_name = "_check_which_density_gaussian_kernal_plot"
-        fk_id_function = management._query_func_id(func_name)
-        messages = management._get_messages(fk_id_function, language, func_name)
         if len(which) != 1:
+            func_name = "_check_which_density_gaussian_kernal_plot"
+            fk_id_function = management._query_func_id(func_name)
+            messages = management._get_messages(fk_id_function, language, func_name)
             try:
                 error = messages[4][0][0]
                 raise ValueError(error)
@@ -1357,11 +1451,11 @@ def _flat_list_of_lists(my_list, param_name, language):
 
     """
     checkers._check_is_list(my_list, param_name, language)
-    ### quering ###
-    func_name = "_flat_list_of_lists"
-    fk_id_function = management._query_func_id(func_name)
-    messages = management._get_messages(fk_id_function, language, func_name)
     if all(isinstance(element, list) for element in my_list) == False:
+        ### quering ###
+        func_name = "_flat_list_of_lists"
+        fk_id_function = management._query_func_id(func_name)
+        messages = management._get_messages(fk_id_function, language, func_name)
         try:
             raise ValueError(messages[1][0][0])
         except ValueError:
@@ -1372,6 +1466,48 @@ def _flat_list_of_lists(my_list, param_name, language):
             raise
     return [item for sublist in my_list for item in sublist]
 
+# with tests, without database, with docstring
+@functools.lru_cache(maxsize=None)
+def _get_result_class(name, field_names, aliases=None):
+    """Returns the ``namedtuple`` class used to return the results of a test.
+
+    The classes are built once for each ``(name, field_names, aliases)`` and then reused, so the results of every call of a test (in the same language) share the same class, which is cheap to create and can be pickled.
+
+    Parameters
+    ----------
+    name : ``str``
+        The (translated) name of the class, e.g., ``"ShapiroWilkResult"``
+    field_names : ``tuple`` of ``str``
+        The (translated) names of the fields
+    aliases : ``tuple`` of ``str``, optional
+        Language independent names for the fields (same order as ``field_names``), which are added as read-only properties. An alias equal to a field name is skipped.
+
+    Returns
+    -------
+    result : ``type``
+        A subclass of ``namedtuple``
+
+    Examples
+    --------
+
+    >>> from pycafee.utils.helpers import _get_result_class
+    >>> result = _get_result_class("ShapiroWilkResultado", ("Estatistica", "Critico"), ("statistic", "critical"))
+    >>> r = result(0.97, 0.88)
+    >>> print(r.Estatistica, r.statistic)
+    0.97 0.97
+
+    """
+    base = namedtuple(name, field_names)
+    namespace = {
+        "__slots__": (),
+        "__reduce__": lambda self: (_rebuild_result, (name, field_names, aliases, tuple(self))),
+    }
+    if aliases is not None:
+        for index, alias in enumerate(aliases):
+            if alias not in field_names:
+                namespace[alias] = property(itemgetter(index), doc=f"Alias for field number {index}")
+    return type(name, (base,), namespace)
+
 # wtih tests, with text, the database is stored on func_name, with docstring
 def _raises_when_fit_was_not_applied(func_name, language, name):
     """This function raises error when called
@@ -1410,6 +1546,12 @@ def _raises_when_fit_was_not_applied(func_name, language, name):
                             )
         raise
 
+# with tests, without database, with docstring
+def _rebuild_result(name, field_names, aliases, values):
+    """Rebuilds a result created with :func:`_get_result_class` (used by ``pickle``).
+    """
+    return _get_result_class(name, field_names, aliases)(*values)
+
 # with some test, no text, no database, with docstring
 def _replace_last_occurrence(value, old, new, occurrence):
     """This function replaces the last ``occurrence`` of ``old`` in ``value`` with the value passed in ``new``
@@ -1464,12 +1606,11 @@ def _sep_checker(sep, language):
 
     """
     checkers._check_is_str(sep, "sep", language)
-    ### quering ###
-    func_name = "_sep_checker"
-    fk_id_function = management._query_func_id(func_name)
-    messages = management._get_messages(fk_id_function, language, func_name)
-
     if len(sep) != 1:
+        ### quering ###
+        func_name = "_sep_checker"
+        fk_id_function = management._query_func_id(func_name)
+        messages = management._get_messages(fk_id_function, language, func_name)
         try:
             raise ValueError(messages[1][0][0]) #message
         except ValueError:
@@ -0,0 +1,61 @@
+"""Tests if the build_catalog is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_build_catalog. This checks if the catalog shipped on pycafee/data/messages_catalog.py is up to date with main_database.db, and if the library still works without it
+
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/database_management/test_catalog/test_build_catalog.py
+    or
+    python -m unittest -b tests/database_management/test_catalog/test_build_catalog.py
+
+--------------------------------------------------------------------------------
+"""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from pycafee.data import messages_catalog
+from pycafee.database_management import catalog, management
+os.system('cls')
+
+class Test_build_catalog(unittest.TestCase):
+
+    def test_shipped_catalog_is_up_to_date(self):
+        languages, functions, messages = catalog._read_database()
+        self.assertDictEqual(messages_catalog.LANGUAGES, languages, "The catalog must be rebuilt: the languages are different")
+        self.assertDictEqual(messages_catalog.FUNCTIONS, functions, "The catalog must be rebuilt: the functions are different")
+        self.assertDictEqual(messages_catalog.MESSAGES, messages, "The catalog must be rebuilt: the messages are different")
+        self.assertEqual(messages_catalog.SCHEMA_VERSION, management.SCHEMA_VERSION, "The catalog must be rebuilt: the schema version is different")
+
+    def test_output(self):
+        with tempfile.TemporaryDirectory() as folder:
+            output = catalog.build_catalog(output=Path(folder) / "messages_catalog.py")
+            self.assertTrue(output.exists(), "The catalog was not written")
+            namespace = {}
+            exec(output.read_text(encoding="utf-8"), namespace)
+        self.assertDictEqual(namespace["MESSAGES"], messages_catalog.MESSAGES, "The generated catalog is not the same as the shipped one")
+
+    def test_fallback_to_database(self):
+        func_id = management._query_func_id("normalitycheck_fit")
+        expected = management._get_messages(func_id, "pt-br", "normalitycheck_fit")
+        management._clear_messages_cache()
+        try:
+            with mock.patch.object(management, "messages_catalog", None):
+                result = management._get_messages(func_id, "pt-br", "normalitycheck_fit")
+                self.assertEqual(management._query_func_id("normalitycheck_fit"), func_id)
+        finally:
+            management._clear_messages_cache()
+        self.assertDictEqual(dict(result), dict(expected), "The messages read from the database are not the same as the catalog ones")
+
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()
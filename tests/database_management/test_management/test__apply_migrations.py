@@ -0,0 +1,86 @@
+"""Tests if the _apply_migrations is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test__apply_migrations. This checks if an old copy of the database is brought to the newest schema version, if the migrations can be applied twice and if the shipped database is up to date
+
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/database_management/test_management/test__apply_migrations.py
+    or
+    python -m unittest -b tests/database_management/test_management/test__apply_migrations.py
+
+--------------------------------------------------------------------------------
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from pycafee.database_management import management
+os.system('cls')
+
+class Test__apply_migrations(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        database = Path(management.__file__).parent / "../data/main_database.db"
+        self.database = Path(self.folder.name) / "main_database.db"
+        shutil.copy(database, self.database)
+        # turning the copy into a version 0 database
+        _connection = sqlite3.connect(self.database)
+        for (name,) in _connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'").fetchall():
+            _connection.execute(f"DROP INDEX {name}")
+        _connection.execute("PRAGMA user_version = 0")
+        _connection.commit()
+        self.connection = _connection
+
+    def tearDown(self):
+        self.connection.close()
+        self.folder.cleanup()
+
+    def _indexes(self):
+        return {name for (name,) in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'")}
+
+    def test_migrates_old_database(self):
+        version = management._apply_migrations(self.connection)
+        self.assertEqual(version, management.SCHEMA_VERSION, "The database was not brought to the newest version")
+        self.assertEqual(self.connection.execute("PRAGMA user_version").fetchone()[0], management.SCHEMA_VERSION)
+        self.assertIn("idx_message_slices_fk_id_message", self._indexes())
+        self.assertIn("idx_message_fk_id_function_fk_id_language", self._indexes())
+
+    def test_idempotent(self):
+        management._apply_migrations(self.connection)
+        indexes = self._indexes()
+        version = management._apply_migrations(self.connection)
+        self.assertEqual(version, management.SCHEMA_VERSION)
+        self.assertSetEqual(self._indexes(), indexes, "Applying the migrations twice changed the database")
+
+    def test_uses_index(self):
+        management._apply_migrations(self.connection)
+        plan = self.connection.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT Message.position, Message_slices.message
+            FROM Message_slices LEFT JOIN Message ON Message.id_message = Message_Slices.fk_id_message
+            WHERE Message.fk_id_function = ? AND Message.fk_id_language = ?
+        """, (1, 2)).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        self.assertNotIn("SCAN Message_slices", details, "The slices are still scanned")
+
+    def test_shipped_database_is_migrated(self):
+        _cursor, _connection = management._connecting_to_database()
+        version = management._get_schema_version(_cursor)
+        _cursor.close()
+        _connection.close()
+        self.assertEqual(version, management.SCHEMA_VERSION, "The shipped database must be migrated (python -m pycafee.database_management.catalog)")
+
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()
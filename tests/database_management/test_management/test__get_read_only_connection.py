@@ -0,0 +1,67 @@
+"""Tests if the _get_read_only_connection is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test__get_read_only_connection. This checks if the connection is reused inside a thread, if each thread gets its own connection and if the connection is really read-only
+
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/database_management/test_management/test__get_read_only_connection.py
+    or
+    python -m unittest -b tests/database_management/test_management/test__get_read_only_connection.py
+
+--------------------------------------------------------------------------------
+"""
+import os
+import sqlite3
+import threading
+import unittest
+from pycafee.database_management import management
+os.system('cls')
+
+class Test__get_read_only_connection(unittest.TestCase):
+
+    def tearDown(self):
+        management._close_read_only_connection()
+
+    def test_type(self):
+        result = management._get_read_only_connection()
+        self.assertIsInstance(result, sqlite3.Connection, "The connection is not of type 'sqlite3.Connection'")
+
+    def test_reused(self):
+        result = management._get_read_only_connection()
+        management._get_current_default_language()
+        self.assertIs(management._get_read_only_connection(), result, "The connection is opened again on each call")
+
+    def test_read_only(self):
+        _connection = management._get_read_only_connection()
+        with self.assertRaises(sqlite3.OperationalError, msg="The connection allows writing"):
+            _connection.execute("UPDATE Default_Values SET default_input = 'en' WHERE default_parameter = 'language'")
+
+    def test_one_per_thread(self):
+        main_connection = management._get_read_only_connection()
+        connections = []
+        def worker():
+            connections.append(management._get_read_only_connection())
+            connections.append(management._get_current_default_language())
+            management._close_read_only_connection()
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertIsNot(connections[0], main_connection, "The threads share the same connection")
+        self.assertEqual(connections[1], "en")
+
+    def test_close(self):
+        result = management._get_read_only_connection()
+        management._close_read_only_connection()
+        self.assertIsNot(management._get_read_only_connection(), result, "The connection was not closed")
+
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests if the _load_messages_catalog is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test__load_messages_catalog. This checks if the in-memory catalog matches the database, if it is loaded only once and if it can be cleared
+
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/database_management/test_management/test__load_messages_catalog.py
+    or
+    python -m unittest -b tests/database_management/test_management/test__load_messages_catalog.py
+
+--------------------------------------------------------------------------------
+"""
+import os
+import threading
+import unittest
+from collections import defaultdict
+from unittest import mock
+from pycafee.database_management import management
+os.system('cls')
+
+class Test__load_messages_catalog(unittest.TestCase):
+
+    def setUp(self):
+        management._clear_messages_cache()
+
+    def tearDown(self):
+        management._clear_messages_cache()
+
+    def _messages_from_database(self, fk_id_function, fk_id_language):
+        _cursor, _connection = management._connecting_to_database()
+        _cursor.execute("""
+        SELECT
+            Message.position,
+            Message_slices.message
+        FROM
+            Message_slices
+        LEFT JOIN
+            Message
+        ON
+            Message.id_message = Message_Slices.fk_id_message
+        WHERE
+            Message.fk_id_function = ? AND Message.fk_id_language = ?
+        ;
+        """, (fk_id_function, fk_id_language))
+        messages = defaultdict(list)
+        for x, y in _cursor.fetchall():
+            messages[x].append([y])
+        _cursor.close()
+        _connection.close()
+        return messages
+
+    def test_same_messages_as_database(self):
+        for func_name in ["shapiro_wilk", "normalitycheck_fit", "_check_is_numpy_1_D", "generic"]:
+            func_id = management._query_func_id(func_name)
+            for language, fk_id_language in [("en", 2), ("pt-br", 3)]:
+                with self.subTest(func_name=func_name, language=language):
+                    result = management._get_messages(func_id, language, func_name)
+                    expected = self._messages_from_database(func_id, fk_id_language)
+                    self.assertDictEqual(dict(result), dict(expected), "The cached messages are not the same as the database ones")
+
+    def test_unknown_language_falls_back_to_english(self):
+        func_id = management._query_func_id("shapiro_wilk")
+        with mock.patch.object(management.general, "_display_two_line_attention"):
+            result = management._get_messages(func_id, "xx", "shapiro_wilk")
+        self.assertDictEqual(dict(result), dict(management._get_messages(func_id, "en", "shapiro_wilk")), "The fallback language is not 'en'")
+
+    def test_database_is_read_once(self):
+        func_id = management._query_func_id("shapiro_wilk")
+        management._get_messages(func_id, "en", "shapiro_wilk")
+        with mock.patch.object(management, "_connecting_to_database") as connecting:
+            for i in range(10):
+                management._query_func_id("shapiro_wilk")
+                management._get_messages(func_id, "en", "shapiro_wilk")
+            connecting.assert_not_called()
+
+    def test_returns_a_copy(self):
+        func_id = management._query_func_id("shapiro_wilk")
+        result = management._get_messages(func_id, "en", "shapiro_wilk")
+        result.clear()
+        result = management._get_messages(func_id, "en", "shapiro_wilk")
+        self.assertNotEqual(len(result), 0, "Changing the returned messages changed the cache")
+
+    def test_clear(self):
+        management._load_messages_catalog(2)
+        self.assertIn(2, management._MESSAGES_CATALOG)
+        management._clear_messages_cache()
+        self.assertEqual(len(management._MESSAGES_CATALOG), 0, "The catalog was not cleared")
+        self.assertEqual(len(management._FUNCTION_IDS), 0, "The function ids were not cleared")
+
+    def test_threads(self):
+        func_id = management._query_func_id("shapiro_wilk")
+        expected = dict(management._get_messages(func_id, "pt-br", "shapiro_wilk"))
+        management._clear_messages_cache()
+        results = []
+        def worker():
+            results.append(dict(management._get_messages(func_id, "pt-br", "shapiro_wilk")))
+        threads = [threading.Thread(target=worker) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        for result in results:
+            self.assertDictEqual(result, expected, "The messages are not the same across threads")
+
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()
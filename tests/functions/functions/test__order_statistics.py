@@ -0,0 +1,68 @@
+"""Tests if the _order_statistics is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_order_statistics
+    This class compares the order statistics obtained with one np.partition with np.min, np.quantile, np.median and np.max (linear method) and with the interquartile_range function (tukey method), for odd and even sample sizes, with ties and with integer data. It also checks the is_sorted and overwrite_input parameters.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/functions/functions/test__order_statistics.py
+    or
+    python -m unittest -b tests/functions/functions/test__order_statistics.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.functions.functions import _order_statistics, interquartile_range
+import numpy as np
+os.system('cls')
+
+class Test_order_statistics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(13)
+        cls.samples = [rng.normal(size=n_rep)*100 for n_rep in list(range(1, 40)) + [1000, 1001]]
+        cls.samples += [rng.normal(size=n_rep).round(1) for n_rep in range(3, 30)]
+        cls.samples += [rng.integers(0, 5, size=n_rep) for n_rep in range(3, 30)]
+
+    def test_linear(self):
+        for x in self.samples:
+            with self.subTest(n_rep=x.size):
+                x_min, q1, median, q3, x_max = _order_statistics(x)
+                self.assertEqual(x_min, x.min(), "wrong min")
+                self.assertEqual(x_max, x.max(), "wrong max")
+                self.assertEqual(median, np.median(x), "does not match np.median")
+                self.assertEqual(q1, np.quantile(x, 0.25), "does not match np.quantile")
+                self.assertEqual(q3, np.quantile(x, 0.75), "does not match np.quantile")
+
+    def test_tukey(self):
+        for x in self.samples:
+            if x.size < 3:
+                continue
+            with self.subTest(n_rep=x.size):
+                x_min, q1, median, q3, x_max = _order_statistics(x, method="tukey")
+                expected, _, _ = interquartile_range(x)
+                self.assertEqual((q3 - q1, q1, q3), tuple(expected), "does not match interquartile_range")
+                self.assertEqual(median, np.median(x), "does not match np.median")
+
+    def test_is_sorted(self):
+        for x in self.samples:
+            with self.subTest(n_rep=x.size):
+                for method in ["linear", "tukey"]:
+                    self.assertEqual(_order_statistics(np.sort(x), method=method, is_sorted=True), _order_statistics(x, method=method), "wrong values for sorted data")
+
+    def test_overwrite_input(self):
+        x = np.array([5.0, 1.0, 4.0, 2.0, 3.0])
+        self.assertEqual(_order_statistics(x)[2], 3.0, "wrong median")
+        np.testing.assert_array_equal(x, [5.0, 1.0, 4.0, 2.0, 3.0], err_msg="the input was changed")
+        self.assertEqual(_order_statistics(x, overwrite_input=True)[2], 3.0, "wrong median")
+        self.assertEqual(x[2], 3.0, "the input was not partitioned")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,10 @@ Description:
 
 ---> Class Test_interquartile_range_tukey. This class tests the interquartile_range using the tukey method
 
+---> Class Test_interquartile_range_sketch. This class tests the interquartile_range estimated with a QuantileSketch (rank_error or a sketch as input)
+
+---> Class Test_interquartile_range_assume_sorted. This class tests the interquartile_range of sorted data that is not sorted again (assume_sorted parameter), and if it raises ValueError when assume_sorted is not bool
+
 
 
 --------------------------------------------------------------------------------
@@ -21,6 +25,7 @@ Command to run at the prompt:
 import os
 import unittest
 from pycafee.functions.functions import interquartile_range
+from pycafee.functions.quantilesketch import QuantileSketch
 import numpy as np
 import sys
 import io
@@ -179,6 +184,62 @@ class Test_interquartile_range_tukey(unittest.TestCase):
 
 
 
+class Test_interquartile_range_sketch(unittest.TestCase):
+
+    def test_small(self):
+        x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4])
+        result, x_low, x_upper = interquartile_range(x, rank_error=0.01)
+        self.assertEqual(tuple(result), tuple(interquartile_range(x)[0]), "should be exact for small samples")
+        sketch = QuantileSketch()
+        sketch.push(x)
+        result, x_low, x_upper = interquartile_range(sketch)
+        self.assertEqual(tuple(result), tuple(interquartile_range(x)[0]), "should be exact for small sketches")
+        self.assertListEqual(list(x_low), [4.4, 4.6, 4.6, 4.7, 4.9], msg="wrong x_low")
+
+    def test_large(self):
+        x = np.random.default_rng(2).uniform(size=200001)
+        result, x_low, x_upper = interquartile_range(x, rank_error=0.01)
+        self.assertAlmostEqual(result[1], 0.25, delta=0.01, msg="wrong q1")
+        self.assertAlmostEqual(result[2], 0.75, delta=0.01, msg="wrong q3")
+        self.assertIsNone(x_low, "x_low should be None")
+        self.assertIsNone(x_upper, "x_upper should be None")
+        sketch = QuantileSketch(rank_error=0.01)
+        for chunk in np.array_split(x, 4):
+            sketch.push(chunk)
+        result, x_low, x_upper = interquartile_range(sketch)
+        self.assertAlmostEqual(result[0], 0.5, delta=0.02, msg="wrong interquartile range")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when the sketch is empty"):
+            interquartile_range(QuantileSketch())
+        with self.assertRaises(ValueError, msg="Does not raised error when rank_error is negative"):
+            interquartile_range(np.array([1.0, 2.0, 3.0]), rank_error=-0.1)
+
+
+
+class Test_interquartile_range_assume_sorted(unittest.TestCase):
+
+    def test_assume_sorted(self):
+        for n in [9, 10]:
+            x = np.random.default_rng(n).normal(size=n)
+            x_sorted = np.sort(x)
+            expected, expected_low, expected_upper = interquartile_range(x)
+            result, x_low, x_upper = interquartile_range(x_sorted, assume_sorted=True)
+            self.assertEqual(tuple(result), tuple(expected), msg="wrong result for sorted data")
+            self.assertListEqual(list(x_low), list(expected_low), msg="wrong x_low")
+            self.assertListEqual(list(x_upper), list(expected_upper), msg="wrong x_upper")
+            self.assertTrue(np.shares_memory(x_low, x_sorted), msg="the data was copied")
+
+    def test_assume_sorted_not_bool(self):
+        x = np.array([3.0, 1.0, 2.0, 5.0])
+        for value in ["no", 1, None]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError, msg="Does not raised error when assume_sorted is not bool"):
+                    interquartile_range(x, assume_sorted=value)
+
+
+
+
 # are y read to jummmmmppppp? https://youtu.be/m9P2WJI0A_c?t=233
 
 if __name__ == "__main__":
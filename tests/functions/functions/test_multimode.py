@@ -5,6 +5,10 @@ Description:
 
 ---> Class Test_multimode. This class tests the multimode against the output type and against modal, bimodal and 3modal data
 
+---> Class Test_multimode_rows. This class tests the multimode with 2D arrays (one sample per row), the order of the modes and large arrays
+
+---> Class Test_multimode_tolerance. This class tests the tolerance parameter
+
 
 
 --------------------------------------------------------------------------------
@@ -103,3 +107,69 @@ class Test_multimode(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class Test_multimode_rows(unittest.TestCase):
+
+    def test_2d(self):
+        x = np.array([[1, 2, 3, 3, 3, 3, 4, 5],
+                      [6, 6, 1, 1, 2, 3, 4, 5],
+                      [1, 2, 3, 4, 5, 6, 7, 8]])
+        result = multimode(x)
+        self.assertIsInstance(result, list, "the output is not a list")
+        self.assertEqual(len(result), 3, "the list does not have 3 rows")
+        for row, expected in zip(x, result):
+            self.assertEqual(list(multimode(row).items()), list(expected.items()), "the row does not match the 1D result")
+        self.assertEqual(list(result[1].items()), [(6, 2), (1, 2)], "the modes are not in the order of the first occurrence")
+        self.assertIsNone(list(result[2].keys())[0], "the key is not None")
+
+    def test_first_occurrence(self):
+        x = np.array([5, 9, 1, 9, 5, 1, 7])
+        result = multimode(x)
+        self.assertEqual(list(result.keys()), [5, 9, 1], "the modes are not in the order of the first occurrence")
+        for value in result.values():
+            self.assertIsInstance(value, int, "the value is not an int")
+
+    def test_large(self):
+        x = np.random.default_rng(0).integers(0, 1000, size=200000)
+        x[:50] = 999
+        result = multimode(x)
+        values, counts = np.unique(x, return_counts=True)
+        self.assertEqual(list(result.keys()), list(values[counts == counts.max()]), "the modes do not match np.unique")
+        self.assertEqual(list(result.values())[0], counts.max(), "the count does not match np.unique")
+
+
+class Test_multimode_tolerance(unittest.TestCase):
+
+    def test_bins(self):
+        x = np.array([1.02, 0.98, 1.01, 2.0, 2.04, 3.1])
+        result = multimode(x, tolerance=0.1)
+        self.assertEqual(len(result), 1, "the dict does not have 1 mode")
+        self.assertAlmostEqual(list(result.keys())[0], 1.0, msg="the mode is not 1.0")
+        self.assertEqual(list(result.values())[0], 3, "the count of the mode is not 3")
+
+    def test_keys(self):
+        x = np.array([0.3, 0.31, 0.29, 1.0])
+        result = multimode(x, tolerance=0.1)
+        self.assertEqual(result, {0.3: 3}, "the key is not rounded to the decimals of tolerance")
+        result = multimode(np.array([0.75, 0.74, 1.5]), tolerance=0.25)
+        self.assertEqual(result, {0.75: 2}, "the key is not rounded to the decimals of tolerance")
+        result = multimode(np.array([11.0, 9.0, 12.0, 31.0]), tolerance=5)
+        self.assertEqual(result, {10.0: 3}, "the key is not a multiple of tolerance")
+
+    def test_no_tolerance(self):
+        x = np.array([1.02, 0.98, 1.01, 2.0, 2.04, 3.1])
+        result = multimode(x)
+        self.assertIsNone(list(result.keys())[0], "the key is not None")
+
+    def test_tolerance_not_positive(self):
+        x = np.array([1.02, 0.98, 1.01])
+        with self.assertRaises(ValueError, msg="Does not raised error when tolerance is 0"):
+            multimode(x, tolerance=0)
+        with self.assertRaises(ValueError, msg="Does not raised error when tolerance is negative"):
+            multimode(x, tolerance=-0.1)
+
+    def test_tolerance_not_number(self):
+        x = np.array([1.02, 0.98, 1.01])
+        with self.assertRaises(ValueError, msg="Does not raised error when tolerance is a str"):
+            multimode(x, tolerance="0.1")
@@ -0,0 +1,59 @@
+"""Tests if the merge method of the QuantileSketch class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_merge
+    This class checks the quantiles of merged sketches, that merging small sketches keeps the exact mode, that the other sketch is not changed, and the error when other is not a QuantileSketch.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/functions/quantilesketch/QuantileSketch/test_merge.py
+    or
+    python -m unittest -b tests/functions/quantilesketch/QuantileSketch/test_merge.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.functions.quantilesketch import QuantileSketch
+import numpy as np
+os.system('cls')
+
+class Test_merge(unittest.TestCase):
+
+    def test_shards(self):
+        x = np.random.default_rng(3).uniform(size=300000)
+        merged = QuantileSketch(rank_error=0.01)
+        for seed, shard in enumerate(np.array_split(x, 6)):
+            partial = QuantileSketch(rank_error=0.01, seed=seed)
+            partial.push(shard)
+            self.assertIs(merged.merge(partial), merged, "does not return the sketch")
+        self.assertEqual(merged.n, x.size, "wrong number of observations")
+        probabilities = np.linspace(0.01, 0.99, 99)
+        self.assertLess(np.max(np.abs(merged.quantile(probabilities) - probabilities)), 0.01, "the rank error is too high")
+
+    def test_exact(self):
+        sketch_a = QuantileSketch()
+        sketch_a.push(np.array([1.0, 2.0, 3.0]))
+        sketch_b = QuantileSketch()
+        sketch_b.push(np.array([4.0, 5.0]))
+        sketch_a.merge(sketch_b)
+        self.assertTrue(sketch_a.is_exact(), "should be exact")
+        self.assertEqual(sketch_a.quantile(0.5), 3.0, "wrong median")
+        self.assertEqual(sketch_b.n, 2, "the other sketch was changed")
+        empty = QuantileSketch()
+        empty.merge(sketch_a)
+        self.assertEqual(empty.min, 1.0, "wrong min")
+        self.assertEqual(empty.max, 5.0, "wrong max")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when other is not a QuantileSketch"):
+            QuantileSketch().merge(np.array([1, 2]))
+        with self.assertRaises(ValueError, msg="Does not raised error when other is not a QuantileSketch"):
+            QuantileSketch(language="pt-br").merge("sketch")
+
+
+if __name__ == "__main__":
+    unittest.main()
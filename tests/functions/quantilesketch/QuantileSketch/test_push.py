@@ -0,0 +1,63 @@
+"""Tests if the push method of the QuantileSketch class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_push
+    This class checks that the sketch is exact for small samples, that the rank error of large samples is within the rank_error, that the memory is bounded, that the min and max are exact, and the errors for invalid data.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/functions/quantilesketch/QuantileSketch/test_push.py
+    or
+    python -m unittest -b tests/functions/quantilesketch/QuantileSketch/test_push.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.functions.quantilesketch import QuantileSketch
+import numpy as np
+os.system('cls')
+
+class Test_push(unittest.TestCase):
+
+    def test_exact(self):
+        x = np.random.default_rng(1).normal(size=250)
+        sketch = QuantileSketch(rank_error=0.01)
+        sketch.push(x[:100])
+        sketch.push(x[100:])
+        self.assertTrue(sketch.is_exact(), "should be exact for small samples")
+        probabilities = np.linspace(0, 1, 21)
+        np.testing.assert_array_equal(sketch.quantile(probabilities), np.quantile(x, probabilities), err_msg="does not match np.quantile")
+
+    def test_rank_error(self):
+        probabilities = np.linspace(0.01, 0.99, 99)
+        for rank_error in [0.05, 0.01]:
+            with self.subTest(rank_error=rank_error):
+                x = np.random.default_rng(7).standard_t(3, size=400001)
+                sketch = QuantileSketch(rank_error=rank_error)
+                for chunk in np.array_split(x, 13):
+                    sketch.push(chunk)
+                self.assertFalse(sketch.is_exact(), "should not be exact for large samples")
+                self.assertEqual(sketch.n, x.size, "wrong number of observations")
+                self.assertEqual(sketch.min, x.min(), "wrong min")
+                self.assertEqual(sketch.max, x.max(), "wrong max")
+                ranks = np.searchsorted(np.sort(x), sketch.quantile(probabilities))/x.size
+                self.assertLess(np.max(np.abs(ranks - probabilities)), rank_error, "the rank error is too high")
+                self.assertLess(sum(level.size for level in sketch._levels), 4*sketch.k, "the memory is not bounded")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is a list"):
+            QuantileSketch().push([1, 2, 3])
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is empty"):
+            QuantileSketch().push(np.array([]))
+        with self.assertRaises(ValueError, msg="Does not raised error when rank_error is higher than 1"):
+            QuantileSketch(rank_error=1.5)
+        with self.assertRaises(ValueError, msg="Does not raised error when rank_error is not a float"):
+            QuantileSketch(rank_error=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
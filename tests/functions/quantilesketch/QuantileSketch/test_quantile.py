@@ -0,0 +1,52 @@
+"""Tests if the quantile method of the QuantileSketch class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_quantile
+    This class checks the output types, the exact min and max for the probabilities 0 and 1, and the errors for an empty sketch and invalid probabilities.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/functions/quantilesketch/QuantileSketch/test_quantile.py
+    or
+    python -m unittest -b tests/functions/quantilesketch/QuantileSketch/test_quantile.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.functions.quantilesketch import QuantileSketch
+import numpy as np
+os.system('cls')
+
+class Test_quantile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(5).normal(size=100000)
+        cls.sketch = QuantileSketch(rank_error=0.05)
+        cls.sketch.push(cls.x)
+
+    def test_output(self):
+        self.assertIsInstance(self.sketch.quantile(0.5), float, "does not return a float")
+        result = self.sketch.quantile(np.array([0.25, 0.75]))
+        self.assertIsInstance(result, np.ndarray, "does not return a numpy array")
+        self.assertEqual(result.shape, (2,), "wrong shape")
+        self.assertEqual(self.sketch.quantile(0), self.x.min(), "the quantile 0 is not the min")
+        self.assertEqual(self.sketch.quantile(1), self.x.max(), "the quantile 1 is not the max")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when the sketch is empty"):
+            QuantileSketch().quantile(0.5)
+        with self.assertRaises(ValueError, msg="Does not raised error when q is higher than 1"):
+            self.sketch.quantile(1.5)
+        with self.assertRaises(ValueError, msg="Does not raised error when q is negative"):
+            self.sketch.quantile(np.array([0.5, -0.1]))
+        with self.assertRaises(ValueError, msg="Does not raised error when q is a str"):
+            self.sketch.quantile("0.5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -96,10 +96,10 @@ class Test_fit(unittest.TestCase):
 
 
 
-    def test_alfa_0_12(self):
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12"):
+    def test_alfa_0_25(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25"):
             result = AbdiMolin()
-            resultado, conclusao = result.fit(self.x, alfa=0.12)
+            resultado, conclusao = result.fit(self.x, alfa=0.25)
 
 
 
@@ -245,10 +245,10 @@ class Test_fit(unittest.TestCase):
 
 
 
-    def test_alfa_0_12_not_normal(self):
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12 with not normal data"):
+    def test_alfa_0_25_not_normal(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25 with not normal data"):
             result = AbdiMolin()
-            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.12)
+            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.25)
 
 
 
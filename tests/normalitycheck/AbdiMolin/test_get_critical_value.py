@@ -69,19 +69,27 @@ class Test_get_critical_value(unittest.TestCase):
 
     def test_alfa_not_supported(self):
         test = AbdiMolin()
-        resultado, alfa = test.get_critical_value(10, alfa=0.02)
-        self.assertIsNone(resultado, "Not None for alfa = 0.02")
-        self.assertEqual(alfa, 0.02, "wrong alfa value")
+        resultado, alfa = test.get_critical_value(10, alfa=0.005)
+        self.assertIsNone(resultado, "Not None for alfa = 0.005")
+        self.assertEqual(alfa, 0.005, "wrong alfa value")
 
-        resultado, alfa = test.get_critical_value(10, alfa=0.16)
-        self.assertIsNone(resultado, "Not None for alfa = 0.16")
-        self.assertEqual(alfa, 0.16, "wrong alfa value")
+        resultado, alfa = test.get_critical_value(60, alfa=0.25)
+        self.assertIsNone(resultado, "Not None for alfa = 0.25")
+        self.assertEqual(alfa, 0.25, "wrong alfa value")
 
         resultado, alfa = test.get_critical_value(10, alfa=0.75)
         self.assertIsNone(resultado, "Not None for alfa = 0.75")
         self.assertEqual(alfa, 0.75, "wrong alfa value")
 
 
+    def test_alfa_interpolated(self):
+        test = AbdiMolin()
+        for n_rep in [10, 60]:
+            resultado, alfa = test.get_critical_value(n_rep, alfa=0.16)
+            self.assertTrue(test.get_critical_value(n_rep, alfa=0.20)[0] < resultado < test.get_critical_value(n_rep, alfa=0.15)[0], "wrong interpolated value for alfa = 0.16")
+            self.assertEqual(alfa, 0.16, "wrong alfa value")
+
+
     def test_alfa(self):
         test = AbdiMolin()
         resultado, alfa = test.get_critical_value(10, alfa=0.01)
@@ -0,0 +1,70 @@
+"""Tests if the fit_many function for AndersonDarling is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_fit_many
+    This class compares the results of fit_many with the results of calling fit for each sample, for both comparisons, for a 2 D array (by rows and by columns) and for a list of samples with different sizes.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/AndersonDarling/test_fit_many.py
+    or
+    python -m unittest -b tests/normalitycheck/AndersonDarling/test_fit_many.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.andersondarling import AndersonDarling
+import numpy as np
+os.system('cls')
+
+class Test_fit_many(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(25)
+        cls.X = np.vstack([rng.normal(size=(20, 25)), rng.exponential(size=(20, 25))])
+        cls.samples = [rng.normal(size=n) for n in (5, 25, 12, 5, 49)]
+
+    def compare(self, samples, result, alfa=None, comparison=None):
+        for i, sample in enumerate(samples):
+            expected, conclusion = AndersonDarling().fit(sample, alfa=alfa, comparison=comparison, details="binary")
+            self.assertAlmostEqual(result.iloc[i, 0], expected[0], places=12, msg="statistic does not match")
+            for column, value in ((1, expected[1]), (2, expected[2])):
+                if value is None:
+                    self.assertTrue(np.isnan(result.iloc[i, column]), "missing values should be nan")
+                else:
+                    self.assertAlmostEqual(result.iloc[i, column], value, places=12, msg="critical or p_value does not match")
+            self.assertEqual(result.iloc[i, 5], conclusion, "conclusion does not match")
+
+    def test_critical(self):
+        result = AndersonDarling().fit_many(self.X)
+        self.compare(self.X, result)
+        result = AndersonDarling().fit_many(self.X, alfa=0.025)
+        self.compare(self.X, result, alfa=0.025)
+
+    def test_p_value(self):
+        result = AndersonDarling().fit_many(self.X, comparison="p-value")
+        self.compare(self.X, result, comparison="p-value")
+
+    def test_axis(self):
+        result = AndersonDarling().fit_many(self.X.T, axis=0)
+        self.compare(self.X, result)
+        for axis in [-1, 2]:
+            with self.assertRaises(ValueError, msg="Does not raised error when axis is not valid"):
+                AndersonDarling().fit_many(self.X, axis=axis)
+
+    def test_list(self):
+        result = AndersonDarling().fit_many(self.samples)
+        self.compare(self.samples, result)
+
+    def test_alfa(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when there is no critical value"):
+            AndersonDarling().fit_many(self.X, alfa=0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,22 +40,22 @@ class Test_get_ks_tabulated_value(unittest.TestCase):
 
         result = KolmogorovSmirnov()
         test = result.get_critical_value(26)
-        self.assertEqual(test[0], 0.24, msg = "Wrong tabulated value for n_rep = 26 alpha = 0.05")
+        self.assertTrue(0.24 < test[0] < 0.27, msg = "Wrong interpolated value for n_rep = 26 alpha = 0.05")
         self.assertEqual(test[1], 0.05, msg = "Wrong alpha value for n_rep = 26 alpha = 0.05")
 
         result = KolmogorovSmirnov()
         test = result.get_critical_value(26, 0.01)
-        self.assertEqual(test[0], 0.29, msg = "Wrong tabulated value for n_rep = 26 alpha = 0.01")
+        self.assertTrue(0.29 < test[0] < 0.32, msg = "Wrong interpolated value for n_rep = 26 alpha = 0.01")
         self.assertEqual(test[1], 0.01, msg = "Wrong alpha value for n_rep = 26 alpha = 0.01")
 
         result = KolmogorovSmirnov()
         test = result.get_critical_value(26, 0.1)
-        self.assertEqual(test[0], 0.22, msg = "Wrong tabulated value for n_rep = 26 alpha = 0.1")
+        self.assertTrue(0.22 < test[0] < 0.24, msg = "Wrong interpolated value for n_rep = 26 alpha = 0.1")
         self.assertEqual(test[1], 0.10, msg = "Wrong alpha value for n_rep = 26 alpha = 0.1")
 
         result = KolmogorovSmirnov()
         test = result.get_critical_value(22, 0.05)
-        self.assertEqual(test[0], 0.27, msg = "Wrong tabulated value for n_rep = 22 alpha = 0.05")
+        self.assertTrue(0.27 < test[0] < 0.294, msg = "Wrong interpolated value for n_rep = 22 alpha = 0.05")
         self.assertEqual(test[1], 0.05, msg = "Wrong alpha value for n_rep = 22 alpha = 0.05")
 
         result = KolmogorovSmirnov()
@@ -70,7 +70,7 @@ class Test_get_ks_tabulated_value(unittest.TestCase):
 
         result = KolmogorovSmirnov()
         test = result.get_critical_value(32, 0.05)
-        self.assertEqual(test[0], 0.23, msg = "Wrong tabulated value for n_rep = 32 alpha = 0.05")
+        self.assertTrue(0.23 < test[0] < 0.24, msg = "Wrong interpolated value for n_rep = 32 alpha = 0.05")
         self.assertEqual(test[1], 0.05, msg = "Wrong alpha value for n_rep = 32 alpha = 0.05")
 
         result = KolmogorovSmirnov()
@@ -92,24 +92,29 @@ class Test_get_ks_tabulated_value(unittest.TestCase):
 
     def test_pass_None(self):
         result = KolmogorovSmirnov()
-        test = result.get_critical_value(26, 0.12)
-        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 26 alpha = 0.12")
-        self.assertEqual(test[1], 0.12, msg = "Wrong alpha value for n_rep = 26 alpha = 0.12")
+        test = result.get_critical_value(26, 0.005)
+        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 26 alpha = 0.005")
+        self.assertEqual(test[1], 0.005, msg = "Wrong alpha value for n_rep = 26 alpha = 0.005")
 
         result = KolmogorovSmirnov()
-        test = result.get_critical_value(22, 0.12)
-        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 22 alpha = 0.12")
-        self.assertEqual(test[1], 0.12, msg = "Wrong alpha value for n_rep = 22 alpha = 0.12")
+        test = result.get_critical_value(5, 0.25)
+        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 5 alpha = 0.25")
+        self.assertEqual(test[1], 0.25, msg = "Wrong alpha value for n_rep = 5 alpha = 0.25")
 
         result = KolmogorovSmirnov()
-        test = result.get_critical_value(5, 0.12)
-        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 5 alpha = 0.12")
-        self.assertEqual(test[1], 0.12, msg = "Wrong alpha value for n_rep = 5 alpha = 0.12")
+        test = result.get_critical_value(76, 0.25)
+        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 76 alpha = 0.25")
+        self.assertEqual(test[1], 0.25, msg = "Wrong alpha value for n_rep = 76 alpha = 0.25")
 
+    def test_pass_interpolated(self):
         result = KolmogorovSmirnov()
-        test = result.get_critical_value(33, 0.12)
-        self.assertEqual(test[0], None, msg = "Wrong tabulated value for n_rep = 33 alpha = 0.12")
-        self.assertEqual(test[1], 0.12, msg = "Wrong alpha value for n_rep = 33 alpha = 0.12")
+        for n_rep in [5, 22, 33, 76]:
+            test = result.get_critical_value(n_rep, 0.12)
+            lower = result.get_critical_value(n_rep, 0.15)[0]
+            upper = result.get_critical_value(n_rep, 0.10)[0]
+            self.assertTrue(lower < test[0] < upper, msg = f"Wrong interpolated value for n_rep = {n_rep} alpha = 0.12")
+            self.assertEqual(test[1], 0.12, msg = f"Wrong alpha value for n_rep = {n_rep} alpha = 0.12")
+
 
 
 
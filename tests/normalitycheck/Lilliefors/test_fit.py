@@ -51,31 +51,31 @@ class Test_fit(unittest.TestCase):
         self.assertEqual(conclusao, "Data is Normal at a 90.0% of confidence level.", msg='wrong conclusion')
 
 
-    def test_alfa_0_12(self):
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12 with default paramters"):
+    def test_alfa_0_25(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25 with default paramters"):
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x, alfa=0.12)
+            resultado, conclusao = result.fit(self.x, alfa=0.25)
 
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12 with conclusion='critical'"):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25 with conclusion='critical'"):
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x, alfa=0.12, comparison="critical")
+            resultado, conclusao = result.fit(self.x, alfa=0.25, comparison="critical")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12"):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25"):
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x, alfa=0.12)
+            resultado, conclusao = result.fit(self.x, alfa=0.25)
 
 
-    def test_alfa_0_12_output(self):
+    def test_alfa_0_25_output(self):
 
         capturedOutput = io.StringIO()
         sys.stdout = capturedOutput
         try:
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x, alfa=0.12)
+            resultado, conclusao = result.fit(self.x, alfa=0.25)
         except ValueError:
             pass
         sys.stdout = sys.__stdout__
-        expected = "The critical value for alpha '0.12' is not available. The available alpha values are:"
+        expected = "The critical value for alpha '0.25' is not available. The available alpha values are:"
         result = False
         if expected in capturedOutput.getvalue():
             result = True
@@ -87,11 +87,11 @@ class Test_fit(unittest.TestCase):
         sys.stdout = capturedOutput
         try:
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x, alfa=0.12, comparison="critical")
+            resultado, conclusao = result.fit(self.x, alfa=0.25, comparison="critical")
         except ValueError:
             pass
         sys.stdout = sys.__stdout__
-        expected = "The critical value for alpha '0.12' is not available. The available alpha values are:"
+        expected = "The critical value for alpha '0.25' is not available. The available alpha values are:"
         result = False
         if expected in capturedOutput.getvalue():
             result = True
@@ -103,11 +103,11 @@ class Test_fit(unittest.TestCase):
         sys.stdout = capturedOutput
         try:
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x, alfa=0.12)
+            resultado, conclusao = result.fit(self.x, alfa=0.25)
         except ValueError:
             pass
         sys.stdout = sys.__stdout__
-        expected = "The critical value for alpha '0.12' is not available. The available alpha values are:"
+        expected = "The critical value for alpha '0.25' is not available. The available alpha values are:"
         result = False
         if expected in capturedOutput.getvalue():
             result = True
@@ -318,27 +318,27 @@ class Test_fit(unittest.TestCase):
         self.assertEqual(conclusao, "Data is Not Normal at a 90.0% of confidence level.", msg='wrong conclusion')
 
 
-    def test_alfa_0_12_not_normal(self):
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12 with default parameters, not normal data"):
+    def test_alfa_0_25_not_normal(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25 with default parameters, not normal data"):
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.12)
+            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.25)
 
-        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.12 with conclusion='tabulate', not normal data"):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa=0.25 with conclusion='tabulate', not normal data"):
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.12, comparison="critical")
+            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.25, comparison="critical")
 
 
-    def test_alfa_0_12_output_not_normal(self):
+    def test_alfa_0_25_output_not_normal(self):
 
         capturedOutput = io.StringIO()
         sys.stdout = capturedOutput
         try:
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.12)
+            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.25)
         except ValueError:
             pass
         sys.stdout = sys.__stdout__
-        expected = "The critical value for alpha '0.12' is not available. The available alpha values are:"
+        expected = "The critical value for alpha '0.25' is not available. The available alpha values are:"
         result = False
         if expected in capturedOutput.getvalue():
             result = True
@@ -350,11 +350,11 @@ class Test_fit(unittest.TestCase):
         sys.stdout = capturedOutput
         try:
             result = Lilliefors()
-            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.12, comparison="critical")
+            resultado, conclusao = result.fit(self.x_not_normal, alfa=0.25, comparison="critical")
         except ValueError:
             pass
         sys.stdout = sys.__stdout__
-        expected = "The critical value for alpha '0.12' is not available. The available alpha values are:"
+        expected = "The critical value for alpha '0.25' is not available. The available alpha values are:"
         result = False
         if expected in capturedOutput.getvalue():
             result = True
@@ -48,7 +48,7 @@ class Test_get_critical_value(unittest.TestCase):
 
         result = Lilliefors()
         test = result.get_critical_value(22, alfa=0.01)
-        self.assertEqual(test[0], 0.203, msg = "Wrong tabulated value for n_rep = 22 alpha = 0.01")
+        self.assertTrue(0.203 < test[0] < 0.231, msg = "Wrong interpolated value for n_rep = 22 alpha = 0.01")
         self.assertEqual(test[1], 0.01, msg = "Wrong alpha value for n_rep = 22 alpha = 0.01")
 
         result = Lilliefors()
@@ -58,7 +58,7 @@ class Test_get_critical_value(unittest.TestCase):
 
         result = Lilliefors()
         test = result.get_critical_value(26, alfa=0.01)
-        self.assertEqual(test[0], 0.187, msg = "Wrong tabulated value for n_rep = 26 alpha = 0.01")
+        self.assertTrue(0.187 < test[0] < 0.203, msg = "Wrong interpolated value for n_rep = 26 alpha = 0.01")
         self.assertEqual(test[1], 0.01, msg = "Wrong alpha value for n_rep = 26 alpha = 0.01")
 
         result = Lilliefors()
@@ -75,13 +75,19 @@ class Test_get_critical_value(unittest.TestCase):
 
     def test_pass_None(self):
         result = Lilliefors()
-        test = result.get_critical_value(5, alfa=0.13)
-        self.assertIsNone(test[0], msg = "Not None for n_rep=51 alfa=0.13")
-        self.assertEqual(test[1], 0.13, msg = "Wrong alpha value for n_rep = 51 alpha = 0.13")
+        test = result.get_critical_value(5, alfa=0.005)
+        self.assertIsNone(test[0], msg = "Not None for n_rep=5 alfa=0.005")
+        self.assertEqual(test[1], 0.005, msg = "Wrong alpha value for n_rep = 5 alpha = 0.005")
 
+        result = Lilliefors()
+        test = result.get_critical_value(13, alfa=0.3)
+        self.assertIsNone(test[0], msg = "Not None for n_rep=13 alfa=0.3")
+        self.assertEqual(test[1], 0.3, msg = "Wrong alpha value for n_rep = 13 alpha = 0.3")
+
+    def test_pass_interpolated(self):
         result = Lilliefors()
         test = result.get_critical_value(13, alfa=0.07)
-        self.assertIsNone(test[0], msg = "Not None for n_rep=13 alfa=0.07")
+        self.assertTrue(result.get_critical_value(13, alfa=0.10)[0] < test[0] < result.get_critical_value(13, alfa=0.05)[0], msg = "Wrong interpolated value for n_rep = 13 alpha = 0.07")
         self.assertEqual(test[1], 0.07, msg = "Wrong alpha value for n_rep = 13 alpha = 0.07")
 
 
@@ -96,5 +102,6 @@ class Test_get_critical_value(unittest.TestCase):
 
 
 
+
 if __name__ == "__main__":
     unittest.main()
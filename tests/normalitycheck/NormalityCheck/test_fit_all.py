@@ -0,0 +1,99 @@
+"""Tests if the fit_all function for NormalityCheck is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_fit_all
+    This class tests the fit_all function. It should raise ValueError when x_exp, alfa or comparison are not valid, when the sample is too small for any test or when some test has no critical value for alfa.
+
+---> Class Test_fit_all_results
+    This class compares the results of fit_all with the results of calling fit for each test.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/NormalityCheck/test_fit_all.py
+    or
+    python -m unittest -b tests/normalitycheck/NormalityCheck/test_fit_all.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.normalitycheck import NormalityCheck
+import numpy as np
+import pandas as pd
+os.system('cls')
+
+class Test_fit_all(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+
+    def test_x_exp(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is a list"):
+            NormalityCheck().fit_all(list(self.x))
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is too small"):
+            NormalityCheck().fit_all(self.x[:3])
+
+    def test_alfa(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is not valid"):
+            NormalityCheck().fit_all(self.x, alfa=5)
+        with self.assertRaises(ValueError, msg="Does not raised error when there is no critical value"):
+            NormalityCheck().fit_all(self.x, alfa=0.02)
+
+    def test_comparison(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when comparison is not valid"):
+            NormalityCheck().fit_all(self.x, comparison="pvalue")
+
+    def test_table(self):
+        result = NormalityCheck().fit_all(self.x)
+        self.assertIsInstance(result, pd.DataFrame, "fit_all does not return a DataFrame")
+        self.assertListEqual(list(result.index), ["Abdi-Molin", "Anderson-Darling", "Kolmogorov-Smirnov", "Lilliefors", "Shapiro-Wilk"], "wrong tests")
+        self.assertListEqual(list(result.columns), ["Statistic", "Critical", "p_value", "Alpha", "Conclusion"], "wrong column names")
+        result = NormalityCheck(language="pt-br").fit_all(self.x)
+        self.assertListEqual(list(result.columns), ["Estatistica", "Critico", "p_valor", "Alfa", "Conclusao"], "wrong column names")
+
+
+class Test_fit_all_results(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(21)
+        cls.samples = [
+            np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9]),
+            np.array([1, 1, 1, 1.1, 1.2, 5.3, 10.1, 10.2, 10.3]),
+            rng.normal(size=30),
+            rng.exponential(size=25),
+        ]
+        cls.tests = {"Abdi-Molin": "am", "Anderson-Darling": "ad", "Kolmogorov-Smirnov": "ks", "Lilliefors": "li", "Shapiro-Wilk": "sw"}
+
+    def compare(self, x, result, alfa=None, comparison=None):
+        for name, test in self.tests.items():
+            if test == "am":
+                expected, conclusion = NormalityCheck().fit(x, test=test, alfa=alfa, details="binary")
+            else:
+                expected, conclusion = NormalityCheck().fit(x, test=test, alfa=alfa, comparison=comparison, details="binary")
+            row = result.loc[name]
+            self.assertAlmostEqual(row.iloc[0], expected[0], places=10, msg=f"statistic does not match for {name}")
+            for column, value in ((1, expected[1]), (2, expected[2])):
+                if value is None:
+                    self.assertTrue(np.isnan(row.iloc[column]), f"missing values should be nan for {name}")
+                else:
+                    self.assertAlmostEqual(row.iloc[column], value, places=10, msg=f"critical or p_value does not match for {name}")
+            self.assertEqual(row.iloc[4], conclusion, f"conclusion does not match for {name}")
+
+    def test_critical(self):
+        for x in self.samples:
+            self.compare(x, NormalityCheck().fit_all(x))
+            self.compare(x, NormalityCheck().fit_all(x, alfa=0.01), alfa=0.01)
+
+    def test_p_value(self):
+        for x in self.samples:
+            self.compare(x, NormalityCheck().fit_all(x, comparison="p-value"), comparison="p-value")
+            self.compare(x, NormalityCheck().fit_all(x, alfa=0.1, comparison="p-value"), alfa=0.1, comparison="p-value")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Tests if the fit_many function for NormalityCheck is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_fit_many
+    This class tests the fit_many function. It should raise ValueError when test, comparison, alfa, axis or X (not a 2 D numpy array or a list of 1 D numpy arrays) are not valid, and the error about a missing critical value should not depend on the fit method.
+
+---> Class Test_fit_many_results
+    This class compares the results of fit_many, for every test, with the results of calling fit for each sample.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/NormalityCheck/test_fit_many.py
+    or
+    python -m unittest -b tests/normalitycheck/NormalityCheck/test_fit_many.py
+
+--------------------------------------------------------------------------------
+"""
+
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+from pycafee.normalitycheck.normalitycheck import NormalityCheck
+from pycafee.normalitycheck.abdimolin import AbdiMolin
+from pycafee.normalitycheck.andersondarling import AndersonDarling
+from pycafee.normalitycheck.kolmogorovsmirnov import KolmogorovSmirnov
+from pycafee.normalitycheck.lilliefors import Lilliefors
+from pycafee.normalitycheck.shapirowilk import ShapiroWilk
+import numpy as np
+import pandas as pd
+os.system('cls')
+
+class Test_fit_many(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.X = np.random.default_rng(10).normal(size=(4, 12))
+
+    def test_test(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when test is not valid"):
+            NormalityCheck().fit_many(self.X, test="any")
+
+    def test_comparison(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when comparison is not valid"):
+            NormalityCheck().fit_many(self.X, comparison="p_value")
+
+    def test_alfa(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is not valid"):
+            NormalityCheck().fit_many(self.X, alfa=1.5)
+
+    def test_alfa_not_tabulated(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when there is no critical value"):
+            NormalityCheck().fit_many(self.X, alfa=0.005)
+
+    def test_alfa_not_tabulated_without_fit(self):
+        # the error comes from _raises_critical_not_found, not from a call to fit
+        classes = {"sw": ShapiroWilk, "ks": KolmogorovSmirnov, "li": Lilliefors, "ab": AbdiMolin, "ad": AndersonDarling}
+        for test, cls in classes.items():
+            with self.subTest(test=test):
+                with mock.patch.object(cls, "fit") as fit:
+                    with self.assertRaises(ValueError, msg="Does not raised error when there is no critical value"):
+                        NormalityCheck().fit_many(self.X, test=test, alfa=0.005)
+                    fit.assert_not_called()
+
+    def test_axis(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when axis is not valid"):
+            NormalityCheck().fit_many(self.X, axis=2)
+        with self.assertRaises(ValueError, msg="Does not raised error when axis is not valid"):
+            NormalityCheck().fit_many(self.X, axis=1.0)
+        with self.assertRaises(ValueError, msg="Does not raised error when axis is negative"):
+            NormalityCheck().fit_many(self.X, axis=-1)
+
+    def test_axis_output(self):
+        capturedOutput = io.StringIO()
+        sys.stdout = capturedOutput
+        try:
+            NormalityCheck().fit_many(self.X, axis=-1)
+        except ValueError:
+            pass
+        sys.stdout = sys.__stdout__
+        output = capturedOutput.getvalue()
+        self.assertIn("'axis'", output, msg="wrong output when Raising Error")
+        self.assertIn("--->    0", output, msg="the allowed values were not shown")
+        self.assertIn("--->    -1", output, msg="the value passed was not shown")
+
+    def test_X(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when X is 1 D"):
+            NormalityCheck().fit_many(self.X[0])
+        with self.assertRaises(ValueError, msg="Does not raised error when X is a list with a 2 D array"):
+            NormalityCheck().fit_many([self.X[0], self.X])
+
+    def test_columns(self):
+        result = NormalityCheck().fit_many(self.X)
+        self.assertIsInstance(result, pd.DataFrame, "fit_many does not return a DataFrame")
+        self.assertListEqual(list(result.columns), ["Statistic", "Critical", "p_value", "Alpha", "n", "Conclusion"], "wrong column names")
+        result = NormalityCheck(language="pt-br").fit_many(self.X)
+        self.assertListEqual(list(result.columns), ["Estatistica", "Critico", "p_valor", "Alfa", "n", "Conclusao"], "wrong column names")
+
+    def test_normality_test(self):
+        normality_test = NormalityCheck()
+        normality_test.fit_many(self.X, test="li")
+        self.assertEqual(normality_test.normality_test, "Lilliefors", "wrong normality_test attribute")
+
+
+class Test_fit_many_results(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(42)
+        cls.X = np.vstack([rng.normal(size=(5, 15)), rng.exponential(size=(5, 15))])
+        cls.samples = [rng.normal(size=7), rng.exponential(size=20), rng.normal(size=7), rng.normal(size=12)]
+
+    def compare(self, samples, result, test, comparison=None, alfa=None):
+        self.assertEqual(result.shape[0], len(samples), "wrong number of rows")
+        for i, sample in enumerate(samples):
+            expected, conclusion = NormalityCheck().fit(sample, test=test, alfa=alfa, comparison=comparison, details="binary")
+            self.assertAlmostEqual(result.iloc[i, 0], expected[0], places=10, msg="statistic does not match")
+            if expected[1] is None:
+                self.assertTrue(np.isnan(result.iloc[i, 1]), "critical should be nan")
+            else:
+                self.assertAlmostEqual(result.iloc[i, 1], expected[1], places=10, msg="critical does not match")
+            if expected[2] is None:
+                self.assertTrue(np.isnan(result.iloc[i, 2]), "p_value should be nan")
+            else:
+                self.assertAlmostEqual(result.iloc[i, 2], expected[2], places=10, msg="p_value does not match")
+            self.assertEqual(result.iloc[i, 4], sample.size, "n does not match")
+            self.assertEqual(result.iloc[i, 5], conclusion, "conclusion does not match")
+
+    def test_critical(self):
+        for test in ["sw", "ks", "li", "am", "ad"]:
+            with self.subTest(test=test):
+                result = NormalityCheck().fit_many(self.X, test=test)
+                self.compare(list(self.X), result, test)
+
+    def test_p_value(self):
+        for test in ["sw", "ks", "li", "ad"]:
+            with self.subTest(test=test):
+                result = NormalityCheck().fit_many(self.X, test=test, comparison="p-value", alfa=0.1)
+                self.compare(list(self.X), result, test, comparison="p-value", alfa=0.1)
+
+    def test_axis(self):
+        result = NormalityCheck().fit_many(self.X.T, axis=0)
+        self.compare(list(self.X), result, "sw")
+
+    def test_list(self):
+        for test in ["sw", "ks", "li"]:
+            with self.subTest(test=test):
+                result = NormalityCheck().fit_many(self.samples, test=test)
+                self.compare(self.samples, result, test)
+
+
+if __name__ == "__main__":
+    unittest.main()
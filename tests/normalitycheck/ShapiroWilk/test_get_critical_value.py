@@ -75,15 +75,32 @@ class Test_get_critical_value(unittest.TestCase):
 
     def test_pass_None(self):
         result = ShapiroWilk()
-        test = result.get_critical_value(5, alfa=0.13)
-        self.assertIsNone(test[0], msg = "Not None for alfa=0.13")
-        self.assertEqual(test[1], 0.13, msg = "Wrong alpha value for n_rep = 51 alpha = 0.13")
+        test = result.get_critical_value(5, alfa=0.005)
+        self.assertIsNone(test[0], msg = "Not None for alfa=0.005")
+        self.assertEqual(test[1], 0.005, msg = "Wrong alpha value for n_rep = 5 alpha = 0.005")
 
+        result = ShapiroWilk()
+        test = result.get_critical_value(13, alfa=0.75)
+        self.assertIsNone(test[0], msg = "Not None for alfa=0.75")
+        self.assertEqual(test[1], 0.75, msg = "Wrong alpha value for n_rep = 13 alpha = 0.75")
+
+    def test_pass_interpolated(self):
         result = ShapiroWilk()
         test = result.get_critical_value(13, alfa=0.07)
-        self.assertIsNone(test[0], msg = "Not None for alfa=0.07")
+        self.assertTrue(result.get_critical_value(13, alfa=0.05)[0] < test[0] < result.get_critical_value(13, alfa=0.10)[0], msg = "Wrong interpolated value for n_rep = 13 alpha = 0.07")
         self.assertEqual(test[1], 0.07, msg = "Wrong alpha value for n_rep = 13 alpha = 0.07")
 
+        test = result.get_critical_value(30, alfa=0.025)
+        self.assertTrue(result.get_critical_value(30, alfa=0.02)[0] < test[0] < result.get_critical_value(30, alfa=0.05)[0], msg = "Wrong interpolated value for n_rep = 30 alpha = 0.025")
+
+    def test_pass_extrapolated(self):
+        result = ShapiroWilk()
+        critical = [result.get_critical_value(n_rep, alfa=0.05)[0] for n_rep in [50, 51, 100, 500]]
+        self.assertEqual(critical[0], 0.947, msg = "Wrong tabulated value for n_rep = 50 alpha = 0.05")
+        self.assertTrue(critical[0] < critical[1] < critical[2] < critical[3] < 1, msg = "The extrapolated values should increase with n_rep")
+        self.assertAlmostEqual(critical[1], critical[0], places=2, msg = "The extrapolation should be continuous at n_rep = 50")
+
+
 
 
 
@@ -0,0 +1,42 @@
+"""Tests if the _anderson_darling_critical_values function is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_anderson_darling_critical_values
+    This class compares the cached critical values with the ones returned by scipy.stats.anderson and checks that they are cached for each sample size.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__anderson_darling_critical_values.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__anderson_darling_critical_values.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+import warnings
+from pycafee.normalitycheck.kernels import _anderson_darling_critical_values
+import numpy as np
+from scipy.stats import anderson
+os.system('cls')
+
+class Test_anderson_darling_critical_values(unittest.TestCase):
+
+    def test_values(self):
+        rng = np.random.default_rng(15)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            for n in (3, 7, 10, 33, 500):
+                expected = anderson(rng.normal(size=n))[1]
+                np.testing.assert_array_equal(_anderson_darling_critical_values(n), expected, err_msg=f"critical values do not match for n = {n}")
+
+    def test_cached(self):
+        self.assertIs(_anderson_darling_critical_values(20), _anderson_darling_critical_values(20), "critical values are not cached")
+        self.assertFalse(_anderson_darling_critical_values(20).flags.writeable, "cached critical values should be read-only")
+
+
+if __name__ == "__main__":
+    unittest.main()
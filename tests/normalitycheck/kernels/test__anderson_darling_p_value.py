@@ -0,0 +1,58 @@
+"""Tests if the _anderson_darling_p_value kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_anderson_darling_p_value
+    This class compares the p-value calculated by the kernel (for one sample and for a batch of samples) with the p-value of statsmodels normal_ad, covering all the intervals of the approximation.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__anderson_darling_p_value.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__anderson_darling_p_value.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _anderson_darling_p_value, _anderson_darling_statistic, _sort_and_standardize
+import numpy as np
+from statsmodels.stats.diagnostic import normal_ad
+os.system('cls')
+
+class Test_anderson_darling_p_value(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(14)
+        cls.samples = [rng.normal(size=n) for n in (5, 10, 40)] + [rng.exponential(size=n)**2 for n in (8, 25, 400)]
+        cls.X = np.vstack([rng.normal(size=(10, 12)), rng.exponential(size=(10, 12))])
+
+    def test_one_sample(self):
+        for x in self.samples:
+            p_value = _anderson_darling_p_value(_anderson_darling_statistic(_sort_and_standardize(x), log_sf=False), x.size)
+            self.assertAlmostEqual(p_value, normal_ad(x)[1], places=10, msg="p-value does not match normal_ad")
+
+    def test_batch(self):
+        p_value = _anderson_darling_p_value(_anderson_darling_statistic(_sort_and_standardize(self.X), log_sf=False), self.X.shape[1])
+        for i, x in enumerate(self.X):
+            self.assertAlmostEqual(p_value[i], normal_ad(x)[1], places=10, msg="p-value does not match normal_ad")
+
+    def test_intervals(self):
+        n = 10
+        correction = 1 + 0.75 / n + 2.25 / n**2
+        ad2a = np.array([0.1, 0.3, 0.5, 2.0, 20.0])
+        expected = [
+            1 - np.exp(-13.436 + 101.14 * 0.1 - 223.73 * 0.1**2),
+            1 - np.exp(-8.318 + 42.796 * 0.3 - 59.938 * 0.3**2),
+            np.exp(0.9177 - 4.279 * 0.5 - 1.38 * 0.5**2),
+            np.exp(1.2937 - 5.709 * 2.0 + 0.0186 * 2.0**2),
+            0.0
+        ]
+        np.testing.assert_allclose(_anderson_darling_p_value(ad2a / correction, n), expected, err_msg="wrong interval")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Tests if the _anderson_darling_statistic kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_anderson_darling_statistic
+    This class compares the statistic calculated by the kernel (for one sample and for a batch of samples) with the statistic of scipy.stats.anderson (log_sf=True) and statsmodels normal_ad (log_sf=False).
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__anderson_darling_statistic.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__anderson_darling_statistic.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+import warnings
+from pycafee.normalitycheck.kernels import _anderson_darling_statistic, _sort_and_standardize
+import numpy as np
+from scipy.stats import anderson
+from statsmodels.stats.diagnostic import normal_ad
+os.system('cls')
+
+class Test_anderson_darling_statistic(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(13)
+        cls.samples = [rng.normal(size=n) for n in (3, 5, 8, 20, 100)] + [rng.exponential(size=n) for n in (6, 30, 250)]
+        cls.X = np.vstack([rng.normal(size=(10, 15)), rng.uniform(size=(10, 15))])
+
+    def test_one_sample(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            for x in self.samples:
+                statistic = _anderson_darling_statistic(_sort_and_standardize(x))
+                self.assertAlmostEqual(statistic, anderson(x)[0], places=10, msg="statistic does not match anderson")
+                statistic = _anderson_darling_statistic(_sort_and_standardize(x), log_sf=False)
+                self.assertAlmostEqual(statistic, normal_ad(x)[0], places=10, msg="statistic does not match normal_ad")
+
+    def test_batch(self):
+        statistic = _anderson_darling_statistic(_sort_and_standardize(self.X))
+        self.assertEqual(statistic.shape, (self.X.shape[0],), "wrong shape")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            for i, x in enumerate(self.X):
+                self.assertAlmostEqual(statistic[i], anderson(x)[0], places=10, msg="statistic does not match anderson")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Tests if the _ks_p_value kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_ks_p_value
+    This class compares the p-value calculated by the kernel (for one sample and for a batch of samples) with the p-value of scipy.stats.kstest.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__ks_p_value.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__ks_p_value.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _ks_p_value, _ks_statistic, _sort_and_standardize
+import numpy as np
+from scipy.stats import kstest
+os.system('cls')
+
+class Test_ks_p_value(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(8)
+        cls.samples = [rng.normal(size=n) for n in (3, 6, 15, 50)] + [rng.exponential(size=n) for n in (8, 40)]
+        cls.X = np.vstack([rng.normal(size=(10, 12)), rng.exponential(size=(10, 12))])
+
+    def test_one_sample(self):
+        for x in self.samples:
+            p_value = _ks_p_value(_ks_statistic(_sort_and_standardize(x)), x.size)
+            expected = kstest(x, cdf='norm', args=(x.mean(), x.std(ddof=1)))[1]
+            self.assertAlmostEqual(p_value, expected, places=10, msg="p-value does not match kstest")
+
+    def test_batch(self):
+        p_value = _ks_p_value(_ks_statistic(_sort_and_standardize(self.X)), self.X.shape[1])
+        for i, x in enumerate(self.X):
+            expected = kstest(x, cdf='norm', args=(x.mean(), x.std(ddof=1)))[1]
+            self.assertAlmostEqual(p_value[i], expected, places=10, msg="p-value does not match kstest")
+
+
+if __name__ == "__main__":
+    unittest.main()
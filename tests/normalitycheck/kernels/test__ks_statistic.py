@@ -0,0 +1,56 @@
+"""Tests if the _ks_statistic kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_ks_statistic
+    This class compares the statistic calculated by the kernel (for one sample and for a batch of samples) with the statistic of scipy.stats.kstest and statsmodels lilliefors.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__ks_statistic.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__ks_statistic.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _ks_statistic, _sort_and_standardize
+import numpy as np
+from scipy.stats import kstest
+from statsmodels.stats.diagnostic import lilliefors
+os.system('cls')
+
+class Test_ks_statistic(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(7)
+        cls.samples = [rng.normal(size=n) for n in (4, 5, 10, 31, 100)] + [rng.exponential(size=n) for n in (4, 20, 60)]
+        cls.X = np.vstack([rng.normal(5, 2, size=(20, 25)), rng.uniform(size=(20, 25))])
+
+    def test_one_sample(self):
+        for x in self.samples:
+            statistic = _ks_statistic(_sort_and_standardize(x))
+            expected = kstest(x, cdf='norm', args=(x.mean(), x.std(ddof=1)))[0]
+            self.assertAlmostEqual(statistic, expected, places=12, msg="statistic does not match kstest")
+            expected = lilliefors(x, dist='norm', pvalmethod='table')[0]
+            self.assertAlmostEqual(statistic, expected, places=12, msg="statistic does not match lilliefors")
+
+    def test_batch(self):
+        statistic = _ks_statistic(_sort_and_standardize(self.X))
+        self.assertEqual(statistic.shape, (self.X.shape[0],), "wrong shape")
+        for i, x in enumerate(self.X):
+            expected = kstest(x, cdf='norm', args=(x.mean(), x.std(ddof=1)))[0]
+            self.assertAlmostEqual(statistic[i], expected, places=12, msg="statistic does not match kstest")
+
+    def test_does_not_change_input(self):
+        x = np.array([3.0, 1.0, 2.0, 5.0])
+        _ks_statistic(_sort_and_standardize(x))
+        np.testing.assert_array_equal(x, np.array([3.0, 1.0, 2.0, 5.0]), "input was changed")
+
+
+if __name__ == "__main__":
+    unittest.main()
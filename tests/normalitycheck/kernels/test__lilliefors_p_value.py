@@ -0,0 +1,48 @@
+"""Tests if the _lilliefors_p_value kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_lilliefors_p_value
+    This class compares the p-value calculated by the kernel (for one sample and for a batch of samples) with the p-value of statsmodels lilliefors (pvalmethod='table').
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__lilliefors_p_value.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__lilliefors_p_value.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _lilliefors_p_value, _ks_statistic, _sort_and_standardize
+import numpy as np
+from statsmodels.stats.diagnostic import lilliefors
+os.system('cls')
+
+class Test_lilliefors_p_value(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(9)
+        cls.samples = [rng.normal(size=n) for n in (4, 9, 30, 200)] + [rng.exponential(size=n) for n in (5, 25, 80)]
+        cls.X = np.vstack([rng.normal(size=(10, 16)), rng.exponential(size=(10, 16))])
+
+    def test_one_sample(self):
+        for x in self.samples:
+            p_value = _lilliefors_p_value(_ks_statistic(_sort_and_standardize(x)), x.size)
+            expected = lilliefors(x, dist='norm', pvalmethod='table')[1]
+            self.assertAlmostEqual(p_value, expected, places=10, msg="p-value does not match lilliefors")
+
+    def test_batch(self):
+        p_value = _lilliefors_p_value(_ks_statistic(_sort_and_standardize(self.X)), self.X.shape[1])
+        self.assertEqual(p_value.shape, (self.X.shape[0],), "wrong shape")
+        for i, x in enumerate(self.X):
+            expected = lilliefors(x, dist='norm', pvalmethod='table')[1]
+            self.assertAlmostEqual(p_value[i], expected, places=10, msg="p-value does not match lilliefors")
+
+
+if __name__ == "__main__":
+    unittest.main()
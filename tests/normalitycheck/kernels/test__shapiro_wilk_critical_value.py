@@ -0,0 +1,44 @@
+"""Tests if the _shapiro_wilk_critical_value kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_shapiro_wilk_critical_value
+    This class checks that the critical value calculated by the kernel is the inverse of the p-value kernel (for n >= 12), that it works with arrays of n and alfa, and that it increases with n and with alfa.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__shapiro_wilk_critical_value.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__shapiro_wilk_critical_value.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _shapiro_wilk_critical_value, _shapiro_wilk_p_value
+import numpy as np
+os.system('cls')
+
+class Test_shapiro_wilk_critical_value(unittest.TestCase):
+
+    def test_inverse(self):
+        for n in [12, 30, 51, 500, 5000]:
+            for alfa in [0.01, 0.025, 0.05, 0.10, 0.5]:
+                with self.subTest(n=n, alfa=alfa):
+                    critical = _shapiro_wilk_critical_value(n, alfa)
+                    self.assertIsInstance(critical, float, "does not return a float")
+                    self.assertAlmostEqual(_shapiro_wilk_p_value(critical, n), alfa, places=10, msg="not the inverse of the p-value")
+
+    def test_arrays(self):
+        n = np.array([60, 100, 500])
+        result = _shapiro_wilk_critical_value(n, 0.05)
+        self.assertEqual(result.shape, (3,), "wrong shape")
+        self.assertTrue(np.all(np.diff(result) > 0), "should increase with n")
+        result = _shapiro_wilk_critical_value(100, np.array([0.01, 0.05, 0.10]))
+        self.assertTrue(np.all(np.diff(result) > 0), "should increase with alfa")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests if the _shapiro_wilk_p_value kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_shapiro_wilk_p_value
+    This class compares the p-value calculated by the kernel (for one sample and for a batch of samples) with the p-value of scipy.stats.shapiro, covering the three regimes of the approximation (n = 3, 4 <= n <= 11 and n >= 12).
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__shapiro_wilk_p_value.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__shapiro_wilk_p_value.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _shapiro_wilk_p_value, _shapiro_wilk_statistic
+import numpy as np
+from scipy.stats import shapiro
+os.system('cls')
+
+class Test_shapiro_wilk_p_value(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(12)
+        cls.samples = [rng.normal(size=n) for n in range(3, 30)] + [rng.exponential(size=n)**2 for n in (3, 4, 8, 11, 12, 40, 500)]
+        cls.X = np.vstack([rng.normal(size=(10, 9)), rng.exponential(size=(10, 9))])
+
+    def test_one_sample(self):
+        for x in self.samples:
+            p_value = _shapiro_wilk_p_value(_shapiro_wilk_statistic(x), x.size)
+            self.assertAlmostEqual(p_value, shapiro(x)[1], places=6, msg=f"p-value does not match shapiro for n = {x.size}")
+
+    def test_batch(self):
+        p_value = _shapiro_wilk_p_value(_shapiro_wilk_statistic(self.X), self.X.shape[1])
+        for i, x in enumerate(self.X):
+            self.assertAlmostEqual(p_value[i], shapiro(x)[1], places=6, msg="p-value does not match shapiro")
+
+    def test_range_zero(self):
+        self.assertEqual(_shapiro_wilk_p_value(1.0, 10), 1.0, "p-value should be 1 when the range is zero")
+        self.assertEqual(_shapiro_wilk_p_value(1.0, 30), 1.0, "p-value should be 1 when the range is zero")
+
+
+if __name__ == "__main__":
+    unittest.main()
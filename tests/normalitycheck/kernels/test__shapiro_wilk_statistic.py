@@ -0,0 +1,58 @@
+"""Tests if the _shapiro_wilk_statistic kernel is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_shapiro_wilk_statistic
+    This class compares the statistic calculated by the kernel (for one sample and for a batch of samples) with the statistic of scipy.stats.shapiro. It also checks that the coefficients are cached for each sample size.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/normalitycheck/kernels/test__shapiro_wilk_statistic.py
+    or
+    python -m unittest -b tests/normalitycheck/kernels/test__shapiro_wilk_statistic.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.normalitycheck.kernels import _shapiro_wilk_statistic, _shapiro_wilk_coefficients
+import numpy as np
+from scipy.stats import shapiro
+os.system('cls')
+
+class Test_shapiro_wilk_statistic(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(11)
+        cls.samples = [rng.normal(size=n) for n in range(3, 30)] + [rng.exponential(size=n) for n in (3, 4, 5, 6, 11, 12, 50, 300)]
+        cls.X = np.vstack([rng.normal(10, 3, size=(15, 25)), rng.exponential(size=(15, 25))])
+
+    def test_one_sample(self):
+        for x in self.samples:
+            expected = shapiro(x)[0]
+            self.assertAlmostEqual(_shapiro_wilk_statistic(x), expected, places=7, msg=f"statistic does not match shapiro for n = {x.size}")
+
+    def test_batch(self):
+        statistic = _shapiro_wilk_statistic(self.X)
+        self.assertEqual(statistic.shape, (self.X.shape[0],), "wrong shape")
+        for i, x in enumerate(self.X):
+            self.assertAlmostEqual(statistic[i], shapiro(x)[0], places=7, msg="statistic does not match shapiro")
+
+    def test_range_zero(self):
+        self.assertEqual(_shapiro_wilk_statistic(np.ones(10)), 1.0, "statistic should be 1 when the range is zero")
+
+    def test_coefficients(self):
+        for n in (3, 4, 5, 6, 7, 20, 21):
+            coefficients = _shapiro_wilk_coefficients(n)
+            self.assertEqual(coefficients.size, n, "wrong number of coefficients")
+            self.assertAlmostEqual(np.sum(coefficients**2), 1.0, places=6, msg="coefficients are not normalized")
+            np.testing.assert_allclose(coefficients, -coefficients[::-1], err_msg="coefficients are not antisymmetric")
+        self.assertIs(_shapiro_wilk_coefficients(25), _shapiro_wilk_coefficients(25), "coefficients are not cached")
+        self.assertFalse(_shapiro_wilk_coefficients(25).flags.writeable, "cached coefficients should be read-only")
+
+
+if __name__ == "__main__":
+    unittest.main()
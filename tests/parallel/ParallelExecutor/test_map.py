@@ -0,0 +1,114 @@
+"""Tests if the map function for ParallelExecutor is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_init
+    This class tests the parameters of the constructor. It should raise ValueError when max_workers or chunk_size are not positive integers.
+
+---> Class Test_map
+    This class tests the map function. It should raise ValueError when test_class is not a class with the method, when init_kwargs or method_kwargs are not dicts and when X is not valid. It also checks that the results are the same (and in the same order) as calling the method for each sample, using the workers (with shared memory) and in the current process.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/parallel/ParallelExecutor/test_map.py
+    or
+    python -m unittest -b tests/parallel/ParallelExecutor/test_map.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.parallel import ParallelExecutor
+from pycafee.normalitycheck import NormalityCheck
+from pycafee.sample.outliers import Dixon, Grubbs
+import numpy as np
+os.system('cls')
+
+class Test_init(unittest.TestCase):
+
+    def test_max_workers(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when max_workers is not an integer"):
+            ParallelExecutor(max_workers=2.0)
+        with self.assertRaises(ValueError, msg="Does not raised error when max_workers is zero"):
+            ParallelExecutor(max_workers=0)
+
+    def test_chunk_size(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when chunk_size is not an integer"):
+            ParallelExecutor(chunk_size="10")
+        with self.assertRaises(ValueError, msg="Does not raised error when chunk_size is negative"):
+            ParallelExecutor(chunk_size=-1)
+
+
+class Test_map(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(30)
+        cls.X = rng.normal(size=(60, 12))
+        cls.X[::7, 0] = 8.0 # some outliers
+        cls.samples = [rng.normal(size=n) for n in (10, 15, 10, 20, 12, 10, 11)]
+
+    def test_test_class(self):
+        executor = ParallelExecutor(max_workers=1)
+        with self.assertRaises(ValueError, msg="Does not raised error when test_class is an instance"):
+            executor.map(Grubbs(), self.X)
+        with self.assertRaises(ValueError, msg="Does not raised error when test_class does not have the method"):
+            executor.map(Grubbs, self.X, method="any")
+        with self.assertRaises(ValueError, msg="Does not raised error when method is not a str"):
+            executor.map(Grubbs, self.X, method=1)
+
+    def test_kwargs(self):
+        executor = ParallelExecutor(max_workers=1)
+        with self.assertRaises(ValueError, msg="Does not raised error when init_kwargs is not a dict"):
+            executor.map(Grubbs, self.X, init_kwargs=["en"])
+        with self.assertRaises(ValueError, msg="Does not raised error when method_kwargs is not a dict"):
+            executor.map(Grubbs, self.X, method_kwargs=("binary",))
+
+    def test_X(self):
+        executor = ParallelExecutor(max_workers=1)
+        with self.assertRaises(ValueError, msg="Does not raised error when X is 1 D"):
+            executor.map(Grubbs, self.X[0])
+        with self.assertRaises(ValueError, msg="Does not raised error when X is a list of lists"):
+            executor.map(Grubbs, [[1, 2, 3]])
+        self.assertEqual(executor.map(Grubbs, []), [], "an empty list should return an empty list")
+
+    def compare(self, results, test_class, samples, method_kwargs):
+        self.assertEqual(len(results), len(samples), "wrong number of results")
+        for result, sample in zip(results, samples):
+            expected = test_class().fit(sample, **method_kwargs)
+            self.assertEqual(tuple(result[0]), tuple(expected[0]), "result does not match")
+            self.assertEqual(result[1], expected[1], "conclusion does not match")
+
+    def test_workers(self):
+        executor = ParallelExecutor(max_workers=2, chunk_size=7)
+        method_kwargs = {"details": "binary"}
+        self.compare(executor.map(Grubbs, self.X, method_kwargs=method_kwargs), Grubbs, self.X, method_kwargs)
+        method_kwargs = {"alfa": 0.05, "details": "binary"}
+        self.compare(executor.map(Dixon, self.X, method_kwargs=method_kwargs), Dixon, self.X, method_kwargs)
+
+    def test_list(self):
+        executor = ParallelExecutor(max_workers=2, chunk_size=2)
+        method_kwargs = {"test": "li", "details": "binary"}
+        self.compare(executor.map(NormalityCheck, self.samples, method_kwargs=method_kwargs), NormalityCheck, self.samples, method_kwargs)
+
+    def test_current_process(self):
+        executor = ParallelExecutor(max_workers=1)
+        method_kwargs = {"details": "binary"}
+        self.compare(executor.map(Grubbs, self.X, method_kwargs=method_kwargs), Grubbs, self.X, method_kwargs)
+
+    def test_language(self):
+        executor = ParallelExecutor(max_workers=2, chunk_size=30, language="pt-br")
+        results = executor.map(Grubbs, self.X, method_kwargs={"details": "short"})
+        expected = Grubbs(language="pt-br").fit(self.X[1], details="short")
+        self.assertEqual(results[1][1], expected[1], "the language was not used by the workers")
+
+    def test_errors_from_workers(self):
+        executor = ParallelExecutor(max_workers=2, chunk_size=1)
+        with self.assertRaises(ValueError, msg="Does not raised the error of the workers"):
+            executor.map(Grubbs, self.X[:4], method_kwargs={"alfa": 0.005})
+
+
+if __name__ == "__main__":
+    unittest.main()
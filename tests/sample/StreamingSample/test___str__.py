@@ -0,0 +1,40 @@
+"""Tests if the __str__ and __repr__ methods of the StreamingSample class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_str
+    This class checks the text before and after pushing data, in both languages.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test___str__.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test___str__.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.streamingsample import StreamingSample
+import numpy as np
+os.system('cls')
+
+class Test_str(unittest.TestCase):
+
+    def test_str(self):
+        sample = StreamingSample(name="bwidaba")
+        self.assertEqual(str(sample), "No data has been added to this sample yet. Use the 'push' method to add data to bwidaba", "wrong __str__")
+        sample.push(np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9]))
+        self.assertEqual(str(sample), "bwidaba with mean = 4.859 +/- 0.291", "wrong __str__")
+        sample = StreamingSample(language="pt-br")
+        self.assertEqual(str(sample), "Nenhum dado foi adicionado a esta amostra ainda. Utilize o método 'push' para adicionar dados à Amostra contínua", "wrong __str__")
+
+    def test_repr(self):
+        self.assertEqual(repr(StreamingSample()), "Streaming sample evaluation class", "wrong __repr__")
+        self.assertEqual(repr(StreamingSample(language="pt-br")), "Classe de avaliação de uma amostra contínua", "wrong __repr__")
+
+
+if __name__ == "__main__":
+    unittest.main()
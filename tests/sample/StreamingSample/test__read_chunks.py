@@ -0,0 +1,110 @@
+"""Tests if the _read_chunks function of the streamingsample module is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_read_chunks
+    This class checks that paths (.npy and raw float64 files), numpy arrays and iterables of arrays are read in chunks with the same values, and the errors for invalid sources.
+
+---> Class Test_check_source
+    This class checks which data must be read in chunks and the error when both x_exp and x_source are used.
+
+---> Class Test_check_is_reiterable
+    This class checks that iterators are rejected when the data must be read twice.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test__read_chunks.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test__read_chunks.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+import tempfile
+from unittest import mock
+from pycafee.sample import streamingsample
+from pycafee.sample.streamingsample import _read_chunks, _check_source, _check_is_reiterable
+import numpy as np
+os.system('cls')
+
+
+class Test_read_chunks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(3).normal(size=1001)
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.raw = os.path.join(cls.folder.name, "x.bin")
+        cls.x.tofile(cls.raw)
+        cls.npy = os.path.join(cls.folder.name, "x.npy")
+        np.save(cls.npy, cls.x)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def test_sources(self):
+        sources = {
+            "raw": self.raw,
+            "npy": self.npy,
+            "array": self.x,
+            "memmap": np.memmap(self.raw, dtype=np.float64, mode="r"),
+            "list": [self.x[:500], self.x[500:]],
+            "generator": (self.x[i:i + 100] for i in range(0, self.x.size, 100)),
+        }
+        with mock.patch.object(streamingsample, "CHUNK_SIZE", 64):
+            for name, source in sources.items():
+                with self.subTest(source=name):
+                    chunks = list(_read_chunks(source, "en"))
+                    self.assertTrue(all(chunk.size <= 64 for chunk in chunks), msg="chunk larger than CHUNK_SIZE")
+                    self.assertTrue(all(isinstance(chunk, np.ndarray) and not isinstance(chunk, np.memmap) for chunk in chunks), msg="chunk is not a numpy array")
+                    np.testing.assert_array_equal(np.concatenate(chunks), self.x, err_msg="wrong values")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is an int"):
+            list(_read_chunks(3, "en"))
+        with self.assertRaises(ValueError, msg="Does not raised error when a chunk is a list"):
+            list(_read_chunks([self.x, [1, 2]], "en"))
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is a 2D array"):
+            list(_read_chunks(np.ones((3, 3)), "en"))
+
+
+class Test_check_source(unittest.TestCase):
+
+    def test_source(self):
+        x = np.array([1.0, 2.0, 3.0])
+        self.assertIsNone(_check_source(x, None, "en"), msg="data in memory should not be read in chunks")
+        self.assertEqual(_check_source(None, "x.npy", "en"), "x.npy", msg="wrong source")
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "x.bin")
+            x.tofile(path)
+            memmap = np.memmap(path, dtype=np.float64, mode="r")
+            self.assertIs(_check_source(memmap, None, "en"), memmap, msg="a memmap should be read in chunks")
+            del memmap
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp and x_source are used"):
+            _check_source(np.array([1.0, 2.0, 3.0]), "x.npy", "en")
+
+
+class Test_check_is_reiterable(unittest.TestCase):
+
+    def test_reiterable(self):
+        x = np.array([1.0, 2.0, 3.0])
+        self.assertTrue(_check_is_reiterable("x.npy", "en"))
+        self.assertTrue(_check_is_reiterable(x, "en"))
+        self.assertTrue(_check_is_reiterable([x, x], "en"))
+
+    def test_raises(self):
+        x = np.array([1.0, 2.0, 3.0])
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is a generator"):
+            _check_is_reiterable((chunk for chunk in [x, x]), "en")
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is an iterator"):
+            _check_is_reiterable(iter([x, x]), "en")
+
+
+if __name__ == "__main__":
+    unittest.main()
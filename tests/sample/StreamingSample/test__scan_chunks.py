@@ -0,0 +1,60 @@
+"""Tests if the _scan_chunks function of the streamingsample module is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_scan_chunks
+    This class compares the moments and the values at both ends accumulated in chunks with numpy applied to the whole data, including samples smaller than the number of values kept at both ends.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test__scan_chunks.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test__scan_chunks.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.streamingsample import _scan_chunks
+from pycafee.functions.quantilesketch import QuantileSketch
+import numpy as np
+os.system('cls')
+
+
+class Test_scan_chunks(unittest.TestCase):
+
+    def test_moments(self):
+        x = np.random.default_rng(5).normal(size=1000)
+        moments, ends = _scan_chunks(np.array_split(x, 13), n_ends=3)
+        self.assertEqual(moments[0], x.size, msg="wrong number of observations")
+        self.assertAlmostEqual(moments[1], x.mean(), places=12, msg="wrong mean")
+        self.assertAlmostEqual(moments[2]/(x.size - 1), x.var(ddof=1), places=12, msg="wrong variance")
+        self.assertEqual(moments[5], x.min(), msg="wrong min")
+        self.assertEqual(moments[6], x.max(), msg="wrong max")
+        x_sorted = np.sort(x)
+        np.testing.assert_array_equal(ends, np.concatenate((x_sorted[:3], x_sorted[-3:])), err_msg="wrong ends")
+
+    def test_small(self):
+        x = np.array([4.0, 1.0, 3.0, 5.0, 2.0])
+        for n in range(1, x.size + 1):
+            with self.subTest(n=n):
+                moments, ends = _scan_chunks([x[:2], x[2:n]] if n > 2 else [x[:n]], n_ends=3)
+                np.testing.assert_array_equal(ends, np.sort(x[:n]), err_msg="wrong ends")
+
+    def test_sketch(self):
+        x = np.random.default_rng(5).normal(size=100)
+        sketch = QuantileSketch()
+        moments, ends = _scan_chunks(np.array_split(x, 4), sketch=sketch)
+        self.assertEqual(sketch.n, x.size, msg="the sketch did not receive all values")
+        self.assertEqual(ends.size, 0, msg="no value should be kept")
+
+    def test_empty(self):
+        moments, ends = _scan_chunks([])
+        self.assertEqual(moments[0], 0, msg="wrong number of observations")
+        self.assertTrue(np.isnan(moments[1]), msg="the mean should be nan")
+
+
+if __name__ == "__main__":
+    unittest.main()
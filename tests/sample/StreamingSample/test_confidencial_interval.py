@@ -0,0 +1,59 @@
+"""Tests if the confidencial_interval method of the StreamingSample class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_confidencial_interval
+    This class checks if a ValueError is raised when no data was pushed, if the output is a DataFrame with the expected columns, and if the values match the Sample statistics calculated from the raw data.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test_confidencial_interval.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test_confidencial_interval.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.streamingsample import StreamingSample
+import pandas as pd
+import scipy.stats as stats
+import numpy as np
+os.system('cls')
+
+class Test_confidencial_interval(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+
+    def test_no_push(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when no data was pushed"):
+            StreamingSample().confidencial_interval()
+        with self.assertRaises(ValueError, msg="Does not raised error when no data was pushed"):
+            StreamingSample(name="bwidaba", language="pt-br").confidencial_interval(show=False)
+
+    def test_output(self):
+        sample = StreamingSample()
+        sample.push(self.x[:4])
+        sample.push(self.x[4:])
+        result = sample.confidencial_interval(show=False)
+        self.assertIsInstance(result, pd.DataFrame, msg="Output is not a DataFrame")
+        self.assertEqual(list(result.columns), ['Mean - IC', 'Mean', 'Mean + IC'], "wrong column names")
+        self.assertEqual(result.shape, (1, 3), "wrong shape")
+        self.assertAlmostEqual(result["Mean"][0], self.x.mean(), places=12, msg="wrong mean")
+        t_interval = self.x.std(ddof=1)*stats.t.ppf(0.975, self.x.size - 1)/np.sqrt(self.x.size)
+        self.assertAlmostEqual(result["Mean + IC"][0], self.x.mean() + t_interval, places=12, msg="wrong interval")
+
+    def test_alfa(self):
+        sample = StreamingSample(alfa=0.10)
+        sample.push(self.x)
+        result = sample.confidencial_interval(show=False)
+        t_interval = self.x.std(ddof=1)*stats.t.ppf(0.95, self.x.size - 1)/np.sqrt(self.x.size)
+        self.assertAlmostEqual(result["Mean + IC"][0], self.x.mean() + t_interval, places=12, msg="alfa was not used")
+
+
+if __name__ == "__main__":
+    unittest.main()
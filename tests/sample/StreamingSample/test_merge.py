@@ -0,0 +1,62 @@
+"""Tests if the merge method of the StreamingSample class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_merge
+    This class checks that merging shards gives the same statistics of pushing all the data to one sample, that empty samples are handled, that the other sample is not changed, and the error when other is not a StreamingSample.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test_merge.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test_merge.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.streamingsample import StreamingSample
+import numpy as np
+os.system('cls')
+
+class Test_merge(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(4).normal(50, 3, size=3001)
+
+    def test_shards(self):
+        whole = StreamingSample()
+        whole.push(self.x)
+        merged = StreamingSample()
+        for shard in np.array_split(self.x, 9):
+            partial = StreamingSample()
+            partial.push(shard)
+            self.assertIs(merged.merge(partial), merged, "does not return the sample")
+        self.assertEqual(merged.n, whole.n, "wrong number of observations")
+        for attribute in ["mean", "variance", "skewness", "kurtosis", "min", "max"]:
+            with self.subTest(attribute=attribute):
+                self.assertAlmostEqual(getattr(merged, attribute), getattr(whole, attribute), places=9, msg=f"wrong {attribute}")
+
+    def test_empty(self):
+        sample = StreamingSample()
+        sample.push(self.x)
+        mean = sample.mean
+        sample.merge(StreamingSample())
+        self.assertEqual(sample.mean, mean, "merging an empty sample changed the mean")
+        other = StreamingSample()
+        other.merge(sample)
+        self.assertEqual(other.mean, mean, "merging into an empty sample is wrong")
+        self.assertEqual(sample.n, self.x.size, "the other sample was changed")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when other is not a StreamingSample"):
+            StreamingSample().merge(self.x)
+        with self.assertRaises(ValueError, msg="Does not raised error when other is not a StreamingSample"):
+            StreamingSample(language="pt-br").merge([1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
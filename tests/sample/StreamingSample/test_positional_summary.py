@@ -0,0 +1,55 @@
+"""Tests if the positional_summary method of the StreamingSample class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_positional_summary
+    This class checks if a ValueError is raised when no data was pushed, the columns of the DataFrame, the exact values for small samples and the approximated values for merged large samples.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test_positional_summary.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test_positional_summary.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.streamingsample import StreamingSample
+import pandas as pd
+import numpy as np
+os.system('cls')
+
+class Test_positional_summary(unittest.TestCase):
+
+    def test_no_push(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when no data was pushed"):
+            StreamingSample().positional_summary()
+
+    def test_small(self):
+        x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4, 4.9])
+        sample = StreamingSample()
+        sample.push(x)
+        result = sample.positional_summary(show=False)
+        self.assertIsInstance(result, pd.DataFrame, msg="Output is not a DataFrame")
+        self.assertEqual(list(result.columns), ["Minimum", "Q1", "Median", "Q3", "Maximum", "Interquartile range"], "wrong column names")
+        expected = [4.4, *np.quantile(x, [0.25, 0.5, 0.75]), 5.4]
+        np.testing.assert_allclose(result.values[0][:5], expected, err_msg="wrong values")
+
+    def test_large(self):
+        x = np.random.default_rng(8).uniform(size=200000)
+        sample = StreamingSample(rank_error=0.01)
+        other = StreamingSample(rank_error=0.01)
+        sample.push(x[:50000])
+        other.push(x[50000:])
+        sample.merge(other)
+        result = sample.positional_summary(show=False).values[0]
+        np.testing.assert_allclose(result[1:4], [0.25, 0.5, 0.75], atol=0.01, err_msg="wrong quartiles")
+        self.assertEqual(result[0], x.min(), "wrong min")
+        self.assertEqual(result[4], x.max(), "wrong max")
+
+
+if __name__ == "__main__":
+    unittest.main()
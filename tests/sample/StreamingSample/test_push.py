@@ -0,0 +1,63 @@
+"""Tests if the push method of the StreamingSample class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_push
+    This class compares the statistics accumulated in batches with numpy and scipy applied to the whole data (including data with a large offset), checks a sample with only one observation and the errors for invalid data.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/StreamingSample/test_push.py
+    or
+    python -m unittest -b tests/sample/StreamingSample/test_push.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.streamingsample import StreamingSample
+import scipy.stats as stats
+import numpy as np
+os.system('cls')
+
+class Test_push(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(21).gamma(2, size=20001)*3 + 1e6
+
+    def test_batches(self):
+        for n_batches in [1, 2, 7, 500]:
+            with self.subTest(n_batches=n_batches):
+                sample = StreamingSample()
+                for batch in np.array_split(self.x, n_batches):
+                    sample.push(batch)
+                self.assertEqual(sample.n, self.x.size, "wrong number of observations")
+                self.assertAlmostEqual(sample.mean, self.x.mean(), delta=1e-9, msg="wrong mean")
+                self.assertAlmostEqual(sample.variance/self.x.var(ddof=1), 1, places=10, msg="wrong variance")
+                self.assertAlmostEqual(sample.std/self.x.std(ddof=1), 1, places=10, msg="wrong standard deviation")
+                self.assertAlmostEqual(sample.skewness, stats.skew(self.x), places=8, msg="wrong skewness")
+                self.assertAlmostEqual(sample.kurtosis, stats.kurtosis(self.x), places=8, msg="wrong kurtosis")
+                self.assertEqual(sample.min, self.x.min(), "wrong min")
+                self.assertEqual(sample.max, self.x.max(), "wrong max")
+
+    def test_one_value(self):
+        sample = StreamingSample()
+        sample.push(np.array([3.0]))
+        self.assertEqual(sample.mean, 3.0, "wrong mean")
+        self.assertTrue(np.isnan(sample.variance), "the variance of one observation should be nan")
+
+    def test_raises(self):
+        sample = StreamingSample()
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is a list"):
+            sample.push([1, 2, 3])
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is empty"):
+            sample.push(np.array([]))
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is 2D"):
+            sample.push(np.array([[1, 2], [3, 4]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
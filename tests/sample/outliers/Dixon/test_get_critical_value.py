@@ -2,6 +2,9 @@
 
 ---> Class Test_get_critical_value
 
+---> Class Test_large_samples
+    This class tests the simulated critical values above the tables (with the cache on a temporary folder), and if alfa outside the range of the tables raises ValueError.
+
 
 --------------------------------------------------------------------------------
 Command to run at the prompt:
@@ -13,7 +16,9 @@ Command to run at the prompt:
 """
 
 import os
+import tempfile
 import unittest
+from unittest import mock
 from pycafee.sample.outliers import Dixon
 import numpy as np
 os.system('cls')
@@ -41,57 +46,38 @@ class Test_Raises(unittest.TestCase):
             teste = Dixon()
             result = teste.get_critical_value(2)
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Dixon()
-            result = teste.get_critical_value(32)
-
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Dixon()
             result = teste.get_critical_value(2, ratio="r10")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Dixon()
-            result = teste.get_critical_value(32, ratio="r10")
-
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Dixon()
             result = teste.get_critical_value(2, ratio="r11")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Dixon()
-            result = teste.get_critical_value(32, ratio="r11")
-
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Dixon()
             result = teste.get_critical_value(2, ratio="r12")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Dixon()
-            result = teste.get_critical_value(32, ratio="r12")
-
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Dixon()
             result = teste.get_critical_value(2, ratio="r20")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Dixon()
-            result = teste.get_critical_value(32, ratio="r20")
-
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Dixon()
             result = teste.get_critical_value(2, ratio="r21")
 
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Dixon()
-            result = teste.get_critical_value(32, ratio="r21")
+            result = teste.get_critical_value(2, ratio="r22")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
+    def test_alfa(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is outside the tabulated range"):
             teste = Dixon()
-            result = teste.get_critical_value(2, ratio="r22")
+            result = teste.get_critical_value(5, alfa=0.005)
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is outside the tabulated range"):
             teste = Dixon()
-            result = teste.get_critical_value(32, ratio="r22")
+            result = teste.get_critical_value(10, ratio="r22", alfa=0.5)
 
 
 class Test_get_critical_value(unittest.TestCase):
@@ -336,5 +322,49 @@ class Test_get_critical_value(unittest.TestCase):
         self.assertEqual(result[1], 0.01, msg="wrong alfa value when alfa 0.01")
 
 
+class Test_large_samples(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.environment = mock.patch.dict(os.environ, {"PYCAFEE_CACHE_DIR": self.folder.name})
+        self.environment.start()
+
+    def tearDown(self):
+        self.environment.stop()
+        self.folder.cleanup()
+
+    def test_continuity(self):
+        teste = Dixon()
+        for ratio in ["r10", "r11", "r12", "r20", "r21", "r22"]:
+            with self.subTest(ratio=ratio):
+                result = teste.get_critical_value(31, ratio=ratio)
+                self.assertIsInstance(result[0], float, msg="critical not float")
+                self.assertTrue(abs(result[0] - teste.get_critical_value(30, ratio=ratio)[0]) < 0.02, msg="far from the table")
+
+    def test_cache(self):
+        teste = Dixon()
+        result = teste.get_critical_value(100, ratio="r22", alfa=0.01)
+        self.assertTrue(os.path.exists(os.path.join(self.folder.name, "critical_values.json")), msg="the simulated values were not cached")
+        self.assertEqual(teste.get_critical_value(100, ratio="r22", alfa=0.01)[0], result[0], msg="the cached value is different")
+
+    def test_alfa_raises(self):
+        teste = Dixon()
+        for ratio in ["r10", "r22"]:
+            for alfa in [0.005, 0.5, 0.999]:
+                with self.subTest(ratio=ratio, alfa=alfa):
+                    with self.assertRaises(ValueError, msg="Does not raised error when alfa is outside the range above the table"):
+                        teste.get_critical_value(40, ratio=ratio, alfa=alfa)
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is outside the range above the table"):
+            Dixon().fit(np.random.default_rng(5).normal(size=40), alfa=0.5)
+        self.assertFalse(os.path.exists(os.path.join(self.folder.name, "critical_values.json")), msg="the critical values should not be simulated")
+
+    def test_fit(self):
+        x_exp = np.random.default_rng(5).normal(size=100)
+        x_exp[7] = 10.0
+        result = Dixon().fit(x_exp, details="binary")
+        self.assertEqual(result[0][3], "r22", msg="wrong ratio")
+        self.assertEqual(result[1], 1, msg="the outlier was not detected")
+
+
 if __name__ == "__main__":
     unittest.main()
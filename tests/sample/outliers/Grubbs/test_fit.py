@@ -10,6 +10,10 @@
 
 ---> Class Test_one: This checks the results for cases where kind equals to one
 
+---> Class Test_Grubbs_x_source checks the fit with the data read in chunks (x_source and np.memmap)
+
+---> Class Test_Grubbs_assume_sorted checks the assume_sorted parameter, the sorted data kept on the object (cache_sorted=True) and the default (no cache) after changing the data in place, and if assume_sorted must be bool
+
 --------------------------------------------------------------------------------
 Command to run at the prompt:
     python -m unittest -v tests/sample/outliers/Grubbs/test_fit.py
@@ -23,6 +27,7 @@ import os
 import unittest
 from pycafee.sample.outliers import Grubbs
 import numpy as np
+import tempfile
 import sys
 import io
 os.system('cls')
@@ -565,7 +570,7 @@ class Test_raises(unittest.TestCase):
     def test_alfa_raises(self):
         with self.assertRaises(ValueError, msg="Does not raised error when alfa not allowed"):
             teste = Grubbs()
-            result = teste.fit(self.x, alfa=0.02)
+            result = teste.fit(self.x, alfa=0.005)
 
         with self.assertRaises(ValueError, msg="Does not raised error when alfa is str"):
             teste = Grubbs()
@@ -1059,5 +1064,94 @@ class Test_two(unittest.TestCase):
 
 
 
+class Test_Grubbs_x_source(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(7).normal(size=1000)
+        cls.x[100] = 4.5
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.raw = os.path.join(cls.folder.name, "x.bin")
+        cls.x.tofile(cls.raw)
+        cls.npy = os.path.join(cls.folder.name, "x.npy")
+        np.save(cls.npy, cls.x)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def _assert_same(self, result, expected):
+        self.assertEqual(result[1], expected[1], msg="wrong conclusion")
+        for value, reference in zip(result[0], expected[0]):
+            if isinstance(reference, str):
+                self.assertEqual(value, reference, msg="wrong result")
+            else:
+                np.testing.assert_allclose(value, reference, err_msg="wrong result")
+
+    def test_chunks(self):
+        for kwargs in [{}, {"which": "min"}, {"kind": "two"}, {"kind": "three", "which": "min"}, {"kind": "three", "which": "max"}]:
+            expected = Grubbs().fit(self.x, **kwargs)
+            chunks = [self.x[i:i + 64] for i in range(0, self.x.size, 64)]
+            self._assert_same(Grubbs().fit(x_source=iter(chunks), **kwargs), expected)
+            self._assert_same(Grubbs().fit(x_source=self.raw, **kwargs), expected)
+            self._assert_same(Grubbs().fit(x_source=self.npy, **kwargs), expected)
+            self._assert_same(Grubbs().fit(np.memmap(self.raw, dtype=np.float64, mode="r"), **kwargs), expected)
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp and x_source are used"):
+            Grubbs().fit(self.x, x_source=self.npy)
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is not valid"):
+            Grubbs().fit(x_source=3)
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source has less than 3 values"):
+            Grubbs().fit(x_source=[self.x[:2]])
+
+
+class Test_Grubbs_assume_sorted(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(9).normal(size=25)
+        cls.x[3] = 4.5
+
+    def test_assume_sorted(self):
+        x_sorted = np.sort(self.x)
+        for kwargs in [{}, {"which": "min"}, {"kind": "two"}, {"kind": "three"}]:
+            expected = Grubbs().fit(self.x, **kwargs)
+            result = Grubbs().fit(x_sorted, assume_sorted=True, **kwargs)
+            self.assertEqual(str(result), str(expected), msg="wrong result for sorted data")
+
+    def test_assume_sorted_not_bool(self):
+        for value in ["no", 1, None]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError, msg="Does not raised error when assume_sorted is not bool"):
+                    Grubbs().fit(self.x, assume_sorted=value)
+
+    def test_cache(self):
+        x = self.x.copy()
+        teste = Grubbs(cache_sorted=True)
+        expected = teste.fit(x)
+        x_sorted = teste._find_sorted(x)
+        self.assertIsNotNone(x_sorted, msg="the sorted data was not cached")
+        self.assertEqual(str(teste.fit(x)), str(expected), msg="wrong result with the cache")
+        self.assertIs(teste._find_sorted(x), x_sorted, msg="the data was sorted again")
+        x[3] = -4.5
+        teste.invalidate_sorted()
+        result = teste.fit(x)
+        self.assertEqual(str(result), str(Grubbs().fit(x.copy())), msg="the cache was not invalidated")
+
+    def test_in_place(self):
+        x = self.x.copy()
+        teste = Grubbs()
+        teste.fit(x)
+        self.assertIsNone(teste._find_sorted(x), msg="the sorted data should not be cached by default")
+        x[:] = np.arange(1.0, 26.0)
+        result = teste.fit(x)
+        self.assertEqual(str(result), str(Grubbs().fit(x.copy())), msg="wrong result after changing the data in place")
+
+    def test_cache_sorted(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when cache_sorted is not bool"):
+            Grubbs(cache_sorted=1)
+
+
 if __name__ == "__main__":
     unittest.main()
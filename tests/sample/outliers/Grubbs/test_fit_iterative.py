@@ -0,0 +1,109 @@
+"""Tests if the fit_iterative function for Grubbs is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_Raises
+    This class tests the parameters. It should raise ValueError when x_exp, max_outliers or alfa are not valid, and ZeroDivisionError when the sample has no variance.
+
+---> Class Test_fit_iterative
+    This class checks the result with the example of the NIST/SEMATECH e-Handbook (Rosner data, 3 outliers), the masking effect, a sample without outliers and the default max_outliers.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/Grubbs/test_fit_iterative.py
+    or
+    python -m unittest -b tests/sample/outliers/Grubbs/test_fit_iterative.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import Grubbs
+import numpy as np
+os.system('cls')
+
+
+class Test_Raises(unittest.TestCase):
+
+    def test_x_exp(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is a list"):
+            Grubbs().fit_iterative([1, 2, 3, 4])
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is too small"):
+            Grubbs().fit_iterative(np.array([1.0, 2.0]))
+        with self.assertRaises(ZeroDivisionError, msg="Does not raised error when x_exp has no variance"):
+            Grubbs().fit_iterative(np.ones(10))
+
+    def test_max_outliers(self):
+        x_exp = np.arange(10.0)
+        with self.assertRaises(ValueError, msg="Does not raised error when max_outliers is not an integer"):
+            Grubbs().fit_iterative(x_exp, max_outliers=2.0)
+        with self.assertRaises(ValueError, msg="Does not raised error when max_outliers is zero"):
+            Grubbs().fit_iterative(x_exp, max_outliers=0)
+        with self.assertRaises(ValueError, msg="Does not raised error when max_outliers is too large"):
+            Grubbs().fit_iterative(x_exp, max_outliers=9)
+
+    def test_alfa(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is not a float"):
+            Grubbs().fit_iterative(np.arange(10.0), alfa=5)
+
+
+class Test_fit_iterative(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # NIST/SEMATECH e-Handbook of Statistical Methods, section 1.3.5.17.3
+        cls.rosner = np.array([
+            -0.25, 0.68, 0.94, 1.15, 1.20, 1.26, 1.26, 1.34, 1.38, 1.43, 1.49, 1.49, 1.55, 1.56,
+            1.58, 1.65, 1.69, 1.70, 1.76, 1.77, 1.81, 1.91, 1.94, 1.96, 1.99, 2.06, 2.09, 2.10,
+            2.14, 2.15, 2.23, 2.24, 2.26, 2.35, 2.37, 2.40, 2.47, 2.54, 2.62, 2.64, 2.90, 2.92,
+            2.92, 2.93, 3.21, 3.26, 3.30, 3.59, 3.68, 4.30, 4.64, 5.34, 5.42, 6.01
+            ])
+
+    def test_rosner(self):
+        result = Grubbs().fit_iterative(self.rosner, max_outliers=10)
+        statistic = [3.118, 2.942, 3.179, 2.810, 2.815, 2.848, 2.279, 2.310, 2.101, 2.067]
+        critical = [3.158, 3.151, 3.143, 3.136, 3.128, 3.120, 3.111, 3.103, 3.094, 3.085]
+        np.testing.assert_allclose(result[0], statistic, atol=0.0015, err_msg="wrong statistic")
+        np.testing.assert_allclose(result[1], critical, atol=0.0015, err_msg="wrong critical")
+        self.assertEqual(result[2], 0.05, msg="wrong alfa")
+        np.testing.assert_array_equal(result[3], [6.01, 5.42, 5.34], err_msg="wrong outliers")
+        np.testing.assert_array_equal(result[4], [53, 52, 51], err_msg="wrong indices")
+
+    def test_masking(self):
+        # the first step alone does not detect the outliers (the two values mask each other)
+        result = Grubbs().fit_iterative(self.rosner, max_outliers=1)
+        self.assertEqual(result[4].size, 0, msg="should not find outliers with only one step")
+        self.assertTrue(result[0][0] < result[1][0], msg="the first statistic should be lower than the critical value")
+
+    def test_unordered(self):
+        rng = np.random.default_rng(3)
+        x_exp = rng.permutation(self.rosner)
+        result = Grubbs().fit_iterative(x_exp, max_outliers=10)
+        np.testing.assert_array_equal(np.sort(x_exp[result[4]]), [5.34, 5.42, 6.01], err_msg="wrong indices")
+
+    def test_no_outliers(self):
+        x_exp = np.random.default_rng(8).normal(size=100)
+        result = Grubbs().fit_iterative(x_exp)
+        self.assertEqual(result[0].size, 10, msg="the default max_outliers is not 10% of the sample")
+        self.assertEqual(result[4].size, 0, msg="found outliers in normal data")
+        self.assertEqual(result[4].dtype.kind, "i", msg="indices are not integers")
+
+    def test_both_ends(self):
+        x_exp = np.random.default_rng(9).normal(size=200)
+        x_exp[[10, 20]] = [8.0, -9.0]
+        result = Grubbs().fit_iterative(x_exp, max_outliers=5)
+        np.testing.assert_array_equal(result[4], [20, 10], err_msg="wrong indices")
+
+    def test_one_step(self):
+        # the first step is the Grubbs test for one outlier
+        x_exp = np.array([159, 153, 184, 153, 156, 150, 147])
+        result = Grubbs().fit_iterative(x_exp, max_outliers=1)
+        fit = Grubbs().fit(x_exp)
+        self.assertAlmostEqual(result[0][0], fit[0][0], places=10, msg="wrong statistic")
+        self.assertAlmostEqual(result[1][0], fit[0][1], places=3, msg="wrong critical value")
+
+
+if __name__ == "__main__":
+    unittest.main()
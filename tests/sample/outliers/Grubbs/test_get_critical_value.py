@@ -2,6 +2,9 @@
 
 ---> Class Test_get_critical_value
 
+---> Class Test_large_samples
+    This class tests the critical values above the tables: analytic for kind="one" and simulated (with the cache on a temporary folder) for kind="two" and kind="three", and if alfa outside the range of the tables raises ValueError.
+
 
 --------------------------------------------------------------------------------
 Command to run at the prompt:
@@ -13,7 +16,9 @@ Command to run at the prompt:
 """
 
 import os
+import tempfile
 import unittest
+from unittest import mock
 from pycafee.sample.outliers import Grubbs
 import numpy as np
 import sys
@@ -95,18 +100,10 @@ class Test_Raises(unittest.TestCase):
             teste = Grubbs()
             result = teste.get_critical_value(2)
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Grubbs()
-            result = teste.get_critical_value(32)
-
         with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
             teste = Grubbs()
             result = teste.get_critical_value(3, kind="three")
 
-        with self.assertRaises(ValueError, msg="Does not raised error when n_rep not allowed"):
-            teste = Grubbs()
-            result = teste.get_critical_value(21, kind="two")
-
 
     def test_n_rep_raises_output(self):
 
@@ -130,7 +127,7 @@ class Test_Raises(unittest.TestCase):
     def test_alfa_raises(self):
         with self.assertRaises(ValueError, msg="Does not raised error when alfa not allowed"):
             teste = Grubbs()
-            result = teste.get_critical_value(5, alfa=0.02)
+            result = teste.get_critical_value(5, alfa=0.005)
 
         with self.assertRaises(ValueError, msg="Does not raised error when alfa is str"):
             teste = Grubbs()
@@ -143,11 +140,11 @@ class Test_Raises(unittest.TestCase):
         sys.stdout = capturedOutput
         try:
             teste = Grubbs()
-            result = teste.get_critical_value(5, alfa=0.02)
+            result = teste.get_critical_value(5, alfa=0.005)
         except ValueError:
             pass
         sys.stdout = sys.__stdout__
-        expected = "0.02"
+        expected = "0.005"
         result = False
         if expected in capturedOutput.getvalue():
             result = True
@@ -228,6 +225,54 @@ class Test_get_critical_value(unittest.TestCase):
 
 
 
+class Test_large_samples(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.environment = mock.patch.dict(os.environ, {"PYCAFEE_CACHE_DIR": self.folder.name})
+        self.environment.start()
+
+    def tearDown(self):
+        self.environment.stop()
+        self.folder.cleanup()
+
+    def test_one(self):
+        teste = Grubbs()
+        result = teste.get_critical_value(31)
+        self.assertIsInstance(result[0], float, msg="critical not float")
+        self.assertAlmostEqual(result[0], 2.924, places=3, msg="wrong critical value")
+        result = teste.get_critical_value(100)
+        self.assertAlmostEqual(result[0], 3.384, places=3, msg="wrong critical value")
+        result = teste.get_critical_value(1000, alfa=0.01)
+        self.assertAlmostEqual(result[0], 4.397, places=3, msg="wrong critical value")
+        result = teste.get_critical_value(100, alfa=0.02)
+        self.assertTrue(result[0] > teste.get_critical_value(100, alfa=0.05)[0], msg="the critical value should decrease with alfa")
+
+    def test_alfa_raises(self):
+        teste = Grubbs()
+        for kind in ["one", "two", "three"]:
+            for alfa in [0.001, 0.2, 0.999]:
+                with self.subTest(kind=kind, alfa=alfa):
+                    with self.assertRaises(ValueError, msg="Does not raised error when alfa is outside the range above the table"):
+                        teste.get_critical_value(31, kind=kind, alfa=alfa)
+        self.assertFalse(os.path.exists(os.path.join(self.folder.name, "critical_values.json")), msg="the critical values should not be simulated")
+
+    def test_two_three(self):
+        teste = Grubbs()
+        two = teste.get_critical_value(21, kind="two")[0]
+        self.assertAlmostEqual(two, 4.55, delta=0.05, msg="wrong critical value for kind='two'")
+        self.assertTrue(two > teste.get_critical_value(20, kind="two")[0], msg="the critical value should increase with n_rep")
+        three = teste.get_critical_value(31, kind="three")[0]
+        self.assertTrue(teste.get_critical_value(30, kind="three")[0] < three < 0.62, msg="wrong critical value for kind='three'")
+        self.assertTrue(os.path.exists(os.path.join(self.folder.name, "critical_values.json")), msg="the simulated values were not cached")
+
+    def test_fit(self):
+        x_exp = np.random.default_rng(5).normal(size=200)
+        x_exp[7] = 10.0
+        result = Grubbs().fit(x_exp, details="binary")
+        self.assertEqual(result[1], 1, msg="the outlier was not detected")
+        self.assertEqual(result[0][4], 10.0, msg="wrong outlier")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,12 @@
 
 ---> Class Test_Tukey checks if the results are correc for some datasets. It also checks for raises ValueError
 
+---> Class Test_Tukey_rank_error checks the fit with the quartiles estimated by a QuantileSketch
+
+---> Class Test_Tukey_x_source checks the fit with the data read in chunks (x_source and np.memmap)
+
+---> Class Test_Tukey_assume_sorted checks the assume_sorted parameter (which must be bool)
+
 --------------------------------------------------------------------------------
 Command to run at the prompt:
     python -m unittest -v tests/sample/outliers/Tukey/test_fit.py
@@ -15,6 +21,7 @@ import os
 import unittest
 from pycafee.sample.outliers import Tukey
 import numpy as np
+import tempfile
 import sys
 import io
 os.system('cls')
@@ -503,6 +510,86 @@ class Test_Tukey(unittest.TestCase):
 
 
 
+class Test_Tukey_rank_error(unittest.TestCase):
+
+    def test_small(self):
+        x = np.array([6.3, 5.8, 7.1, 6.3, 6.5, 7.6, 4.9, 7.3, 6.7, 7.2, 12])
+        result, conclusion = Tukey().fit(x, rank_error=0.01)
+        self.assertEqual(list(result[0]), list(Tukey().fit(x)[0][0]), "should be exact for small samples")
+
+    def test_large(self):
+        x = np.random.default_rng(4).normal(size=300000)
+        x[10] = 12
+        result, conclusion = Tukey().fit(x, rank_error=0.005, details="binary")
+        expected, _ = Tukey().fit(x)
+        np.testing.assert_allclose(result[0], expected[0], atol=0.1, err_msg="wrong interval")
+        self.assertEqual(result[2], 12, msg="wrong outlier value")
+        self.assertEqual(conclusion, 1, msg="wrong conclusion")
+
+
+class Test_Tukey_x_source(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # the sketch keeps the whole sample, so the quartiles are exact
+        cls.x = np.random.default_rng(7).normal(size=250)
+        cls.x[100] = 4.5
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.raw = os.path.join(cls.folder.name, "x.bin")
+        cls.x.tofile(cls.raw)
+        cls.npy = os.path.join(cls.folder.name, "x.npy")
+        np.save(cls.npy, cls.x)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def _assert_same(self, result, expected):
+        self.assertEqual(result[1], expected[1], msg="wrong conclusion")
+        for value, reference in zip(result[0], expected[0]):
+            if isinstance(reference, str):
+                self.assertEqual(value, reference, msg="wrong result")
+            else:
+                np.testing.assert_allclose(value, reference, err_msg="wrong result")
+
+    def test_chunks(self):
+        for kwargs in [{}, {"which": "min"}, {"critical": "mild"}]:
+            expected = Tukey().fit(self.x, **kwargs)
+            chunks = [self.x[i:i + 64] for i in range(0, self.x.size, 64)]
+            self._assert_same(Tukey().fit(x_source=iter(chunks), **kwargs), expected)
+            self._assert_same(Tukey().fit(x_source=self.raw, **kwargs), expected)
+            self._assert_same(Tukey().fit(x_source=self.npy, **kwargs), expected)
+            self._assert_same(Tukey().fit(np.memmap(self.raw, dtype=np.float64, mode="r"), **kwargs), expected)
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp and x_source are used"):
+            Tukey().fit(self.x, x_source=self.npy)
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is not valid"):
+            Tukey().fit(x_source=3)
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source has less than 3 values"):
+            Tukey().fit(x_source=[self.x[:2]])
+
+
+class Test_Tukey_assume_sorted(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(9).normal(size=25)
+        cls.x[3] = 4.5
+
+    def test_assume_sorted(self):
+        x_sorted = np.sort(self.x)
+        for kwargs in [{}, {"which": "min"}, {"critical": "mild"}]:
+            expected = Tukey().fit(self.x, **kwargs)
+            result = Tukey().fit(x_sorted, assume_sorted=True, **kwargs)
+            self.assertEqual(str(result), str(expected), msg="wrong result for sorted data")
+
+    def test_assume_sorted_not_bool(self):
+        for value in ["no", 1, None]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError, msg="Does not raised error when assume_sorted is not bool"):
+                    Tukey().fit(self.x, assume_sorted=value)
+
 
 if __name__ == "__main__":
     unittest.main()
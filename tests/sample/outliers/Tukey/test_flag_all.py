@@ -0,0 +1,54 @@
+"""Tests if the flag_all method of the Tukey class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_flag_all
+    This class compares the boolean mask and the fences with the fit method, checks the string critical values and the errors for invalid critical values.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/Tukey/test_flag_all.py
+    or
+    python -m unittest -b tests/sample/outliers/Tukey/test_flag_all.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import Tukey
+import numpy as np
+os.system('cls')
+
+class Test_flag_all(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        x = np.random.default_rng(9).normal(size=400)
+        x[[0, 50]] = [8, -9]
+        cls.x = x
+
+    def test_fit(self):
+        test = Tukey()
+        for critical in [None, "mild", "extreme", 0.5]:
+            with self.subTest(critical=critical):
+                result = test.flag_all(self.x, critical=critical)
+                interval = test.fit(self.x, critical=critical)[0][0]
+                self.assertEqual(list(result.interval), list(interval), "the fences do not match the fit")
+                expected = (self.x < interval[0]) | (self.x > interval[1])
+                np.testing.assert_array_equal(result.outlier, expected, err_msg="wrong mask")
+                np.testing.assert_array_equal(result.outlier, result.statistic > result.critical, err_msg="the mask does not match the scores")
+
+    def test_critical(self):
+        test = Tukey()
+        self.assertEqual(test.flag_all(self.x).critical, 3, "wrong default critical value")
+        self.assertEqual(test.flag_all(self.x, critical="mild").critical, 1.5, "wrong mild critical value")
+        with self.assertRaises(ValueError, msg="Does not raised error when critical is not allowed"):
+            test.flag_all(self.x, critical="medium")
+        with self.assertRaises(ValueError, msg="Does not raised error when critical is negative"):
+            test.flag_all(self.x, critical=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
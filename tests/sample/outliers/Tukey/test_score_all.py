@@ -0,0 +1,46 @@
+"""Tests if the score_all method of the Tukey class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_score_all
+    This class checks the scores (distance to the nearest quartile in units of the interquartile range), the case with interquartile range equal to zero and the errors for invalid data.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/Tukey/test_score_all.py
+    or
+    python -m unittest -b tests/sample/outliers/Tukey/test_score_all.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import Tukey
+from pycafee.functions.functions import interquartile_range
+import numpy as np
+os.system('cls')
+
+class Test_score_all(unittest.TestCase):
+
+    def test_scores(self):
+        x = np.random.default_rng(5).normal(size=999)
+        result = Tukey().score_all(x)
+        (DI, q1, q3), _, _ = interquartile_range(x)
+        expected = np.array([max(q1 - value, value - q3)/DI for value in x])
+        np.testing.assert_allclose(result, expected, rtol=1e-12, err_msg="wrong scores")
+
+    def test_zero_iqr(self):
+        result = Tukey().score_all(np.array([1.0, 2.0, 2.0, 2.0, 2.0, 2.0, 5.0]))
+        np.testing.assert_array_equal(result, [np.inf, 0, 0, 0, 0, 0, np.inf], err_msg="wrong scores when the interquartile range is zero")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is a list"):
+            Tukey().score_all([1, 2, 3, 4])
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp has only 2 values"):
+            Tukey().score_all(np.array([1, 2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 
 ---> Class Test_ZScore checks if the results are correc for some datasets. It also checks for raises ValueError
 
+---> Class Test_ZScore_x_source checks the fit with the data read in chunks (x_source and np.memmap)
+
 --------------------------------------------------------------------------------
 Command to run at the prompt:
     python -m unittest -v tests/sample/outliers/ZScore/test_fit.py
@@ -15,6 +17,7 @@ import os
 import unittest
 from pycafee.sample.outliers import ZScore
 import numpy as np
+import tempfile
 import sys
 import io
 os.system('cls')
@@ -482,5 +485,47 @@ class Test_ZScore(unittest.TestCase):
 
 
 
+class Test_ZScore_x_source(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(7).normal(size=1000)
+        cls.x[100] = 4.5
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.raw = os.path.join(cls.folder.name, "x.bin")
+        cls.x.tofile(cls.raw)
+        cls.npy = os.path.join(cls.folder.name, "x.npy")
+        np.save(cls.npy, cls.x)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def _assert_same(self, result, expected):
+        self.assertEqual(result[1], expected[1], msg="wrong conclusion")
+        for value, reference in zip(result[0], expected[0]):
+            if isinstance(reference, str):
+                self.assertEqual(value, reference, msg="wrong result")
+            else:
+                np.testing.assert_allclose(value, reference, err_msg="wrong result")
+
+    def test_chunks(self):
+        for kwargs in [{}, {"which": "min"}, {"critical": 2}]:
+            expected = ZScore().fit(self.x, **kwargs)
+            chunks = [self.x[i:i + 64] for i in range(0, self.x.size, 64)]
+            self._assert_same(ZScore().fit(x_source=iter(chunks), **kwargs), expected)
+            self._assert_same(ZScore().fit(x_source=self.raw, **kwargs), expected)
+            self._assert_same(ZScore().fit(x_source=self.npy, **kwargs), expected)
+            self._assert_same(ZScore().fit(np.memmap(self.raw, dtype=np.float64, mode="r"), **kwargs), expected)
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp and x_source are used"):
+            ZScore().fit(self.x, x_source=self.npy)
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source is not valid"):
+            ZScore().fit(x_source=3)
+        with self.assertRaises(ValueError, msg="Does not raised error when x_source has less than 3 values"):
+            ZScore().fit(x_source=[self.x[:2]])
+
+
 if __name__ == "__main__":
     unittest.main()
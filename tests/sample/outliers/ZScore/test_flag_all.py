@@ -0,0 +1,52 @@
+"""Tests if the flag_all method of the ZScore class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_flag_all
+    This class checks the boolean mask against the comparison of the scores with the critical value, the default critical value (3), and the errors for invalid critical values.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/ZScore/test_flag_all.py
+    or
+    python -m unittest -b tests/sample/outliers/ZScore/test_flag_all.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import ZScore
+import numpy as np
+os.system('cls')
+
+class Test_flag_all(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        x = np.random.default_rng(3).normal(size=500)
+        x[[10, 200]] = [12, -15]
+        cls.x = x
+
+    def test_mask(self):
+        test = ZScore()
+        result = test.flag_all(self.x)
+        self.assertEqual(result.critical, 3, "wrong default critical value")
+        self.assertEqual(result.outlier.dtype, bool, "the mask is not boolean")
+        np.testing.assert_array_equal(result.outlier, result.statistic > 3, err_msg="wrong mask")
+        self.assertTrue(result.outlier[10] and result.outlier[200], "the outliers were not flagged")
+        np.testing.assert_array_equal(result.statistic, test.score_all(self.x), err_msg="wrong scores")
+
+    def test_critical(self):
+        test = ZScore()
+        result = test.flag_all(self.x, critical=1)
+        np.testing.assert_array_equal(result.outlier, result.statistic > 1, err_msg="wrong mask")
+        with self.assertRaises(ValueError, msg="Does not raised error when critical is negative"):
+            test.flag_all(self.x, critical=-1)
+        with self.assertRaises(ValueError, msg="Does not raised error when critical is a str"):
+            test.flag_all(self.x, critical="1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Tests if the score_all method of the ZScore class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_score_all
+    This class checks that the scores are calculated for every observation, that they match the statistic of the fit method for the min and the max, and that it raises an error for invalid data.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/ZScore/test_score_all.py
+    or
+    python -m unittest -b tests/sample/outliers/ZScore/test_score_all.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import ZScore
+import numpy as np
+os.system('cls')
+
+class Test_score_all(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(7).normal(size=1001)
+
+    def test_scores(self):
+        x = self.x
+        test = ZScore()
+        result = test.score_all(x)
+        self.assertEqual(result.shape, x.shape, "wrong shape")
+        np.testing.assert_allclose(result, np.abs(x - x.mean())/x.std(ddof=1), rtol=1e-12, err_msg="wrong scores")
+
+    def test_fit(self):
+        test = ZScore()
+        result = test.score_all(self.x)
+        for which, position in [("min", np.argmin(self.x)), ("max", np.argmax(self.x))]:
+            with self.subTest(which=which):
+                self.assertAlmostEqual(result[position], test.fit(self.x, which=which)[0][0], places=12, msg="does not match the fit")
+
+    def test_raises(self):
+        test = ZScore()
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp is a list"):
+            test.score_all([1, 2, 3, 4])
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp has only 2 values"):
+            test.score_all(np.array([1, 2]))
+        with self.assertRaises(ZeroDivisionError, msg="Does not raised error when the scale is zero"):
+            test.score_all(np.array([1, 1, 1, 1, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
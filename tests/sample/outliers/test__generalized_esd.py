@@ -0,0 +1,56 @@
+"""Tests if the _generalized_esd is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> class Test_generalized_esd: this class compares the incremental statistics with the statistics calculated from scratch, removing one observation at a time
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/test__generalized_esd.py
+    or
+    python -m unittest -b tests/sample/outliers/test__generalized_esd.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import _generalized_esd
+import numpy as np
+os.system('cls')
+
+class Test_generalized_esd(unittest.TestCase):
+
+    def from_scratch(self, x_exp, max_outliers):
+        positions = np.arange(x_exp.size)
+        statistic = []
+        removed = []
+        for _ in range(max_outliers):
+            deviation = np.abs(x_exp[positions] - x_exp[positions].mean())
+            farthest = np.argmax(deviation)
+            statistic.append(deviation[farthest]/np.std(x_exp[positions], ddof=1))
+            removed.append(positions[farthest])
+            positions = np.delete(positions, farthest)
+        return np.array(statistic), np.array(removed)
+
+    def test_from_scratch(self):
+        rng = np.random.default_rng(11)
+        for n_rep, max_outliers in [(10, 8), (50, 20), (500, 100)]:
+            with self.subTest(n_rep=n_rep):
+                x_exp = rng.standard_t(3, size=n_rep)*10 + 1000
+                statistic, removed = _generalized_esd(x_exp, max_outliers)
+                expected_statistic, expected_removed = self.from_scratch(x_exp, max_outliers)
+                np.testing.assert_allclose(statistic, expected_statistic, rtol=1e-9, err_msg="wrong statistic")
+                np.testing.assert_array_equal(removed, expected_removed, err_msg="wrong order")
+
+    def test_no_variance(self):
+        statistic, removed = _generalized_esd(np.array([1.0, 1.0, 1.0, 5.0]), 2)
+        self.assertTrue(statistic[0] > 0, "wrong statistic")
+        self.assertEqual(statistic[1], 0.0, "should be zero when the remaining data has no variance")
+        self.assertEqual(removed[0], 3, "wrong position")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests if the _grubbs_critical_values and _get_grubbs_critical_value are working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> class Test_grubbs_critical_values: this class checks that the analytic critical values reproduce the table of Grubbs (kind="one") and that the function works with arrays
+
+---> class Test_get_grubbs_critical_value: this class checks that the scalar function returns a float and uses the cache
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/sample/outliers/test__grubbs_critical_values.py
+    or
+    python -m unittest -b tests/sample/outliers/test__grubbs_critical_values.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.sample.outliers import _grubbs_critical_values, _get_grubbs_critical_value, Grubbs
+import numpy as np
+os.system('cls')
+
+class Test_grubbs_critical_values(unittest.TestCase):
+
+    def test_table(self):
+        table = Grubbs.GRUBBS_ONE_TABLE
+        n_rep = np.array(table["n_rep"])
+        for alfa in [0.10, 0.05, 0.01]:
+            with self.subTest(alfa=alfa):
+                result = _grubbs_critical_values(n_rep, alfa)
+                np.testing.assert_allclose(result, table[alfa], atol=0.0015, err_msg="does not match the table")
+
+    def test_arrays(self):
+        result = _grubbs_critical_values(np.array([10, 100, 1000]), 0.05)
+        self.assertEqual(result.shape, (3,), "wrong shape")
+        self.assertTrue(np.all(np.diff(result) > 0), "should increase with n_rep")
+        result = _grubbs_critical_values(np.array([[50], [500]]), np.array([0.01, 0.05, 0.10]))
+        self.assertEqual(result.shape, (2, 3), "does not broadcast")
+        self.assertTrue(np.all(np.diff(result, axis=1) < 0), "should decrease with alfa")
+
+
+class Test_get_grubbs_critical_value(unittest.TestCase):
+
+    def test_cache(self):
+        _get_grubbs_critical_value.cache_clear()
+        result = _get_grubbs_critical_value(100, 0.05)
+        self.assertIsInstance(result, float, "does not return a float")
+        self.assertEqual(result, _get_grubbs_critical_value(100, 0.05), "different values")
+        self.assertEqual(_get_grubbs_critical_value.cache_info().hits, 1, "the cache was not used")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,12 @@ Description:
 ---> Class Test_fit
     This class tests the fit function. It should raise ValueError when test gets the wrong key.
 
+---> Class Test_rank_error_stats
+    This class tests the median and the quartiles estimated with a QuantileSketch (rank_error parameter).
+
+---> Class Test_x_source_stats
+    This class tests the statistics of data read in chunks (x_source parameter and np.memmap), and if normality_check raises ValueError after such a fit.
+
 
 ---> Classes Test_Normality_fit_default, Test_Normality_fit_sw, Test_Normality_fit_ab, Test_Normality_fit_ad, Test_Normality_fit_ks, Test_Normality_fit_li, tests the Normality test with every parameter by comparing with the original way to get the results.
 
@@ -23,6 +29,7 @@ import unittest
 from pycafee.sample.sample import Sample
 import numpy as np
 import scipy.stats as stats
+import tempfile
 os.system('cls')
 
 
@@ -1082,6 +1089,74 @@ class Test_non_normal_like_stats(unittest.TestCase):
 #         self.assertEqual(conclusao_esperado, conclusao, "conclusion does not match")
 
 
+class Test_rank_error_stats(unittest.TestCase):
+
+    def test_small(self):
+        x = np.array([5.1, 4.9, 4.7, 4.6, 5.0, 5.4, 4.6, 5.0, 4.4])
+        amostra = Sample()
+        amostra.fit(x, rank_error=0.01)
+        self.assertEqual(amostra.median, np.median(x), msg="wrong median")
+        self.assertEqual(amostra.Q1, np.quantile(x, 0.25), msg="wrong Q1")
+        self.assertEqual(amostra.Q3, np.quantile(x, 0.75), msg="wrong Q3")
+
+    def test_large(self):
+        x = np.random.default_rng(6).uniform(size=100000)
+        amostra = Sample()
+        amostra.fit(x, rank_error=0.01)
+        self.assertAlmostEqual(amostra.median, 0.5, delta=0.01, msg="wrong median")
+        self.assertAlmostEqual(amostra.Q1, 0.25, delta=0.01, msg="wrong Q1")
+        self.assertAlmostEqual(amostra.Q3, 0.75, delta=0.01, msg="wrong Q3")
+        self.assertEqual(amostra.min, x.min(), msg="wrong min")
+
+
+class Test_x_source_stats(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.default_rng(8).normal(10, 2, size=200)
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.npy = os.path.join(cls.folder.name, "x.npy")
+        np.save(cls.npy, cls.x)
+        cls.expected = Sample()
+        cls.expected.fit(cls.x)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def test_sources(self):
+        sources = {
+            "path": {"x_source": self.npy},
+            "chunks": {"x_source": (self.x[i:i + 32] for i in range(0, self.x.size, 32))},
+            "memmap": {"x_exp": np.load(self.npy, mmap_mode="r")},
+        }
+        for name, kwargs in sources.items():
+            with self.subTest(source=name):
+                amostra = Sample()
+                amostra.fit(**kwargs)
+                for stat in ["mean", "std", "variance", "cv", "t_interval", "min", "Q1", "median", "Q3", "max", "DI"]:
+                    self.assertAlmostEqual(getattr(amostra, stat), getattr(self.expected, stat), places=10, msg=f"wrong {stat}")
+                self.assertIsNone(amostra.mode, msg="the mode should not be evaluated")
+                self.assertIsNone(amostra.normality_result, msg="the normality test should not be evaluated")
+
+    def test_raises(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when x_exp and x_source are used"):
+            Sample().fit(self.x, x_source=self.npy)
+
+    def test_normality_check(self):
+        amostra = Sample()
+        amostra.fit(x_source=self.npy)
+        with self.assertRaises(ValueError, msg="Does not raised error when the Normality test was not evaluated"):
+            amostra.normality_check()
+        amostra = Sample(language="pt-br")
+        amostra.fit(x_exp=np.load(self.npy, mmap_mode="r"))
+        with self.assertRaises(ValueError, msg="Does not raised error when the Normality test was not evaluated"):
+            amostra.normality_check(show=False)
+        amostra.fit(self.x)
+        df = amostra.normality_check(show=False)
+        self.assertEqual(df.shape[0], 1, msg="the Normality test was not evaluated after fitting x_exp")
+
+
 # and now i understand the problems, you can see https://youtu.be/N26_hRITlsU?t=51
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+"""Tests if the get_critical_value function for MonteCarloTable is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_init
+    This class tests the parameters of the constructor. It should raise ValueError when replicates, seed or max_workers are not valid.
+
+---> Class Test_get_critical_value
+    This class tests the get_critical_value function. It should raise ValueError when the test, n_rep or alfa are not valid. It also checks that the simulated critical values are close to the tables of pycafee, that the values are saved on the cache file and read from it, and that the results are the same for the same seed.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/tables/MonteCarloTable/test_get_critical_value.py
+    or
+    python -m unittest -b tests/tables/MonteCarloTable/test_get_critical_value.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+from pycafee.tables import MonteCarloTable
+from pycafee.tables import cache
+from pycafee.sample.outliers import Dixon, Grubbs
+import numpy as np
+os.system('cls')
+
+class Test_init(unittest.TestCase):
+
+    def test_replicates(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when replicates is not an integer"):
+            MonteCarloTable(replicates=1000.0)
+        with self.assertRaises(ValueError, msg="Does not raised error when replicates is zero"):
+            MonteCarloTable(replicates=0)
+
+    def test_seed(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when seed is not an integer"):
+            MonteCarloTable(seed="1")
+        with self.assertRaises(ValueError, msg="Does not raised error when seed is negative"):
+            MonteCarloTable(seed=-1)
+
+    def test_max_workers(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when max_workers is zero"):
+            MonteCarloTable(max_workers=0)
+
+
+class Test_get_critical_value(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.table = MonteCarloTable(replicates=50000, cache_dir=self.folder.name)
+
+    def tearDown(self):
+        cache._MEMORY.clear()
+        self.folder.cleanup()
+
+    def test_test(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when test is not valid"):
+            self.table.get_critical_value("grubbs", 10)
+        with self.assertRaises(ValueError, msg="Does not raised error when test is not a str"):
+            self.table.get_critical_value(1, 10)
+
+    def test_n_rep(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when n_rep is not an integer"):
+            self.table.get_critical_value("grubbs_one", 10.0)
+        with self.assertRaises(ValueError, msg="Does not raised error when n_rep is too small"):
+            self.table.get_critical_value("dixon_r22", 5)
+
+    def test_alfa(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is not a float"):
+            self.table.get_critical_value("grubbs_one", 10, alfa=5)
+        with self.assertRaises(ValueError, msg="Does not raised error when alfa is not in range"):
+            self.table.get_critical_value("grubbs_one", 10, alfa=[0.05, 1.5])
+
+    def test_tables(self):
+        tests = [
+            ("grubbs_one", Grubbs.GRUBBS_DENSE_TABLES["one"]),
+            ("grubbs_two", Grubbs.GRUBBS_DENSE_TABLES["two"]),
+            ("grubbs_three", Grubbs.GRUBBS_DENSE_TABLES["three"]),
+            ("dixon_r10", Dixon.DIXON_DENSE_TABLES["r10"]),
+            ("dixon_r22", Dixon.DIXON_DENSE_TABLES["r22"]),
+        ]
+        for test, table in tests:
+            for n_rep in [10, 20]:
+                with self.subTest(test=test, n_rep=n_rep):
+                    result = self.table.get_critical_value(test, n_rep, alfa=[0.05, 0.10])
+                    expected = table.values[[list(table.alphas).index(0.05), list(table.alphas).index(0.10)], n_rep - table.n_rep[0]]
+                    np.testing.assert_allclose(result[0], expected, rtol=0.03, err_msg="far from the table")
+
+    def test_result(self):
+        result = self.table.get_critical_value("grubbs_one", 10)
+        self.assertIsInstance(result[0], float, "critical is not a float")
+        self.assertEqual(result[1], 0.05, "wrong default alfa")
+        result = self.table.get_critical_value("grubbs_one", 10, alfa=[0.01, 0.05])
+        self.assertEqual(result[0].shape, (2,), "wrong shape")
+        self.assertTrue(result[0][0] > result[0][1], "the critical value should decrease with alfa")
+        result = self.table.get_critical_value("shapiro_wilk", 10, alfa=[0.01, 0.05])
+        self.assertTrue(result[0][0] < result[0][1], "the critical value should increase with alfa")
+
+    def test_cache(self):
+        result = self.table.get_critical_value("dixon_r10", 40, alfa=0.05)
+        path = os.path.join(self.folder.name, cache.CACHE_FILE_NAME)
+        self.assertTrue(os.path.exists(path), "the cache file was not created")
+        with open(path, "r", encoding="utf-8") as file:
+            entries = json.load(file)
+        self.assertEqual(entries, {"dixon_r10|40|0.05|50000|0": result[0]}, "wrong cache entries")
+
+        ## the cached value is used without simulating ##
+        cache._MEMORY.clear()
+        with mock.patch.object(MonteCarloTable, "simulate", side_effect=AssertionError("simulated again")):
+            again = self.table.get_critical_value("dixon_r10", 40, alfa=0.05)
+        self.assertEqual(again[0], result[0], "the cached value is different")
+
+        ## only the missing alfa is simulated, with the same samples ##
+        result = self.table.get_critical_value("dixon_r10", 40, alfa=[0.05, 0.01])
+        with open(path, "r", encoding="utf-8") as file:
+            entries = json.load(file)
+        self.assertEqual(len(entries), 2, "wrong number of cache entries")
+        self.assertEqual(entries["dixon_r10|40|0.01|50000|0"], result[0][1], "wrong cache entry")
+
+    def test_seed(self):
+        result = self.table.get_critical_value("grubbs_one", 12)
+        other_folder = tempfile.TemporaryDirectory()
+        try:
+            same = MonteCarloTable(replicates=50000, cache_dir=other_folder.name).get_critical_value("grubbs_one", 12)
+            other = MonteCarloTable(replicates=50000, seed=1, cache_dir=other_folder.name).get_critical_value("grubbs_one", 12)
+        finally:
+            other_folder.cleanup()
+        self.assertEqual(result[0], same[0], "the same seed gives different results")
+        self.assertNotEqual(result[0], other[0], "different seeds give the same result")
+
+    def test_environment(self):
+        with mock.patch.dict(os.environ, {"PYCAFEE_CACHE_DIR": self.folder.name}):
+            MonteCarloTable(replicates=1000).get_critical_value("grubbs_one", 5)
+        self.assertTrue(os.path.exists(os.path.join(self.folder.name, cache.CACHE_FILE_NAME)), "the environment variable was not used")
+
+
+if __name__ == "__main__":
+    unittest.main()
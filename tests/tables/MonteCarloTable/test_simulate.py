@@ -0,0 +1,51 @@
+"""Tests if the simulate function for MonteCarloTable is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_simulate
+    This class tests the simulate function. It should raise ValueError when the test or n_rep are not valid. It also checks the size and the order of the simulated statistics, and that they are the same when the simulation uses many blocks and many processes.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/tables/MonteCarloTable/test_simulate.py
+    or
+    python -m unittest -b tests/tables/MonteCarloTable/test_simulate.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from unittest import mock
+from pycafee.tables import MonteCarloTable
+from pycafee.tables import montecarlo
+import numpy as np
+os.system('cls')
+
+class Test_simulate(unittest.TestCase):
+
+    def test_test(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when test is not valid"):
+            MonteCarloTable(replicates=100).simulate("dixon", 10)
+        with self.assertRaises(ValueError, msg="Does not raised error when n_rep is too small"):
+            MonteCarloTable(replicates=100).simulate("grubbs_three", 3)
+
+    def test_result(self):
+        result = MonteCarloTable(replicates=1234).simulate("shapiro_wilk", 15)
+        self.assertEqual(result.shape, (1234,), "wrong size")
+        self.assertTrue(np.all(np.diff(result) >= 0), "the statistics are not sorted")
+        self.assertTrue(np.all((result > 0) & (result <= 1)), "W should be in (0, 1]")
+
+    def test_blocks(self):
+        # small blocks, so the simulation uses many blocks
+        with mock.patch.object(montecarlo, "BLOCK_SIZE", 1000):
+            blocks = montecarlo._get_blocks(30, 1234, 0)
+            self.assertEqual(sum(rows for rows, _ in blocks), 1234, "wrong number of replicates")
+            one = MonteCarloTable(replicates=1234).simulate("grubbs_one", 30)
+            many = MonteCarloTable(replicates=1234, max_workers=2).simulate("grubbs_one", 30)
+        np.testing.assert_array_equal(one, many, err_msg="the processes change the result")
+
+
+if __name__ == "__main__":
+    unittest.main()
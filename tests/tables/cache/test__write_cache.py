@@ -0,0 +1,72 @@
+"""Tests if the _write_cache function is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_write_cache
+    This class tests the cache file. It checks that the entries are written and read back, that the entries saved by other processes are kept, that a corrupted file is ignored and that a folder that cannot be written keeps the entries in memory.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/tables/cache/test__write_cache.py
+    or
+    python -m unittest -b tests/tables/cache/test__write_cache.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from pycafee.tables import cache
+os.system('cls')
+
+class Test_write_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = cache._get_cache_path(self.folder.name)
+
+    def tearDown(self):
+        cache._MEMORY.clear()
+        self.folder.cleanup()
+
+    def test_key(self):
+        self.assertEqual(cache._make_key("grubbs_one", 50, 0.05, 1000, 0), "grubbs_one|50|0.05|1000|0", "wrong key")
+        self.assertEqual(cache._make_key("grubbs_one", 50, 0.1, 1000, 0), cache._make_key("grubbs_one", 50, 0.10, 1000, 0), "wrong key")
+
+    def test_write_and_read(self):
+        self.assertEqual(cache._read_cache(self.path), {}, "the cache should be empty")
+        cache._write_cache(self.path, {"a": 1.5})
+        cache._MEMORY.clear()
+        self.assertEqual(cache._read_cache(self.path), {"a": 1.5}, "the entry was not saved")
+        self.assertEqual(os.listdir(self.folder.name), [cache.CACHE_FILE_NAME], "the temporary file was not removed")
+
+    def test_other_processes(self):
+        cache._write_cache(self.path, {"a": 1.5})
+        # another process adds an entry
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"a": 1.5, "b": 2.5}, file)
+        cache._write_cache(self.path, {"c": 3.5})
+        cache._MEMORY.clear()
+        self.assertEqual(cache._read_cache(self.path), {"a": 1.5, "b": 2.5, "c": 3.5}, "the entries of other processes were lost")
+
+    def test_corrupted(self):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        self.assertEqual(cache._read_cache(self.path), {}, "the corrupted file was not ignored")
+        cache._write_cache(self.path, {"a": 1.5})
+        cache._MEMORY.clear()
+        self.assertEqual(cache._read_cache(self.path), {"a": 1.5}, "the corrupted file was not replaced")
+
+    def test_read_only(self):
+        path = os.path.join(self.folder.name, cache.CACHE_FILE_NAME, "inside_a_file", cache.CACHE_FILE_NAME)
+        with open(os.path.join(self.folder.name, cache.CACHE_FILE_NAME), "w", encoding="utf-8") as file:
+            file.write("{}")
+        cache._write_cache(path, {"a": 1.5})
+        self.assertEqual(cache._read_cache(path), {"a": 1.5}, "the entry was not kept in memory")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests if the vectorized statistics used by the simulations are working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_STATISTICS
+    This class compares each vectorized statistic with the statistic calculated by the classes of pycafee for each sample (taking the most extreme end of the sample for Grubbs and Dixon).
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/tables/statistics/test_STATISTICS.py
+    or
+    python -m unittest -b tests/tables/statistics/test_STATISTICS.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.tables.statistics import STATISTICS
+from pycafee.sample.outliers import Dixon, Grubbs
+from pycafee.normalitycheck.kernels import _shapiro_wilk_statistic
+import numpy as np
+os.system('cls')
+
+class Test_STATISTICS(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.x_sorted = np.sort(np.random.default_rng(7).normal(size=(20, 12)), axis=1)
+
+    def compare(self, test, function):
+        result = STATISTICS[test].function(self.x_sorted)
+        self.assertEqual(result.shape, (20,), "wrong shape")
+        for i, x in enumerate(self.x_sorted):
+            self.assertAlmostEqual(result[i], function(x), places=12, msg=f"wrong statistic for the sample {i}")
+
+    def test_grubbs(self):
+        grubbs = Grubbs()
+        self.compare("grubbs_one", lambda x: max(grubbs._one(x, "min"), grubbs._one(x, "max")))
+        self.compare("grubbs_two", grubbs._two)
+        self.compare("grubbs_three", lambda x: min(grubbs._three(x, "min"), grubbs._three(x, "max")))
+
+    def test_dixon(self):
+        dixon = Dixon()
+        for ratio in ["r10", "r11", "r12", "r20", "r21", "r22"]:
+            with self.subTest(ratio=ratio):
+                function = getattr(dixon, "_" + ratio)
+                self.compare("dixon_" + ratio, lambda x: max(function(x, "min"), function(x, "max")))
+
+    def test_shapiro_wilk(self):
+        self.compare("shapiro_wilk", _shapiro_wilk_statistic)
+        self.assertFalse(STATISTICS["shapiro_wilk"].upper, "W rejects for low values")
+
+
+if __name__ == "__main__":
+    unittest.main()
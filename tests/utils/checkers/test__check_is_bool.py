@@ -18,6 +18,8 @@ Command to run at the prompt:
 
 import os
 import unittest
+from unittest import mock
+from pycafee.database_management import management
 from pycafee.utils.checkers import _check_is_bool
 import numpy as np
 os.system('cls')
@@ -67,6 +69,11 @@ class Test_check_is_bool(unittest.TestCase):
         result = _check_is_bool(False, param_name="parameter", language='en')
         self.assertTrue(result, msg = "An error was raised when value was False")
 
+    def test_valid_input_does_not_query_messages(self):
+        with mock.patch.object(management, "_get_messages") as get_messages:
+            result = _check_is_bool(True, param_name="parameter", language='en')
+        self.assertTrue(result, "The valid input was not accepted")
+        get_messages.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -18,6 +18,8 @@ Command to run at the prompt:
 
 import os
 import unittest
+from unittest import mock
+from pycafee.database_management import management
 from pycafee.utils.checkers import _check_is_numpy_1_D
 import numpy as np
 os.system('cls')
@@ -44,9 +46,11 @@ class Test_check_is_numpy_1_D(unittest.TestCase):
         result = _check_is_numpy_1_D(x, param_name="param", language='en')
         self.assertTrue(result, msg="Does not return True when the input is np.array([1,2,3,4])")
 
-
-
-
+    def test_valid_input_does_not_query_messages(self):
+        with mock.patch.object(management, "_get_messages") as get_messages:
+            result = _check_is_numpy_1_D(np.array([1, 2, 3]), param_name="parameter", language='en')
+        self.assertTrue(result, "The valid input was not accepted")
+        get_messages.assert_not_called()
 
 
 if __name__ == "__main__":
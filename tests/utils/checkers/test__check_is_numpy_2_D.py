@@ -0,0 +1,59 @@
+"""Tests if the _check_is_numpy_2_D is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_check_is_numpy_2_D
+    This class tests if the value is a two dimension not empty numpy array. It searches for ValueError when type is not array, when it has other number of dimensions and when it is empty. It also checks if True is returned when value is 2D numpy array.
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/utils/checkers/test__check_is_numpy_2_D.py
+    or
+    python -m unittest -b tests/utils/checkers/test__check_is_numpy_2_D.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from unittest import mock
+from pycafee.database_management import management
+from pycafee.utils.checkers import _check_is_numpy_2_D
+import numpy as np
+os.system('cls')
+
+class Test_check_is_numpy_2_D(unittest.TestCase):
+
+    def test_empty_array(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when the numpy array is empty"):
+            _check_is_numpy_2_D(np.empty((0, 5)), param_name="param", language='en')
+        with self.assertRaises(ValueError, msg="Does not raised error when the numpy array is empty"):
+            _check_is_numpy_2_D(np.empty((3, 0)), param_name="param", language='pt-br')
+
+    def test_is_list(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when is list"):
+            _check_is_numpy_2_D([[1, 2], [3, 4]], param_name="param", language='en')
+
+    def test_other_dimensions(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when the array has one dimension"):
+            _check_is_numpy_2_D(np.array([1, 2, 3]), param_name="param", language='en')
+        with self.assertRaises(ValueError, msg="Does not raised error when the array has three dimensions"):
+            _check_is_numpy_2_D(np.ones((2, 3, 4)), param_name="param", language='en')
+
+    def test_pass(self):
+        result = _check_is_numpy_2_D(np.array([[1, 2, 3]]), param_name="param", language='en')
+        self.assertTrue(result, msg="Does not returned True with a 2D numpy array")
+        result = _check_is_numpy_2_D(np.ones((10, 4)), param_name="param", language='en')
+        self.assertTrue(result, msg="Does not returned True with a 2D numpy array")
+
+    def test_valid_input_does_not_query_messages(self):
+        with mock.patch.object(management, "_get_messages") as get_messages:
+            result = _check_is_numpy_2_D(np.ones((2, 3)), param_name="parameter", language='en')
+        self.assertTrue(result, "The valid input was not accepted")
+        get_messages.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,8 @@ Command to run at the prompt:
 
 import os
 import unittest
+from unittest import mock
+from pycafee.database_management import management
 from pycafee.utils.checkers import _check_is_str
 import numpy as np
 os.system('cls')
@@ -75,9 +77,11 @@ class Test_check_is_str(unittest.TestCase):
         result = _check_is_str("auisdhsa9d8ysadasd9oasdasdonha nsad\n", param_name="param", language='en')
         self.assertTrue(result, msg="Does not returned True with a string")
 
-
-
-
+    def test_valid_input_does_not_query_messages(self):
+        with mock.patch.object(management, "_get_messages") as get_messages:
+            result = _check_is_str("a", param_name="parameter", language='en')
+        self.assertTrue(result, "The valid input was not accepted")
+        get_messages.assert_not_called()
 
 
 if __name__ == "__main__":
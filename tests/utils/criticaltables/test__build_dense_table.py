@@ -0,0 +1,78 @@
+"""Tests if the _build_dense_table is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_build_dense_table
+    This class tests the conversion of a dict of lists table into a DenseTable. It checks the shape of the arrays, the order of the alphas, that the tabulated values are kept, the interpolation of the sample sizes that are not tabulated, the truncation of the sample sizes without critical values, the selection of alphas and the asymptotic coefficients.
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/utils/criticaltables/test__build_dense_table.py
+    or
+    python -m unittest -b tests/utils/criticaltables/test__build_dense_table.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.utils.criticaltables import _build_dense_table, DenseTable
+import numpy as np
+os.system('cls')
+
+class Test_build_dense_table(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = {
+            "n_rep": [3, 4, 5, 10],
+            0.10: [0.9, 0.8, 0.7, 0.5],
+            0.05: [0.95, 0.85, 0.75, 0.55],
+        }
+
+    def test_shape(self):
+        result = _build_dense_table(self.table)
+        self.assertIsInstance(result, DenseTable, "does not return a DenseTable")
+        self.assertEqual(result.values.shape, (2, 8), "wrong shape")
+        self.assertEqual(result.slopes.shape, (2, 8), "wrong shape")
+        np.testing.assert_array_equal(result.n_rep, np.arange(3, 11))
+        np.testing.assert_array_equal(result.alphas, [0.05, 0.10])
+        self.assertIsNone(result.asymptotic, "asymptotic should be None")
+
+    def test_values(self):
+        result = _build_dense_table(self.table)
+        np.testing.assert_array_equal(result.values[1, [0, 1, 2, 7]], [0.9, 0.8, 0.7, 0.5])
+        np.testing.assert_array_equal(result.values[0, [0, 1, 2, 7]], [0.95, 0.85, 0.75, 0.55])
+        # interpolated (monotone) between 5 and 10
+        self.assertTrue(np.all(np.diff(result.values[1, 2:]) < 0), "the interpolation is not monotone")
+        self.assertTrue(np.all((result.values[1, 3:7] < 0.7) & (result.values[1, 3:7] > 0.5)), "the interpolation is out of range")
+
+    def test_short_lists(self):
+        table = {"n_rep": [3, 4, 5, 6], 0.10: [0.9, 0.8, 0.7], 0.05: [0.95, 0.85, 0.75]}
+        result = _build_dense_table(table)
+        np.testing.assert_array_equal(result.n_rep, [3, 4, 5])
+        self.assertFalse(np.any(np.isnan(result.values)), "there are nan values")
+
+    def test_read_only(self):
+        result = _build_dense_table(self.table)
+        with self.assertRaises(ValueError, msg="the values are not read only"):
+            result.values[0, 0] = 1.0
+
+    def test_alphas(self):
+        table = dict(self.table)
+        table[0.01] = [0.99, 0.9, 0.8, 0.6]
+        result = _build_dense_table(table, alphas=[0.10, 0.05])
+        self.assertEqual(result.values.shape, (2, 8), "wrong shape")
+        np.testing.assert_array_equal(result.alphas, [0.05, 0.10])
+
+    def test_asymptotic(self):
+        result = _build_dense_table(self.table, asymptotic={0.05: 1.36, 0.10: 1.22}, divisor=np.sqrt)
+        np.testing.assert_array_equal(result.asymptotic, [1.36, 1.22])
+        self.assertEqual(result.asymptotic_slopes.shape, (2,), "wrong shape")
+        self.assertIs(result.divisor, np.sqrt, "wrong divisor")
+
+
+if __name__ == "__main__":
+    unittest.main()
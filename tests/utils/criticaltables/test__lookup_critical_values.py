@@ -0,0 +1,116 @@
+"""Tests if the _lookup_critical_values is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_lookup_critical_values
+    This class tests the lookup of critical values. It checks scalar and array inputs, the tolerance on alfa, the interpolation between the tabulated alphas, the nan returned for alphas outside the tabulated range and for small sample sizes, the asymptotic approximation and the extrapolation.
+
+---> Class Test_lookup_critical_values_tests
+    This class compares the vectorized lookup with the get_critical_value of the Normality tests.
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/utils/criticaltables/test__lookup_critical_values.py
+    or
+    python -m unittest -b tests/utils/criticaltables/test__lookup_critical_values.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.utils.criticaltables import _build_dense_table, _lookup_critical_values
+from pycafee.normalitycheck.kolmogorovsmirnov import KolmogorovSmirnov
+from pycafee.normalitycheck.lilliefors import Lilliefors
+from pycafee.normalitycheck.abdimolin import AbdiMolin
+from pycafee.normalitycheck.shapirowilk import ShapiroWilk
+import numpy as np
+os.system('cls')
+
+class Test_lookup_critical_values(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        table = {
+            "n_rep": [3, 4, 5, 10],
+            0.10: [0.9, 0.8, 0.7, 0.5],
+            0.05: [0.95, 0.85, 0.75, 0.55],
+            0.01: [0.99, 0.9, 0.8, 0.6],
+        }
+        cls.table = _build_dense_table(table)
+        cls.asymptotic = _build_dense_table(table, asymptotic={0.10: 1.0, 0.05: 2.0, 0.01: 3.0}, divisor=np.sqrt)
+        cls.extrapolation = _build_dense_table(table, extrapolation=lambda n_rep, alfa, critical: critical/n_rep)
+
+    def test_scalar(self):
+        result = _lookup_critical_values(self.table, 4, 0.05)
+        self.assertIsInstance(result, float, "does not return a float")
+        self.assertEqual(result, 0.85, "wrong critical value")
+        self.assertEqual(_lookup_critical_values(self.table, 10, 0.01), 0.6, "wrong critical value")
+        self.assertEqual(_lookup_critical_values(self.table, 3, 0.10), 0.9, "wrong critical value")
+
+    def test_tolerance(self):
+        self.assertEqual(_lookup_critical_values(self.table, 3, 0.1 + 1e-15), 0.9, "alfa is compared with ==")
+        self.assertEqual(_lookup_critical_values(self.table, 3, 0.05*2), 0.9, "alfa is compared with ==")
+
+    def test_interpolation(self):
+        result = _lookup_critical_values(self.table, 5, 0.025)
+        self.assertTrue(0.75 < result < 0.8, "the interpolation in alfa is out of range")
+        result = _lookup_critical_values(self.table, 7, 0.05)
+        self.assertTrue(0.55 < result < 0.75, "the interpolation in n_rep is out of range")
+        alphas = np.linspace(0.01, 0.10, 50)
+        result = _lookup_critical_values(self.table, 7, alphas)
+        self.assertTrue(np.all(np.diff(result) <= 0), "the interpolation is not monotone")
+
+    def test_nan(self):
+        self.assertTrue(np.isnan(_lookup_critical_values(self.table, 4, 0.005)), "should be nan when alfa is lower than the tabulated range")
+        self.assertTrue(np.isnan(_lookup_critical_values(self.table, 4, 0.2)), "should be nan when alfa is higher than the tabulated range")
+        self.assertTrue(np.isnan(_lookup_critical_values(self.table, 2, 0.05)), "should be nan when n_rep is too small")
+        self.assertTrue(np.isnan(_lookup_critical_values(self.table, 11, 0.05)), "should be nan when n_rep is too large")
+
+    def test_above(self):
+        self.assertEqual(_lookup_critical_values(self.asymptotic, 100, 0.05), 0.2, "wrong asymptotic value")
+        self.assertEqual(_lookup_critical_values(self.asymptotic, 10, 0.05), 0.55, "wrong tabulated value")
+        result = _lookup_critical_values(self.asymptotic, 100, 0.025)
+        self.assertTrue(0.2 < result < 0.3, "wrong interpolated asymptotic value")
+        self.assertEqual(_lookup_critical_values(self.extrapolation, 20, 0.05), 0.55/20, "wrong extrapolated value")
+
+    def test_arrays(self):
+        n_rep = np.array([2, 3, 4, 16, 100])
+        result = _lookup_critical_values(self.asymptotic, n_rep, 0.10)
+        np.testing.assert_allclose(result, [np.nan, 0.9, 0.8, 0.25, 0.1])
+        result = _lookup_critical_values(self.asymptotic, 3, np.array([0.10, 0.05, 0.001]))
+        np.testing.assert_allclose(result, [0.9, 0.95, np.nan])
+        result = _lookup_critical_values(self.asymptotic, n_rep[:, np.newaxis], np.array([0.10, 0.05]))
+        self.assertEqual(result.shape, (5, 2), "does not broadcast")
+
+
+class Test_lookup_critical_values_tests(unittest.TestCase):
+
+    def compare(self, test, dense_table, n_min, n_max):
+        n_rep = np.arange(n_min, n_max)
+        for alfa in [0.005, 0.01, 0.025, 0.05, 0.10, 0.15, 0.20]:
+            with self.subTest(alfa=alfa):
+                result = _lookup_critical_values(dense_table, n_rep, alfa)
+                for n, critical in zip(n_rep, result):
+                    expected = test.get_critical_value(int(n), alfa=alfa)[0]
+                    if expected is None:
+                        self.assertTrue(np.isnan(critical), "should be nan")
+                    else:
+                        self.assertEqual(critical, expected, "does not match get_critical_value")
+
+    def test_kolmogorov_smirnov(self):
+        self.compare(KolmogorovSmirnov(), KolmogorovSmirnov.KOLMOGOROV_SMIRNOV_DENSE_TABLE, 2, 60)
+
+    def test_lilliefors(self):
+        self.compare(Lilliefors(), Lilliefors.LILLIEFORS_DENSE_TABLE, 4, 60)
+
+    def test_abdi_molin(self):
+        self.compare(AbdiMolin(), AbdiMolin.ABDIMOLIN_DENSE_TABLE, 4, 80)
+
+    def test_shapiro_wilk(self):
+        self.compare(ShapiroWilk(), ShapiroWilk.SHAPIRO_WILK_DENSE_TABLE, 3, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
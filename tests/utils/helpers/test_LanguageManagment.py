@@ -7,6 +7,8 @@
     This class tests if the method set_language is working as expected, testing if it raise ValueError when a not valid language is passed, and if it changes the values whan pt-br is passed.
 ---> Class Test_init
     This class tests if the method init is working as expected, testing if it raise ValueError when a not valid language is passed, if it changes the values whan pt-br is passed and if the defaul value is en.
+---> Class Test_init_without_io
+    This class tests if the object construction does not access the database once the default language is known.
 
 --------------------------------------------------------------------------------
 Command to run at the prompt:
@@ -19,6 +21,8 @@ Command to run at the prompt:
 
 import os
 import unittest
+from unittest import mock
+from pycafee.database_management import management
 from pycafee.utils.helpers import LanguageManagement
 os.system("cls")
 
@@ -66,6 +70,22 @@ class Test_get_language(unittest.TestCase):
 
 
 
+class Test_init_without_io(unittest.TestCase):
+
+    def test_no_database_access(self):
+        LanguageManagement()
+        with mock.patch.object(management, "_get_read_only_connection") as read_only, mock.patch.object(management, "_connecting_to_database") as connecting:
+            for i in range(5):
+                self.assertEqual(LanguageManagement().get_language(), "en")
+                self.assertEqual(LanguageManagement("pt-br").get_language(), "pt-br")
+        read_only.assert_not_called()
+        connecting.assert_not_called()
+
+    def test_cache_cleared(self):
+        LanguageManagement()
+        management._clear_messages_cache()
+        self.assertEqual(LanguageManagement().get_language(), "en", msg="The default language is not read again after the cache is cleared")
+
 
 
 
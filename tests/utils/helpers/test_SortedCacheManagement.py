@@ -0,0 +1,80 @@
+"""Tests if the SortedCacheManagement is working as expected
+
+---> Class Test_get_sorted
+    This class tests if the sorted copy is kept for the same array (it is not sorted again) when cache_sorted is True, if it is read only, if a different array (or the same array after invalidate_sorted) is sorted again and if nothing is cached by default
+
+---> Class Test_assume_sorted
+    This class tests if the data is returned as it is (without copies) when assume_sorted is True
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/utils/helpers/test_SortedCacheManagement.py
+    or
+    python -m unittest -b tests/utils/helpers/test_SortedCacheManagement.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import unittest
+from pycafee.utils.helpers import SortedCacheManagement
+import numpy as np
+os.system("cls")
+
+
+class Test_get_sorted(unittest.TestCase):
+
+    def test_cache(self):
+        x = np.array([3.0, 1.0, 2.0])
+        teste = SortedCacheManagement(cache_sorted=True)
+        self.assertIsNone(teste._find_sorted(x), msg="the array should not be on the cache")
+        x_sorted = teste._get_sorted(x)
+        np.testing.assert_array_equal(x_sorted, np.sort(x), err_msg="the array is not sorted")
+        self.assertIs(teste._get_sorted(x), x_sorted, msg="the array was sorted again")
+        self.assertIs(teste._find_sorted(x), x_sorted, msg="the array is not on the cache")
+        self.assertFalse(x_sorted.flags.writeable, msg="the sorted copy is not read only")
+
+    def test_other_array(self):
+        x = np.array([3.0, 1.0, 2.0])
+        teste = SortedCacheManagement(cache_sorted=True)
+        x_sorted = teste._get_sorted(x)
+        y = x.copy()
+        self.assertIsNone(teste._find_sorted(y), msg="a copy should not be on the cache")
+        self.assertIsNot(teste._get_sorted(y), x_sorted, msg="a copy was not sorted again")
+
+    def test_invalidate_sorted(self):
+        x = np.array([3.0, 1.0, 2.0])
+        teste = SortedCacheManagement(cache_sorted=True)
+        teste._get_sorted(x)
+        x[0] = 0.0
+        teste.invalidate_sorted()
+        self.assertEqual(teste.generation, 1, msg="the generation was not increased")
+        self.assertIsNone(teste._find_sorted(x), msg="the array should not be on the cache")
+        np.testing.assert_array_equal(teste._get_sorted(x), [0.0, 1.0, 2.0], err_msg="the array was not sorted again")
+
+    def test_default(self):
+        x = np.array([3.0, 1.0, 2.0])
+        teste = SortedCacheManagement()
+        self.assertFalse(teste.cache_sorted, msg="the cache should be disabled by default")
+        np.testing.assert_array_equal(teste._get_sorted(x), [1.0, 2.0, 3.0], err_msg="the array is not sorted")
+        self.assertIsNone(teste._find_sorted(x), msg="the array should not be on the cache")
+        x[:] = [6.0, 5.0, 4.0]
+        np.testing.assert_array_equal(teste._get_sorted(x), [4.0, 5.0, 6.0], err_msg="the array changed in place was not sorted again")
+
+    def test_cache_sorted(self):
+        with self.assertRaises(ValueError, msg="Does not raised error when cache_sorted is not bool"):
+            SortedCacheManagement(cache_sorted="True")
+
+
+class Test_assume_sorted(unittest.TestCase):
+
+    def test_no_copy(self):
+        x = np.array([1.0, 2.0, 3.0])
+        teste = SortedCacheManagement()
+        self.assertIs(teste._get_sorted(x, assume_sorted=True), x, msg="the array was copied")
+        self.assertIs(teste._find_sorted(x, assume_sorted=True), x, msg="the array was copied")
+        self.assertIsNone(teste._find_sorted(x), msg="the array should not be cached")
+
+
+if __name__ == "__main__":
+    unittest.main()
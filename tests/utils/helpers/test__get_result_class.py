@@ -0,0 +1,81 @@
+"""Tests if the _get_result_class is working as expected
+
+--------------------------------------------------------------------------------
+Description:
+
+---> Class Test_get_result_class
+    This class tests if the result classes are reused, if the aliases point to the right fields, if the results can be pickled and if the results of the tests share the same class between calls.
+
+
+--------------------------------------------------------------------------------
+Command to run at the prompt:
+    python -m unittest -v tests/utils/helpers/test__get_result_class.py
+    or
+    python -m unittest -b tests/utils/helpers/test__get_result_class.py
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import pickle
+import unittest
+import numpy as np
+from pycafee.normalitycheck.shapirowilk import ShapiroWilk
+from pycafee.sample.outliers import Grubbs
+from pycafee.utils.helpers import _get_result_class
+os.system('cls')
+
+
+class Test_get_result_class(unittest.TestCase):
+
+    def test_reused(self):
+        first = _get_result_class("TestResult", ("Estatistica", "Critico"), ("statistic", "critical"))
+        second = _get_result_class("TestResult", ("Estatistica", "Critico"), ("statistic", "critical"))
+        self.assertIs(first, second, msg="A new class was created for the same fields")
+
+    def test_aliases(self):
+        result = _get_result_class("TestResult", ("Estatistica", "Critico", "alpha"), ("statistic", "critical", "alpha"))
+        r = result(1.5, 2.5, 0.05)
+        self.assertEqual(r.Estatistica, 1.5)
+        self.assertEqual(r.statistic, 1.5)
+        self.assertEqual(r.critical, 2.5)
+        self.assertEqual(r.alpha, 0.05)
+        self.assertEqual(tuple(r), (1.5, 2.5, 0.05), msg="The aliases changed the tuple")
+        with self.assertRaises(AttributeError, msg="The alias is writable"):
+            r.statistic = 1
+
+    def test_no_dict(self):
+        result = _get_result_class("TestResult", ("Estatistica", "Critico"), ("statistic", "critical"))
+        self.assertFalse(hasattr(result(1, 2), "__dict__"), msg="The result has a __dict__")
+
+    def test_pickle(self):
+        result = _get_result_class("TestResult", ("Estatistica", "Critico"), ("statistic", "critical"))
+        r = pickle.loads(pickle.dumps(result(1.5, 2.5)))
+        self.assertIsInstance(r, result)
+        self.assertEqual(r, (1.5, 2.5))
+        self.assertEqual(r.critical, 2.5)
+
+    def test_fit_results(self):
+        x = np.array([5.1, 4.9, 5.3, 5.0, 5.2, 4.8, 5.4, 5.1, 5.0, 4.9])
+        for language in ["en", "pt-br"]:
+            with self.subTest(language=language):
+                teste = ShapiroWilk(language=language)
+                first, _ = teste.fit(x)
+                second, _ = teste.fit(x + 1)
+                self.assertIs(type(first), type(second), msg="The fit method creates a new class on each call")
+                self.assertEqual(first.statistic, first[0])
+                self.assertEqual(first.p_value, first[2])
+                self.assertEqual(pickle.loads(pickle.dumps(first)), first, msg="The result can not be pickled")
+
+    def test_critical_value_results(self):
+        for language in ["en", "pt-br"]:
+            with self.subTest(language=language):
+                result = Grubbs(language=language).get_critical_value(10, alfa=0.05)
+                self.assertEqual(result.critical, result[0])
+                self.assertEqual(result.alpha, 0.05)
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()